@@ -4,8 +4,15 @@ Módulo principal del motor del juego que maneja el estado, el bucle principal y
 """
 
 from .state import GameState
-from .loop import GameLoop
 from .events import EventManager
 
 __all__ = ['GameState', 'GameLoop', 'EventManager']
 
+
+def __getattr__(name):
+    # GameLoop importa pygame y los minijuegos: se carga solo cuando se pide,
+    # para que engine.rules, engine.state y engine.trace funcionen sin pygame
+    if name == 'GameLoop':
+        from .loop import GameLoop
+        return GameLoop
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
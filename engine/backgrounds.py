@@ -0,0 +1,137 @@
+"""
+Backgrounds - Generador procedural de fondos
+Construye una sola vez los fondos de respaldo (degradados, campos de estrellas,
+rejillas) que se usan cuando falta el asset de imagen, y los cachea por
+(tamaño, paleta). Así el fondo procedural cuesta lo mismo que un blit de textura.
+"""
+
+import pygame
+import random
+from typing import Dict, Tuple, Sequence, Hashable
+import logging
+
+logger = logging.getLogger(__name__)
+
+Color = Tuple[int, int, int]
+Size = Tuple[int, int]
+
+# Superficies generadas, indexadas por (tipo, tamaño, paleta, ...)
+_cache: Dict[Hashable, pygame.Surface] = {}
+
+
+def _finalize(surface: pygame.Surface) -> pygame.Surface:
+    """Convierte al formato de la pantalla si ya existe una (blits más rápidos)"""
+    if pygame.display.get_init() and pygame.display.get_surface() is not None:
+        return surface.convert()
+    return surface
+
+
+def get_gradient_background(size: Size, top_color: Color, bottom_color: Color) -> pygame.Surface:
+    """
+    Obtiene un degradado vertical lineal de top_color a bottom_color
+
+    El degradado se genera como una columna de 1px que luego se escala,
+    en lugar de dibujar una línea por cada fila de la pantalla.
+
+    Args:
+        size: (ancho, alto) de la superficie
+        top_color: Color de la fila superior
+        bottom_color: Color hacia el que tiende la fila inferior
+
+    Returns:
+        Superficie cacheada (no modificar; solo hacer blit)
+    """
+    key = ('gradient', tuple(size), tuple(top_color), tuple(bottom_color))
+    surface = _cache.get(key)
+    if surface is not None:
+        return surface
+
+    width, height = size
+    column = pygame.Surface((1, height))
+    for y in range(height):
+        t = y / height
+        color = tuple(int(top + (bottom - top) * t)
+                      for top, bottom in zip(top_color, bottom_color))
+        column.set_at((0, y), color)
+
+    surface = _finalize(pygame.transform.scale(column, (width, height)))
+    _cache[key] = surface
+    logger.debug(f"Fondo degradado generado: {size} {top_color}->{bottom_color}")
+    return surface
+
+
+def get_starfield_background(size: Size, base_color: Color, num_stars: int = 100,
+                             star_color: Color = (255, 255, 255),
+                             star_sizes: Sequence[int] = (1,),
+                             seed: int = 0) -> pygame.Surface:
+    """
+    Obtiene un fondo liso con un campo de estrellas fijo
+
+    Args:
+        size: (ancho, alto) de la superficie
+        base_color: Color de fondo
+        num_stars: Número de estrellas
+        star_color: Color de las estrellas
+        star_sizes: Radios posibles (se elige uno al azar por estrella)
+        seed: Semilla del campo (mismo seed -> mismas estrellas)
+
+    Returns:
+        Superficie cacheada (no modificar; solo hacer blit)
+    """
+    key = ('starfield', tuple(size), tuple(base_color), num_stars,
+           tuple(star_color), tuple(star_sizes), seed)
+    surface = _cache.get(key)
+    if surface is not None:
+        return surface
+
+    width, height = size
+    # Generador propio para no alterar la secuencia global de random
+    rng = random.Random(seed)
+    surface = pygame.Surface((width, height))
+    surface.fill(base_color)
+    for _ in range(num_stars):
+        x = rng.randint(0, width)
+        y = rng.randint(0, height)
+        pygame.draw.circle(surface, star_color, (x, y), rng.choice(star_sizes))
+
+    surface = _finalize(surface)
+    _cache[key] = surface
+    logger.debug(f"Campo de estrellas generado: {size} ({num_stars} estrellas)")
+    return surface
+
+
+def get_grid_background(size: Size, base_color: Color, grid_color: Color,
+                        spacing: int = 50) -> pygame.Surface:
+    """
+    Obtiene un fondo liso con una rejilla de líneas (patrón de circuitos)
+
+    Args:
+        size: (ancho, alto) de la superficie
+        base_color: Color de fondo
+        grid_color: Color de las líneas
+        spacing: Separación entre líneas en píxeles
+
+    Returns:
+        Superficie cacheada (no modificar; solo hacer blit)
+    """
+    key = ('grid', tuple(size), tuple(base_color), tuple(grid_color), spacing)
+    surface = _cache.get(key)
+    if surface is not None:
+        return surface
+
+    width, height = size
+    surface = pygame.Surface((width, height))
+    surface.fill(base_color)
+    for x in range(0, width, spacing):
+        pygame.draw.line(surface, grid_color, (x, 0), (x, height), 1)
+    for y in range(0, height, spacing):
+        pygame.draw.line(surface, grid_color, (0, y), (width, y), 1)
+
+    surface = _finalize(surface)
+    _cache[key] = surface
+    return surface
+
+
+def clear_background_cache() -> None:
+    """Vacía la caché (p.ej. tras cambiar el modo de vídeo)"""
+    _cache.clear()
@@ -17,6 +17,8 @@ class EventType(Enum):
     OXYGEN_CHANGED = auto()
     MATERIALS_GAINED = auto()  # Simplificado para materiales genéricos
     MATERIALS_CONSUMED = auto()
+    RESOURCES_GAINED = auto()  # Lote de recursos tipados (gameplay.resources)
+    RESOURCES_CONSUMED = auto()
     REPAIR_PROGRESS_CHANGED = auto()
     
     # Eventos de turnos
@@ -32,6 +34,8 @@ class EventType(Enum):
     LOAN_OVERDUE = auto()  # Pago vencido
     LOAN_DEFAULTED = auto()
     PENALTY_APPLIED = auto()
+    RISK_FORECAST_UPDATED = auto()  # Nuevo pronóstico de riesgo (simulation.forecaster)
+    ADVICE_UPDATED = auto()  # Nueva recomendación de estrategia (simulation.advisor)
     
     # Eventos de minijuegos
     MINIGAME_STARTED = auto()
@@ -52,6 +56,7 @@ class EventType(Enum):
     NOTIFICATION_SHOWN = auto()
     ALERT_OXYGEN = auto()
     ALERT_MATERIALS = auto()
+    ASSET_LOADED = auto()  # Recurso cargado en segundo plano (ui.assets)
 
 
 @dataclass
@@ -97,6 +102,9 @@ class EventManager:
         self.event_history: List[Event] = []
         self.max_history_size = 100
         
+        # Callback opcional al encolar (el bucle lo usa para despertar si está en reposo)
+        self.on_queued: Optional[Callable[[], None]] = None
+        
         # Inicializar listas vacías para cada tipo de evento
         for event_type in EventType:
             self.subscribers[event_type] = []
@@ -159,6 +167,8 @@ class EventManager:
         """
         self.event_queue.append(event)
         logger.debug(f"Evento encolado: {event.event_type.name}")
+        if self.on_queued:
+            self.on_queued()
     
     def process_queue(self) -> None:
         """Procesa todos los eventos en la cola"""
@@ -5,10 +5,13 @@ Gestiona el flujo del juego, turnos, tiempo y fases
 
 import pygame
 import random
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
 import logging
 from .state import GameState
 from .events import EventManager, EventType, Event
+from .timers import TimerScheduler
+from . import rules
 from gameplay.minigames import (
     MiningMinigame,
     AsteroidShooterMinigame,
@@ -19,6 +22,9 @@ from gameplay.minigames import (
 
 logger = logging.getLogger(__name__)
 
+# Evento de Pygame para despertar al bucle cuando está esperando en reposo
+WAKE_EVENT = pygame.event.custom_type()
+
 
 class GameLoop:
     """
@@ -37,19 +43,34 @@ class GameLoop:
         - ui.hud.HUD: Para mostrar la interfaz
     """
     
-    def __init__(self, game_state: GameState, event_manager: EventManager):
+    def __init__(self, game_state: GameState, event_manager: EventManager,
+                 timers: Optional[TimerScheduler] = None):
         """
         Inicializa el bucle del juego
         
         Args:
             game_state: Instancia del estado del juego
             event_manager: Gestor de eventos
+            timers: Temporizadores compartidos con Renderer, HUD y Narrator (None = nuevos)
         """
         self.game_state = game_state
         self.event_manager = event_manager
         self.running = False
         self.clock = pygame.time.Clock()
         self.fps = 60
+        self.idle_fps = 10  # Tasa cuando nada se anima (0 = desactivado)
+        
+        # Temporizadores compartidos con Renderer, HUD y Narrator (se avanzan en update)
+        self.timers = TimerScheduler() if timers is None else timers
+        
+        # Instante de arranque del juego (time.perf_counter) para medir el primer frame
+        self.launch_time: Optional[float] = None
+        self.first_frame_ms: Optional[float] = None
+        
+        # Reposo: evento sacado por pygame.event.wait y si el bucle está esperando
+        self._woken_event = None
+        self._waiting = False
+        self.event_manager.on_queued = self._wake
         
         # Referencias a componentes (se asignan después)
         self.renderer = None
@@ -58,6 +79,9 @@ class GameLoop:
         self.audio_manager = None
         self.config = None
         self.screen = None
+        self.difficulty_engine = None
+        self.risk_forecaster = None
+        self.strategy_advisor = None
         
         # Estado del minijuego actual
         self.current_minigame = None
@@ -73,6 +97,7 @@ class GameLoop:
         self.oxygen_event_shown = False  # Para mostrar solo una vez por sesión
         self.oxygen_event_pending = False  # Si hay un evento pendiente
         self.oxygen_event_accepted = False  # Si el jugador aceptó el evento
+        self._oxygen_checked_version = -1  # Versión de GameState ya revisada para el evento
         
         # Suscribir a eventos importantes
         self._setup_event_subscriptions()
@@ -104,6 +129,10 @@ class GameLoop:
     def run(self) -> None:
         """Ejecuta el bucle principal del juego"""
         while self.running:
+            # En reposo (juego por turnos sin animaciones) dormir hasta recibir input
+            if self.is_idle():
+                self._wait_for_activity()
+            
             # Calcular delta time
             delta_time = self.clock.tick(self.fps) / 1000.0
             
@@ -121,9 +150,68 @@ class GameLoop:
         
         logger.info("Bucle del juego terminado")
     
+    def is_idle(self) -> bool:
+        """
+        Indica si el bucle puede bajar a la tasa de reposo
+        
+        Solo en el juego principal o la pantalla final, sin minijuego, sin
+        eventos encolados y sin animaciones en Renderer, HUD o Narrator.
+        
+        Returns:
+            True si nada necesita la tasa de frames completa
+        """
+        if self.idle_fps <= 0 or self.current_minigame:
+            return False
+        if self.game_state.current_phase not in ("main_game", "end"):
+            return False
+        if self.event_manager.event_queue:
+            return False
+        for component in (self.renderer, self.hud, self.narrator):
+            if component and component.is_animating():
+                return False
+        return True
+    
+    def _wait_for_activity(self) -> None:
+        """Bloquea hasta que llegue un evento de Pygame o pase un frame de reposo"""
+        self._waiting = True
+        try:
+            # Un evento encolado justo antes de marcar la espera no despertaría al bucle
+            if self.event_manager.event_queue:
+                return
+            
+            # No dormir más allá del próximo temporizador
+            timeout = 1.0 / self.idle_fps
+            next_timer = self.timers.time_until_next()
+            if next_timer is not None:
+                timeout = min(timeout, next_timer)
+            event = pygame.event.wait(int(timeout * 1000))
+        finally:
+            self._waiting = False
+        
+        # wait() saca el evento de la cola: se guarda para handle_events
+        if event.type != pygame.NOEVENT:
+            self._woken_event = event
+    
+    def _wake(self) -> None:
+        """Despierta al bucle si está en reposo (se llama desde cualquier hilo)"""
+        if not self._waiting:
+            return
+        try:
+            pygame.event.post(pygame.event.Event(WAKE_EVENT))
+        except pygame.error:
+            # Sin pantalla inicializada no hay nada que despertar
+            pass
+    
     def handle_events(self) -> None:
         """Procesa todos los eventos de entrada"""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if self._woken_event is not None:
+            events.insert(0, self._woken_event)
+            self._woken_event = None
+        
+        for event in events:
+            if event.type == WAKE_EVENT:
+                continue
             if event.type == pygame.QUIT:
                 self.stop()
                 return
@@ -156,6 +244,9 @@ class GameLoop:
         Args:
             delta_time: Tiempo transcurrido desde el último frame (en segundos)
         """
+        # Ejecutar temporizadores vencidos (notificaciones, shake, prestamista, escritura)
+        self.timers.advance(delta_time)
+        
         # Actualizar renderer (para efectos como shake)
         if self.renderer and hasattr(self.renderer, 'update'):
             self.renderer.update(delta_time)
@@ -182,10 +273,19 @@ class GameLoop:
         if self.game_state.current_phase == "main_game":
             self.game_state.check_game_over_conditions()
             
-            # Verificar evento de oxígeno (solo una vez cuando baja del 80%)
-            if (self.game_state.oxygen < 80 and not self.oxygen_event_shown 
-                and not self.oxygen_event_pending):
-                self._trigger_oxygen_event()
+            # Pedir un nuevo pronóstico de riesgo si el estado cambió (se calcula en otro hilo)
+            if self.risk_forecaster:
+                self.risk_forecaster.request_if_changed()
+            if self.strategy_advisor:
+                self.strategy_advisor.request_if_changed()
+            
+            # Verificar evento de oxígeno (solo una vez cuando baja del 80%),
+            # únicamente cuando el oxígeno cambió desde la última revisión
+            if self.game_state.changed_since(self._oxygen_checked_version, 'oxygen'):
+                self._oxygen_checked_version = self.game_state.version
+                if (self.game_state.oxygen < 80 and not self.oxygen_event_shown 
+                    and not self.oxygen_event_pending):
+                    self._trigger_oxygen_event()
     
     def render(self) -> None:
         """Renderiza el frame actual"""
@@ -216,6 +316,10 @@ class GameLoop:
         
         # Actualizar pantalla
         pygame.display.flip()
+        
+        if self.first_frame_ms is None and self.launch_time is not None:
+            self.first_frame_ms = (time.perf_counter() - self.launch_time) * 1000
+            logger.info(f"Primer frame a los {self.first_frame_ms:.0f} ms del arranque")
     
     def change_phase(self, new_phase: str) -> None:
         """
@@ -231,6 +335,7 @@ class GameLoop:
         
         old_phase = self.game_state.current_phase
         self.game_state.current_phase = new_phase
+        self.game_state.mark_changed('status')
         
         logger.info(f"Cambio de fase: {old_phase} -> {new_phase}")
         
@@ -281,6 +386,11 @@ class GameLoop:
         """Detiene el bucle del juego"""
         logger.info("Deteniendo el bucle del juego...")
         self.running = False
+        
+        if self.risk_forecaster:
+            self.risk_forecaster.stop()
+        if self.strategy_advisor:
+            self.strategy_advisor.stop()
     
     def _handle_intro_events(self, event: pygame.event.Event) -> None:
         """Maneja eventos durante la fase de intro"""
@@ -359,17 +469,51 @@ class GameLoop:
                 # Salir del juego
                 self.stop()
     
+    def _get_minigame_tuning(self, minigame_key: str):
+        """
+        Obtiene los parámetros de un minijuego para la dificultad y el turno actuales
+        
+        Args:
+            minigame_key: Clave del minijuego en config.json ('mining', 'timing', ...)
+        
+        Returns:
+            Parámetros del minijuego, o None si no hay motor de dificultad
+            (el minijuego usa entonces sus valores por defecto)
+        """
+        if not self.difficulty_engine:
+            return None
+        
+        level = 0
+        if self.config and 'gameplay' in self.config:
+            level = self.config['gameplay'].get('difficulty_level', 0)
+        
+        return self.difficulty_engine.get_tuning(minigame_key, level, self.game_state.turn_number)
+    
+    def _apply_rules_action(self, action: rules.Action) -> Tuple[rules.RulesState, rules.RulesState]:
+        """
+        Aplica una acción de engine.rules a la partida
+        
+        Args:
+            action: Acción (los minijuegos se aplican con outcome=0: solo el coste)
+        
+        Returns:
+            (estado antes, estado después)
+        """
+        before = rules.from_game_state(self.game_state)
+        after = rules.transition(before, action, random)
+        rules.apply_to_game(self.game_state, before, after)
+        return before, after
+    
     def start_mining_minigame(self) -> None:
         """Inicia el minijuego de minería"""
-        if not self.game_state.can_afford_action("mining"):
+        if not rules.can_mine(self.game_state):
             if self.hud:
                 self.hud.add_notification("Oxígeno insuficiente para minar", "warning")
             return
         
-        # Consumir oxígeno (aleatorio entre 12-15)
-        oxygen_consumed = random.randint(12, 15)
-        self.game_state.update_oxygen(-oxygen_consumed)
-        logger.info(f"Oxígeno consumido en minería: {oxygen_consumed}")
+        # Consumir oxígeno (aleatorio entre 12-15); los materiales llegan al terminar el minijuego
+        before, after = self._apply_rules_action(rules.Action(rules.MINE, outcome=0))
+        logger.info(f"Oxígeno consumido en minería: {before.oxygen - after.oxygen:.0f}")
         
         # Cerrar paneles del HUD antes de entrar al minijuego
         if self.hud:
@@ -396,7 +540,8 @@ class GameLoop:
             selected_game = random.choice(mining_games)
         
         # Crear el minijuego seleccionado
-        self.current_minigame = selected_game(self.screen.get_width(), self.screen.get_height())
+        self.current_minigame = selected_game(self.screen.get_width(), self.screen.get_height(),
+                                              tuning=self._get_minigame_tuning(selected_game.TUNING_KEY))
         
         # Mostrar notificación del minijuego
         game_name = "Mineral Rush" if selected_game == MiningMinigame else "Asteroid Shooter"
@@ -407,23 +552,19 @@ class GameLoop:
     
     def start_repair_minigame(self) -> None:
         """Inicia el minijuego de reparación"""
-        if not self.game_state.can_afford_action("repair"):
+        if self.game_state.oxygen < self.game_state.oxygen_cost_repair:
             if self.hud:
                 self.hud.add_notification("Oxígeno insuficiente para reparar", "warning")
             return
         
-        if self.game_state.materials < 5:
+        if not rules.can_repair(self.game_state):
             if self.hud:
                 self.hud.add_notification("Materiales insuficientes para reparar", "warning")
             return
         
-        # Consumir oxígeno (aleatorio entre 12-15) y materiales
-        oxygen_consumed = random.randint(12, 15)
-        self.game_state.update_oxygen(-oxygen_consumed)
-        logger.info(f"Oxígeno consumido en reparación: {oxygen_consumed}")
-        
-        materials_cost = random.randint(5, 10)
-        self.game_state.consume_materials(materials_cost)
+        # Consumir oxígeno (aleatorio entre 12-15) y materiales; el progreso llega al terminar el minijuego
+        before, after = self._apply_rules_action(rules.Action(rules.REPAIR, outcome=0))
+        logger.info(f"Oxígeno consumido en reparación: {before.oxygen - after.oxygen:.0f}")
         
         # Cerrar paneles del HUD antes de entrar al minijuego
         if self.hud:
@@ -450,7 +591,8 @@ class GameLoop:
             selected_game = random.choice(repair_games)
         
         # Crear el minijuego seleccionado
-        self.current_minigame = selected_game(self.screen.get_width(), self.screen.get_height())
+        self.current_minigame = selected_game(self.screen.get_width(), self.screen.get_height(),
+                                              tuning=self._get_minigame_tuning(selected_game.TUNING_KEY))
         
         # Mostrar notificación del minijuego
         game_name = "Timing Precision" if selected_game == TimingMinigame else "Wiring Puzzle"
@@ -643,7 +785,9 @@ class GameLoop:
         self.change_phase("minigame")
         
         # Crear el minijuego
-        self.current_minigame = OxygenRescueMinigame(self.screen.get_width(), self.screen.get_height())
+        self.current_minigame = OxygenRescueMinigame(
+            self.screen.get_width(), self.screen.get_height(),
+            tuning=self._get_minigame_tuning(OxygenRescueMinigame.TUNING_KEY))
         
         # Notificación
         if self.hud:
@@ -669,12 +813,18 @@ class GameLoop:
         self.game_state.victory = False
         self.game_state.game_over_reason = ""
         self.game_state.prestamista_shown = False
+        self.game_state.mark_changed()
         
         # Limpiar préstamos activos si existen
         if self.game_state.loan_manager:
-            self.game_state.loan_manager.active_loans.clear()
+            self.game_state.loan_manager.reset()
             logger.info("Préstamos activos limpiados")
         
+        if self.game_state.resource_manager:
+            self.game_state.resource_manager.reset()
+        if self.game_state.repair_system:
+            self.game_state.repair_system.reset()
+        
         # Resetear contadores de minijuegos (para volver a mostrar tutorial)
         self.mining_attempts = 0
         self.repair_attempts = 0
@@ -683,6 +833,7 @@ class GameLoop:
         self.oxygen_event_shown = False
         self.oxygen_event_pending = False
         self.oxygen_event_accepted = False
+        self._oxygen_checked_version = -1
         
         # Resetear animaciones del renderer
         if self.renderer:
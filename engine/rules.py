@@ -0,0 +1,412 @@
+"""
+Rules - Núcleo puro de reglas del juego
+Reglas de una partida como funciones puras sobre tuplas inmutables, sin
+pygame, eventos ni log: transition(state, action, rng) devuelve el estado
+siguiente tras minar, reparar, intercambiar, ofrecer/aceptar/rechazar un
+préstamo, pagar o terminar el turno.
+
+El juego interactivo también avanza con transition: GameLoop (costes de los
+minijuegos), HUD (intercambio) y GameState.advance_turn copian el estado de la
+partida con from_game_state, aplican la acción y devuelven el resultado con
+apply_to_game; LoanManager.apply_turn copia los préstamos. El interés y los
+vencimientos de cada préstamo (advance_loan) y las penalizaciones
+(process_loans) vienen de finance.loan_step, el mismo paso de turno que usan
+Debt, CompactDebt y PaymentAllocator. Las búsquedas y simulaciones pueden
+aplicar millones de transiciones por minuto sin tocar el juego interactivo.
+"""
+
+import random
+from typing import NamedTuple, Optional, Tuple
+import logging
+
+from finance.compact import CREDITOR_STRATEGIES
+from finance.debt import Debt
+from finance.loan_step import LoanState, advance_loan, apply_resources, from_debt, process_loans
+
+logger = logging.getLogger(__name__)
+
+# Costes de las acciones (GameLoop.start_mining_minigame / start_repair_minigame)
+ACTION_OXYGEN_COST = (12, 15)  # randint(12, 15) por minijuego con los costes por defecto
+# Oxígeno extra que puede costar un minijuego sobre el mínimo
+# (GameState.oxygen_cost_mining / oxygen_cost_repair)
+ACTION_OXYGEN_SPREAD = ACTION_OXYGEN_COST[1] - ACTION_OXYGEN_COST[0]
+REPAIR_MATERIAL_COST = (5, 10)  # randint(5, 10) por reparación
+MIN_MATERIALS_FOR_REPAIR = 5
+
+# Recompensas de los minijuegos cuando no se indica el resultado
+MINING_REWARD = (0, 7)  # Materiales obtenidos en Mineral Rush (0 a max_materials)
+REPAIR_REWARD = (5, 20)  # Progreso de Timing (5-15) y Wiring (10-20) con éxito
+VICTORY_REPAIR_PROGRESS = 100
+
+# Intercambio (HUD.confirm_exchange): 1 material = 5 oxígeno, hasta 100
+EXCHANGE_OXYGEN_PER_MATERIAL = 5
+EXCHANGE_OXYGEN_CAP = 100
+
+# Game over por deudas (GameState.check_game_over_conditions)
+DEBT_OXYGEN_THRESHOLD = 20
+DEBT_MATERIALS_MARGIN = 100
+
+MAX_ACTIVE_LOANS = 3
+
+# Tipos de acción
+MINE = 'mine'
+REPAIR = 'repair'
+EXCHANGE = 'exchange'
+OFFER = 'offer'
+ACCEPT = 'accept'
+REJECT = 'reject'
+PAY = 'pay'
+END_TURN = 'end_turn'
+
+
+class OfferState(NamedTuple):
+    """Oferta de préstamo pendiente"""
+    creditor: str
+    amount: float
+    turns: int
+    turn_rate: float
+
+
+class RulesState(NamedTuple):
+    """
+    Estado inmutable de una partida
+    
+    Atributos:
+        oxygen, max_oxygen: Oxígeno actual y máximo
+        materials, max_materials: Materiales actuales y límite
+        repair_progress: Progreso de reparación (0-100)
+        turn: Número de turno
+        oxygen_cost_per_turn: Consumo de oxígeno al terminar el turno
+        oxygen_cost_mining, oxygen_cost_repair: Oxígeno mínimo que cuesta cada minijuego
+        loans: Préstamos activos
+        pending_offer: Oferta de préstamo pendiente (o None)
+        game_over, victory, reason: Estado final de la partida
+        max_loans: Máximo de préstamos activos
+    """
+    oxygen: float = 100.0
+    max_oxygen: float = 100.0
+    materials: int = 0
+    max_materials: int = 999
+    repair_progress: float = 0.0
+    turn: int = 0
+    oxygen_cost_per_turn: float = 1.0
+    oxygen_cost_mining: float = ACTION_OXYGEN_COST[0]
+    oxygen_cost_repair: float = ACTION_OXYGEN_COST[0]
+    loans: Tuple[LoanState, ...] = ()
+    pending_offer: Optional[OfferState] = None
+    game_over: bool = False
+    victory: bool = False
+    reason: str = ""
+    max_loans: int = MAX_ACTIVE_LOANS
+
+
+class Action(NamedTuple):
+    """
+    Acción del jugador
+    
+    Atributos:
+        kind: MINE, REPAIR, EXCHANGE, OFFER, ACCEPT, REJECT, PAY o END_TURN
+        amount: Materiales a intercambiar/pagar u oxígeno ofrecido
+        index: Préstamo al que se paga (PAY)
+        creditor: Acreedor de la oferta (OFFER)
+        outcome: Recompensa del minijuego (None = se sortea con rng)
+    """
+    kind: str
+    amount: float = 0
+    index: int = 0
+    creditor: str = ''
+    outcome: Optional[float] = None
+
+
+def can_mine(state) -> bool:
+    """Si hay oxígeno para minar (acepta RulesState o GameState)"""
+    return state.oxygen >= state.oxygen_cost_mining
+
+
+def can_repair(state) -> bool:
+    """Si hay oxígeno y materiales para reparar (acepta RulesState o GameState)"""
+    return state.oxygen >= state.oxygen_cost_repair and state.materials >= MIN_MATERIALS_FOR_REPAIR
+
+
+def roll_action_oxygen(rng, minimum: float = ACTION_OXYGEN_COST[0]) -> int:
+    """Oxígeno que consume un minijuego (de `minimum` a `minimum` + ACTION_OXYGEN_SPREAD)"""
+    minimum = int(minimum)
+    return rng.randint(minimum, minimum + ACTION_OXYGEN_SPREAD)
+
+
+def roll_repair_materials(rng) -> int:
+    """Materiales que consume una reparación"""
+    return rng.randint(*REPAIR_MATERIAL_COST)
+
+
+def exchange_quote(oxygen: float, materials: int, amount: int) -> Tuple[int, int]:
+    """
+    Materiales que se venden y oxígeno que se obtiene al intercambiar
+    
+    Args:
+        oxygen: Oxígeno actual
+        materials: Materiales disponibles
+        amount: Materiales que el jugador quiere vender
+    
+    Returns:
+        (materiales vendidos, oxígeno obtenido); (0, 0) si no hay intercambio
+    """
+    if amount <= 0 or amount > materials or oxygen >= EXCHANGE_OXYGEN_CAP:
+        return 0, 0
+    
+    oxygen_gained = amount * EXCHANGE_OXYGEN_PER_MATERIAL
+    oxygen_available = EXCHANGE_OXYGEN_CAP - oxygen
+    if oxygen_gained > oxygen_available:
+        # Solo se vende lo necesario para llegar al máximo (redondeando hacia arriba)
+        oxygen_gained = int(oxygen_available)
+        amount = (oxygen_gained + EXCHANGE_OXYGEN_PER_MATERIAL - 1) // EXCHANGE_OXYGEN_PER_MATERIAL
+    return amount, oxygen_gained
+
+
+def is_debt_overwhelming(total_debt: float, materials: int, oxygen: float) -> bool:
+    """Si la deuda es impagable (poco oxígeno y deuda muy por encima de los materiales)"""
+    return oxygen < DEBT_OXYGEN_THRESHOLD and total_debt > materials + DEBT_MATERIALS_MARGIN
+
+
+def new_loan(creditor: str, amount: float, turns: Optional[int] = None,
+             turn_rate: Optional[float] = None) -> LoanState:
+    """Préstamo recién aceptado (mismas reglas que CompactDebt)"""
+    strategy = CREDITOR_STRATEGIES[creditor]
+    if strategy.max_principal is not None:
+        amount = min(amount, strategy.max_principal)
+    owed = int(amount * (1 + strategy.interest_rate))
+    return LoanState(creditor, amount, owed, 0.0, owed,
+                     strategy.default_terms if turns is None else turns,
+                     strategy.default_turn_rate if turn_rate is None else turn_rate)
+
+
+def total_debt(state: RulesState) -> int:
+    """Materiales adeudados en todos los préstamos"""
+    return sum(loan.materials_owed for loan in state.loans)
+
+
+def _with_oxygen(state: RulesState, delta: float) -> RulesState:
+    """GameState.update_oxygen: limita a [0, max_oxygen] y agota -> game over"""
+    oxygen = max(0, min(state.max_oxygen, state.oxygen + delta))
+    if oxygen <= 0:
+        return state._replace(oxygen=oxygen, game_over=True, reason=state.reason or 'oxygen_depleted')
+    return state._replace(oxygen=oxygen)
+
+
+def _with_repair(state: RulesState, delta: float) -> RulesState:
+    """GameState.update_repair_progress: limita a [0, 100] y completa -> victoria"""
+    progress = max(0, min(VICTORY_REPAIR_PROGRESS, state.repair_progress + delta))
+    return state._replace(repair_progress=progress,
+                          victory=state.victory or progress >= VICTORY_REPAIR_PROGRESS)
+
+
+def _mine(state: RulesState, action: Action, rng) -> RulesState:
+    if not can_mine(state):
+        return state
+    state = _with_oxygen(state, -roll_action_oxygen(rng, state.oxygen_cost_mining))
+    reward = action.outcome if action.outcome is not None else rng.randint(*MINING_REWARD)
+    if reward > 0:
+        state = state._replace(materials=min(state.materials + int(reward), state.max_materials))
+    return state
+
+
+def _repair(state: RulesState, action: Action, rng) -> RulesState:
+    if not can_repair(state):
+        return state
+    state = _with_oxygen(state, -roll_action_oxygen(rng, state.oxygen_cost_repair))
+    cost = roll_repair_materials(rng)
+    if state.materials >= cost:
+        state = state._replace(materials=state.materials - cost)
+    reward = action.outcome if action.outcome is not None else rng.randint(*REPAIR_REWARD)
+    if reward > 0:
+        state = _with_repair(state, reward)
+    return state
+
+
+def _exchange(state: RulesState, action: Action, rng) -> RulesState:
+    sold, gained = exchange_quote(state.oxygen, state.materials, int(action.amount))
+    if sold <= 0:
+        return state
+    return _with_oxygen(state._replace(materials=state.materials - sold), gained)
+
+
+def _offer(state: RulesState, action: Action, rng) -> RulesState:
+    strategy = CREDITOR_STRATEGIES[action.creditor]
+    turns = action.index or strategy.default_terms
+    return state._replace(pending_offer=OfferState(action.creditor, action.amount, turns,
+                                                   strategy.default_turn_rate))
+
+
+def _accept(state: RulesState, action: Action, rng) -> RulesState:
+    offer = state.pending_offer
+    if offer is None:
+        return state
+    if len(state.loans) >= state.max_loans:
+        return state._replace(pending_offer=None)
+    loan = new_loan(offer.creditor, offer.amount, offer.turns, offer.turn_rate)
+    state = state._replace(loans=state.loans + (loan,), pending_offer=None)
+    return _with_oxygen(state, offer.amount)
+
+
+def _reject(state: RulesState, action: Action, rng) -> RulesState:
+    return state._replace(pending_offer=None)
+
+
+def _pay(state: RulesState, action: Action, rng) -> RulesState:
+    """LoanManager.make_payment: paga `amount` materiales al préstamo `index`"""
+    amount = int(action.amount)
+    if amount <= 0 or state.materials < amount or not 0 <= action.index < len(state.loans):
+        return state
+    loan = state.loans[action.index]
+    owed = max(0, loan.materials_owed - amount)
+    if owed <= 0:
+        loans = state.loans[:action.index] + state.loans[action.index + 1:]
+    else:
+        loans = (state.loans[:action.index] + (loan._replace(materials_owed=owed),) +
+                 state.loans[action.index + 1:])
+    return state._replace(materials=state.materials - amount, loans=loans)
+
+
+def _end_turn(state: RulesState, action: Action, rng) -> RulesState:
+    """GameState.advance_turn: consumo de oxígeno, préstamos y condiciones de fin"""
+    state = _with_oxygen(state._replace(turn=state.turn + 1), -state.oxygen_cost_per_turn)
+    state = process_loans(state)
+    
+    if state.oxygen <= 0:
+        return state._replace(game_over=True, reason=state.reason or 'oxygen_depleted')
+    if is_debt_overwhelming(total_debt(state), state.materials, state.oxygen):
+        return state._replace(game_over=True, reason=state.reason or 'debt_overwhelming')
+    if state.repair_progress >= VICTORY_REPAIR_PROGRESS:
+        return state._replace(victory=True)
+    return state
+
+
+_HANDLERS = {
+    MINE: _mine,
+    REPAIR: _repair,
+    EXCHANGE: _exchange,
+    OFFER: _offer,
+    ACCEPT: _accept,
+    REJECT: _reject,
+    PAY: _pay,
+    END_TURN: _end_turn,
+}
+
+
+def is_terminal(state: RulesState) -> bool:
+    """Si la partida ha terminado (game over o victoria)"""
+    return state.game_over or state.victory
+
+
+def transition(state: RulesState, action: Action, rng: Optional[random.Random] = None) -> RulesState:
+    """
+    Aplica una acción y devuelve el estado siguiente
+    
+    Las acciones no permitidas (sin oxígeno, sin materiales, sin oferta...)
+    devuelven el mismo estado. Los estados terminales no cambian.
+    
+    Args:
+        state: Estado actual (no se modifica)
+        action: Acción a aplicar
+        rng: Generador para costes y recompensas (None = módulo random)
+    
+    Returns:
+        Nuevo estado
+    """
+    if state.game_over or state.victory:
+        return state
+    handler = _HANDLERS.get(action.kind)
+    if handler is None:
+        raise ValueError(f"Acción desconocida: {action.kind}")
+    return handler(state, action, rng or random)
+
+
+def legal_actions(state: RulesState) -> Tuple[Action, ...]:
+    """
+    Acciones que cambian el estado (para búsquedas y simulaciones)
+    
+    Los pagos posibles son el pago mínimo de cada préstamo y la deuda completa;
+    el intercambio vende lo necesario para llenar el oxígeno.
+    """
+    if is_terminal(state):
+        return ()
+    if state.pending_offer is not None:
+        return (Action(ACCEPT), Action(REJECT))
+    
+    actions = [Action(END_TURN)]
+    if can_mine(state):
+        actions.append(Action(MINE))
+    if can_repair(state):
+        actions.append(Action(REPAIR))
+    if state.materials > 0 and state.oxygen < EXCHANGE_OXYGEN_CAP:
+        actions.append(Action(EXCHANGE, state.materials))
+    for index, loan in enumerate(state.loans):
+        minimum = minimum_payment(loan)
+        for amount in sorted({minimum, loan.materials_owed}):
+            if 0 < amount <= state.materials:
+                actions.append(Action(PAY, amount, index))
+    return tuple(actions)
+
+
+def minimum_payment(loan: LoanState) -> int:
+    """Debt.get_minimum_payment"""
+    return Debt._minimum_payment_for(loan.materials_owed, loan.turns_until_due)
+
+
+def from_game_state(game_state, loan_manager=None) -> RulesState:
+    """
+    Copia el estado de la partida en curso
+    
+    Args:
+        game_state: GameState
+        loan_manager: LoanManager (None = game_state.loan_manager)
+    """
+    loan_manager = loan_manager or getattr(game_state, 'loan_manager', None)
+    loans = ()
+    pending = None
+    if loan_manager is not None:
+        loans = tuple(from_debt(loan) for loan in loan_manager.active_loans)
+        offer = loan_manager.pending_offer
+        if offer:
+            terms = loan_manager.offer_engine.get_creditor(offer['creditor_type'])
+            pending = OfferState(offer['creditor_type'], offer['amount'], offer['turns_to_pay'],
+                                 terms.turn_rate)
+    return RulesState(
+        oxygen=game_state.oxygen,
+        max_oxygen=game_state.max_oxygen,
+        materials=game_state.materials,
+        max_materials=game_state.max_materials,
+        repair_progress=game_state.repair_progress,
+        turn=game_state.turn_number,
+        oxygen_cost_per_turn=game_state.oxygen_cost_per_turn,
+        oxygen_cost_mining=game_state.oxygen_cost_mining,
+        oxygen_cost_repair=game_state.oxygen_cost_repair,
+        loans=loans,
+        pending_offer=pending,
+        game_over=game_state.game_over,
+        victory=game_state.victory,
+        reason=game_state.game_over_reason or "",
+        max_loans=loan_manager.max_loans if loan_manager is not None else MAX_ACTIVE_LOANS
+    )
+
+
+def apply_to_game(game_state, before: RulesState, after: RulesState) -> None:
+    """
+    Copia en la partida el resultado de una transición (inverso de from_game_state)
+    
+    Los cambios pasan por los métodos de GameState (update_oxygen,
+    consume_materials...), que registran la traza y las versiones y detectan
+    el fin de partida. El turno lo lleva GameState.advance_turn y los
+    préstamos LoanManager.apply_turn.
+    
+    Args:
+        game_state: GameState (o un objeto con los mismos métodos)
+        before: Estado del que partió la transición
+        after: Estado que devolvió transition
+    """
+    apply_resources(game_state, before, after)
+    
+    if after.game_over and not before.game_over:
+        game_state.trigger_game_over(after.reason)
+    elif after.victory and not before.victory:
+        game_state.trigger_victory()
@@ -1,14 +1,30 @@
 """
 GameState - Gestión del Estado del Juego
 Mantiene el estado global del juego incluyendo recursos, progreso y condiciones de victoria/derrota
+
+Cada cambio real del estado incrementa un contador global (version) y anota
+ese valor en su grupo de campos. Los consumidores guardan la versión que
+vieron y preguntan changed_since(version) antes de recalcular nada.
 """
 
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 import logging
 
+from .trace import record, TraceKind
+
 logger = logging.getLogger(__name__)
 
+# Grupos de campos con versión propia
+STATE_GROUPS = (
+    'oxygen',     # oxygen, max_oxygen
+    'materials',  # materials, max_materials
+    'repair',     # repair_progress
+    'turn',       # turn_number
+    'status',     # game_over, victory, current_phase
+    'loans',      # préstamos activos (marcado por LoanManager)
+)
+
 
 @dataclass
 class GameState:
@@ -26,6 +42,7 @@ class GameState:
         turn_number: Número del turno actual
         game_over: Estado del juego (True si terminó)
         victory: True si el jugador ganó
+        version: Contador global de cambios (ver changed_since)
     """
     
     config: Dict[str, Any] = field(default_factory=dict)
@@ -54,6 +71,11 @@ class GameState:
     # Sistema de prestamista
     prestamista_shown: bool = False  # Flag para mostrar prestamista solo una vez
     
+    # Versiones de cambios (no forman parte del constructor ni de la comparación)
+    version: int = field(default=0, init=False, repr=False, compare=False)
+    _group_versions: Dict[str, int] = field(default_factory=lambda: dict.fromkeys(STATE_GROUPS, 0),
+                                            init=False, repr=False, compare=False)
+    
     # Referencias a otros managers (se inicializan después)
     loan_manager = None
     resource_manager = None
@@ -72,6 +94,41 @@ class GameState:
             
         logger.info(f"GameState inicializado: Oxígeno={self.oxygen}, Materiales={self.materials}")
     
+    def mark_changed(self, *groups: str) -> int:
+        """
+        Registra un cambio en uno o varios grupos de campos
+        
+        Necesario solo cuando se asignan campos directamente (los métodos de
+        GameState ya lo llaman).
+        
+        Args:
+            groups: Grupos de STATE_GROUPS (ninguno = todos)
+            
+        Returns:
+            Nueva versión global
+        """
+        self.version += 1
+        for group in groups or STATE_GROUPS:
+            self._group_versions[group] = self.version
+        return self.version
+    
+    def get_version(self, group: Optional[str] = None) -> int:
+        """Versión global o de un grupo (última versión global en que cambió)"""
+        return self.version if group is None else self._group_versions[group]
+    
+    def changed_since(self, version: int, *groups: str) -> bool:
+        """
+        Indica si el estado cambió después de `version`
+        
+        Args:
+            version: Versión global guardada por el consumidor
+            groups: Grupos que interesan (ninguno = cualquiera)
+        """
+        if not groups:
+            return self.version > version
+        versions = self._group_versions
+        return any(versions[group] > version for group in groups)
+    
     def update_oxygen(self, delta: float) -> bool:
         """
         Actualiza el nivel de oxígeno (moneda del juego)
@@ -86,7 +143,8 @@ class GameState:
         self.oxygen = max(0, min(self.max_oxygen, self.oxygen + delta))
         
         if self.oxygen != old_oxygen:
-            logger.info(f"Oxígeno actualizado: {old_oxygen:.1f} -> {self.oxygen:.1f}")
+            self.mark_changed('oxygen')
+            record(TraceKind.OXYGEN_UPDATED, 0, 0, old_oxygen, self.oxygen)
             
         # Verificar condición de game over
         if self.oxygen <= 0:
@@ -109,8 +167,10 @@ class GameState:
         added = min(amount, self.max_materials - self.materials)
         self.materials = min(self.materials + amount, self.max_materials)
         
+        if self.materials != old_materials:
+            self.mark_changed('materials')
         if added > 0:
-            logger.info(f"Materiales añadidos: +{added} (Total: {self.materials})")
+            record(TraceKind.MATERIALS_ADDED, 0, added, self.materials)
             
         return added
     
@@ -126,10 +186,12 @@ class GameState:
         """
         if self.materials >= amount:
             self.materials -= amount
-            logger.info(f"Materiales consumidos: -{amount} (Total: {self.materials})")
+            if amount:
+                self.mark_changed('materials')
+            record(TraceKind.MATERIALS_CONSUMED, 0, amount, self.materials)
             return True
         else:
-            logger.warning(f"Materiales insuficientes: Necesarios={amount}, Disponibles={self.materials}")
+            record(TraceKind.MATERIALS_INSUFFICIENT, 0, amount, self.materials)
             return False
     
     def update_repair_progress(self, delta: float) -> None:
@@ -143,7 +205,8 @@ class GameState:
         self.repair_progress = max(0, min(100, self.repair_progress + delta))
         
         if self.repair_progress != old_progress:
-            logger.info(f"Progreso de reparación: {old_progress:.1f}% -> {self.repair_progress:.1f}%")
+            self.mark_changed('repair')
+            record(TraceKind.REPAIR_PROGRESS, 0, 0, old_progress, self.repair_progress)
             
         # Verificar condición de victoria
         if self.repair_progress >= 100 and not self.victory:
@@ -153,19 +216,26 @@ class GameState:
         """
         Avanza un turno en el juego
         Sistema basado en acciones, no en tiempo real
+        
+        El consumo de oxígeno, los préstamos y las condiciones de fin los
+        calcula engine.rules.transition; aquí solo se copia el resultado.
         """
-        self.turn_number += 1
-        logger.info(f"=== Turno {self.turn_number} ===")
+        from . import rules  # rules importa finance, que importa engine
+        
+        before = rules.from_game_state(self)
+        after = rules.transition(before, rules.Action(rules.END_TURN))
+        if after is before:
+            return
         
-        # Consumir oxígeno por turno (costo de supervivencia)
-        self.update_oxygen(-self.oxygen_cost_per_turn)
+        self.turn_number = after.turn
+        self.mark_changed('turn')
+        record(TraceKind.TURN_STARTED, 0, self.turn_number)
+        logger.info(f"=== Turno {self.turn_number} ===")
         
-        # Procesar préstamos si existen
+        # Préstamos (ledger, eventos) y recursos (oxígeno por turno, penalizaciones)
         if self.loan_manager:
-            self.loan_manager.process_turn()
-        
-        # Verificar condiciones del juego
-        self.check_game_over_conditions()
+            self.loan_manager.apply_turn(after.loans)
+        rules.apply_to_game(self, before, after)
     
     def check_game_over_conditions(self) -> None:
         """Verifica las condiciones de game over y victoria"""
@@ -176,12 +246,12 @@ class GameState:
             
         # Game Over por deudas impagables
         if self.loan_manager:
+            from .rules import is_debt_overwhelming
             total_debt = self.loan_manager.get_total_debt_in_materials()
-            if total_debt > self.materials + 50:  # Margen de 50 materiales
-                # Solo si el oxígeno es muy bajo y no puede recuperarse
-                if self.oxygen < 20 and total_debt > self.materials + 100:
-                    self.trigger_game_over("debt_overwhelming")
-                    return
+            # Solo si el oxígeno es muy bajo y no puede recuperarse
+            if is_debt_overwhelming(total_debt, self.materials, self.oxygen):
+                self.trigger_game_over("debt_overwhelming")
+                return
         
         # Victoria por reparación completa
         if self.repair_progress >= 100:
@@ -193,6 +263,7 @@ class GameState:
             self.game_over = True
             self.game_over_reason = reason
             self.current_phase = "end"
+            self.mark_changed('status')
             logger.info(f"GAME OVER: {reason}")
     
     def trigger_victory(self) -> None:
@@ -200,6 +271,7 @@ class GameState:
         if not self.victory:
             self.victory = True
             self.current_phase = "end"
+            self.mark_changed('status')
             logger.info("\u00a1VICTORIA! Nave reparada al 100%")
     
     def can_afford_action(self, action: str) -> bool:
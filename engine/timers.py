@@ -0,0 +1,167 @@
+"""
+Timers - Planificador de temporizadores del juego
+Montículo (heapq) de plazos con callbacks. Los componentes registran cuándo
+debe pasar algo (caducar una notificación, terminar un shake, habilitar el
+input del prestamista) y el bucle solo ejecuta los plazos vencidos en cada
+frame, en vez de que cada componente sondee sus contadores.
+
+El tiempo es de juego: avanza con el delta_time que pasa el bucle, así que
+es determinista en pruebas y no corre mientras el bucle está detenido.
+"""
+
+import heapq
+from typing import Any, Callable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Timer:
+    """
+    Temporizador registrado en un TimerScheduler
+    
+    Attributes:
+        deadline: Instante (tiempo de juego) en que vence
+        callback: Función a llamar al vencer
+        args: Argumentos del callback
+        active: False si ya venció o se canceló
+    """
+    
+    __slots__ = ('deadline', 'callback', 'args', 'active', '_scheduler')
+    
+    def __init__(self, scheduler: 'TimerScheduler', deadline: float,
+                 callback: Callable[..., Any], args: Tuple):
+        self._scheduler = scheduler
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.active = True
+    
+    def cancel(self) -> None:
+        """Cancela el temporizador (no hace nada si ya venció)"""
+        if self.active:
+            self.active = False
+            self._scheduler._on_cancel()
+    
+    @property
+    def remaining(self) -> float:
+        """Segundos de juego que faltan para que venza"""
+        return max(0.0, self.deadline - self._scheduler.now)
+
+
+class TimerScheduler:
+    """
+    Planificador de temporizadores basado en un montículo
+    
+    Responsabilidades:
+        - Registrar plazos con callback (schedule)
+        - Ejecutar en orden los plazos vencidos al avanzar el tiempo (advance)
+        - Informar del próximo plazo para que el bucle no duerma de más
+    
+    Las cancelaciones son perezosas: el temporizador se marca inactivo y se
+    descarta al llegar a la cima del montículo. Si se acumulan muchas, el
+    montículo se reconstruye.
+    
+    Dependencias:
+        - Ninguna (lo avanza engine.loop.GameLoop)
+    """
+    
+    # Reconstruir el montículo si más de la mitad de sus entradas están canceladas
+    COMPACT_MIN_SIZE = 64
+    
+    def __init__(self):
+        """Inicializa el planificador con el reloj en 0"""
+        self.now = 0.0
+        self._heap: List[Tuple[float, int, Timer]] = []
+        self._sequence = 0
+        self._cancelled = 0
+    
+    def schedule(self, delay: float, callback: Callable[..., Any], *args: Any) -> Timer:
+        """
+        Registra un callback para dentro de `delay` segundos de juego
+        
+        Args:
+            delay: Segundos hasta el vencimiento (negativo cuenta como 0)
+            callback: Función a llamar
+            *args: Argumentos del callback
+        
+        Returns:
+            Temporizador, que puede cancelarse con cancel()
+        """
+        timer = Timer(self, self.now + max(0.0, delay), callback, args)
+        # La secuencia desempata plazos iguales en orden de registro
+        heapq.heappush(self._heap, (timer.deadline, self._sequence, timer))
+        self._sequence += 1
+        return timer
+    
+    def advance(self, delta_time: float) -> int:
+        """
+        Avanza el reloj y ejecuta los temporizadores vencidos
+        
+        Los temporizadores que registre un callback se ejecutan como pronto
+        en el siguiente avance, aunque su plazo sea 0 (así un callback que se
+        reprograma a sí mismo no bloquea el bucle).
+        
+        Args:
+            delta_time: Segundos de juego transcurridos
+        
+        Returns:
+            Número de callbacks ejecutados
+        """
+        self.now += delta_time
+        limit = self._sequence
+        fired = 0
+        
+        # self._heap se relee en cada vuelta: una cancelación dentro de un
+        # callback puede compactarlo y sustituir la lista
+        while self._heap and self._heap[0][0] <= self.now:
+            _, sequence, timer = self._heap[0]
+            if sequence >= limit:
+                break
+            heapq.heappop(self._heap)
+            if not timer.active:
+                self._cancelled -= 1
+                continue
+            
+            timer.active = False
+            fired += 1
+            try:
+                timer.callback(*timer.args)
+            except Exception as e:
+                logger.error(f"Error en temporizador {getattr(timer.callback, '__name__', timer.callback)}: {e}")
+        
+        return fired
+    
+    def time_until_next(self) -> Optional[float]:
+        """
+        Segundos hasta el próximo temporizador activo
+        
+        Returns:
+            Tiempo restante (0 si ya venció) o None si no hay ninguno
+        """
+        heap = self._heap
+        while heap and not heap[0][2].active:
+            heapq.heappop(heap)
+            self._cancelled -= 1
+        if not heap:
+            return None
+        return max(0.0, heap[0][0] - self.now)
+    
+    def clear(self) -> None:
+        """Cancela todos los temporizadores pendientes"""
+        for _, _, timer in self._heap:
+            timer.active = False
+        self._heap.clear()
+        self._cancelled = 0
+    
+    def __len__(self) -> int:
+        """Número de temporizadores activos"""
+        return len(self._heap) - self._cancelled
+    
+    def _on_cancel(self) -> None:
+        """Lleva la cuenta de cancelaciones y compacta el montículo si hace falta"""
+        self._cancelled += 1
+        if len(self._heap) >= self.COMPACT_MIN_SIZE and self._cancelled * 2 > len(self._heap):
+            self._heap = [entry for entry in self._heap if entry[2].active]
+            heapq.heapify(self._heap)
+            self._cancelled = 0
@@ -0,0 +1,370 @@
+"""
+Trace - Registro binario de eventos de bajo coste
+Sustituye a los logger.info con f-strings de las rutas calientes (GameState,
+Debt, LoanManager). Cada evento es un registro de tamaño fijo empaquetado con
+struct en un buffer circular preasignado; un hilo de fondo vacía el buffer
+periódicamente y escribe bloques comprimidos con zlib en disco. Con la
+traza desactivada, registrar un evento cuesta una comparación con None.
+
+Formato del archivo:
+    MAGIC (8 bytes) + tamaño de registro (uint16)
+    Bloques: longitud comprimida (uint32) + registros (uint32) + datos zlib
+
+Uso del decodificador:
+    python -m engine.trace data/trace.bin --format csv --output trace.csv
+"""
+
+import argparse
+import csv
+import struct
+import sys
+import threading
+import time
+import zlib
+from enum import IntEnum
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'ADTRACE1'
+HEADER = struct.Struct('<8sH')
+FRAME = struct.Struct('<II')
+
+# Registro: instante, tipo, sujeto (p.ej. código de acreedor), valor entero, dos valores reales
+RECORD = struct.Struct('<dHHidd')
+RECORD_FIELDS = ('time', 'kind', 'subject', 'value', 'a', 'b')
+
+DEFAULT_CAPACITY = 65536  # Registros en el buffer circular (2 MB)
+DEFAULT_FLUSH_INTERVAL = 0.5  # Segundos entre vaciados
+COMPRESSION_LEVEL = 1  # zlib rápido: el hilo de fondo no debe competir con el juego
+
+
+class TraceKind(IntEnum):
+    """Tipos de evento de la traza"""
+    OXYGEN_UPDATED = 1
+    MATERIALS_ADDED = 2
+    MATERIALS_CONSUMED = 3
+    MATERIALS_INSUFFICIENT = 4
+    REPAIR_PROGRESS = 5
+    TURN_STARTED = 6
+    DEBT_CREATED = 10
+    DEBT_PAYMENT = 11
+    DEBT_PAID_OFF = 12
+    DEBT_DEFAULTED = 13
+    LOAN_OFFERED = 20
+    LOAN_ACCEPTED = 21
+    LOAN_REJECTED = 22
+    LOAN_OVERDUE = 23
+    LOAN_PAYMENT_FAILED = 24
+    PENALTY_APPLIED = 25
+    AUTO_PAY = 26
+
+
+# Significado de (subject, value, a, b) para cada tipo (None = no se usa)
+KIND_LAYOUTS: Dict[TraceKind, Tuple[Optional[str], ...]] = {
+    TraceKind.OXYGEN_UPDATED: (None, None, 'old', 'new'),
+    TraceKind.MATERIALS_ADDED: (None, 'added', 'total', None),
+    TraceKind.MATERIALS_CONSUMED: (None, 'consumed', 'total', None),
+    TraceKind.MATERIALS_INSUFFICIENT: (None, 'required', 'available', None),
+    TraceKind.REPAIR_PROGRESS: (None, None, 'old', 'new'),
+    TraceKind.TURN_STARTED: (None, 'turn', None, None),
+    TraceKind.DEBT_CREATED: ('creditor', 'materials_owed', 'principal', None),
+    TraceKind.DEBT_PAYMENT: ('creditor', 'paid', 'remaining', None),
+    TraceKind.DEBT_PAID_OFF: ('creditor', None, None, None),
+    TraceKind.DEBT_DEFAULTED: ('creditor', 'materials_owed', None, None),
+    TraceKind.LOAN_OFFERED: ('creditor', 'amount', 'materials_to_pay', None),
+    TraceKind.LOAN_ACCEPTED: ('creditor', 'amount', 'materials_owed', None),
+    TraceKind.LOAN_REJECTED: ('creditor', 'amount', None, None),
+    TraceKind.LOAN_OVERDUE: ('creditor', 'materials_owed', None, None),
+    TraceKind.LOAN_PAYMENT_FAILED: (None, 'required', 'available', None),
+    TraceKind.PENALTY_APPLIED: ('creditor', 'materials_lost', 'oxygen_lost', 'repair_lost'),
+    TraceKind.AUTO_PAY: (None, 'paid', 'loans', None),
+}
+
+
+class TraceBuffer:
+    """
+    Buffer circular de registros de tamaño fijo
+    
+    Si el productor da la vuelta antes de que el hilo de fondo vacíe el
+    buffer, se sobrescriben los registros más antiguos (se cuentan en dropped).
+    """
+    
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity: Número máximo de registros sin vaciar
+        """
+        self.capacity = capacity
+        self._data = bytearray(capacity * RECORD.size)
+        self._written = 0  # Registros escritos (monótono)
+        self._drained = 0  # Registros ya vaciados (monótono)
+        self.dropped = 0
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return self._written - self._drained
+    
+    def append(self, kind: int, subject: int, value: int, a: float, b: float) -> None:
+        """Añade un registro (sobrescribe el más antiguo si el buffer está lleno)"""
+        with self._lock:
+            if self._written - self._drained >= self.capacity:
+                self._drained += 1
+                self.dropped += 1
+            RECORD.pack_into(self._data, (self._written % self.capacity) * RECORD.size,
+                             time.time(), kind, subject, value, a, b)
+            self._written += 1
+    
+    def drain(self) -> Tuple[bytes, int]:
+        """
+        Extrae los registros pendientes en orden
+        
+        Returns:
+            (bytes de los registros, número de registros)
+        """
+        with self._lock:
+            count = self._written - self._drained
+            if count == 0:
+                return b'', 0
+            start = (self._drained % self.capacity) * RECORD.size
+            end = start + count * RECORD.size
+            if end <= len(self._data):
+                data = bytes(self._data[start:end])
+            else:
+                data = bytes(self._data[start:]) + bytes(self._data[:end - len(self._data)])
+            self._drained = self._written
+            return data, count
+
+
+class TraceWriter:
+    """
+    Hilo de fondo que vacía un TraceBuffer en un archivo comprimido
+    
+    Atributos:
+        path: Archivo de salida (se sobrescribe al arrancar)
+        buffer: Buffer circular que se vacía
+        flush_interval: Segundos entre vaciados
+        records_written: Registros escritos en disco
+    """
+    
+    def __init__(self, path: str, buffer: TraceBuffer,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.path = path
+        self.buffer = buffer
+        self.flush_interval = flush_interval
+        self.records_written = 0
+        self._file = None
+        self._file_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Abre el archivo, escribe la cabecera y arranca el hilo"""
+        self._file = open(self.path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, RECORD.size))
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="TraceWriter", daemon=True)
+        self._thread.start()
+    
+    def _run(self) -> None:
+        """Bucle del hilo de fondo"""
+        while not self._stopping.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error al escribir la traza: {e}", exc_info=True)
+    
+    def flush(self) -> int:
+        """
+        Escribe en disco los registros pendientes como un bloque comprimido
+        
+        Returns:
+            Registros escritos en este bloque
+        """
+        with self._file_lock:
+            if self._file is None:
+                return 0
+            data, count = self.buffer.drain()
+            if count:
+                payload = zlib.compress(data, COMPRESSION_LEVEL)
+                self._file.write(FRAME.pack(len(payload), count))
+                self._file.write(payload)
+                self._file.flush()
+                self.records_written += count
+            return count
+    
+    def stop(self) -> None:
+        """Detiene el hilo, escribe lo pendiente y cierra el archivo"""
+        self._stopping.set()
+        if self._thread:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self.flush()
+        with self._file_lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
+# Traza activa (None = desactivada; record no hace nada)
+_buffer: Optional[TraceBuffer] = None
+_writer: Optional[TraceWriter] = None
+
+
+def record(kind: int, subject: int = 0, value: int = 0, a: float = 0.0, b: float = 0.0) -> None:
+    """Registra un evento en la traza activa (no hace nada si está desactivada)"""
+    buffer = _buffer
+    if buffer is not None:
+        buffer.append(kind, subject, value, a, b)
+
+
+def is_enabled() -> bool:
+    """True si hay una traza activa"""
+    return _buffer is not None
+
+
+def start_tracing(path: str, capacity: int = DEFAULT_CAPACITY,
+                  flush_interval: float = DEFAULT_FLUSH_INTERVAL) -> TraceWriter:
+    """
+    Activa la traza global escribiendo en `path`
+    
+    Returns:
+        Escritor en segundo plano
+    """
+    global _buffer, _writer
+    stop_tracing()
+    buffer = TraceBuffer(capacity)
+    writer = TraceWriter(path, buffer, flush_interval)
+    writer.start()
+    _buffer, _writer = buffer, writer
+    logger.info(f"Traza binaria activada: {path} ({capacity} registros en memoria)")
+    return writer
+
+
+def stop_tracing() -> None:
+    """Desactiva la traza global y vacía lo pendiente en disco"""
+    global _buffer, _writer
+    writer, buffer = _writer, _buffer
+    _buffer, _writer = None, None
+    if writer:
+        writer.stop()
+        logger.info(f"Traza binaria cerrada: {writer.records_written} registros"
+                    f"{f', {buffer.dropped} descartados' if buffer.dropped else ''}")
+
+
+def start_from_config(config: Optional[Dict[str, Any]]) -> Optional[TraceWriter]:
+    """Activa la traza si la sección 'trace' de config.json lo indica"""
+    section = (config or {}).get('trace', {})
+    if not section.get('enabled', False):
+        return None
+    return start_tracing(section.get('path', 'data/trace.bin'),
+                         section.get('capacity', DEFAULT_CAPACITY),
+                         section.get('flush_interval', DEFAULT_FLUSH_INTERVAL))
+
+
+def read_trace(path: str) -> Iterator[Tuple[float, int, int, int, float, float]]:
+    """
+    Lee los registros de un archivo de traza en orden
+    
+    Yields:
+        Tuplas (time, kind, subject, value, a, b)
+    """
+    with open(path, 'rb') as trace_file:
+        header = trace_file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"Archivo de traza vacío o truncado: {path}")
+        magic, record_size = HEADER.unpack(header)
+        if magic != MAGIC or record_size != RECORD.size:
+            raise ValueError(f"Formato de traza no reconocido: {path}")
+        
+        while True:
+            frame = trace_file.read(FRAME.size)
+            if len(frame) < FRAME.size:
+                return
+            length, count = FRAME.unpack(frame)
+            payload = trace_file.read(length)
+            if len(payload) < length:
+                logger.warning(f"Último bloque de la traza truncado ({count} registros perdidos)")
+                return
+            yield from RECORD.iter_unpack(zlib.decompress(payload))
+
+
+def _creditor_names() -> Dict[int, str]:
+    """Código de acreedor -> clave (finance.portfolio), si está disponible"""
+    try:
+        from finance.portfolio import CREDITOR_CODES
+    except ImportError:
+        return {}
+    return {code: key for key, code in CREDITOR_CODES.items()}
+
+
+def decode_record(row: Tuple[float, int, int, int, float, float],
+                  creditors: Dict[int, str]) -> Dict[str, Any]:
+    """Convierte un registro en un diccionario con los nombres de su tipo"""
+    timestamp, kind, subject, value, a, b = row
+    try:
+        kind = TraceKind(kind)
+        layout = KIND_LAYOUTS.get(kind, (None, None, None, None))
+        name = kind.name
+    except ValueError:
+        layout, name = ('subject', 'value', 'a', 'b'), f"UNKNOWN_{kind}"
+    
+    decoded = {'time': timestamp, 'kind': name}
+    for label, raw in zip(layout, (subject, value, a, b)):
+        if label == 'creditor':
+            decoded[label] = creditors.get(raw, raw)
+        elif label:
+            decoded[label] = raw
+    return decoded
+
+
+def write_text(rows: Iterator[Tuple], output: TextIO) -> int:
+    """Escribe la traza como texto legible; devuelve el número de registros"""
+    creditors = _creditor_names()
+    count = 0
+    for row in rows:
+        decoded = decode_record(row, creditors)
+        stamp = time.strftime('%H:%M:%S', time.localtime(decoded.pop('time')))
+        fields = ' '.join(f"{key}={value:g}" if isinstance(value, float) else f"{key}={value}"
+                          for key, value in decoded.items() if key != 'kind')
+        output.write(f"{stamp} {decoded['kind']:<22} {fields}\n")
+        count += 1
+    return count
+
+
+def write_csv(rows: Iterator[Tuple], output: TextIO) -> int:
+    """Escribe los registros en CSV (columnas fijas); devuelve el número de registros"""
+    writer = csv.writer(output)
+    writer.writerow(RECORD_FIELDS)
+    count = 0
+    for timestamp, kind, subject, value, a, b in rows:
+        try:
+            kind_name = TraceKind(kind).name
+        except ValueError:
+            kind_name = str(kind)
+        writer.writerow((f"{timestamp:.6f}", kind_name, subject, value, a, b))
+        count += 1
+    return count
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Decodificador de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Decodifica una traza binaria de AstroDebt")
+    parser.add_argument('path', help="Archivo de traza (p.ej. data/trace.bin)")
+    parser.add_argument('--format', choices=('text', 'csv'), default='text', help="Formato de salida")
+    parser.add_argument('--output', help="Archivo de salida (por defecto, salida estándar)")
+    args = parser.parse_args(argv)
+    
+    write = write_csv if args.format == 'csv' else write_text
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as output:
+            count = write(read_trace(args.path), output)
+        print(f"{count} registros escritos en {args.output}")
+    else:
+        write(read_trace(args.path), sys.stdout)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
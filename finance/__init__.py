@@ -5,6 +5,12 @@ Módulo que gestiona el sistema financiero del juego: préstamos, deudas y acree
 
 from .debt import Debt, ZorvaxDebt, KtarDebt, NebulaConsortiumDebt
 from .loan_manager import LoanManager
+from .portfolio import LoanPortfolio
+from .offers import LenderOfferEngine
+from .allocator import PaymentAllocator
+from .ledger import LoanLedger
+from .compact import CompactDebt
+from .loan_step import LoanState
 
-__all__ = ['Debt', 'ZorvaxDebt', 'KtarDebt', 'NebulaConsortiumDebt', 'LoanManager']
+__all__ = ['Debt', 'ZorvaxDebt', 'KtarDebt', 'NebulaConsortiumDebt', 'LoanManager', 'LoanPortfolio', 'LenderOfferEngine', 'PaymentAllocator', 'LoanLedger', 'CompactDebt', 'LoanState']
 
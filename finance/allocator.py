@@ -0,0 +1,158 @@
+"""
+Allocator - Reparto óptimo de materiales entre préstamos
+Dado el material disponible y los préstamos activos, calcula cuánto pagar a
+cada uno este turno para minimizar el coste esperado de las penalizaciones
+(robo de Zorvax, pérdida de capacidad de K'tar, sabotaje de la Nebulosa)
+durante el resto del horizonte, suponiendo que no se paga nada más.
+
+Es una programación dinámica memoizada sobre (materiales, estados de los
+préstamos): el coste de cada préstamo para cada pago posible se calcula una
+sola vez y las consultas repetidas con el mismo estado (p.ej. cada vez que se
+abre el panel de deudas) salen directamente de la caché.
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple, Any
+import logging
+
+from .debt import Debt
+from .loan_step import LoanState, advance_loan, from_debt
+from .penalties import CREDITOR_PENALTIES
+
+logger = logging.getLogger(__name__)
+
+# Horizonte mínimo simulado (turnos)
+DEFAULT_HORIZON = 10
+
+# Coste de cada unidad de penalización, en materiales equivalentes
+PENALTY_COSTS: Dict[str, float] = {
+    'material_theft': 1.0,  # Zorvax: por material robado
+    'oxygen_capacity_reduction': 1.0,  # K'tar: por punto de oxígeno máximo (permanente)
+    'repair_sabotage': 1.5,  # Nebulosa: por % de reparación perdido
+    'narrative_only': 0.0,  # Aliado: sin efecto en recursos
+}
+
+def loan_state(loan: Debt) -> LoanState:
+    """Estado inmutable de un préstamo (clave de la caché)"""
+    return from_debt(loan)
+
+
+@lru_cache(maxsize=65536)
+def _loan_cost(state: LoanState, paid: int, horizon: int,
+               costs: Tuple[Tuple[str, float], ...]) -> Tuple[float, float]:
+    """
+    Coste de penalizaciones y saldo final de un préstamo si hoy se pagan `paid` materiales
+    
+    Reproduce Debt.make_payment, Debt.advance_turn y la penalización que
+    LoanManager.process_turn aplica cada turno en default.
+    
+    Returns:
+        (coste de penalizaciones, saldo al final del horizonte)
+    """
+    owed = max(0, state.materials_owed - paid)
+    if owed <= 0:
+        return 0.0, 0.0
+    
+    cost_table = dict(costs)
+    # Misma penalización que Debt.apply_penalty (sin efecto en recursos si el acreedor no la tiene)
+    penalty = CREDITOR_PENALTIES.get(state.creditor, CREDITOR_PENALTIES['friendly'])
+    unit_cost = cost_table.get(penalty.kind, 0.0)
+    cost = 0.0
+    loan = state._replace(materials_owed=owed)
+    for _ in range(horizon):
+        loan = advance_loan(loan)
+        if loan.is_defaulted:
+            cost += unit_cost * penalty.amount(loan.materials_owed, loan.principal)
+    return cost, loan.materials_owed + loan.accrued_interest
+
+
+@lru_cache(maxsize=4096)
+def _solve(materials: int, states: Tuple[LoanState, ...], horizon: int,
+           costs: Tuple[Tuple[str, float], ...]) -> Tuple[float, float, int, Tuple[int, ...]]:
+    """
+    Programación dinámica sobre (préstamo i, materiales restantes)
+    
+    Minimiza lexicográficamente: coste de penalizaciones, saldo final total y
+    materiales gastados.
+    
+    Returns:
+        (coste, saldo final, materiales gastados, pago por préstamo)
+    """
+    memo: Dict[Tuple[int, int], Tuple[float, float, int, Tuple[int, ...]]] = {}
+    
+    def best(index: int, remaining: int) -> Tuple[float, float, int, Tuple[int, ...]]:
+        if index == len(states):
+            return 0.0, 0.0, 0, ()
+        key = (index, remaining)
+        if key not in memo:
+            options = []
+            for paid in range(min(remaining, states[index].materials_owed) + 1):
+                cost, balance = _loan_cost(states[index], paid, horizon, costs)
+                rest_cost, rest_balance, rest_spent, rest_plan = best(index + 1, remaining - paid)
+                options.append((round(cost + rest_cost, 9), round(balance + rest_balance, 9),
+                                paid + rest_spent, (paid,) + rest_plan))
+            memo[key] = min(options)
+        return memo[key]
+    
+    return best(0, materials)
+
+
+class PaymentAllocator:
+    """
+    Calcula el reparto de materiales que minimiza las penalizaciones esperadas
+    
+    Atributos:
+        penalty_costs: Coste en materiales de cada unidad de penalización
+        min_horizon: Horizonte mínimo simulado en turnos
+    """
+    
+    def __init__(self, penalty_costs: Optional[Dict[str, float]] = None,
+                 min_horizon: int = DEFAULT_HORIZON):
+        """
+        Args:
+            penalty_costs: Costes por tipo de penalización (None = PENALTY_COSTS)
+            min_horizon: Horizonte mínimo en turnos
+        """
+        self.penalty_costs = dict(PENALTY_COSTS, **(penalty_costs or {}))
+        self.min_horizon = min_horizon
+    
+    def get_horizon(self, loans: Sequence[Debt]) -> int:
+        """Horizonte que cubre el vencimiento de todos los préstamos (+1 turno de default)"""
+        return max([self.min_horizon] + [loan.turns_until_due + 1 for loan in loans])
+    
+    def allocate(self, loans: Sequence[Debt], materials: int,
+                 horizon: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Reparte `materials` entre los préstamos
+        
+        Args:
+            loans: Préstamos activos
+            materials: Materiales disponibles para pagar
+            horizon: Turnos simulados (None = get_horizon)
+        
+        Returns:
+            Diccionario con:
+                payments: Materiales a pagar a cada préstamo (mismo orden que loans)
+                materials_used: Total a pagar
+                expected_penalty: Coste de penalizaciones con el reparto
+                baseline_penalty: Coste de penalizaciones sin pagar nada
+                horizon: Turnos simulados
+        """
+        loans = list(loans)
+        horizon = self.get_horizon(loans) if horizon is None else horizon
+        states = tuple(loan_state(loan) for loan in loans)
+        costs = tuple(sorted(self.penalty_costs.items()))
+        
+        cost, _, used, payments = _solve(max(0, int(materials)), states, horizon, costs)
+        baseline = sum(_loan_cost(state, 0, horizon, costs)[0] for state in states)
+        
+        logger.debug(f"Reparto óptimo de {materials} materiales: {payments} "
+                     f"(penalización {baseline:.1f} -> {cost:.1f})")
+        
+        return {
+            'payments': list(payments),
+            'materials_used': used,
+            'expected_penalty': cost,
+            'baseline_penalty': baseline,
+            'horizon': horizon
+        }
@@ -0,0 +1,227 @@
+"""
+Compact - Préstamos compactos para simulaciones masivas
+CompactDebt guarda el estado de un préstamo en __slots__ (sin __dict__) y
+delega todo lo que depende del acreedor (nombre, conversión, plazo, modelo de
+interés y penalización) en una tabla de estrategias compartida, en lugar de
+una subclase por acreedor. Las fórmulas de interés y de penalización son las
+de finance.interest y finance.penalties, las mismas que usa Debt.
+
+Crear un préstamo no escribe en el log ni crea un modelo de interés por
+instancia, y bulk_create construye lotes sin pasar por __init__.
+
+Los resultados son idénticos a los de ZorvaxDebt, KtarDebt,
+NebulaConsortiumDebt y FriendlyDebt (ver tests/test_compact.py).
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Type, Any
+import logging
+
+from .debt import Debt
+from .interest import CREDITOR_INTEREST_MODELS, DEFAULT_TURN_RATES
+from .penalties import CREDITOR_PENALTIES, CreditorPenalty
+from . import loan_step
+from .portfolio import CREDITOR_TABLE
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CreditorStrategy:
+    """
+    Comportamiento compartido por todos los préstamos de un acreedor
+    
+    Atributos:
+        key: Clave del acreedor ('zorvax', 'ktar', ...)
+        name: Nombre mostrado
+        debt_class: Clase Debt equivalente (para convertir)
+        interest_rate: Conversión oxígeno -> materiales
+        default_terms: Plazo por defecto en turnos
+        default_turn_rate: Interés por turno por defecto
+        max_principal: Máximo de oxígeno prestado (None = sin límite)
+        balance_after: Forma cerrada del modelo de interés (finance.interest)
+        penalty: Penalización en default (finance.penalties)
+    """
+    key: str
+    name: str
+    debt_class: Type[Debt]
+    interest_rate: float
+    default_terms: int
+    default_turn_rate: float
+    max_principal: Optional[float]
+    balance_after: Callable
+    penalty: CreditorPenalty
+
+
+# Tabla de estrategias (una entrada por acreedor, compartida por todos los préstamos)
+CREDITOR_STRATEGIES: Mapping[str, CreditorStrategy] = MappingProxyType({
+    key: CreditorStrategy(
+        key=key,
+        name=debt_class.CREDITOR_NAME,
+        debt_class=debt_class,
+        interest_rate=rate,
+        default_terms=terms,
+        default_turn_rate=DEFAULT_TURN_RATES[key],
+        max_principal=debt_class.MAX_PRINCIPAL,
+        balance_after=CREDITOR_INTEREST_MODELS[key].closed_form,
+        penalty=CREDITOR_PENALTIES[key]
+    )
+    for key, debt_class, rate, terms in CREDITOR_TABLE
+})
+
+
+class CompactDebt:
+    """
+    Préstamo con __slots__ y comportamiento delegado en CreditorStrategy
+    
+    Mismos atributos y métodos que finance.debt.Debt (creditor_name,
+    interest_rate y CREDITOR_TYPE se leen de la estrategia).
+    """
+    
+    __slots__ = ('strategy', 'principal', 'current_balance', 'materials_owed',
+                 'turns_until_due', 'is_defaulted', 'turn_rate', 'accrued_interest',
+                 'base_materials')
+    
+    def __init__(self, creditor_type: str, principal: float, turns: Optional[int] = None,
+                 turn_rate: Optional[float] = None):
+        """
+        Args:
+            creditor_type: Clave del acreedor
+            principal: Oxígeno prestado
+            turns: Plazo en turnos (None = plazo del acreedor)
+            turn_rate: Interés por turno (None = tipo del acreedor)
+        """
+        strategy = CREDITOR_STRATEGIES[creditor_type]
+        if strategy.max_principal is not None:
+            principal = min(principal, strategy.max_principal)
+        self.strategy = strategy
+        self.principal = principal
+        self.current_balance = principal
+        self.materials_owed = int(principal * (1 + strategy.interest_rate))
+        self.base_materials = self.materials_owed
+        self.turns_until_due = strategy.default_terms if turns is None else turns
+        self.is_defaulted = False
+        self.turn_rate = strategy.default_turn_rate if turn_rate is None else turn_rate
+        self.accrued_interest = 0.0
+    
+    @classmethod
+    def bulk_create(cls, creditor_types: Sequence[str], principals: Sequence[float],
+                    turns: Optional[Sequence[int]] = None,
+                    turn_rates: Optional[Sequence[float]] = None) -> List['CompactDebt']:
+        """
+        Crea un lote de préstamos sin pasar por __init__
+        
+        Args:
+            creditor_types: Acreedor de cada préstamo
+            principals: Oxígeno prestado
+            turns: Plazos (None = plazo de cada acreedor)
+            turn_rates: Intereses por turno (None = tipo de cada acreedor)
+        
+        Returns:
+            Lista de CompactDebt en el mismo orden
+        """
+        count = len(principals)
+        turns = turns if turns is not None else [None] * count
+        turn_rates = turn_rates if turn_rates is not None else [None] * count
+        strategies = CREDITOR_STRATEGIES
+        new = object.__new__
+        
+        loans = []
+        append = loans.append
+        for creditor_type, principal, term, rate in zip(creditor_types, principals, turns, turn_rates):
+            strategy = strategies[creditor_type]
+            if strategy.max_principal is not None and principal > strategy.max_principal:
+                principal = strategy.max_principal
+            loan = new(cls)
+            loan.strategy = strategy
+            loan.principal = principal
+            loan.current_balance = principal
+            loan.materials_owed = loan.base_materials = int(principal * (1 + strategy.interest_rate))
+            loan.turns_until_due = strategy.default_terms if term is None else term
+            loan.is_defaulted = False
+            loan.turn_rate = strategy.default_turn_rate if rate is None else rate
+            loan.accrued_interest = 0.0
+            append(loan)
+        return loans
+    
+    @classmethod
+    def from_debt(cls, debt: Debt) -> 'CompactDebt':
+        """Copia el estado de un Debt"""
+        loan = object.__new__(cls)
+        loan.strategy = CREDITOR_STRATEGIES[debt.CREDITOR_TYPE]
+        for name in cls.__slots__[1:]:
+            setattr(loan, name, getattr(debt, name))
+        return loan
+    
+    def to_debt(self) -> Debt:
+        """Crea el Debt equivalente (p.ej. para pasarlo a LoanManager)"""
+        debt = self.strategy.debt_class(self.principal, self.turns_until_due, turn_rate=self.turn_rate)
+        for name in self.__slots__[1:]:
+            setattr(debt, name, getattr(self, name))
+        return debt
+    
+    @property
+    def CREDITOR_TYPE(self) -> str:
+        return self.strategy.key
+    
+    @property
+    def CREDITOR_CODE(self) -> int:
+        return self.strategy.debt_class.CREDITOR_CODE
+    
+    @property
+    def creditor_name(self) -> str:
+        return self.strategy.name
+    
+    @property
+    def interest_rate(self) -> float:
+        return self.strategy.interest_rate
+    
+    def make_payment(self, materials_paid: int) -> bool:
+        """Realiza un pago EN MATERIALES (Debt.make_payment, sin log)"""
+        if materials_paid <= 0:
+            return False
+        
+        self.materials_owed = max(0, self.materials_owed - materials_paid)
+        if self.materials_owed <= 0:
+            self.accrued_interest = 0.0
+        
+        payment_ratio = materials_paid / (self.principal * (1 + self.strategy.interest_rate))
+        self.current_balance = max(0, self.current_balance - (self.principal * payment_ratio))
+        return self.materials_owed <= 0
+    
+    def project_balance(self, turns: int) -> float:
+        """Saldo en materiales dentro de `turns` turnos si no se paga nada"""
+        if self.materials_owed <= 0:
+            return 0.0
+        return float(self.strategy.balance_after(self.materials_owed + self.accrued_interest,
+                                                 self.base_materials, turns,
+                                                 self.turns_until_due, self.turn_rate))
+    
+    def calculate_interest(self) -> float:
+        """Interés del próximo turno (en materiales)"""
+        if self.materials_owed <= 0:
+            return 0.0
+        return self.project_balance(1) - (self.materials_owed + self.accrued_interest)
+    
+    def advance_turn(self) -> None:
+        """Avanza un turno: aplica el interés y verifica vencimiento (finance.loan_step, sin log)"""
+        state = loan_step.advance_loan(loan_step.from_debt(self))
+        self.materials_owed = state.materials_owed
+        self.accrued_interest = state.accrued_interest
+        self.turns_until_due = state.turns_until_due
+        self.is_defaulted = state.is_defaulted
+    
+    def get_minimum_payment(self) -> int:
+        """Pago mínimo requerido EN MATERIALES"""
+        return Debt._minimum_payment_for(self.materials_owed, self.turns_until_due)
+    
+    def apply_penalty(self) -> Dict[str, Any]:
+        """Penalización del acreedor si el préstamo está en default"""
+        if not self.is_defaulted:
+            return {}
+        return self.strategy.penalty.describe(self.materials_owed, self.principal)
+    
+    def __repr__(self) -> str:
+        return (f"CompactDebt({self.strategy.key!r}, owed={self.materials_owed}, "
+                f"turns={self.turns_until_due}, defaulted={self.is_defaulted})")
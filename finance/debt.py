@@ -4,10 +4,14 @@ Simplificado para MVP: Préstamos en oxígeno, pagos en materiales
 Concepto educativo: Oxígeno = Dinero, Materiales = Trabajo
 """
 
-from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Optional, Dict, Any
+from abc import ABC
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, ClassVar
 import logging
+from engine.trace import record, TraceKind
+from .interest import InterestModel, create_interest_model, DEFAULT_TURN_RATES
+from .penalties import CREDITOR_PENALTIES
+from .loan_step import LoanState, advance_loan, from_debt
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +33,22 @@ class Debt(ABC):
         turns_until_due: Turnos restantes para pagar
         is_defaulted: True si se ha incumplido el pago
         creditor_name: Nombre del acreedor
+        turn_rate: Interés por turno sobre los materiales adeudados
+        accrued_interest: Fracción de material de interés aún no sumada a materials_owed
+        base_materials: MATERIALES adeudados al crear el préstamo
+        interest_model: Modelo de interés del acreedor (finance.interest)
     """
     
+    # Clave del acreedor en config.json (elige el modelo de interés)
+    CREDITOR_TYPE: ClassVar[str] = ""
+    # Código numérico del acreedor (mismo que finance.portfolio.CREDITOR_CODES; traza binaria)
+    CREDITOR_CODE: ClassVar[int] = 0
+    # Términos del acreedor (fuente única para finance.portfolio y finance.compact)
+    CREDITOR_NAME: ClassVar[str] = "Unknown"
+    INTEREST_RATE: ClassVar[float] = 0.0
+    DEFAULT_TERMS: ClassVar[int] = 0
+    MAX_PRINCIPAL: ClassVar[Optional[float]] = None
+    
     principal: float  # Oxígeno prestado
     interest_rate: float  # Multiplicador de conversión
     current_balance: float  # Balance en oxígeno (para tracking)
@@ -38,6 +56,12 @@ class Debt(ABC):
     is_defaulted: bool = False
     creditor_name: str = "Unknown"
     materials_owed: int = 0  # Materiales a pagar
+    turn_rate: float = 0.0  # Interés por turno
+    accrued_interest: float = 0.0  # Fracción de interés pendiente (< 1 material)
+    base_materials: int = 0  # Materiales a pagar al crear el préstamo
+    interest_model: Optional[InterestModel] = field(default=None, repr=False, compare=False)
+    # Calendario de pagos proyectado (se recalcula tras make_payment/advance_turn)
+    _schedule: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Inicializa el balance y calcula materiales a pagar"""
@@ -47,29 +71,33 @@ class Debt(ABC):
         # Calcular materiales a pagar según interés
         # Fórmula: materiales = oxígeno * (1 + interest_rate)
         self.materials_owed = int(self.principal * (1 + self.interest_rate))
+        self.base_materials = self.materials_owed
+        
+        if self.interest_model is None:
+            self.interest_model = create_interest_model(self.CREDITOR_TYPE, self.turn_rate)
         
-        logger.info(f"Préstamo creado: {self.principal} oxígeno de {self.creditor_name}, "
-                   f"debe pagar {self.materials_owed} materiales")
+        record(TraceKind.DEBT_CREATED, self.CREDITOR_CODE, self.materials_owed, self.principal)
     
-    @abstractmethod
     def calculate_interest(self) -> float:
         """
-        Calcula el interés para el turno actual
+        Calcula el interés para el turno actual (modelo del acreedor)
         
         Returns:
-            Cantidad de interés generado
+            Cantidad de interés generado (en materiales)
         """
-        pass
+        return self._next_turn_interest()
     
-    @abstractmethod
-    def apply_penalty(self) -> dict:
+    def apply_penalty(self) -> Dict[str, Any]:
         """
-        Aplica penalizaciones por impago o retraso
+        Aplica penalizaciones por impago o retraso (finance.penalties)
         
         Returns:
-            Diccionario con los efectos de la penalización
+            Diccionario con los efectos de la penalización ({} si no hay default)
         """
-        pass
+        if not self.is_defaulted:
+            return {}
+        
+        return CREDITOR_PENALTIES[self.CREDITOR_TYPE].describe(self.materials_owed, self.principal)
     
     def make_payment(self, materials_paid: int) -> bool:
         """
@@ -84,34 +112,140 @@ class Debt(ABC):
         if materials_paid <= 0:
             return False
         
+        self._schedule = None
+        
         # Reducir materiales adeudados
         self.materials_owed = max(0, self.materials_owed - materials_paid)
+        if self.materials_owed <= 0:
+            self.accrued_interest = 0.0
         
         # Actualizar balance en oxígeno (para tracking)
         payment_ratio = materials_paid / (self.principal * (1 + self.interest_rate))
         self.current_balance = max(0, self.current_balance - (self.principal * payment_ratio))
         
-        logger.info(f"Pago de {materials_paid} materiales a {self.creditor_name}. "
-                   f"Restante: {self.materials_owed} materiales")
+        record(TraceKind.DEBT_PAYMENT, self.CREDITOR_CODE, materials_paid, self.materials_owed)
         
         # Verificar si está completamente pagado
         if self.materials_owed <= 0:
-            logger.info(f"Préstamo de {self.creditor_name} pagado completamente")
+            record(TraceKind.DEBT_PAID_OFF, self.CREDITOR_CODE)
             return True
         
         return False
     
+    def project_balance(self, turns: int) -> float:
+        """
+        Saldo en materiales dentro de `turns` turnos si no se paga nada
+        
+        Usa la forma cerrada del modelo de interés: cuesta lo mismo proyectar
+        1 turno que 1000.
+        
+        Args:
+            turns: Turnos a proyectar
+            
+        Returns:
+            Materiales adeudados (con fracción) tras esos turnos
+        """
+        if self.materials_owed <= 0:
+            return 0.0
+        return float(self.interest_model.balance_at(self.materials_owed + self.accrued_interest,
+                                                    self.base_materials, turns, self.turns_until_due))
+    
+    def _next_turn_interest(self) -> float:
+        """Materiales que sumará el interés al cerrar el turno actual"""
+        if self.materials_owed <= 0:
+            return 0.0
+        return self.project_balance(1) - (self.materials_owed + self.accrued_interest)
+    
     def advance_turn(self) -> None:
-        """Avanza un turno, verificando vencimiento"""
-        self.turns_until_due -= 1
+        """Avanza un turno: aplica el interés del turno y verifica vencimiento (finance.loan_step)"""
+        self.apply_loan_state(advance_loan(from_debt(self)))
+    
+    def apply_loan_state(self, state: LoanState) -> None:
+        """
+        Copia el resultado de finance.loan_step.advance_loan para este préstamo
         
-        # En MVP, el interés ya está calculado en materials_owed
-        # No se aplica interés compuesto adicional
+        Args:
+            state: LoanState tras el turno
+        """
+        self.materials_owed = state.materials_owed
+        self.accrued_interest = state.accrued_interest
+        self.turns_until_due = state.turns_until_due
+        self.is_defaulted = state.is_defaulted
+        self._schedule = None
         
         if self.turns_until_due <= 0 and self.materials_owed > 0:
-            self.is_defaulted = True
+            record(TraceKind.DEBT_DEFAULTED, self.CREDITOR_CODE, self.materials_owed)
             logger.warning(f"Préstamo de {self.creditor_name} en DEFAULT")
     
+    @staticmethod
+    def _minimum_payment_for(materials_owed: int, turns_until_due: int) -> int:
+        """Pago mínimo EN MATERIALES para una deuda y un plazo dados"""
+        if turns_until_due <= 0:
+            # Si está vencido, debe pagar todo
+            return materials_owed
+        elif turns_until_due <= 2:
+            # Si quedan pocos turnos, pagar al menos la mitad
+            return max(1, materials_owed // 2)
+        else:
+            # Pago mínimo proporcional
+            return max(1, materials_owed // turns_until_due)
+    
+    def get_schedule(self) -> Dict[str, Any]:
+        """
+        Obtiene el calendario de pagos proyectado si se paga el mínimo cada turno
+        
+        Se calcula la primera vez que se pide y se reutiliza hasta el siguiente
+        make_payment() o advance_turn().
+        
+        Returns:
+            Diccionario con:
+                payments: Lista por turno (0 = turno actual) con turns_until_due,
+                    minimum_payment, remaining (materiales tras el pago) e
+                    interest (materiales que suma el interés al cerrar el turno)
+                penalty_turn: Turno (relativo al actual) en el que saltaría la
+                    penalización pagando solo el mínimo; 0 si ya está en default
+                    y None si no llega a saltar
+        """
+        if self._schedule is not None:
+            return self._schedule
+        
+        payments: List[Dict[str, int]] = []
+        penalty_turn = 0 if self.is_defaulted else None
+        owed = self.materials_owed
+        accrued = self.accrued_interest
+        turns = self.turns_until_due
+        turn = 0
+        
+        while owed > 0:
+            minimum = self._minimum_payment_for(owed, turns)
+            owed = max(0, owed - minimum)
+            
+            # Interés del turno sobre lo que queda tras el pago
+            interest = 0
+            if owed > 0:
+                balance = float(self.interest_model.balance_at(owed + accrued, self.base_materials,
+                                                               1, turns))
+                interest = int(balance) - owed
+                accrued = balance - int(balance)
+            
+            payments.append({
+                'turn': turn,
+                'turns_until_due': turns,
+                'minimum_payment': minimum,
+                'remaining': owed,
+                'interest': interest
+            })
+            owed += interest
+            
+            # Al avanzar el turno, vencer con materiales pendientes es default
+            turns -= 1
+            turn += 1
+            if penalty_turn is None and turns <= 0 and owed > 0:
+                penalty_turn = turn
+        
+        self._schedule = {'payments': payments, 'penalty_turn': penalty_turn}
+        return self._schedule
+    
     def get_minimum_payment(self) -> int:
         """
         Calcula el pago mínimo requerido EN MATERIALES
@@ -119,15 +253,20 @@ class Debt(ABC):
         Returns:
             Cantidad mínima de materiales a pagar
         """
-        if self.turns_until_due <= 0:
-            # Si está vencido, debe pagar todo
-            return self.materials_owed
-        elif self.turns_until_due <= 2:
-            # Si quedan pocos turnos, pagar al menos la mitad
-            return max(1, self.materials_owed // 2)
-        else:
-            # Pago mínimo proporcional
-            return max(1, self.materials_owed // self.turns_until_due)
+        payments = self.get_schedule()['payments']
+        if not payments:
+            # Deuda ya saldada: sin calendario
+            return self._minimum_payment_for(self.materials_owed, self.turns_until_due)
+        return payments[0]['minimum_payment']
+    
+    def get_penalty_turn(self) -> Optional[int]:
+        """
+        Turnos hasta que saltaría la penalización pagando solo el mínimo
+        
+        Returns:
+            Turnos relativos al actual (0 = ya en default), o None si no salta
+        """
+        return self.get_schedule()['penalty_turn']
 
 
 class ZorvaxDebt(Debt):
@@ -136,6 +275,7 @@ class ZorvaxDebt(Debt):
     
     Características:
         - Interés del 50% (1.5x conversión oxígeno->materiales)
+        - Interés compuesto por turno sobre el saldo (5% por defecto)
         - Penalización: Roba materiales adicionales si no pagas
         - Plazo: 10 turnos
     
@@ -145,32 +285,21 @@ class ZorvaxDebt(Debt):
         - Si no pagas, te quita materiales extras
     """
     
-    def __init__(self, principal: float, turns: int = 10):
+    CREDITOR_TYPE = 'zorvax'
+    CREDITOR_CODE = 0
+    CREDITOR_NAME = "Banco Zorvax"
+    INTEREST_RATE = 0.5  # 50% interés
+    DEFAULT_TERMS = 10
+    
+    def __init__(self, principal: float, turns: int = DEFAULT_TERMS, turn_rate: Optional[float] = None):
         super().__init__(
             principal=principal,
-            interest_rate=0.5,  # 50% interés
+            interest_rate=self.INTEREST_RATE,
             current_balance=principal,
             turns_until_due=turns,
-            creditor_name="Banco Zorvax"
+            creditor_name=self.CREDITOR_NAME,
+            turn_rate=DEFAULT_TURN_RATES['zorvax'] if turn_rate is None else turn_rate
         )
-    
-    def calculate_interest(self) -> float:
-        """Interés ya calculado en materials_owed"""
-        return 0  # En MVP no hay interés compuesto adicional
-    
-    def apply_penalty(self) -> Dict[str, Any]:
-        """Aplica penalización: robo de materiales"""
-        if not self.is_defaulted:
-            return {}
-        
-        # Penalización: pierde materiales adicionales
-        penalty_materials = max(3, self.materials_owed // 10)
-        
-        return {
-            "type": "material_theft",
-            "materials_lost": penalty_materials,
-            "message": f"Zorvax se lleva {penalty_materials} materiales como penalización"
-        }
 
 
 class KtarDebt(Debt):
@@ -179,6 +308,7 @@ class KtarDebt(Debt):
     
     Características:
         - Interés del 20% (1.2x conversión oxígeno->materiales)
+        - Interés simple por turno sobre la deuda original (10% por defecto)
         - Penalización: Reduce oxígeno máximo temporalmente
         - Plazo: 5 turnos (más urgente)
     
@@ -188,32 +318,21 @@ class KtarDebt(Debt):
         - Si no pagas, reduce tu oxígeno máximo
     """
     
-    def __init__(self, principal: float, turns: int = 5):
+    CREDITOR_TYPE = 'ktar'
+    CREDITOR_CODE = 1
+    CREDITOR_NAME = "Prestamistas K'tar"
+    INTEREST_RATE = 0.2  # 20% interés
+    DEFAULT_TERMS = 5
+    
+    def __init__(self, principal: float, turns: int = DEFAULT_TERMS, turn_rate: Optional[float] = None):
         super().__init__(
             principal=principal,
-            interest_rate=0.2,  # 20% interés
+            interest_rate=self.INTEREST_RATE,
             current_balance=principal,
             turns_until_due=turns,
-            creditor_name="Prestamistas K'tar"
+            creditor_name=self.CREDITOR_NAME,
+            turn_rate=DEFAULT_TURN_RATES['ktar'] if turn_rate is None else turn_rate
         )
-    
-    def calculate_interest(self) -> float:
-        """Interés ya calculado en materials_owed"""
-        return 0
-    
-    def apply_penalty(self) -> Dict[str, Any]:
-        """Aplica penalización: reduce oxígeno máximo"""
-        if not self.is_defaulted:
-            return {}
-        
-        # Penalización: reduce capacidad de oxígeno
-        oxygen_reduction = min(10, self.principal * 0.2)
-        
-        return {
-            "type": "oxygen_capacity_reduction",
-            "oxygen_lost": oxygen_reduction,
-            "message": f"K'tar reduce tu oxígeno máximo en {oxygen_reduction:.0f}"
-        }
 
 
 class NebulaConsortiumDebt(Debt):
@@ -222,6 +341,7 @@ class NebulaConsortiumDebt(Debt):
     
     Características:
         - Interés del 10% (1.1x conversión oxígeno->materiales)
+        - Interés por retraso: nada en plazo, después crece exponencialmente
         - Penalización: Reduce progreso de reparación
         - Plazo: 15 turnos (más flexible)
     
@@ -231,32 +351,21 @@ class NebulaConsortiumDebt(Debt):
         - Si no pagas, pierdes progreso de reparación
     """
     
-    def __init__(self, principal: float, turns: int = 15):
+    CREDITOR_TYPE = 'nebula'
+    CREDITOR_CODE = 2
+    CREDITOR_NAME = "Consorcio Nebulosa"
+    INTEREST_RATE = 0.1  # 10% interés
+    DEFAULT_TERMS = 15
+    
+    def __init__(self, principal: float, turns: int = DEFAULT_TERMS, turn_rate: Optional[float] = None):
         super().__init__(
             principal=principal,
-            interest_rate=0.1,  # 10% interés
+            interest_rate=self.INTEREST_RATE,
             current_balance=principal,
             turns_until_due=turns,
-            creditor_name="Consorcio Nebulosa"
+            creditor_name=self.CREDITOR_NAME,
+            turn_rate=DEFAULT_TURN_RATES['nebula'] if turn_rate is None else turn_rate
         )
-    
-    def calculate_interest(self) -> float:
-        """Interés ya calculado en materials_owed"""
-        return 0
-    
-    def apply_penalty(self) -> Dict[str, Any]:
-        """Aplica penalización: reduce progreso de reparación"""
-        if not self.is_defaulted:
-            return {}
-        
-        # Penalización: pierde progreso de reparación
-        repair_loss = min(10, self.principal * 0.1)
-        
-        return {
-            "type": "repair_sabotage",
-            "repair_lost": repair_loss,
-            "message": f"El Consorcio sabotea tu nave, pierdes {repair_loss:.0f}% de reparación"
-        }
 
 
 class FriendlyDebt(Debt):
@@ -270,28 +379,22 @@ class FriendlyDebt(Debt):
         - Solo disponible una vez
     """
     
-    def __init__(self, principal: float, turns: int = 20):
+    CREDITOR_TYPE = 'friendly'
+    CREDITOR_CODE = 3
+    CREDITOR_NAME = "Aliado"
+    INTEREST_RATE = 0.05  # 5% interés (casi sin interés)
+    DEFAULT_TERMS = 20
+    MAX_PRINCIPAL = 30  # Máximo de oxígeno que presta un aliado
+    
+    def __init__(self, principal: float, turns: int = DEFAULT_TERMS, turn_rate: Optional[float] = None):
         # Limitar cantidad máxima
-        principal = min(principal, 30)
+        principal = min(principal, self.MAX_PRINCIPAL)
         super().__init__(
             principal=principal,
-            interest_rate=0.05,  # 5% interés (casi sin interés)
+            interest_rate=self.INTEREST_RATE,
             current_balance=principal,
             turns_until_due=turns,
-            creditor_name="Aliado"
+            creditor_name=self.CREDITOR_NAME,
+            turn_rate=DEFAULT_TURN_RATES['friendly'] if turn_rate is None else turn_rate
         )
-    
-    def calculate_interest(self) -> float:
-        """Interés mínimo ya calculado"""
-        return 0
-    
-    def apply_penalty(self) -> Dict[str, Any]:
-        """Sin penalizaciones directas, solo narrativas"""
-        if not self.is_defaulted:
-            return {}
-        
-        return {
-            "type": "narrative_only",
-            "message": "Tu aliado está decepcionado. No volverá a ayudarte."
-        }
 
@@ -0,0 +1,172 @@
+"""
+Interest - Modelos de interés por turno
+Cada modelo calcula en forma cerrada el saldo tras N turnos sin pagos, sin
+iterar turno a turno. Así proyectar 1000+ turnos cuesta lo mismo que uno, y
+las mismas fórmulas sirven para un préstamo (float) o para una cartera
+entera (arrays de NumPy).
+
+Modelos:
+    - NoInterest: el saldo no crece (Aliado)
+    - SimpleInterest: interés fijo sobre la deuda original (Prestamistas K'tar)
+    - CompoundInterest: interés compuesto sobre el saldo (Banco Zorvax)
+    - LateExponentialInterest: sin interés hasta el vencimiento; después el
+      tipo crece exponencialmente con cada turno de retraso (Consorcio Nebulosa)
+"""
+
+from typing import Dict, Type, Union
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+Number = Union[float, np.ndarray]
+
+
+class InterestModel:
+    """
+    Modelo de interés base (sin interés)
+    
+    Atributos:
+        rate: Tipo de interés por turno
+    """
+    
+    def __init__(self, rate: float = 0.0):
+        """
+        Args:
+            rate: Tipo de interés por turno (p.ej. 0.05 = 5%)
+        """
+        self.rate = rate
+    
+    def balance_at(self, balance: Number, base: Number, turns: Number,
+                   turns_until_due: Number) -> Number:
+        """
+        Saldo tras `turns` turnos sin pagos (forma cerrada)
+        
+        Args:
+            balance: Saldo actual en materiales (con fracción acumulada)
+            base: Materiales adeudados al crear el préstamo
+            turns: Turnos a proyectar
+            turns_until_due: Turnos que faltan hoy para el vencimiento
+        
+        Returns:
+            Saldo proyectado en materiales
+        """
+        return self.closed_form(balance, base, turns, turns_until_due, self.rate)
+    
+    @staticmethod
+    def closed_form(balance: Number, base: Number, turns: Number,
+                    turns_until_due: Number, rate: Number) -> Number:
+        """Fórmula del modelo; acepta escalares o arrays (rate puede variar por préstamo)"""
+        return balance
+
+
+class NoInterest(InterestModel):
+    """Sin interés: el saldo solo baja con los pagos"""
+
+
+class SimpleInterest(InterestModel):
+    """
+    Interés simple: cada turno se suma rate * deuda original
+    
+    saldo(n) = saldo + base * rate * n
+    """
+    
+    @staticmethod
+    def closed_form(balance, base, turns, turns_until_due, rate):
+        return balance + base * rate * turns
+
+
+class CompoundInterest(InterestModel):
+    """
+    Interés compuesto sobre el saldo pendiente
+    
+    saldo(n) = saldo * (1 + rate) ^ n
+    """
+    
+    @staticmethod
+    def closed_form(balance, base, turns, turns_until_due, rate):
+        return balance * np.power(1 + rate, turns)
+
+
+class LateExponentialInterest(InterestModel):
+    """
+    Interés por retraso con tipo exponencialmente creciente
+    
+    No hay interés mientras el préstamo está en plazo. En el turno de retraso
+    número a el tipo instantáneo es rate * ACCELERATION^a, hasta un máximo de
+    MAX_RATE por turno. El logaritmo del factor acumulado tras a turnos de
+    retraso es, con a* el turno en que se alcanza el máximo:
+    
+        L(a) = rate * (ACCELERATION^min(a, a*) - 1) / ln(ACCELERATION)
+               + MAX_RATE * max(0, a - a*)
+    
+    y saldo(n) = saldo * exp(L(a_n) - L(a_0)), donde a_0 y a_n son los turnos
+    de retraso transcurridos hoy y dentro de n turnos.
+    
+    Con rate = 0 el tipo nunca crece ni llega al máximo (a* es infinito), así
+    que L(a) = 0 y el saldo se queda constante.
+    """
+    
+    # Cuánto se multiplica el tipo con cada turno de retraso
+    ACCELERATION = 1.5
+    # Tipo máximo por turno (evita desbordamientos en proyecciones largas)
+    MAX_RATE = 0.25
+    
+    @staticmethod
+    def _log_factor(late_turns, rate):
+        """L(a): logaritmo del factor acumulado tras `late_turns` turnos de retraso"""
+        log_acceleration = np.log(LateExponentialInterest.ACCELERATION)
+        max_rate = LateExponentialInterest.MAX_RATE
+        rate = np.minimum(rate, max_rate)
+        # Los préstamos sin interés se calculan aparte (L = 0); el tipo que se
+        # les pone aquí solo evita dividir por cero y se descarta
+        charged = rate > 0
+        safe_rate = np.where(charged, rate, max_rate)
+        cap_turn = np.log(max_rate / safe_rate) / log_acceleration
+        growing = np.minimum(late_turns, cap_turn)
+        log_factor = (safe_rate * (np.exp(growing * log_acceleration) - 1) / log_acceleration +
+                      max_rate * np.maximum(0, late_turns - cap_turn))
+        return np.where(charged, log_factor, 0.0)
+    
+    @staticmethod
+    def closed_form(balance, base, turns, turns_until_due, rate):
+        # El turno en el que turns_until_due llega a 0 ya cuenta como retraso
+        late_now = np.maximum(0, 1 - turns_until_due)
+        late_then = np.maximum(0, turns + 1 - turns_until_due)
+        return balance * np.exp(LateExponentialInterest._log_factor(late_then, rate) -
+                                LateExponentialInterest._log_factor(late_now, rate))
+
+
+# Modelo de cada acreedor (clave de config.json -> clase del modelo)
+CREDITOR_INTEREST_MODELS: Dict[str, Type[InterestModel]] = {
+    'zorvax': CompoundInterest,
+    'ktar': SimpleInterest,
+    'nebula': LateExponentialInterest,
+    'friendly': NoInterest,
+}
+
+# Tipos por turno por defecto (base_interest_rate de config.json)
+DEFAULT_TURN_RATES: Dict[str, float] = {
+    'zorvax': 0.05,
+    'ktar': 0.10,
+    'nebula': 0.02,
+    'friendly': 0.0,
+}
+
+
+def create_interest_model(creditor_type: str, rate: float = None) -> InterestModel:
+    """
+    Crea el modelo de interés de un acreedor
+    
+    Args:
+        creditor_type: Clave del acreedor ('zorvax', 'ktar', ...)
+        rate: Tipo por turno (None = DEFAULT_TURN_RATES)
+    
+    Returns:
+        Modelo de interés (NoInterest si el acreedor no tiene modelo)
+    """
+    model_class = CREDITOR_INTEREST_MODELS.get(creditor_type, NoInterest)
+    if rate is None:
+        rate = DEFAULT_TURN_RATES.get(creditor_type, 0.0)
+    return model_class(rate)
@@ -0,0 +1,337 @@
+"""
+Ledger - Libro mayor de préstamos
+Registro de solo-anexión de cada oferta, aceptación, rechazo, pago,
+penalización y default. Mantiene índices en memoria por acreedor, tipo de
+asiento y turno, y escribe por lotes en un archivo SQLite local para que los
+facilitadores consulten el historial financiero de toda una clase sin
+reproducir las partidas.
+"""
+
+from contextlib import closing
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple, Any
+import json
+import logging
+import sqlite3
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+# Tipos de asiento
+OFFER = 'offer'
+ACCEPTANCE = 'acceptance'
+REJECTION = 'rejection'
+PAYMENT = 'payment'
+PENALTY = 'penalty'
+DEFAULT = 'default'
+
+ENTRY_KINDS = (OFFER, ACCEPTANCE, REJECTION, PAYMENT, PENALTY, DEFAULT)
+
+# Asientos acumulados antes de escribir en SQLite
+DEFAULT_BATCH_SIZE = 25
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ledger (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL,
+    player TEXT,
+    entry_id INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    turn INTEGER NOT NULL,
+    creditor TEXT,
+    loan_id INTEGER,
+    oxygen REAL NOT NULL DEFAULT 0,
+    materials INTEGER NOT NULL DEFAULT 0,
+    timestamp REAL NOT NULL,
+    data TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_ledger_creditor ON ledger (creditor);
+CREATE INDEX IF NOT EXISTS idx_ledger_turn ON ledger (turn);
+CREATE INDEX IF NOT EXISTS idx_ledger_player ON ledger (player, session_id);
+"""
+
+_COLUMNS = ('session_id', 'player', 'entry_id', 'kind', 'turn', 'creditor', 'loan_id',
+            'oxygen', 'materials', 'timestamp', 'data')
+
+
+@dataclass(frozen=True)
+class LedgerEntry:
+    """
+    Asiento inmutable del libro mayor
+    
+    Atributos:
+        entry_id: Posición en el libro (0, 1, 2...)
+        kind: Tipo de asiento (OFFER, ACCEPTANCE, PAYMENT...)
+        turn: Turno de la partida
+        creditor: Clave del acreedor ('zorvax', 'ktar', ...)
+        loan_id: Préstamo al que se refiere (None para ofertas y rechazos)
+        oxygen: Oxígeno implicado (prestado, ofrecido o capacidad perdida)
+        materials: Materiales implicados (pagados, a devolver o robados)
+        timestamp: Momento del asiento (time.time())
+        data: Detalles adicionales
+    """
+    entry_id: int
+    kind: str
+    turn: int
+    creditor: Optional[str]
+    loan_id: Optional[int] = None
+    oxygen: float = 0.0
+    materials: int = 0
+    timestamp: float = 0.0
+    data: Dict[str, Any] = field(default_factory=dict, compare=False)
+
+
+class LoanLedger:
+    """
+    Libro mayor de préstamos de una partida
+    
+    Los asientos solo se añaden, nunca se modifican. Cada record() actualiza
+    los índices en memoria y deja el asiento en un búfer que se escribe en
+    SQLite con una sola transacción al llenarse el lote o al llamar a flush().
+    """
+    
+    def __init__(self, db_path: Optional[str] = None, player: Optional[str] = None,
+                 session_id: Optional[str] = None, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        Args:
+            db_path: Archivo SQLite (None = solo en memoria)
+            player: Nombre del jugador (para las consultas de clase)
+            session_id: Identificador de la partida (None = uno nuevo)
+            batch_size: Asientos por escritura en SQLite
+        """
+        self.db_path = db_path
+        self.player = player
+        self.session_id = session_id or uuid.uuid4().hex
+        self.batch_size = max(1, batch_size)
+        
+        self.entries: List[LedgerEntry] = []
+        self._by_creditor: Dict[Optional[str], List[int]] = {}
+        self._by_kind: Dict[str, List[int]] = {}
+        self._by_turn: Dict[int, List[int]] = {}
+        
+        self._pending: List[LedgerEntry] = []
+        self._connection: Optional[sqlite3.Connection] = None
+        # id(préstamo) -> (préstamo, identificador); guardar el préstamo evita
+        # que Python reutilice su id() para otro objeto
+        self._loans: Dict[int, Tuple[Any, int]] = {}
+        
+        logger.info(f"Libro mayor iniciado (sesión {self.session_id}, "
+                    f"{'SQLite: ' + db_path if db_path else 'solo memoria'})")
+    
+    def register_loan(self, loan) -> int:
+        """
+        Asigna un identificador estable a un préstamo
+        
+        Args:
+            loan: Instancia de Debt
+        
+        Returns:
+            Identificador del préstamo en el libro
+        """
+        if id(loan) not in self._loans:
+            self._loans[id(loan)] = (loan, len(self._loans) + 1)
+        return self._loans[id(loan)][1]
+    
+    def get_loan_id(self, loan) -> Optional[int]:
+        """Identificador de un préstamo registrado (None si no lo está)"""
+        registered = self._loans.get(id(loan))
+        return registered[1] if registered else None
+    
+    def record(self, kind: str, turn: int, creditor: Optional[str] = None,
+               loan_id: Optional[int] = None, oxygen: float = 0.0, materials: int = 0,
+               **data: Any) -> LedgerEntry:
+        """
+        Añade un asiento al libro
+        
+        Args:
+            kind: Tipo de asiento (uno de ENTRY_KINDS)
+            turn: Turno de la partida
+            creditor: Clave del acreedor
+            loan_id: Identificador del préstamo (register_loan)
+            oxygen: Oxígeno implicado
+            materials: Materiales implicados
+            **data: Detalles adicionales (deben ser serializables a JSON)
+        
+        Returns:
+            Asiento creado
+        """
+        if kind not in ENTRY_KINDS:
+            raise ValueError(f"Tipo de asiento desconocido: {kind}")
+        
+        entry = LedgerEntry(len(self.entries), kind, turn, creditor, loan_id,
+                            float(oxygen), int(materials), time.time(), data)
+        self.entries.append(entry)
+        self._by_creditor.setdefault(creditor, []).append(entry.entry_id)
+        self._by_kind.setdefault(kind, []).append(entry.entry_id)
+        self._by_turn.setdefault(turn, []).append(entry.entry_id)
+        
+        if self.db_path:
+            self._pending.append(entry)
+            if len(self._pending) >= self.batch_size:
+                self.flush()
+        
+        return entry
+    
+    def query(self, creditor: Optional[str] = None, kind: Optional[str] = None,
+              turn: Optional[int] = None, loan_id: Optional[int] = None) -> List[LedgerEntry]:
+        """
+        Busca asientos usando los índices en memoria
+        
+        Args:
+            creditor: Filtrar por acreedor
+            kind: Filtrar por tipo de asiento
+            turn: Filtrar por turno
+            loan_id: Filtrar por préstamo
+        
+        Returns:
+            Asientos que cumplen todos los filtros, en orden de registro
+        """
+        candidates: Optional[set] = None
+        for index, key in ((self._by_creditor, creditor), (self._by_kind, kind),
+                           (self._by_turn, turn)):
+            if key is None:
+                continue
+            ids = set(index.get(key, ()))
+            candidates = ids if candidates is None else candidates & ids
+        
+        if candidates is None:
+            entries: Iterable[LedgerEntry] = self.entries
+        else:
+            entries = (self.entries[entry_id] for entry_id in sorted(candidates))
+        
+        if loan_id is not None:
+            entries = (entry for entry in entries if entry.loan_id == loan_id)
+        return list(entries)
+    
+    def get_totals_by_creditor(self) -> Dict[str, Dict[str, float]]:
+        """
+        Resumen por acreedor: oxígeno prestado, materiales pagados y penalizaciones
+        
+        Returns:
+            {acreedor: {'borrowed', 'paid', 'penalties', 'defaults'}}
+        """
+        totals: Dict[str, Dict[str, float]] = {}
+        for creditor, entry_ids in self._by_creditor.items():
+            if creditor is None:
+                continue
+            summary = {'borrowed': 0.0, 'paid': 0, 'penalties': 0, 'defaults': 0}
+            for entry_id in entry_ids:
+                entry = self.entries[entry_id]
+                if entry.kind == ACCEPTANCE:
+                    summary['borrowed'] += entry.oxygen
+                elif entry.kind == PAYMENT:
+                    summary['paid'] += entry.materials
+                elif entry.kind == PENALTY:
+                    summary['penalties'] += 1
+                elif entry.kind == DEFAULT:
+                    summary['defaults'] += 1
+            totals[creditor] = summary
+        return totals
+    
+    def flush(self) -> int:
+        """
+        Escribe en SQLite los asientos pendientes (una transacción)
+        
+        Returns:
+            Número de asientos escritos
+        """
+        if not self.db_path or not self._pending:
+            return 0
+        
+        batch, self._pending = self._pending, []
+        rows = [(self.session_id, self.player, entry.entry_id, entry.kind, entry.turn,
+                 entry.creditor, entry.loan_id, entry.oxygen, entry.materials,
+                 entry.timestamp, json.dumps(entry.data, default=str))
+                for entry in batch]
+        try:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    f"INSERT INTO ledger ({', '.join(_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_COLUMNS))})", rows)
+        except sqlite3.Error as e:
+            # Se reintentará en el siguiente flush
+            self._pending = batch + self._pending
+            logger.error(f"No se pudo escribir el libro mayor en {self.db_path}: {e}")
+            return 0
+        
+        logger.debug(f"Libro mayor: {len(rows)} asientos escritos en {self.db_path}")
+        return len(rows)
+    
+    def close(self) -> None:
+        """Escribe lo pendiente y cierra la conexión"""
+        self.flush()
+        if self._connection:
+            self._connection.close()
+            self._connection = None
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Abre la conexión y crea el esquema si hace falta"""
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.db_path)
+            self._connection.executescript(_SCHEMA)
+        return self._connection
+
+
+def query_database(db_path: str, creditor: Optional[str] = None, kind: Optional[str] = None,
+                   player: Optional[str] = None,
+                   session_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Consulta los asientos guardados en SQLite (todas las partidas)
+    
+    Args:
+        db_path: Archivo SQLite
+        creditor: Filtrar por acreedor
+        kind: Filtrar por tipo de asiento
+        player: Filtrar por jugador
+        session_id: Filtrar por partida
+    
+    Returns:
+        Lista de asientos como diccionarios
+    """
+    filters = {'creditor': creditor, 'kind': kind, 'player': player, 'session_id': session_id}
+    clauses = [f"{column} = ?" for column, value in filters.items() if value is not None]
+    params = [value for value in filters.values() if value is not None]
+    sql = f"SELECT {', '.join(_COLUMNS)} FROM ledger"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    sql += " ORDER BY session_id, entry_id"
+    
+    with closing(sqlite3.connect(db_path)) as connection:
+        rows = connection.execute(sql, params).fetchall()
+    
+    results = []
+    for row in rows:
+        entry = dict(zip(_COLUMNS, row))
+        entry['data'] = json.loads(entry['data']) if entry['data'] else {}
+        results.append(entry)
+    return results
+
+
+def summarize_database(db_path: str) -> List[Dict[str, Any]]:
+    """
+    Resumen financiero por jugador y acreedor de todas las partidas guardadas
+    
+    Args:
+        db_path: Archivo SQLite
+    
+    Returns:
+        Lista de {'player', 'creditor', 'loans', 'borrowed', 'paid', 'penalties', 'defaults'}
+    """
+    sql = """
+        SELECT COALESCE(player, session_id), creditor,
+               SUM(kind = 'acceptance'),
+               SUM(CASE WHEN kind = 'acceptance' THEN oxygen ELSE 0 END),
+               SUM(CASE WHEN kind = 'payment' THEN materials ELSE 0 END),
+               SUM(kind = 'penalty'),
+               SUM(kind = 'default')
+        FROM ledger
+        WHERE creditor IS NOT NULL
+        GROUP BY COALESCE(player, session_id), creditor
+        ORDER BY 1, 2
+    """
+    with closing(sqlite3.connect(db_path)) as connection:
+        rows = connection.execute(sql).fetchall()
+    keys = ('player', 'creditor', 'loans', 'borrowed', 'paid', 'penalties', 'defaults')
+    return [dict(zip(keys, row)) for row in rows]
@@ -3,10 +3,14 @@ LoanManager - Gestión Centralizada de Préstamos
 Simplificado para MVP: Préstamos en oxígeno, pagos en materiales
 """
 
-from typing import List, Dict, Type, Optional, Any
-import random
+from typing import List, Dict, Tuple, Type, Optional, Any
 import logging
-from .debt import Debt, ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt
+from engine.trace import record, TraceKind
+from .debt import Debt
+from .loan_step import PlayerResources, advance_loan, apply_resources, from_debt, process_loans
+from .offers import LenderOfferEngine
+from .allocator import PaymentAllocator
+from .ledger import LoanLedger, OFFER, ACCEPTANCE, REJECTION, PAYMENT, PENALTY, DEFAULT
 
 logger = logging.getLogger(__name__)
 
@@ -18,41 +22,65 @@ class LoanManager:
     Responsabilidades:
         - Mantener lista de préstamos activos
         - Procesar pagos
-        - Calcular deuda total
+        - Calcular deuda total (agregados mantenidos de forma incremental)
         - Aplicar intereses cada turno
         - Gestionar defaults y penalizaciones
         - Ofrecer nuevos préstamos
     
     Dependencias:
         - finance.debt: Clases de deuda
+        - finance.offers.LenderOfferEngine: Tablas de acreedores y ofertas
+        - finance.allocator.PaymentAllocator: Reparto óptimo de pagos
+        - finance.ledger.LoanLedger: Libro mayor de ofertas, pagos y penalizaciones
         - engine.events.EventManager: Para emitir eventos de préstamos
         - engine.state.GameState: Para acceder a recursos del jugador
     """
     
-    def __init__(self):
-        """Inicializa el gestor de préstamos"""
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa el gestor de préstamos
+        
+        Args:
+            config: Configuración del juego (None = valores por defecto)
+        """
         self.active_loans: List[Debt] = []
         self.loan_history: List[Debt] = []
         
+        # Referencias a otros componentes (se asignan después)
+        self.event_manager = None
+        self.game_state = None
+        
+        # Tablas de acreedores y ofertas compiladas desde la configuración
+        self.offer_engine = LenderOfferEngine(config)
+        self.payment_allocator = PaymentAllocator()
+        
+        # Libro mayor (SQLite opcional según la sección 'ledger' de la configuración)
+        ledger_config = (config or {}).get('ledger', {})
+        self.ledger = LoanLedger(
+            db_path=ledger_config.get('db_path'),
+            player=ledger_config.get('player') or None,
+            batch_size=ledger_config.get('batch_size', 25)
+        )
+        
         # Catálogo de acreedores disponibles
         self.available_creditors: Dict[str, Type[Debt]] = {
-            'zorvax': ZorvaxDebt,
-            'ktar': KtarDebt,
-            'nebula': NebulaConsortiumDebt,
-            'friendly': FriendlyDebt
+            key: terms.debt_class for key, terms in self.offer_engine.creditors.items()
         }
         
         # Límites y restricciones
-        self.max_loans = 3  # MVP: máximo 3 préstamos activos
+        gameplay = (config or {}).get('gameplay', {})
+        self.max_loans = gameplay.get('max_active_loans', 3)  # MVP: máximo 3 préstamos activos
         self.friendly_loan_used = False
         
+        # Agregados de deuda: se actualizan al aceptar, pagar, avanzar turno y
+        # penalizar, para que las consultas de cada frame sean O(1)
+        self.debug_aggregates = gameplay.get('debug_loan_aggregates', False)
+        self.aggregate_mismatches = 0
+        self._rebuild_aggregates()
+        
         # Ofertas pendientes
         self.pending_offer: Optional[Dict[str, Any]] = None
         
-        # Referencias a otros componentes (se asignan después)
-        self.event_manager = None
-        self.game_state = None
-        
         logger.info("LoanManager inicializado")
     
     def check_loan_appearance(self) -> Optional[Dict[str, Any]]:
@@ -65,54 +93,24 @@ class LoanManager:
         if not self.game_state or len(self.active_loans) >= self.max_loans:
             return None
         
-        oxygen_level = self.game_state.oxygen
-        
-        # Probabilidad de aparición según oxígeno
-        if oxygen_level < 20:
-            # Oxígeno crítico: prestamista obligatorio
-            appearance_chance = 1.0
-        elif oxygen_level < 50:
-            # Oxígeno bajo: 50% de chance
-            appearance_chance = 0.5
-        else:
-            # Oxígeno aceptable: 20% de chance
-            appearance_chance = 0.2
-        
-        if random.random() > appearance_chance:
+        # Tramo de oxígeno, acreedor y cantidad desde las tablas precompiladas
+        offer = self.offer_engine.sample_offer(self.game_state.oxygen)
+        if offer is None:
             return None
         
-        # Seleccionar prestamista (MVP: solo Zorvax y K'tar inicialmente)
-        if oxygen_level < 20:
-            # Situación crítica: Zorvax siempre aparece
-            creditor_type = 'zorvax'
-        else:
-            # Alternar entre Zorvax y K'tar
-            creditor_type = random.choice(['zorvax', 'ktar'])
-        
-        # Calcular cantidad de préstamo ofrecido
-        if oxygen_level < 20:
-            loan_amount = random.randint(30, 50)  # Préstamo grande en emergencia
-        else:
-            loan_amount = random.randint(20, 40)  # Préstamo moderado
-        
-        # Crear oferta
-        offer = {
-            'creditor_type': creditor_type,
-            'amount': loan_amount,
-            'creditor_name': self._get_creditor_name(creditor_type),
-            'interest_rate': self._get_interest_rate(creditor_type),
-            'materials_to_pay': self._calculate_materials_owed(loan_amount, creditor_type),
-            'turns_to_pay': self._get_payment_terms(creditor_type)
-        }
-        
         self.pending_offer = offer
+        self.ledger.record(OFFER, self._current_turn(), offer['creditor_type'],
+                           oxygen=offer['amount'], materials=offer['materials_to_pay'],
+                           turns_to_pay=offer['turns_to_pay'],
+                           oxygen_level=self.game_state.oxygen)
         
         # Emitir evento de aparición de préstamo
         if self.event_manager:
             from engine.events import EventType
             self.event_manager.emit_quick(EventType.LOAN_APPEARED, offer)
         
-        logger.info(f"Prestamista aparece: {offer['creditor_name']} ofrece {loan_amount} oxígeno")
+        record(TraceKind.LOAN_OFFERED, self.offer_engine.creditors[offer['creditor_type']].code,
+               offer['amount'], offer['materials_to_pay'])
         
         return offer
     
@@ -134,11 +132,18 @@ class LoanManager:
             logger.error(f"Tipo de acreedor desconocido: {offer['creditor_type']}")
             return False
         
-        # Crear el préstamo
-        loan = creditor_class(offer['amount'], offer['turns_to_pay'])
+        # Crear el préstamo con el interés por turno de la configuración
+        terms = self.offer_engine.get_creditor(offer['creditor_type'])
+        loan = creditor_class(offer['amount'], offer['turns_to_pay'], turn_rate=terms.turn_rate)
         
         # Añadir a préstamos activos
+        self._ensure_aggregates()
         self.active_loans.append(loan)
+        self._add_loan_aggregate(loan)
+        self.ledger.record(ACCEPTANCE, self._current_turn(), offer['creditor_type'],
+                           loan_id=self.ledger.register_loan(loan), oxygen=offer['amount'],
+                           materials=loan.materials_owed, turns_to_pay=loan.turns_until_due,
+                           turn_rate=loan.turn_rate)
         
         # Dar oxígeno al jugador
         self.game_state.update_oxygen(offer['amount'])
@@ -159,7 +164,7 @@ class LoanManager:
                 }
             )
         
-        logger.info(f"Préstamo aceptado: {offer['amount']} oxígeno de {loan.creditor_name}")
+        record(TraceKind.LOAN_ACCEPTED, loan.CREDITOR_CODE, offer['amount'], loan.materials_owed)
         
         # Limpiar oferta pendiente
         self.pending_offer = None
@@ -169,7 +174,11 @@ class LoanManager:
     def reject_pending_offer(self) -> None:
         """Rechaza la oferta de préstamo pendiente"""
         if self.pending_offer:
-            logger.info(f"Préstamo rechazado de {self.pending_offer['creditor_name']}")
+            record(TraceKind.LOAN_REJECTED, self.offer_engine.creditors[self.pending_offer['creditor_type']].code,
+                   self.pending_offer['amount'])
+            self.ledger.record(REJECTION, self._current_turn(), self.pending_offer['creditor_type'],
+                               oxygen=self.pending_offer['amount'],
+                               materials=self.pending_offer['materials_to_pay'])
             
             if self.event_manager:
                 from engine.events import EventType
@@ -196,14 +205,18 @@ class LoanManager:
         
         # Verificar que el jugador tiene los materiales
         if self.game_state.materials < materials:
-            logger.warning(f"Materiales insuficientes para pago: {materials} requeridos, {self.game_state.materials} disponibles")
+            record(TraceKind.LOAN_PAYMENT_FAILED, 0, materials, self.game_state.materials)
             return False
         
         # Consumir materiales
         self.game_state.consume_materials(materials)
         
         # Procesar el pago
+        self._ensure_aggregates()
         is_paid_off = loan.make_payment(materials)
+        self.ledger.record(PAYMENT, self._current_turn(), loan.CREDITOR_TYPE,
+                           loan_id=self.ledger.register_loan(loan), materials=materials,
+                           remaining=loan.materials_owed, paid_off=is_paid_off)
         
         # Emitir evento
         if self.event_manager:
@@ -222,10 +235,109 @@ class LoanManager:
         if is_paid_off:
             self.active_loans.remove(loan)
             self.loan_history.append(loan)
-            logger.info(f"Préstamo de {loan.creditor_name} pagado completamente")
+            self._remove_loan_aggregate(loan)
+        else:
+            self._update_loan_aggregate(loan)
         
         return True
     
+    def get_payment_plan(self, materials: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Calcula cuánto pagar a cada préstamo para minimizar las penalizaciones
+        
+        Args:
+            materials: Materiales a repartir (None = todos los del jugador)
+            
+        Returns:
+            Resultado de PaymentAllocator.allocate con 'loans' (préstamos en el
+            mismo orden que 'payments')
+        """
+        if materials is None:
+            materials = self.game_state.materials if self.game_state else 0
+        loans = list(self.active_loans)
+        plan = self.payment_allocator.allocate(loans, materials)
+        plan['loans'] = loans
+        return plan
+    
+    def auto_pay(self, materials: Optional[int] = None) -> int:
+        """
+        Paga los préstamos según el reparto óptimo
+        
+        Args:
+            materials: Materiales a repartir (None = todos los del jugador)
+            
+        Returns:
+            Materiales pagados en total
+        """
+        plan = self.get_payment_plan(materials)
+        paid = 0
+        for loan, amount in zip(plan['loans'], plan['payments']):
+            if amount > 0 and self.make_payment(loan, amount):
+                paid += amount
+        
+        record(TraceKind.AUTO_PAY, 0, paid, len(plan['loans']))
+        return paid
+    
+    def evaluate_what_if(self, candidates: Optional[List[Dict[str, Any]]] = None,
+                         num_futures: Optional[int] = None, horizon: Optional[int] = None,
+                         seed: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Evalúa acciones hipotéticas (aceptar, rechazar, pagar) en una sola llamada
+        
+        Se toma un único snapshot del estado actual y todas las acciones se
+        simulan juntas sobre él (simulation.forecaster.evaluate_what_if), sin
+        copiar el juego por cada candidato.
+        
+        Args:
+            candidates: Lista de acciones:
+                {'action': 'accept', 'offer': oferta}  (sin 'offer' = pending_offer)
+                {'action': 'reject'}
+                {'action': 'pay', 'loan': Debt o índice en active_loans, 'materials': X}
+                None = aceptar y rechazar la oferta pendiente
+            num_futures: Futuros simulados por acción (None = valor por defecto)
+            horizon: Turnos simulados (None = valor por defecto)
+            seed: Semilla (None = aleatoria)
+            
+        Returns:
+            Por acción: oxígeno y materiales inmediatos y proyectados, riesgo de
+            default, riesgo de game over, probabilidad de victoria y turnos
+            esperados hasta la victoria
+        """
+        if not self.game_state:
+            return []
+        
+        from simulation.forecaster import (
+            snapshot_state, evaluate_what_if, DEFAULT_WHAT_IF_FUTURES, DEFAULT_HORIZON
+        )
+        
+        if candidates is None:
+            if not self.pending_offer:
+                return []
+            candidates = [{'action': 'accept'}, {'action': 'reject'}]
+        
+        resolved = []
+        for candidate in candidates:
+            candidate = dict(candidate)
+            if candidate.get('action') == 'accept':
+                offer = candidate.setdefault('offer', self.pending_offer)
+                if not offer:
+                    raise ValueError("No hay oferta que aceptar")
+                terms = self.offer_engine.get_creditor(offer['creditor_type'])
+                candidate.setdefault('turn_rate', terms.turn_rate)
+            elif candidate.get('action') == 'pay':
+                loan = candidate.get('loan')
+                if isinstance(loan, int):
+                    candidate['row'] = loan
+                else:
+                    candidate['row'] = next(i for i, active in enumerate(self.active_loans)
+                                            if active is loan)
+            resolved.append(candidate)
+        
+        snapshot = snapshot_state(self.game_state, self)
+        return evaluate_what_if(snapshot, resolved,
+                                num_futures or DEFAULT_WHAT_IF_FUTURES,
+                                horizon or DEFAULT_HORIZON, seed)
+    
     def get_total_debt_in_materials(self) -> int:
         """
         Calcula la deuda total EN MATERIALES de todos los préstamos activos
@@ -233,7 +345,8 @@ class LoanManager:
         Returns:
             Suma de todos los materiales adeudados
         """
-        return sum(loan.materials_owed for loan in self.active_loans)
+        self._ensure_aggregates()
+        return self._total_owed
     
     def get_minimum_payment_due(self) -> int:
         """
@@ -242,16 +355,162 @@ class LoanManager:
         Returns:
             Suma de todos los pagos mínimos en materiales
         """
-        return sum(loan.get_minimum_payment() for loan in self.active_loans)
+        self._ensure_aggregates()
+        return self._minimum_due
     
-    def process_turn(self) -> None:
-        """Procesa el final del turno para todos los préstamos"""
+    def get_defaulted_count(self) -> int:
+        """
+        Número de préstamos activos en default
+        
+        Returns:
+            Préstamos en default
+        """
+        self._ensure_aggregates()
+        return self._defaulted_count
+    
+    def get_next_due_turn(self) -> Optional[int]:
+        """
+        Turno de la partida en el que vence el próximo préstamo con deuda
+        
+        Returns:
+            Número de turno, o None si no hay préstamos pendientes
+        """
+        self._ensure_aggregates()
+        if self._turns_to_next_due is None:
+            return None
+        return self._current_turn() + self._turns_to_next_due
+    
+    def reset(self) -> None:
+        """Vacía préstamos, historial y ofertas (reinicio de partida)"""
+        self.active_loans.clear()
+        self.loan_history.clear()
+        self.pending_offer = None
+        self.friendly_loan_used = False
+        self._rebuild_aggregates()
+        logger.info("LoanManager reiniciado")
+    
+    def _loan_contribution(self, loan: Debt) -> Tuple[int, int, int, bool]:
+        """Aportación de un préstamo a los agregados"""
+        return (loan.materials_owed, loan.get_minimum_payment(), loan.turns_until_due,
+                loan.is_defaulted)
+    
+    def _add_loan_aggregate(self, loan: Debt) -> None:
+        """Suma un préstamo a los agregados"""
+        owed, minimum, turns, defaulted = self._loan_aggregates[id(loan)] = self._loan_contribution(loan)
+        self._total_owed += owed
+        self._minimum_due += minimum
+        self._defaulted_count += defaulted
+        self._refresh_next_due()
+    
+    def _remove_loan_aggregate(self, loan: Debt) -> None:
+        """Resta un préstamo de los agregados"""
+        contribution = self._loan_aggregates.pop(id(loan), None)
+        if contribution:
+            owed, minimum, _, defaulted = contribution
+            self._total_owed -= owed
+            self._minimum_due -= minimum
+            self._defaulted_count -= defaulted
+        self._refresh_next_due()
+    
+    def _update_loan_aggregate(self, loan: Debt) -> None:
+        """Reemplaza la aportación de un préstamo que ha cambiado"""
+        self._remove_loan_aggregate(loan)
+        self._add_loan_aggregate(loan)
+    
+    def _refresh_next_due(self) -> None:
+        """
+        Recalcula el vencimiento más próximo, marca los agregados como
+        sincronizados y registra el cambio de préstamos en GameState
+        """
+        self._turns_to_next_due = min(
+            (turns for owed, _, turns, _ in self._loan_aggregates.values() if owed > 0),
+            default=None)
+        self._aggregated_list = self.active_loans
+        self._aggregated_count = len(self.active_loans)
+        if self.game_state:
+            self.game_state.mark_changed('loans')
+    
+    def _rebuild_aggregates(self) -> None:
+        """Recalcula todos los agregados desde cero"""
+        self._loan_aggregates: Dict[int, Tuple[int, int, int, bool]] = {}
+        self._total_owed = 0
+        self._minimum_due = 0
+        self._defaulted_count = 0
         for loan in self.active_loans:
-            loan.advance_turn()
+            self._add_loan_aggregate(loan)
+        self._refresh_next_due()
+    
+    def _ensure_aggregates(self) -> None:
+        """
+        Comprueba en O(1) que nadie ha sustituido ni redimensionado active_loans
+        desde fuera; en modo depuración, además, compara con el cálculo completo
+        """
+        if (self.active_loans is not self._aggregated_list or
+                len(self.active_loans) != self._aggregated_count):
+            self._rebuild_aggregates()
+            return
+        
+        if self.debug_aggregates:
+            expected = (
+                sum(loan.materials_owed for loan in self.active_loans),
+                sum(loan.get_minimum_payment() for loan in self.active_loans),
+                sum(1 for loan in self.active_loans if loan.is_defaulted),
+                min((loan.turns_until_due for loan in self.active_loans if loan.materials_owed > 0),
+                    default=None)
+            )
+            actual = (self._total_owed, self._minimum_due, self._defaulted_count,
+                      self._turns_to_next_due)
+            if actual != expected:
+                self.aggregate_mismatches += 1
+                logger.error(f"Agregados de deuda desincronizados: {actual} != {expected}")
+                self._rebuild_aggregates()
+    
+    def process_turn(self) -> None:
+        """
+        Procesa el final del turno para todos los préstamos
+        
+        El interés, los vencimientos y las penalizaciones los calcula
+        finance.loan_step.process_loans; GameState.advance_turn usa la misma
+        regla a través de engine.rules.transition y llama directamente a apply_turn.
+        """
+        loans = tuple(from_debt(loan) for loan in self.active_loans)
+        if not self.game_state:
+            self.apply_turn(tuple(advance_loan(loan) for loan in loans))
+            return
+        
+        before = PlayerResources(self.game_state.oxygen, self.game_state.max_oxygen,
+                                 self.game_state.materials, self.game_state.repair_progress, loans)
+        after = process_loans(before)
+        
+        self.apply_turn(after.loans)
+        apply_resources(self.game_state, before, after)
+    
+    def apply_turn(self, loans: Tuple[Any, ...]) -> None:
+        """
+        Copia en los préstamos activos el fin de turno calculado por engine.rules
+        
+        Registra los defaults nuevos y las penalizaciones en el ledger, la traza
+        y los eventos. Lo que las penalizaciones quitan al jugador ya viene en
+        el estado de engine.rules (lo aplica engine.rules.apply_to_game).
+        
+        Args:
+            loans: finance.loan_step.LoanState de cada préstamo activo, en el mismo orden
+        """
+        self._ensure_aggregates()
+        for loan, state in zip(self.active_loans, loans):
+            was_defaulted = loan.is_defaulted
+            loan.apply_loan_state(state)
+            
+            if loan.is_defaulted and not was_defaulted:
+                self.ledger.record(DEFAULT, self._current_turn(), loan.CREDITOR_TYPE,
+                                   loan_id=self.ledger.register_loan(loan),
+                                   materials=loan.materials_owed)
             
             # Verificar si está en default
             if loan.is_defaulted:
-                self._apply_loan_penalty(loan)
+                self._record_loan_penalty(loan)
+            
+            self._update_loan_aggregate(loan)
         
         # Verificar préstamos vencidos
         overdue_loans = [loan for loan in self.active_loans if loan.turns_until_due <= 0 and loan.materials_owed > 0]
@@ -266,11 +525,11 @@ class LoanManager:
                         'materials_owed': loan.materials_owed
                     }
                 )
-            logger.warning(f"Préstamo vencido: {loan.creditor_name} espera {loan.materials_owed} materiales")
+            record(TraceKind.LOAN_OVERDUE, loan.CREDITOR_CODE, loan.materials_owed)
     
-    def _apply_loan_penalty(self, loan: Debt) -> None:
+    def _record_loan_penalty(self, loan: Debt) -> None:
         """
-        Aplica la penalización de un préstamo en default
+        Registra la penalización de un préstamo en default
         
         Args:
             loan: Préstamo en default
@@ -279,23 +538,15 @@ class LoanManager:
             return
         
         penalty = loan.apply_penalty()
+        self.ledger.record(PENALTY, self._current_turn(), loan.CREDITOR_TYPE,
+                           loan_id=self.ledger.register_loan(loan),
+                           oxygen=penalty.get('oxygen_lost', 0),
+                           materials=penalty.get('materials_lost', 0),
+                           penalty_type=penalty.get('type'),
+                           repair_lost=penalty.get('repair_lost', 0))
         
-        if penalty.get('type') == 'material_theft':
-            # Zorvax roba materiales
-            materials_lost = min(penalty['materials_lost'], self.game_state.materials)
-            self.game_state.consume_materials(materials_lost)
-            logger.info(f"Penalización aplicada: {penalty['message']}")
-            
-        elif penalty.get('type') == 'oxygen_capacity_reduction':
-            # K'tar reduce oxígeno máximo
-            self.game_state.max_oxygen -= penalty['oxygen_lost']
-            self.game_state.oxygen = min(self.game_state.oxygen, self.game_state.max_oxygen)
-            logger.info(f"Penalización aplicada: {penalty['message']}")
-            
-        elif penalty.get('type') == 'repair_sabotage':
-            # Consorcio reduce progreso de reparación
-            self.game_state.update_repair_progress(-penalty['repair_lost'])
-            logger.info(f"Penalización aplicada: {penalty['message']}")
+        record(TraceKind.PENALTY_APPLIED, loan.CREDITOR_CODE, penalty.get('materials_lost', 0),
+               penalty.get('oxygen_lost', 0), penalty.get('repair_lost', 0))
         
         # Emitir evento de penalización
         if self.event_manager:
@@ -305,25 +556,19 @@ class LoanManager:
                 {'creditor': loan.creditor_name, 'penalty': penalty}
             )
     
+    def _current_turn(self) -> int:
+        """Turno actual de la partida (0 sin game_state)"""
+        return self.game_state.turn_number if self.game_state else 0
+    
     def _get_creditor_name(self, creditor_type: str) -> str:
         """Obtiene el nombre del acreedor"""
-        names = {
-            'zorvax': 'Banco Zorvax',
-            'ktar': 'Prestamistas K\'tar',
-            'nebula': 'Consorcio Nebulosa',
-            'friendly': 'Aliado'
-        }
-        return names.get(creditor_type, 'Desconocido')
+        terms = self.offer_engine.get_creditor(creditor_type)
+        return terms.name if terms else 'Desconocido'
     
     def _get_interest_rate(self, creditor_type: str) -> float:
         """Obtiene la tasa de interés del acreedor"""
-        rates = {
-            'zorvax': 0.5,  # 50%
-            'ktar': 0.2,    # 20%
-            'nebula': 0.1,  # 10%
-            'friendly': 0.05 # 5%
-        }
-        return rates.get(creditor_type, 0.5)
+        terms = self.offer_engine.get_creditor(creditor_type)
+        return terms.interest_rate if terms else 0.5
     
     def _calculate_materials_owed(self, oxygen_amount: float, creditor_type: str) -> int:
         """Calcula materiales a pagar según oxígeno prestado"""
@@ -332,13 +577,8 @@ class LoanManager:
     
     def _get_payment_terms(self, creditor_type: str) -> int:
         """Obtiene el plazo de pago en turnos"""
-        terms = {
-            'zorvax': 10,
-            'ktar': 5,
-            'nebula': 15,
-            'friendly': 20
-        }
-        return terms.get(creditor_type, 10)
+        terms = self.offer_engine.get_creditor(creditor_type)
+        return terms.terms if terms else 10
     
     def can_take_loan(self) -> bool:
         """
@@ -352,8 +592,7 @@ class LoanManager:
             return False
         
         # Verificar si hay demasiados defaults
-        defaulted_loans = [loan for loan in self.active_loans if loan.is_defaulted]
-        if len(defaulted_loans) >= 2:
+        if self.get_defaulted_count() >= 2:
             return False
         
         return True
@@ -369,7 +608,7 @@ class LoanManager:
             'active_loans': len(self.active_loans),
             'total_debt_materials': self.get_total_debt_in_materials(),
             'minimum_payment': self.get_minimum_payment_due(),
-            'defaulted_loans': sum(1 for loan in self.active_loans if loan.is_defaulted),
+            'defaulted_loans': self.get_defaulted_count(),
             'loans': []
         }
         
@@ -0,0 +1,129 @@
+"""
+Loan Step - Fin de turno de los préstamos
+Estado inmutable de un préstamo (LoanState) y el paso de turno que comparten
+Debt, CompactDebt, PaymentAllocator, LoanManager y engine.rules: el interés
+del modelo del acreedor (finance.interest), el vencimiento y el default
+(advance_loan), y lo que las penalizaciones (finance.penalties) quitan al
+jugador (process_loans).
+
+Solo depende de finance.interest y finance.penalties: engine.rules importa
+este módulo y nunca al revés.
+"""
+
+from typing import NamedTuple, Tuple
+import logging
+
+from .interest import CREDITOR_INTEREST_MODELS, NoInterest
+from .penalties import CREDITOR_PENALTIES
+
+logger = logging.getLogger(__name__)
+
+
+class LoanState(NamedTuple):
+    """Estado inmutable de un préstamo (mismos campos que finance.debt.Debt)"""
+    creditor: str
+    principal: float
+    materials_owed: int
+    accrued_interest: float
+    base_materials: int
+    turns_until_due: int
+    turn_rate: float
+    is_defaulted: bool = False
+
+
+class PlayerResources(NamedTuple):
+    """
+    Recursos del jugador que tocan las penalizaciones
+    
+    process_loans acepta esta tupla o cualquier otra con los mismos campos
+    (engine.rules.RulesState).
+    """
+    oxygen: float
+    max_oxygen: float
+    materials: int
+    repair_progress: float
+    loans: Tuple[LoanState, ...] = ()
+
+
+def from_debt(loan) -> LoanState:
+    """Copia un préstamo (finance.debt.Debt o CompactDebt)"""
+    return LoanState(loan.CREDITOR_TYPE, loan.principal, loan.materials_owed, loan.accrued_interest,
+                     loan.base_materials, loan.turns_until_due, loan.turn_rate, loan.is_defaulted)
+
+
+def advance_loan(loan: LoanState) -> LoanState:
+    """Un turno de un préstamo: aplica el interés y verifica vencimiento (Debt.advance_turn)"""
+    owed, accrued = loan.materials_owed, loan.accrued_interest
+    if owed > 0:
+        model = CREDITOR_INTEREST_MODELS.get(loan.creditor, NoInterest)
+        balance = float(model.closed_form(owed + accrued, loan.base_materials, 1,
+                                          loan.turns_until_due, loan.turn_rate))
+        owed = int(balance)
+        accrued = balance - owed
+    turns = loan.turns_until_due - 1
+    return LoanState(loan.creditor, loan.principal, owed, accrued, loan.base_materials, turns,
+                     loan.turn_rate, loan.is_defaulted or (turns <= 0 and owed > 0))
+
+
+def _apply_penalty(resources, loan: LoanState):
+    """Efecto en los recursos de un préstamo en default"""
+    penalty = CREDITOR_PENALTIES.get(loan.creditor)
+    if penalty is None:
+        return resources
+    if penalty.kind == 'material_theft':
+        stolen = min(penalty.amount(loan.materials_owed, loan.principal), resources.materials)
+        return resources._replace(materials=resources.materials - stolen)
+    if penalty.kind == 'oxygen_capacity_reduction':
+        max_oxygen = resources.max_oxygen - penalty.amount(loan.materials_owed, loan.principal)
+        return resources._replace(max_oxygen=max_oxygen, oxygen=min(resources.oxygen, max_oxygen))
+    if penalty.kind == 'repair_sabotage':
+        lost = penalty.amount(loan.materials_owed, loan.principal)
+        return resources._replace(repair_progress=max(0, resources.repair_progress - lost))
+    return resources
+
+
+def process_loans(resources):
+    """
+    Fin de turno de los préstamos (LoanManager.process_turn)
+    
+    Avanza cada préstamo y aplica la penalización de los que están en default.
+    
+    Args:
+        resources: PlayerResources o engine.rules.RulesState
+    
+    Returns:
+        La misma tupla con los préstamos y los recursos tras el turno
+    """
+    loans = tuple(advance_loan(loan) for loan in resources.loans)
+    resources = resources._replace(loans=loans)
+    for loan in loans:
+        if loan.is_defaulted:
+            resources = _apply_penalty(resources, loan)
+    return resources
+
+
+def apply_resources(game_state, before, after) -> None:
+    """
+    Copia en la partida los recursos que cambiaron entre dos estados
+    
+    Los cambios pasan por los métodos de GameState (update_oxygen,
+    consume_materials...), que registran la traza y las versiones.
+    
+    Args:
+        game_state: GameState (o un objeto con los mismos métodos)
+        before: Recursos antes del turno (PlayerResources o RulesState)
+        after: Recursos después del turno
+    """
+    if after.max_oxygen != before.max_oxygen:
+        game_state.max_oxygen = after.max_oxygen
+        game_state.mark_changed('oxygen')
+    if after.oxygen != before.oxygen:
+        game_state.update_oxygen(after.oxygen - before.oxygen)
+    
+    if after.materials < before.materials:
+        game_state.consume_materials(before.materials - after.materials)
+    elif after.materials > before.materials:
+        game_state.add_materials(after.materials - before.materials)
+    
+    if after.repair_progress != before.repair_progress:
+        game_state.update_repair_progress(after.repair_progress - before.repair_progress)
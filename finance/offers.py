@@ -0,0 +1,274 @@
+"""
+Offers - Motor de ofertas de prestamistas
+Compila las secciones 'creditors' y 'loan_offers' de config.json en tablas de
+consulta inmutables al arrancar. Cada oferta se muestrea con una búsqueda
+binaria sobre distribuciones acumuladas precalculadas, sin reconstruir
+diccionarios en cada llamada. También genera lotes de ofertas con NumPy para
+las simulaciones (códigos de acreedor compatibles con LoanPortfolio).
+"""
+
+from bisect import bisect_right
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Type, Any
+import random
+import logging
+
+import numpy as np
+
+from .debt import Debt
+from .interest import DEFAULT_TURN_RATES
+from .portfolio import CREDITOR_TABLE, CREDITOR_CODES
+
+logger = logging.getLogger(__name__)
+
+
+# Acreedores por defecto (equivalentes a la sección 'creditors' de config.json)
+DEFAULT_CREDITORS: Dict[str, Dict[str, Any]] = {
+    'zorvax': {'name': 'Banco Zorvax', 'default_terms': 10},
+    'ktar': {'name': 'Prestamistas K\'tar', 'default_terms': 5},
+    'nebula': {'name': 'Consorcio Nebulosa', 'default_terms': 15},
+    'friendly': {'name': 'Aliado', 'default_terms': 20},
+}
+
+# Tramos de oxígeno por defecto (sección 'loan_offers' de config.json).
+# max_oxygen es el límite superior exclusivo del tramo; None = sin límite
+DEFAULT_OFFER_BANDS: Tuple[Dict[str, Any], ...] = (
+    {'max_oxygen': 20, 'appearance_chance': 1.0,
+     'creditors': {'zorvax': 1}, 'amount': [30, 50]},
+    {'max_oxygen': 50, 'appearance_chance': 0.5,
+     'creditors': {'zorvax': 1, 'ktar': 1}, 'amount': [20, 40]},
+    {'max_oxygen': None, 'appearance_chance': 0.2,
+     'creditors': {'zorvax': 1, 'ktar': 1}, 'amount': [20, 40]},
+)
+
+
+@dataclass(frozen=True)
+class CreditorTerms:
+    """
+    Condiciones compiladas de un acreedor
+    
+    Atributos:
+        key: Clave del acreedor ('zorvax', 'ktar', ...)
+        code: Código numérico (índice de CREDITOR_TABLE)
+        name: Nombre mostrado
+        debt_class: Clase de Debt que se crea al aceptar
+        interest_rate: Conversión oxígeno -> materiales (0.5 = +50%)
+        turn_rate: Interés por turno (base_interest_rate de config.json)
+        terms: Plazo por defecto en turnos
+    """
+    key: str
+    code: int
+    name: str
+    debt_class: Type[Debt]
+    interest_rate: float
+    turn_rate: float
+    terms: int
+    
+    def materials_owed(self, amount: float) -> int:
+        """Materiales a devolver por `amount` de oxígeno"""
+        return int(amount * (1 + self.interest_rate))
+
+
+@dataclass(frozen=True)
+class OfferBand:
+    """
+    Tramo de oxígeno con su probabilidad de aparición y de cada acreedor
+    
+    Atributos:
+        max_oxygen: Límite superior exclusivo (inf = sin límite)
+        appearance_chance: Probabilidad de que aparezca un prestamista
+        creditor_keys: Acreedores posibles
+        cumulative_weights: Distribución acumulada normalizada (último = 1.0)
+        min_amount: Oxígeno mínimo ofrecido
+        max_amount: Oxígeno máximo ofrecido (inclusive)
+    """
+    max_oxygen: float
+    appearance_chance: float
+    creditor_keys: Tuple[str, ...]
+    cumulative_weights: Tuple[float, ...]
+    min_amount: int
+    max_amount: int
+    
+    def pick_creditor(self, roll: float) -> str:
+        """Acreedor correspondiente a una tirada uniforme en [0, 1)"""
+        index = bisect_right(self.cumulative_weights, roll)
+        return self.creditor_keys[min(index, len(self.creditor_keys) - 1)]
+
+
+class LenderOfferEngine:
+    """
+    Motor de ofertas compilado desde la configuración
+    
+    Las tablas se construyen una sola vez en __init__ y son de solo lectura:
+    muestrear una oferta es una búsqueda binaria del tramo de oxígeno y otra
+    del acreedor en la distribución acumulada del tramo.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            config: Configuración del juego (None = valores por defecto)
+        """
+        config = config or {}
+        self.creditors: Mapping[str, CreditorTerms] = MappingProxyType(
+            self._compile_creditors(config.get('creditors', {})))
+        self.bands: Tuple[OfferBand, ...] = self._compile_bands(
+            config.get('loan_offers', {}).get('bands', DEFAULT_OFFER_BANDS))
+        self._thresholds: Tuple[float, ...] = tuple(band.max_oxygen for band in self.bands[:-1])
+        
+        # Tablas NumPy para generar lotes (una fila por tramo)
+        width = max(len(band.creditor_keys) for band in self.bands)
+        self._np_thresholds = np.array(self._thresholds, dtype=np.float64)
+        self._np_chances = np.array([band.appearance_chance for band in self.bands])
+        self._np_min_amounts = np.array([band.min_amount for band in self.bands], dtype=np.int64)
+        self._np_max_amounts = np.array([band.max_amount for band in self.bands], dtype=np.int64)
+        self._np_cumulative = np.ones((len(self.bands), width))
+        self._np_codes = np.zeros((len(self.bands), width), dtype=np.int8)
+        for row, band in enumerate(self.bands):
+            count = len(band.creditor_keys)
+            self._np_cumulative[row, :count] = band.cumulative_weights
+            self._np_codes[row, :count] = [self.creditors[key].code for key in band.creditor_keys]
+            self._np_codes[row, count:] = self._np_codes[row, count - 1]
+        codes = sorted(terms.code for terms in self.creditors.values())
+        by_code = {terms.code: terms for terms in self.creditors.values()}
+        self._np_conversion = np.array([by_code[code].interest_rate for code in codes])
+        self._np_terms = np.array([by_code[code].terms for code in codes], dtype=np.int64)
+        self._np_turn_rates = np.array([by_code[code].turn_rate for code in codes])
+        
+        logger.info(f"Motor de ofertas compilado: {len(self.creditors)} acreedores, "
+                    f"{len(self.bands)} tramos de oxígeno")
+    
+    @staticmethod
+    def _compile_creditors(section: Dict[str, Any]) -> Dict[str, CreditorTerms]:
+        """Combina la sección 'creditors' con los términos de finance.debt"""
+        compiled = {}
+        for key, debt_class, interest_rate, class_terms in CREDITOR_TABLE:
+            entry = {**DEFAULT_CREDITORS[key], **section.get(key, {})}
+            compiled[key] = CreditorTerms(
+                key=key,
+                code=CREDITOR_CODES[key],
+                name=entry['name'],
+                debt_class=debt_class,
+                interest_rate=interest_rate,
+                turn_rate=float(entry.get('base_interest_rate', DEFAULT_TURN_RATES[key])),
+                terms=int(entry.get('default_terms', class_terms))
+            )
+        return compiled
+    
+    def _compile_bands(self, bands: Sequence[Dict[str, Any]]) -> Tuple[OfferBand, ...]:
+        """Ordena los tramos y precalcula sus distribuciones acumuladas"""
+        if not bands:
+            raise ValueError("loan_offers.bands no puede estar vacío")
+        
+        compiled = []
+        for band in bands:
+            weights = band['creditors']
+            unknown = [key for key in weights if key not in self.creditors]
+            if unknown:
+                raise ValueError(f"Acreedor desconocido en loan_offers: {unknown}")
+            total = float(sum(weights.values()))
+            if total <= 0:
+                raise ValueError("Los pesos de acreedores de un tramo deben sumar más de 0")
+            
+            cumulative, running = [], 0.0
+            for weight in weights.values():
+                running += weight
+                cumulative.append(running / total)
+            cumulative[-1] = 1.0
+            
+            max_oxygen = band.get('max_oxygen')
+            min_amount, max_amount = band['amount']
+            compiled.append(OfferBand(
+                max_oxygen=float('inf') if max_oxygen is None else float(max_oxygen),
+                appearance_chance=float(band['appearance_chance']),
+                creditor_keys=tuple(weights),
+                cumulative_weights=tuple(cumulative),
+                min_amount=int(min_amount),
+                max_amount=int(max_amount)
+            ))
+        
+        compiled.sort(key=lambda band: band.max_oxygen)
+        return tuple(compiled)
+    
+    def get_creditor(self, creditor_type: str) -> Optional[CreditorTerms]:
+        """Condiciones de un acreedor (None si no existe)"""
+        return self.creditors.get(creditor_type)
+    
+    def get_band(self, oxygen: float) -> OfferBand:
+        """Tramo que corresponde a un nivel de oxígeno"""
+        return self.bands[bisect_right(self._thresholds, oxygen)]
+    
+    def build_offer(self, creditor_type: str, amount: int) -> Dict[str, Any]:
+        """
+        Construye una oferta para un acreedor y una cantidad concretos
+        
+        Returns:
+            Diccionario con el formato de LoanManager.pending_offer
+        """
+        terms = self.creditors[creditor_type]
+        return {
+            'creditor_type': creditor_type,
+            'amount': amount,
+            'creditor_name': terms.name,
+            'interest_rate': terms.interest_rate,
+            'materials_to_pay': terms.materials_owed(amount),
+            'turns_to_pay': terms.terms
+        }
+    
+    def sample_offer(self, oxygen: float,
+                     rng: Optional[random.Random] = None) -> Optional[Dict[str, Any]]:
+        """
+        Muestrea la oferta de un prestamista para un nivel de oxígeno
+        
+        Args:
+            oxygen: Oxígeno actual del jugador
+            rng: Generador aleatorio (None = módulo random)
+        
+        Returns:
+            Oferta o None si no aparece ningún prestamista
+        """
+        rng = rng or random
+        band = self.get_band(oxygen)
+        if rng.random() > band.appearance_chance:
+            return None
+        
+        creditor_type = band.pick_creditor(rng.random())
+        amount = rng.randint(band.min_amount, band.max_amount)
+        return self.build_offer(creditor_type, amount)
+    
+    def sample_offers_batch(self, oxygen: Sequence[float],
+                            rng: Optional[np.random.Generator] = None) -> Dict[str, np.ndarray]:
+        """
+        Muestrea una oferta por jugador simulado de forma vectorizada
+        
+        Args:
+            oxygen: Oxígeno de cada jugador
+            rng: Generador de NumPy (None = nuevo generador aleatorio)
+        
+        Returns:
+            Diccionario de arrays: 'appeared' (máscara), 'creditor' (código de
+            LoanPortfolio), 'amount', 'materials_to_pay', 'turns' y 'turn_rate'.
+            Las filas sin oferta conservan valores muestreados que se ignoran.
+        """
+        rng = rng or np.random.default_rng()
+        oxygen = np.asarray(oxygen, dtype=np.float64)
+        n = len(oxygen)
+        
+        band = np.searchsorted(self._np_thresholds, oxygen, side='right')
+        appeared = rng.random(n) <= self._np_chances[band]
+        
+        cumulative = self._np_cumulative[band]
+        column = np.minimum((cumulative <= rng.random(n)[:, None]).sum(axis=1),
+                            cumulative.shape[1] - 1)
+        creditor = self._np_codes[band, column]
+        amount = rng.integers(self._np_min_amounts[band], self._np_max_amounts[band] + 1)
+        
+        return {
+            'appeared': appeared,
+            'creditor': creditor,
+            'amount': amount,
+            'materials_to_pay': (amount * (1 + self._np_conversion[creditor])).astype(np.int64),
+            'turns': self._np_terms[creditor],
+            'turn_rate': self._np_turn_rates[creditor]
+        }
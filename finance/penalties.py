@@ -0,0 +1,109 @@
+"""
+Penalties - Penalizaciones por impago de cada acreedor
+Tabla única con la penalización que aplica cada acreedor a un préstamo en
+default. La leen Debt.apply_penalty, CompactDebt, LoanPortfolio,
+PaymentAllocator y engine.rules, así que las fórmulas solo están aquí.
+
+Igual que en finance.interest, cada fórmula sirve para un préstamo
+(escalares) o para una cartera entera (arrays de NumPy): basta con pasarle
+np.maximum y np.minimum en lugar de max y min.
+
+Penalizaciones:
+    - material_theft: Zorvax roba materiales (10% de lo adeudado, mínimo 3)
+    - oxygen_capacity_reduction: K'tar reduce el oxígeno máximo (20% del principal, máximo 10)
+    - repair_sabotage: la Nebulosa sabotea la reparación (10% del principal, máximo 10)
+    - narrative_only: el aliado se decepciona (sin efecto en recursos)
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _zorvax_amount(materials_owed, principal, maximum=max, minimum=min):
+    """Materiales robados"""
+    return maximum(3, materials_owed // 10)
+
+
+def _ktar_amount(materials_owed, principal, maximum=max, minimum=min):
+    """Puntos de oxígeno máximo perdidos"""
+    return minimum(10, principal * 0.2)
+
+
+def _nebula_amount(materials_owed, principal, maximum=max, minimum=min):
+    """Porcentaje de reparación perdido"""
+    return minimum(10, principal * 0.1)
+
+
+def _friendly_amount(materials_owed, principal, maximum=max, minimum=min):
+    """Una decepción por turno (no afecta a los recursos)"""
+    return 1
+
+
+@dataclass(frozen=True)
+class CreditorPenalty:
+    """
+    Penalización de un acreedor por cada turno en default
+    
+    Atributos:
+        kind: Tipo de penalización ('material_theft', ...)
+        field: Clave del recurso perdido en el resultado (None = solo narrativa)
+        amount: Fórmula (materials_owed, principal, maximum, minimum) -> cantidad
+        message: Mensaje para el jugador ({amount} = cantidad)
+    """
+    kind: str
+    field: Optional[str]
+    amount: Callable
+    message: str
+    
+    def describe(self, materials_owed: int, principal: float) -> Dict[str, Any]:
+        """
+        Penalización de un préstamo, en el formato de Debt.apply_penalty
+        
+        Args:
+            materials_owed: Materiales adeudados
+            principal: Oxígeno prestado
+        
+        Returns:
+            Diccionario con type, la cantidad perdida (si aplica) y message
+        """
+        if self.field is None:
+            return {"type": self.kind, "message": self.message}
+        amount = self.amount(materials_owed, principal)
+        return {
+            "type": self.kind,
+            self.field: amount,
+            "message": self.message.format(amount=amount)
+        }
+
+
+# Tabla de penalizaciones por clave de acreedor
+CREDITOR_PENALTIES: Mapping[str, CreditorPenalty] = MappingProxyType({
+    'zorvax': CreditorPenalty(
+        kind='material_theft',
+        field='materials_lost',
+        amount=_zorvax_amount,
+        message="Zorvax se lleva {amount} materiales como penalización"
+    ),
+    'ktar': CreditorPenalty(
+        kind='oxygen_capacity_reduction',
+        field='oxygen_lost',
+        amount=_ktar_amount,
+        message="K'tar reduce tu oxígeno máximo en {amount:.0f}"
+    ),
+    'nebula': CreditorPenalty(
+        kind='repair_sabotage',
+        field='repair_lost',
+        amount=_nebula_amount,
+        message="El Consorcio sabotea tu nave, pierdes {amount:.0f}% de reparación"
+    ),
+    'friendly': CreditorPenalty(
+        kind='narrative_only',
+        field=None,
+        amount=_friendly_amount,
+        message="Tu aliado está decepcionado. No volverá a ayudarte."
+    ),
+})
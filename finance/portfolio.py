@@ -0,0 +1,366 @@
+"""
+Portfolio - Cartera vectorizada de préstamos
+Backend alternativo a LoanManager para simulaciones masivas: guarda los préstamos
+de miles de jugadores simulados en arrays de NumPy y avanza turnos, detecta
+defaults y calcula penalizaciones con operaciones vectorizadas. Los resultados
+son idénticos a los de ZorvaxDebt, KtarDebt, NebulaConsortiumDebt y FriendlyDebt.
+"""
+
+from typing import Dict, List, Optional, Sequence, Any
+import logging
+
+import numpy as np
+
+from .debt import Debt, ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt
+from .interest import CREDITOR_INTEREST_MODELS, DEFAULT_TURN_RATES
+from .penalties import CREDITOR_PENALTIES
+
+logger = logging.getLogger(__name__)
+
+
+# Códigos de acreedor (índice en CREDITOR_TABLE)
+ZORVAX = ZorvaxDebt.CREDITOR_CODE
+KTAR = KtarDebt.CREDITOR_CODE
+NEBULA = NebulaConsortiumDebt.CREDITOR_CODE
+FRIENDLY = FriendlyDebt.CREDITOR_CODE
+
+# Términos leídos de las clases de finance.debt, ordenados por CREDITOR_CODE:
+# (clave, clase, interés, plazo)
+CREDITOR_TABLE = tuple(
+    (debt_class.CREDITOR_TYPE, debt_class, debt_class.INTEREST_RATE, debt_class.DEFAULT_TERMS)
+    for debt_class in sorted((ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt),
+                             key=lambda debt_class: debt_class.CREDITOR_CODE)
+)
+
+CREDITOR_CODES: Dict[str, int] = {key: code for code, (key, _, _, _) in enumerate(CREDITOR_TABLE)}
+INTEREST_RATES = np.array([rate for _, _, rate, _ in CREDITOR_TABLE])
+DEFAULT_TERMS = np.array([turns for _, _, _, turns in CREDITOR_TABLE])
+DEFAULT_RATES = np.array([DEFAULT_TURN_RATES[key] for key, _, _, _ in CREDITOR_TABLE])
+# Forma cerrada del modelo de interés de cada acreedor (finance.interest)
+INTEREST_FORMULAS = tuple(CREDITOR_INTEREST_MODELS[key].closed_form for key, _, _, _ in CREDITOR_TABLE)
+# Fórmula de penalización de cada acreedor (finance.penalties)
+PENALTY_FORMULAS = tuple(CREDITOR_PENALTIES[key].amount for key, _, _, _ in CREDITOR_TABLE)
+
+# Máximo de oxígeno que presta un aliado (FriendlyDebt)
+FRIENDLY_MAX_PRINCIPAL = FriendlyDebt.MAX_PRINCIPAL
+
+
+class LoanPortfolio:
+    """
+    Préstamos de muchos jugadores en arrays columnares
+    
+    Cada préstamo ocupa una fila; `player` indica a qué jugador pertenece.
+    Los préstamos pagados quedan inactivos (active=False), igual que
+    LoanManager los mueve de active_loans a loan_history.
+    
+    Arrays por préstamo:
+        player, creditor, principal, interest_rate, current_balance,
+        materials_owed, turns_until_due, is_defaulted, active,
+        turn_rate, accrued_interest, base_materials
+    """
+    
+    # Arrays por préstamo (se amplían juntos)
+    _COLUMNS = ('player', 'creditor', 'principal', 'interest_rate', 'current_balance',
+                'materials_owed', 'turns_until_due', 'is_defaulted', 'active',
+                'turn_rate', 'accrued_interest', 'base_materials')
+    
+    def __init__(self, num_players: int, capacity: int = 1024):
+        """
+        Args:
+            num_players: Número de jugadores simulados
+            capacity: Reserva inicial de filas (crece automáticamente)
+        """
+        self.num_players = num_players
+        self.size = 0
+        
+        self.player = np.zeros(capacity, dtype=np.int64)
+        self.creditor = np.zeros(capacity, dtype=np.int8)
+        self.principal = np.zeros(capacity, dtype=np.float64)
+        self.interest_rate = np.zeros(capacity, dtype=np.float64)
+        self.current_balance = np.zeros(capacity, dtype=np.float64)
+        self.materials_owed = np.zeros(capacity, dtype=np.int64)
+        self.turns_until_due = np.zeros(capacity, dtype=np.int64)
+        self.is_defaulted = np.zeros(capacity, dtype=bool)
+        self.active = np.zeros(capacity, dtype=bool)
+        self.turn_rate = np.zeros(capacity, dtype=np.float64)
+        self.accrued_interest = np.zeros(capacity, dtype=np.float64)
+        self.base_materials = np.zeros(capacity, dtype=np.int64)
+    
+    def _reserve(self, extra: int) -> None:
+        """Amplía los arrays (al doble) si no caben `extra` filas más"""
+        capacity = len(self.player)
+        needed = self.size + extra
+        if needed <= capacity:
+            return
+        
+        new_capacity = max(needed, capacity * 2)
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=column.dtype)
+            grown[:self.size] = column[:self.size]
+            setattr(self, name, grown)
+    
+    def add_loans(self, players: Sequence[int], creditors: Sequence[int],
+                  principals: Sequence[float],
+                  turns: Optional[Sequence[int]] = None,
+                  turn_rates: Optional[Sequence[float]] = None) -> np.ndarray:
+        """
+        Añade un lote de préstamos
+        
+        Args:
+            players: Jugador de cada préstamo
+            creditors: Código de acreedor de cada préstamo (ZORVAX, KTAR, ...)
+            principals: Oxígeno prestado
+            turns: Plazo en turnos (None = plazo por defecto del acreedor)
+            turn_rates: Interés por turno (None = tipo por defecto del acreedor)
+        
+        Returns:
+            Índices de las filas creadas
+        """
+        players = np.asarray(players, dtype=np.int64)
+        creditors = np.asarray(creditors, dtype=np.int8)
+        principals = np.asarray(principals, dtype=np.float64)
+        count = len(players)
+        
+        self._reserve(count)
+        rows = np.arange(self.size, self.size + count)
+        self.size += count
+        
+        # FriendlyDebt limita el principal antes de calcular nada
+        principals = np.where(creditors == FRIENDLY,
+                              np.minimum(principals, FRIENDLY_MAX_PRINCIPAL), principals)
+        rates = INTEREST_RATES[creditors]
+        
+        self.player[rows] = players
+        self.creditor[rows] = creditors
+        self.principal[rows] = principals
+        self.interest_rate[rows] = rates
+        self.current_balance[rows] = principals
+        # Misma fórmula que Debt.__post_init__: int(principal * (1 + interés))
+        self.materials_owed[rows] = np.trunc(principals * (1 + rates)).astype(np.int64)
+        self.turns_until_due[rows] = DEFAULT_TERMS[creditors] if turns is None else turns
+        self.is_defaulted[rows] = False
+        self.active[rows] = True
+        self.turn_rate[rows] = DEFAULT_RATES[creditors] if turn_rates is None else turn_rates
+        self.accrued_interest[rows] = 0.0
+        self.base_materials[rows] = self.materials_owed[rows]
+        
+        return rows
+    
+    @classmethod
+    def from_debts(cls, debts_by_player: List[List[Debt]]) -> 'LoanPortfolio':
+        """
+        Crea una cartera a partir de objetos Debt (p.ej. active_loans de LoanManager)
+        
+        Args:
+            debts_by_player: Lista de préstamos de cada jugador
+        
+        Returns:
+            Cartera con el estado actual de esos préstamos
+        """
+        class_codes = {debt_class: code for code, (_, debt_class, _, _) in enumerate(CREDITOR_TABLE)}
+        debts = [(player, debt) for player, loans in enumerate(debts_by_player) for debt in loans]
+        
+        portfolio = cls(len(debts_by_player), capacity=max(1, len(debts)))
+        if not debts:
+            return portfolio
+        
+        rows = portfolio.add_loans([player for player, _ in debts],
+                                   [class_codes[type(debt)] for _, debt in debts],
+                                   [debt.principal for _, debt in debts],
+                                   [debt.turns_until_due for _, debt in debts],
+                                   [debt.turn_rate for _, debt in debts])
+        # Copiar el estado tal cual (pagos o turnos ya transcurridos)
+        portfolio.current_balance[rows] = [debt.current_balance for _, debt in debts]
+        portfolio.materials_owed[rows] = [debt.materials_owed for _, debt in debts]
+        portfolio.is_defaulted[rows] = [debt.is_defaulted for _, debt in debts]
+        portfolio.accrued_interest[rows] = [debt.accrued_interest for _, debt in debts]
+        portfolio.base_materials[rows] = [debt.base_materials for _, debt in debts]
+        return portfolio
+    
+    def replicate(self, copies: int) -> 'LoanPortfolio':
+        """
+        Crea una cartera con `copies` copias independientes de esta
+        
+        El jugador p de la copia c pasa a ser el jugador c * num_players + p.
+        Útil para simular muchos futuros posibles de la misma partida.
+        
+        Args:
+            copies: Número de copias
+        
+        Returns:
+            Nueva cartera con num_players * copies jugadores
+        """
+        n = self.size
+        replica = LoanPortfolio(self.num_players * copies, capacity=max(1, n * copies))
+        replica.size = n * copies
+        for name in self._COLUMNS:
+            getattr(replica, name)[:replica.size] = np.tile(getattr(self, name)[:n], copies)
+        
+        offsets = np.repeat(np.arange(copies) * self.num_players, n)
+        replica.player[:replica.size] += offsets
+        return replica
+    
+    def make_payments(self, rows: Sequence[int], materials_paid: Sequence[int]) -> np.ndarray:
+        """
+        Aplica pagos EN MATERIALES a varios préstamos (equivale a Debt.make_payment)
+        
+        Args:
+            rows: Índices de los préstamos (sin repetir)
+            materials_paid: Materiales pagados a cada uno (<= 0 se ignora)
+        
+        Returns:
+            Máscara de los préstamos de `rows` que quedaron pagados
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        paid = np.asarray(materials_paid, dtype=np.int64)
+        valid = paid > 0
+        rows, paid = rows[valid], paid[valid]
+        
+        principal = self.principal[rows]
+        self.materials_owed[rows] = np.maximum(0, self.materials_owed[rows] - paid)
+        payment_ratio = paid / (principal * (1 + self.interest_rate[rows]))
+        self.current_balance[rows] = np.maximum(
+            0, self.current_balance[rows] - principal * payment_ratio)
+        
+        paid_off = self.materials_owed[rows] <= 0
+        self.active[rows[paid_off]] = False
+        self.accrued_interest[rows[paid_off]] = 0.0
+        
+        result = np.zeros(len(valid), dtype=bool)
+        result[valid] = paid_off
+        return result
+    
+    def advance_turn(self) -> Dict[str, np.ndarray]:
+        """
+        Avanza un turno todos los préstamos activos y calcula penalizaciones
+        
+        Equivale a LoanManager.process_turn(): Debt.advance_turn() (interés del
+        turno y vencimiento) seguido de apply_penalty() para cada préstamo en default.
+        
+        Returns:
+            Diccionario con:
+                defaulted: Índices de préstamos en default (penalizados este turno)
+                overdue: Índices de préstamos vencidos con materiales pendientes
+                materials_lost: Penalización de Zorvax por préstamo (0 si no aplica)
+                oxygen_lost: Penalización de K'tar por préstamo
+                repair_lost: Penalización del Consorcio por préstamo
+        """
+        n = self.size
+        active = self.active[:n]
+        turns = self.turns_until_due[:n]
+        owed = self.materials_owed[:n]
+        
+        # Interés del turno, con la fórmula de cada acreedor
+        balance = self.project_balances(1)
+        growing = active & (owed > 0)
+        owed[growing] = balance[growing].astype(np.int64)
+        self.accrued_interest[:n][growing] = balance[growing] - owed[growing]
+        
+        turns[active] -= 1
+        overdue = active & (turns <= 0) & (owed > 0)
+        self.is_defaulted[:n] |= overdue
+        defaulted = active & self.is_defaulted[:n]
+        
+        creditor = self.creditor[:n]
+        principal = self.principal[:n]
+        materials_lost = np.where(defaulted & (creditor == ZORVAX),
+                                  PENALTY_FORMULAS[ZORVAX](owed, principal, np.maximum, np.minimum), 0)
+        oxygen_lost = np.where(defaulted & (creditor == KTAR),
+                               PENALTY_FORMULAS[KTAR](owed, principal, np.maximum, np.minimum), 0.0)
+        repair_lost = np.where(defaulted & (creditor == NEBULA),
+                               PENALTY_FORMULAS[NEBULA](owed, principal, np.maximum, np.minimum), 0.0)
+        
+        return {
+            'defaulted': np.flatnonzero(defaulted),
+            'overdue': np.flatnonzero(overdue),
+            'materials_lost': materials_lost,
+            'oxygen_lost': oxygen_lost,
+            'repair_lost': repair_lost
+        }
+    
+    def apply_penalties(self, penalties: Dict[str, np.ndarray], materials: np.ndarray,
+                        max_oxygen: np.ndarray, oxygen: np.ndarray,
+                        repair_progress: np.ndarray) -> None:
+        """
+        Aplica a los recursos de cada jugador las penalizaciones de advance_turn
+        
+        Modifica in situ los arrays por jugador, con los mismos límites que
+        finance.loan_step.process_loans (no se roban más materiales de los
+        que hay, el oxígeno no supera el máximo y la reparación no baja de 0).
+        """
+        player = self.player[:self.size]
+        
+        stolen = np.bincount(player, weights=penalties['materials_lost'],
+                             minlength=self.num_players).astype(materials.dtype)
+        materials -= np.minimum(stolen, materials)
+        
+        max_oxygen -= np.bincount(player, weights=penalties['oxygen_lost'],
+                                  minlength=self.num_players)
+        np.minimum(oxygen, max_oxygen, out=oxygen)
+        
+        repair_progress -= np.bincount(player, weights=penalties['repair_lost'],
+                                       minlength=self.num_players)
+        np.maximum(repair_progress, 0, out=repair_progress)
+    
+    def project_balances(self, turns: int) -> np.ndarray:
+        """
+        Saldo de cada préstamo dentro de `turns` turnos sin pagos (Debt.project_balance)
+        
+        Forma cerrada: el coste no depende de `turns`.
+        
+        Returns:
+            Materiales adeudados (con fracción) por préstamo; 0 si está pagado
+        """
+        n = self.size
+        owed = self.materials_owed[:n]
+        balance = np.zeros(n)
+        for code, formula in enumerate(INTEREST_FORMULAS):
+            mask = (self.creditor[:n] == code) & (owed > 0)
+            if mask.any():
+                balance[mask] = formula(owed[mask] + self.accrued_interest[:n][mask],
+                                        self.base_materials[:n][mask], turns,
+                                        self.turns_until_due[:n][mask], self.turn_rate[:n][mask])
+        return balance
+    
+    def get_minimum_payments(self) -> np.ndarray:
+        """Pago mínimo por préstamo (Debt.get_minimum_payment); 0 si está inactivo"""
+        n = self.size
+        owed = self.materials_owed[:n]
+        turns = self.turns_until_due[:n]
+        
+        proportional = np.maximum(1, owed // np.maximum(turns, 1))
+        minimum = np.where(turns <= 0, owed,
+                           np.where(turns <= 2, np.maximum(1, owed // 2), proportional))
+        return np.where(self.active[:n], minimum, 0)
+    
+    def get_total_debt(self) -> np.ndarray:
+        """Materiales adeudados por jugador (get_total_debt_in_materials)"""
+        n = self.size
+        return np.bincount(self.player[:n], weights=np.where(self.active[:n], self.materials_owed[:n], 0),
+                           minlength=self.num_players).astype(np.int64)
+    
+    def get_minimum_payment_due(self) -> np.ndarray:
+        """Pago mínimo total por jugador (get_minimum_payment_due)"""
+        return np.bincount(self.player[:self.size], weights=self.get_minimum_payments(),
+                           minlength=self.num_players).astype(np.int64)
+    
+    def get_active_loan_counts(self) -> np.ndarray:
+        """Número de préstamos activos por jugador"""
+        return np.bincount(self.player[:self.size], weights=self.active[:self.size],
+                           minlength=self.num_players).astype(np.int64)
+    
+    def get_loan_state(self, row: int) -> Dict[str, Any]:
+        """Estado de un préstamo, con los mismos nombres que los atributos de Debt"""
+        return {
+            'creditor': CREDITOR_TABLE[self.creditor[row]][0],
+            'principal': float(self.principal[row]),
+            'interest_rate': float(self.interest_rate[row]),
+            'current_balance': float(self.current_balance[row]),
+            'materials_owed': int(self.materials_owed[row]),
+            'turns_until_due': int(self.turns_until_due[row]),
+            'is_defaulted': bool(self.is_defaulted[row]),
+            'turn_rate': float(self.turn_rate[row]),
+            'accrued_interest': float(self.accrued_interest[row]),
+            'base_materials': int(self.base_materials[row])
+        }
@@ -3,8 +3,9 @@ Gameplay Module
 Módulo que contiene la lógica principal del juego: recursos, reparación y minijuegos
 """
 
-from .resources import ResourceManager
-from .repair import RepairSystem
+from .resources import ResourceManager, ResourceType, Resource
+from .repair import RepairSystem, ShipComponent, ComponentStatus
+from .difficulty import DifficultyEngine
 
-__all__ = ['ResourceManager', 'RepairSystem']
+__all__ = ['ResourceManager', 'ResourceType', 'Resource', 'RepairSystem', 'ShipComponent', 'ComponentStatus', 'DifficultyEngine']
 
@@ -0,0 +1,192 @@
+"""
+Difficulty - Motor de dificultad de los minijuegos
+Compila una sola vez, al arrancar, los multiplicadores de dificultad de
+config.json en tablas de parámetros por minijuego, indexadas por nivel de
+dificultad y turno. Los minijuegos leen su ajuste con una consulta O(1).
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class TuningParameter:
+    """
+    Parámetro ajustable de un minijuego
+    
+    Attributes:
+        base: Valor en dificultad 1.0 (config.json puede sobrescribirlo)
+        scaling: Cómo le afecta el multiplicador:
+            'fixed' (no cambia), 'scale' (base * m) o 'inverse' (base / m)
+        minimum: Límite inferior tras escalar
+        maximum: Límite superior tras escalar
+        integer: Redondear a entero
+    """
+    base: float
+    scaling: str = 'fixed'
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    integer: bool = False
+    
+    def resolve(self, base: float, multiplier: float) -> float:
+        """Calcula el valor del parámetro para un multiplicador"""
+        if self.scaling == 'scale':
+            value = base * multiplier
+        elif self.scaling == 'inverse':
+            value = base / multiplier
+        else:
+            value = base
+        
+        if self.minimum is not None:
+            value = max(self.minimum, value)
+        if self.maximum is not None:
+            value = min(self.maximum, value)
+        return int(round(value)) if self.integer else value
+
+
+# Parámetros de cada minijuego. Los valores base son los de dificultad normal;
+# al subir la dificultad el minijuego se vuelve más exigente.
+MINIGAME_PARAMETERS: Dict[str, Dict[str, TuningParameter]] = {
+    'mining': {
+        'time_limit': TuningParameter(10.0),
+        'max_materials': TuningParameter(7, integer=True),
+        'mineral_lifetime': TuningParameter(1.0, 'inverse', minimum=0.4),
+        'combo_timeout': TuningParameter(1.0, 'inverse', minimum=0.4),
+        'spawn_interval_min': TuningParameter(0.6),
+        'spawn_interval_max': TuningParameter(1.0),
+    },
+    'asteroid_shooter': {
+        'time_limit': TuningParameter(30.0),
+        'asteroids_needed': TuningParameter(5, 'scale', maximum=15, integer=True),
+        'asteroid_speed_min': TuningParameter(50.0, 'scale'),
+        'asteroid_speed_max': TuningParameter(150.0, 'scale'),
+        'spawn_rate': TuningParameter(2.0),
+        'min_spawn_rate': TuningParameter(0.5),
+    },
+    'timing': {
+        'time_limit': TuningParameter(30.0),
+        'base_speed': TuningParameter(200.0, 'scale'),
+        'speed_increase': TuningParameter(50.0, 'scale'),
+        'max_speed': TuningParameter(400.0, 'scale'),
+        'target_width': TuningParameter(100, 'inverse', minimum=40, integer=True),
+        'perfect_width': TuningParameter(30, 'inverse', minimum=10, integer=True),
+    },
+    'wiring': {
+        'time_limit': TuningParameter(45.0, 'inverse', minimum=15.0),
+        'num_wires': TuningParameter(4, 'scale', maximum=6, integer=True),
+    },
+    'oxygen_rescue': {
+        'enemy_health': TuningParameter(3, 'scale', maximum=8, integer=True),
+        'enemy_shoot_interval_min': TuningParameter(1.0, 'inverse', minimum=0.4),
+        'enemy_shoot_interval_max': TuningParameter(1.5, 'inverse', minimum=0.6),
+        'player_health': TuningParameter(5, integer=True),
+    },
+}
+
+# Nombres alternativos usados en config.json
+CONFIG_ALIASES = {
+    'duration': 'time_limit',
+}
+
+# Rampa por turno por defecto: desactivada (nivel 0 = valores originales en
+# cualquier turno). Con turn_ramp = 0.02, +2% de dificultad por turno
+DEFAULT_TURN_RAMP = 0.0
+DEFAULT_MAX_RAMP_TURNS = 20
+
+
+class DifficultyEngine:
+    """
+    Tablas de ajuste de minijuegos por (nivel de dificultad, turno)
+    
+    El multiplicador efectivo es difficulty_multipliers[nivel] multiplicado por
+    la rampa del turno (1 + turn_ramp * min(turno, max_ramp_turns)). Todas las
+    combinaciones se precalculan en el constructor; get_tuning solo indexa.
+    
+    Configuración (config.json, sección "minigames"):
+        "<minijuego>": {
+            "difficulty_multipliers": [1.0, 1.3, ...],
+            "time_limit": 30.0,          # o cualquier otro parámetro base
+            "turn_ramp": 0.02,           # opcional (por defecto 0 = sin rampa)
+            "max_ramp_turns": 20         # opcional
+        }
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Compila las tablas de ajuste
+        
+        Args:
+            config: Configuración completa del juego (None = valores por defecto)
+        """
+        minigames_config = (config or {}).get('minigames', {})
+        
+        # minijuego -> nivel -> turno -> parámetros (solo lectura)
+        self.tables: Dict[str, List[List[Mapping[str, Any]]]] = {}
+        
+        for name, parameters in MINIGAME_PARAMETERS.items():
+            section = minigames_config.get(name, {})
+            multipliers = section.get('difficulty_multipliers') or [1.0]
+            turn_ramp = section.get('turn_ramp', DEFAULT_TURN_RAMP)
+            max_ramp_turns = int(section.get('max_ramp_turns', DEFAULT_MAX_RAMP_TURNS))
+            
+            bases = {param: spec.base for param, spec in parameters.items()}
+            for key, value in section.items():
+                param = CONFIG_ALIASES.get(key, key)
+                if param in parameters:
+                    bases[param] = value
+            
+            self.tables[name] = [
+                [
+                    MappingProxyType({
+                        param: spec.resolve(bases[param],
+                                            level_multiplier * (1 + turn_ramp * turn))
+                        for param, spec in parameters.items()
+                    })
+                    for turn in range(max_ramp_turns + 1)
+                ]
+                for level_multiplier in multipliers
+            ]
+        
+        logger.info(f"Motor de dificultad compilado: "
+                    f"{', '.join(f'{name} ({len(levels)} niveles)' for name, levels in self.tables.items())}")
+    
+    def get_tuning(self, minigame: str, level: int = 0, turn: int = 0) -> Mapping[str, Any]:
+        """
+        Obtiene los parámetros de un minijuego
+        
+        Niveles y turnos fuera de rango se ajustan al extremo más cercano.
+        
+        Args:
+            minigame: Clave del minijuego ('mining', 'timing', ...)
+            level: Nivel de dificultad (índice de difficulty_multipliers)
+            turn: Turno actual de la partida
+        
+        Returns:
+            Parámetros del minijuego (mapeo de solo lectura)
+        """
+        levels = self.tables[minigame]
+        turns = levels[min(max(level, 0), len(levels) - 1)]
+        return turns[min(max(turn, 0), len(turns) - 1)]
+    
+    def get_level_count(self, minigame: str) -> int:
+        """Número de niveles de dificultad definidos para un minijuego"""
+        return len(self.tables[minigame])
+
+
+_default_engine: Optional[DifficultyEngine] = None
+
+
+def default_tuning(minigame: str) -> Mapping[str, Any]:
+    """
+    Parámetros por defecto (nivel 0, turno 0, sin config) de un minijuego
+    
+    Se usan cuando un minijuego se crea sin tuning explícito.
+    """
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = DifficultyEngine()
+    return _default_engine.get_tuning(minigame)
@@ -6,8 +6,9 @@ import pygame
 import random
 import math
 import os
-from typing import List, Tuple
+from typing import List, Tuple, Dict, Any, Optional
 from .base import BaseMinigame
+from engine.backgrounds import get_starfield_background
 import logging
 
 logger = logging.getLogger(__name__)
@@ -143,13 +144,18 @@ class AsteroidShooterMinigame(BaseMinigame):
     usando un cañón controlado con el mouse o teclado
     """
     
-    def __init__(self, screen_width: int = 1280, screen_height: int = 720):
-        super().__init__(screen_width, screen_height)
+    TUNING_KEY = 'asteroid_shooter'
+    
+    def __init__(self, screen_width: int = 1280, screen_height: int = 720,
+                 headless: bool = False, tuning: Optional[Dict[str, Any]] = None):
+        super().__init__(screen_width, screen_height, headless, tuning)
         
-        # Configuración del minijuego
-        self.time_remaining = 30.0
+        # Configuración del minijuego (desde el motor de dificultad)
+        self.time_remaining = self.tuning['time_limit']
         self.asteroids_destroyed = 0
-        self.asteroids_needed = 5
+        self.asteroids_needed = self.tuning['asteroids_needed']
+        self.asteroid_speed_min = self.tuning['asteroid_speed_min']
+        self.asteroid_speed_max = self.tuning['asteroid_speed_max']
         
         # Listas de objetos
         self.asteroids: List[Asteroid] = []
@@ -168,7 +174,8 @@ class AsteroidShooterMinigame(BaseMinigame):
         
         # Generación de asteroides
         self.asteroid_spawn_timer = 0.0
-        self.asteroid_spawn_rate = 2.0  # Segundos entre spawns
+        self.asteroid_spawn_rate = self.tuning['spawn_rate']  # Segundos entre spawns
+        self.min_spawn_rate = self.tuning['min_spawn_rate']
         
         # Fondo
         self.background = None
@@ -180,6 +187,9 @@ class AsteroidShooterMinigame(BaseMinigame):
     
     def load_assets(self):
         """Carga los assets del minijuego"""
+        if self.headless:
+            return
+        
         try:
             # Cargar fondo
             bg_path = os.path.join('data', 'assets', 'minigame_asteroid.png')
@@ -196,11 +206,8 @@ class AsteroidShooterMinigame(BaseMinigame):
         if event.type == pygame.MOUSEMOTION:
             # Actualizar posición del cañón con el mouse
             if self.mouse_control:
-                mouse_x, mouse_y = event.pos
                 # Calcular ángulo del cañón hacia el mouse
-                dx = mouse_x - self.cannon_x
-                dy = mouse_y - self.cannon_y
-                self.cannon_angle = math.degrees(math.atan2(dy, dx))
+                self.aim_at(*event.pos)
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Click izquierdo
@@ -222,6 +229,47 @@ class AsteroidShooterMinigame(BaseMinigame):
                 # Salir del minijuego (fallo)
                 self.complete_minigame(False)
     
+    def aim_at(self, target_x: float, target_y: float):
+        """Orienta el cañón hacia una posición"""
+        dx = target_x - self.cannon_x
+        dy = target_y - self.cannon_y
+        self.cannon_angle = math.degrees(math.atan2(dy, dx))
+    
+    def apply_action(self, action: Dict[str, Any]):
+        """Aplica una acción programática (ver BaseMinigame.step)"""
+        action_type = action.get('type')
+        if action_type == 'aim':
+            self.aim_at(*action['pos'])
+        elif action_type == 'click':
+            self.aim_at(*action['pos'])
+            self.shoot(*action['pos'])
+        elif action_type == 'press':
+            target_x = self.cannon_x + math.cos(math.radians(self.cannon_angle)) * 100
+            target_y = self.cannon_y + math.sin(math.radians(self.cannon_angle)) * 100
+            self.shoot(target_x, target_y)
+        else:
+            super().apply_action(action)
+    
+    def get_observation(self) -> Dict[str, Any]:
+        """Observación con asteroides, cañón y progreso"""
+        observation = super().get_observation()
+        observation.update({
+            'asteroids_destroyed': self.asteroids_destroyed,
+            'asteroids_needed': self.asteroids_needed,
+            'cannon': (self.cannon_x, self.cannon_y),
+            'can_shoot': self.can_shoot,
+            'asteroids': [
+                {
+                    'pos': (asteroid.x, asteroid.y),
+                    'size': asteroid.size,
+                    'speed': asteroid.speed,
+                    'health': asteroid.health
+                }
+                for asteroid in self.asteroids
+            ]
+        })
+        return observation
+    
     def shoot(self, target_x: float, target_y: float):
         """Dispara un proyectil hacia la posición objetivo"""
         if self.can_shoot:
@@ -235,7 +283,7 @@ class AsteroidShooterMinigame(BaseMinigame):
         x = random.randint(50, self.screen_width - 50)
         y = -50
         size = random.randint(20, 40)
-        speed = random.uniform(50, 150)
+        speed = random.uniform(self.asteroid_speed_min, self.asteroid_speed_max)
         
         asteroid = Asteroid(x, y, size, speed)
         self.asteroids.append(asteroid)
@@ -271,7 +319,7 @@ class AsteroidShooterMinigame(BaseMinigame):
             self.spawn_asteroid()
             self.asteroid_spawn_timer = 0
             # Aumentar dificultad gradualmente
-            self.asteroid_spawn_rate = max(0.5, self.asteroid_spawn_rate - 0.1)
+            self.asteroid_spawn_rate = max(self.min_spawn_rate, self.asteroid_spawn_rate - 0.1)
         
         # Actualizar asteroides
         for asteroid in self.asteroids[:]:
@@ -338,13 +386,9 @@ class AsteroidShooterMinigame(BaseMinigame):
         if self.background:
             screen.blit(self.background, (0, 0))
         else:
-            screen.fill((10, 10, 30))
-            
-            # Dibujar estrellas de fondo
-            for _ in range(100):
-                x = random.randint(0, self.screen_width)
-                y = random.randint(0, self.screen_height)
-                pygame.draw.circle(screen, (255, 255, 255), (x, y), 1)
+            # Fondo con estrellas (generado una vez y cacheado)
+            screen.blit(get_starfield_background((self.screen_width, self.screen_height),
+                                                 (10, 10, 30), num_stars=100), (0, 0))
         
         # Renderizar asteroides
         for asteroid in self.asteroids:
@@ -3,8 +3,9 @@ Base Minigame - Clase base para todos los minijuegos
 """
 
 import pygame
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Mapping
 from abc import ABC, abstractmethod
+from ..difficulty import default_tuning
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,18 +16,43 @@ class BaseMinigame(ABC):
     Clase base abstracta para todos los minijuegos
     
     Proporciona la estructura común y métodos que todos los minijuegos deben implementar
+    
+    Además de la entrada por eventos de Pygame (handle_input), todos los minijuegos
+    pueden avanzarse por código con step(delta_time, actions), sin ventana ni
+    fuentes, para simulaciones de balance y tests automáticos.
+    
+    Acciones soportadas por step (diccionarios con clave 'type'):
+    - {'type': 'click', 'pos': (x, y)}: clic izquierdo en una posición
+    - {'type': 'aim', 'pos': (x, y)}: mover el puntero / apuntar
+    - {'type': 'press'}: tecla de acción principal (ESPACIO)
+    - {'type': 'quit'}: abandonar el minijuego (fallo)
+    Cada minijuego puede añadir acciones propias (ver apply_action).
     """
     
-    def __init__(self, screen_width: int = 1280, screen_height: int = 720):
+    # Clave del minijuego en gameplay.difficulty / config.json (None = sin ajuste)
+    TUNING_KEY: Optional[str] = None
+    
+    def __init__(self, screen_width: int = 1280, screen_height: int = 720,
+                 headless: bool = False, tuning: Optional[Mapping[str, Any]] = None):
         """
         Inicializa el minijuego base
         
         Args:
             screen_width: Ancho de la pantalla
             screen_height: Alto de la pantalla
+            headless: Si es True no se crean superficies ni fuentes y no se
+                cargan imágenes; el minijuego solo puede avanzarse con step()
+            tuning: Parámetros de dificultad (ver DifficultyEngine.get_tuning);
+                por defecto los de dificultad normal
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
+        self.headless = headless
+        
+        # Parámetros de dificultad
+        if tuning is None and self.TUNING_KEY:
+            tuning = default_tuning(self.TUNING_KEY)
+        self.tuning: Mapping[str, Any] = tuning or {}
         
         # Estado del minijuego
         self.is_complete = False
@@ -43,13 +69,14 @@ class BaseMinigame(ABC):
         self.font_normal = None
         self.font_small = None
         
-        # Superficie de renderizado
-        self.surface = pygame.Surface((screen_width, screen_height))
-        
-        # Inicializar fuentes
-        self._init_fonts()
+        # Superficie de renderizado y fuentes (solo con renderizado)
+        self.surface = None
+        if not headless:
+            self.surface = pygame.Surface((screen_width, screen_height))
+            self._init_fonts()
         
         # Cargar assets específicos del minijuego
+        # (en modo headless cada minijuego decide qué necesita realmente)
         self.assets = {}
         self.load_assets()
     
@@ -99,6 +126,64 @@ class BaseMinigame(ABC):
         """
         pass
     
+    def step(self, delta_time: float,
+             actions: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """
+        Avanza el minijuego un paso de lógica pura, sin eventos ni renderizado
+        
+        Primero aplica las acciones en orden y después avanza la simulación
+        delta_time segundos con update(). Si una acción termina el minijuego,
+        no se avanza el tiempo.
+        
+        Args:
+            delta_time: Tiempo simulado del paso, en segundos
+            actions: Lista de acciones (ver docstring de la clase)
+            
+        Returns:
+            Observación del estado tras el paso (ver get_observation)
+        """
+        if not self.is_complete:
+            for action in actions or ():
+                self.apply_action(action)
+                if self.is_complete:
+                    break
+            else:
+                self.update(delta_time)
+        
+        return self.get_observation()
+    
+    def apply_action(self, action: Dict[str, Any]) -> None:
+        """
+        Aplica una acción programática al minijuego
+        
+        Las subclases la extienden con sus acciones y delegan aquí las comunes.
+        
+        Args:
+            action: Diccionario con la clave 'type' y sus parámetros
+        """
+        if action.get('type') == 'quit':
+            self.complete_minigame(False)
+        else:
+            logger.debug(f"Acción ignorada por {type(self).__name__}: {action}")
+    
+    def get_observation(self) -> Dict[str, Any]:
+        """
+        Obtiene una observación del estado actual para bots y tests
+        
+        Las subclases añaden aquí su estado específico (objetivos, posiciones...).
+        
+        Returns:
+            Diccionario con el estado común del minijuego
+        """
+        return {
+            'is_complete': self.is_complete,
+            'success': self.success,
+            'score': self.score,
+            'time_remaining': self.time_remaining,
+            'reward_materials': self.reward_materials,
+            'reward_repair': self.reward_repair
+        }
+    
     def complete_minigame(self, success: bool) -> None:
         """
         Marca el minijuego como completado
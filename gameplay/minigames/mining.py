@@ -14,7 +14,7 @@ import pygame
 import random
 import math
 import os
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Any
 from .base import BaseMinigame
 import logging
 
@@ -33,10 +33,11 @@ class Mine:
         self.radius = 60
         self.hole_depth = 20
     
-    def spawn_mineral(self, mineral_type: str, mineral_image: pygame.Surface) -> 'Mineral':
+    def spawn_mineral(self, mineral_type: str, mineral_image: pygame.Surface,
+                      lifetime: float = 1.0) -> 'Mineral':
         """Genera un mineral en esta mina"""
         self.is_occupied = True
-        self.current_mineral = Mineral(self.x, self.y, mineral_type, mineral_image)
+        self.current_mineral = Mineral(self.x, self.y, mineral_type, mineral_image, lifetime)
         return self.current_mineral
     
     def clear(self):
@@ -73,7 +74,8 @@ class Mineral:
         'gold': 0.6      # Con combo ×2 suma 1 (0.6×2=1.2→1)
     }
     
-    def __init__(self, x: int, y: int, mineral_type: str, image: pygame.Surface):
+    def __init__(self, x: int, y: int, mineral_type: str, image: pygame.Surface,
+                 lifetime: float = 1.0):
         self.x = x
         self.y = y
         self.base_y = y
@@ -84,7 +86,7 @@ class Mineral:
         self.base_value = self.BASE_VALUES.get(mineral_type, 0.05)
         
         # Estado y animación
-        self.lifetime = 1.0  # ~1s visible según especificación
+        self.lifetime = lifetime  # ~1s visible según especificación
         self.max_lifetime = self.lifetime
         self.is_alive = True
         self.was_clicked = False
@@ -209,16 +211,20 @@ class MineralRush(BaseMinigame):
     - Cada golpe suma su valor redondeado
     """
     
-    def __init__(self, screen_width: int = 1280, screen_height: int = 720):
+    TUNING_KEY = 'mining'
+    
+    def __init__(self, screen_width: int = 1280, screen_height: int = 720,
+                 headless: bool = False, tuning: Optional[Dict[str, Any]] = None):
         # IMPORTANTE: Inicializar antes de super().__init__()
         self.mineral_images = {}
         
-        super().__init__(screen_width, screen_height)
+        super().__init__(screen_width, screen_height, headless, tuning)
         
-        # Configuración del minijuego
-        self.time_remaining = 10.0  # 10 segundos (desafiante)
+        # Configuración del minijuego (desde el motor de dificultad)
+        self.time_remaining = self.tuning['time_limit']
         self.materials_collected = 0  # Entero, máximo 7
-        self.max_materials = 7  # Límite máximo
+        self.max_materials = self.tuning['max_materials']  # Límite máximo
+        self.mineral_lifetime = self.tuning['mineral_lifetime']
         
         # Minas (3x3 grid = 9 minas)
         self.mines: List[Mine] = []
@@ -228,6 +234,8 @@ class MineralRush(BaseMinigame):
         # Sistema de spawn
         self.spawn_timer = 0.0
         self.spawn_interval = 0.8
+        self.spawn_interval_min = self.tuning['spawn_interval_min']
+        self.spawn_interval_max = self.tuning['spawn_interval_max']
         self.max_active_minerals = 3
         self.active_minerals_count = 0
         
@@ -241,8 +249,9 @@ class MineralRush(BaseMinigame):
         # Sistema de combo
         self.combo = 0
         self.combo_timer = 0.0
-        self.combo_timeout = 1.0  # <1s entre golpes para mantener combo
+        self.combo_timeout = self.tuning['combo_timeout']  # <1s entre golpes para mantener combo
         self.last_hit_time = 0.0
+        self.game_time = 0.0  # Reloj propio del minijuego (también en modo headless)
         
         # Multiplicadores de combo
         self.combo_multipliers = {
@@ -262,10 +271,17 @@ class MineralRush(BaseMinigame):
         # Fondo
         self.background = None
         
-        logger.info("Mineral Rush inicializado (Max: 7 materiales, 10s - DESAFIANTE)")
+        logger.info(f"Mineral Rush inicializado (Max: {self.max_materials} materiales, "
+                    f"{self.time_remaining:.0f}s - DESAFIANTE)")
     
     def load_assets(self):
         """Carga los assets del minijuego"""
+        if self.headless:
+            # Sin ventana solo hacen falta las dimensiones de los minerales
+            for mineral_type in ['copper', 'silver', 'gold']:
+                self.mineral_images[mineral_type] = self._create_placeholder_mineral(mineral_type)
+            return
+        
         try:
             # Cargar fondo
             bg_path = os.path.join('data', 'assets', 'minigame_mining_bg.png')
@@ -348,10 +364,41 @@ class MineralRush(BaseMinigame):
                 self.calculate_rewards(False)
                 self.complete_minigame(False)
     
+    def apply_action(self, action: Dict[str, Any]):
+        """Aplica una acción programática (ver BaseMinigame.step)"""
+        action_type = action.get('type')
+        if action_type == 'click':
+            self.try_collect_mineral(action['pos'])
+        elif action_type == 'quit':
+            self.calculate_rewards(False)
+            self.complete_minigame(False)
+        else:
+            super().apply_action(action)
+    
+    def get_observation(self) -> Dict[str, Any]:
+        """Observación con los minerales visibles y el progreso"""
+        observation = super().get_observation()
+        observation.update({
+            'materials_collected': self.materials_collected,
+            'max_materials': self.max_materials,
+            'combo': self.combo,
+            'minerals': [
+                {
+                    'pos': (mine.current_mineral.x, mine.current_mineral.y),
+                    'type': mine.current_mineral.mineral_type,
+                    'lifetime': mine.current_mineral.lifetime,
+                    'clickable': mine.current_mineral.animation_phase >= 1.0
+                }
+                for mine in self.mines
+                if mine.is_occupied and mine.current_mineral
+            ]
+        })
+        return observation
+    
     def try_collect_mineral(self, mouse_pos: Tuple[int, int]):
         """Intenta recolectar un mineral"""
         collected = False
-        current_time = pygame.time.get_ticks() / 1000.0
+        current_time = self.game_time
         
         for mine in self.mines:
             if mine.is_occupied and mine.current_mineral:
@@ -395,7 +442,7 @@ class MineralRush(BaseMinigame):
                     logger.info(f"{mineral.mineral_type.upper()} golpeado: "
                               f"{base_value:.2f} × {multiplier} = {value_with_combo:.2f} "
                               f"→ {materials_gained} mat. | Combo: {self.combo} | "
-                              f"Total: {self.materials_collected}/7")
+                              f"Total: {self.materials_collected}/{self.max_materials}")
                     
                     # Verificar victoria anticipada
                     if self.materials_collected >= self.max_materials:
@@ -445,12 +492,13 @@ class MineralRush(BaseMinigame):
                 mineral_type = m_type
                 break
         
-        mine.spawn_mineral(mineral_type, self.mineral_images[mineral_type])
+        mine.spawn_mineral(mineral_type, self.mineral_images[mineral_type], self.mineral_lifetime)
         self.active_minerals_count += 1
     
     def update(self, delta_time: float):
         """Actualiza la lógica del minijuego"""
         self.time_remaining -= delta_time
+        self.game_time += delta_time
         
         # Verificar fin del tiempo
         if self.time_remaining <= 0:
@@ -458,7 +506,7 @@ class MineralRush(BaseMinigame):
             success = (self.materials_collected >= self.max_materials)
             self.calculate_rewards(success)
             self.complete_minigame(success)
-            logger.info(f"Minijuego terminado por tiempo. Materiales: {self.materials_collected}/7. Éxito: {success}")
+            logger.info(f"Minijuego terminado por tiempo. Materiales: {self.materials_collected}/{self.max_materials}. Éxito: {success}")
             return
         
         # Actualizar combo timer
@@ -471,7 +519,7 @@ class MineralRush(BaseMinigame):
         self.spawn_timer += delta_time
         if self.spawn_timer >= self.spawn_interval:
             self.spawn_timer = 0
-            self.spawn_interval = random.uniform(0.6, 1.0)
+            self.spawn_interval = random.uniform(self.spawn_interval_min, self.spawn_interval_max)
             self.spawn_mineral()
         
         # Actualizar minerales
@@ -5,8 +5,9 @@ Oxygen Rescue - Minijuego de rescate del marciano para obtener oxígeno
 import pygame
 import math
 import random
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Dict, Any
 from .base import BaseMinigame
+from engine.backgrounds import get_gradient_background
 import logging
 import os
 
@@ -42,7 +43,9 @@ class Projectile:
 class Enemy:
     """Representa un enemigo"""
     
-    def __init__(self, spawn_side: str, screen_width: int, screen_height: int, image_path: str):
+    def __init__(self, spawn_side: str, screen_width: int, screen_height: int,
+                 image_path: Optional[str], max_health: int = 3,
+                 shoot_interval_range: Tuple[float, float] = (1.0, 1.5)):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.spawn_side = spawn_side
@@ -70,19 +73,19 @@ class Enemy:
         self.vy = 0 if spawn_side in ["left", "right"] else self.vy
         
         # Propiedades del enemigo
-        self.max_health = 3
+        self.max_health = max_health
         self.health = self.max_health
         self.width = 60
         self.height = 60
         self.shoot_cooldown = 0
-        self.shoot_interval = random.uniform(1.0, 1.5)
+        self.shoot_interval = random.uniform(*shoot_interval_range)
         self.active = True
         self.entering = True  # Estado de entrada a la pantalla
         
-        # Cargar imagen
+        # Cargar imagen (None = sin imagen, p.ej. en modo headless)
         self.image = None
         try:
-            if os.path.exists(image_path):
+            if image_path and os.path.exists(image_path):
                 self.image = pygame.image.load(image_path)
                 self.image = pygame.transform.scale(self.image, (self.width, self.height))
         except Exception as e:
@@ -181,7 +184,8 @@ class Enemy:
 class Player:
     """Representa al jugador"""
     
-    def __init__(self, screen_width: int, screen_height: int):
+    def __init__(self, screen_width: int, screen_height: int, load_image: bool = True,
+                 max_health: int = 5):
         self.screen_width = screen_width
         self.screen_height = screen_height
         
@@ -193,7 +197,7 @@ class Player:
         self.width = 50
         self.height = 50
         self.speed = 400
-        self.max_health = 5
+        self.max_health = max_health
         self.health = self.max_health
         self.angle = 0  # Ángulo de rotación hacia el cursor
         
@@ -202,27 +206,23 @@ class Player:
         self.original_image = None
         try:
             image_path = os.path.join('data', 'assets', 'player_weapon.png')
-            if os.path.exists(image_path):
+            if load_image and os.path.exists(image_path):
                 self.original_image = pygame.image.load(image_path)
                 self.original_image = pygame.transform.scale(self.original_image, (self.width, self.height))
                 self.image = self.original_image.copy()
         except Exception as e:
             logger.warning(f"No se pudo cargar imagen del jugador: {e}")
     
-    def update(self, delta_time: float, keys: pygame.key.ScancodeWrapper, mouse_x: int, mouse_y: int):
-        """Actualiza el jugador"""
-        # Movimiento con WASD
-        dx = 0
-        dy = 0
+    def update(self, delta_time: float, move_x: int, move_y: int, mouse_x: int, mouse_y: int):
+        """
+        Actualiza el jugador
         
-        if keys[pygame.K_w]:
-            dy = -self.speed * delta_time
-        if keys[pygame.K_s]:
-            dy = self.speed * delta_time
-        if keys[pygame.K_a]:
-            dx = -self.speed * delta_time
-        if keys[pygame.K_d]:
-            dx = self.speed * delta_time
+        Args:
+            move_x: Dirección horizontal (-1, 0, 1)
+            move_y: Dirección vertical (-1, 0, 1)
+        """
+        dx = move_x * self.speed * delta_time
+        dy = move_y * self.speed * delta_time
         
         # Aplicar movimiento con límites
         self.x = max(self.width // 2, min(self.screen_width - self.width // 2, self.x + dx))
@@ -323,14 +323,21 @@ class OxygenRescueMinigame(BaseMinigame):
     y obtener +10 de oxígeno
     """
     
-    def __init__(self, screen_width: int = 1280, screen_height: int = 720):
-        super().__init__(screen_width, screen_height)
+    TUNING_KEY = 'oxygen_rescue'
+    
+    def __init__(self, screen_width: int = 1280, screen_height: int = 720,
+                 headless: bool = False, tuning: Optional[Dict[str, Any]] = None):
+        super().__init__(screen_width, screen_height, headless, tuning)
         
         # No usar tiempo límite para este minijuego
         self.time_remaining = -1  # Sin límite de tiempo
         
         # Jugador
-        self.player = Player(screen_width, screen_height)
+        self.player = Player(screen_width, screen_height, load_image=not headless,
+                             max_health=self.tuning['player_health'])
+        
+        # Movimiento mantenido en modo headless (acción 'move')
+        self.move_input = (0, 0)
         
         # Enemigos
         self.enemies: List[Enemy] = []
@@ -357,6 +364,9 @@ class OxygenRescueMinigame(BaseMinigame):
     
     def load_assets(self):
         """Carga los assets del minijuego"""
+        if self.headless:
+            return
+        
         try:
             # Intentar cargar un fondo espacial
             bg_path = os.path.join('data', 'assets', 'space_background.png')
@@ -368,26 +378,31 @@ class OxygenRescueMinigame(BaseMinigame):
         except Exception as e:
             logger.warning(f"No se pudo cargar el fondo: {e}")
     
+    def _create_enemy(self, spawn_side: str, filename: str) -> Enemy:
+        """Crea un enemigo con los parámetros de dificultad (sin imagen en modo headless)"""
+        image_path = None if self.headless else os.path.join('data', 'assets', filename)
+        return Enemy(spawn_side, self.screen_width, self.screen_height, image_path,
+                     max_health=self.tuning['enemy_health'],
+                     shoot_interval_range=(self.tuning['enemy_shoot_interval_min'],
+                                           self.tuning['enemy_shoot_interval_max']))
+    
     def spawn_enemies(self):
         """Crea los enemigos iniciales"""
         # 2 enemigos desde la izquierda
         for i in range(2):
-            image_path = os.path.join('data', 'assets', 'seal_left.png')
-            enemy = Enemy("left", self.screen_width, self.screen_height, image_path)
+            enemy = self._create_enemy("left", 'seal_left.png')
             enemy.y = 200 + i * 150  # Separar verticalmente
             self.enemies.append(enemy)
         
         # 2 enemigos desde la derecha
         for i in range(2):
-            image_path = os.path.join('data', 'assets', 'seal_right.png')
-            enemy = Enemy("right", self.screen_width, self.screen_height, image_path)
+            enemy = self._create_enemy("right", 'seal_right.png')
             enemy.y = 200 + i * 150  # Separar verticalmente
             self.enemies.append(enemy)
         
         # 1 enemigo desde arriba (aleatorio entre seal_left o seal_right)
         random_seal = random.choice(['seal_left.png', 'seal_right.png'])
-        image_path = os.path.join('data', 'assets', random_seal)
-        enemy = Enemy("top", self.screen_width, self.screen_height, image_path)
+        enemy = self._create_enemy("top", random_seal)
         self.enemies.append(enemy)
     
     def handle_input(self, event: pygame.event.Event):
@@ -406,13 +421,77 @@ class OxygenRescueMinigame(BaseMinigame):
                 # Salir del minijuego (derrota)
                 self.complete_minigame(False)
     
+    def apply_action(self, action: Dict[str, Any]):
+        """
+        Aplica una acción programática (ver BaseMinigame.step)
+        
+        Acción propia:
+        - {'type': 'move', 'direction': (dx, dy)}: dirección mantenida (-1, 0, 1)
+          hasta la siguiente acción 'move', como mantener WASD pulsado
+        """
+        action_type = action.get('type')
+        if action_type == 'aim':
+            self.mouse_x, self.mouse_y = action['pos']
+        elif action_type == 'click':
+            self.mouse_x, self.mouse_y = action['pos']
+            self.projectiles.append(self.player.shoot(self.mouse_x, self.mouse_y))
+        elif action_type == 'move':
+            self.move_input = tuple(action['direction'])
+        else:
+            super().apply_action(action)
+    
+    def get_movement_input(self) -> Tuple[int, int]:
+        """Dirección de movimiento del jugador: teclado WASD o acción 'move'"""
+        if self.headless:
+            return self.move_input
+        
+        keys = pygame.key.get_pressed()
+        move_x = 0
+        move_y = 0
+        if keys[pygame.K_w]:
+            move_y = -1
+        if keys[pygame.K_s]:
+            move_y = 1
+        if keys[pygame.K_a]:
+            move_x = -1
+        if keys[pygame.K_d]:
+            move_x = 1
+        return move_x, move_y
+    
+    def get_observation(self) -> Dict[str, Any]:
+        """Observación con jugador, enemigos y proyectiles enemigos"""
+        observation = super().get_observation()
+        observation.update({
+            'player': {
+                'pos': (self.player.x, self.player.y),
+                'health': self.player.health
+            },
+            'enemies': [
+                {
+                    'pos': (enemy.x, enemy.y),
+                    'health': enemy.health,
+                    'entering': enemy.entering
+                }
+                for enemy in self.enemies if enemy.active
+            ],
+            'hostile_projectiles': [
+                {
+                    'pos': (projectile.x, projectile.y),
+                    'velocity': (projectile.vx, projectile.vy)
+                }
+                for projectile in self.projectiles
+                if projectile.active and not projectile.is_player
+            ]
+        })
+        return observation
+    
     def update(self, delta_time: float):
         """Actualiza la lógica del minijuego"""
-        # Obtener estado de las teclas
-        keys = pygame.key.get_pressed()
+        # Obtener dirección de movimiento
+        move_x, move_y = self.get_movement_input()
         
         # Actualizar jugador
-        self.player.update(delta_time, keys, self.mouse_x, self.mouse_y)
+        self.player.update(delta_time, move_x, move_y, self.mouse_x, self.mouse_y)
         
         # Verificar si el jugador perdió
         if self.player.health <= 0:
@@ -502,11 +581,9 @@ class OxygenRescueMinigame(BaseMinigame):
         if self.background:
             screen.blit(self.background, (0, 0))
         else:
-            # Fondo degradado espacial
-            for i in range(self.screen_height):
-                color_value = int(10 + (i / self.screen_height) * 20)
-                color = (color_value, color_value, color_value + 10)
-                pygame.draw.line(screen, color, (0, i), (self.screen_width, i))
+            # Fondo degradado espacial (generado una vez y cacheado)
+            screen.blit(get_gradient_background((self.screen_width, self.screen_height),
+                                                (10, 10, 20), (30, 30, 40)), (0, 0))
         
         # Dibujar explosiones (detrás de todo)
         for explosion in self.explosions:
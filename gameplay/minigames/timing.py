@@ -6,8 +6,9 @@ import pygame
 import random
 import math
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from .base import BaseMinigame
+from engine.backgrounds import get_gradient_background
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,7 +17,8 @@ logger = logging.getLogger(__name__)
 class TimingBar:
     """Representa una barra de timing individual"""
     
-    def __init__(self, y_position: int, screen_width: int, speed: float = 200):
+    def __init__(self, y_position: int, screen_width: int, speed: float = 200,
+                 target_width: int = 100, perfect_width: int = 30):
         self.y = y_position
         self.screen_width = screen_width
         self.speed = speed
@@ -27,8 +29,8 @@ class TimingBar:
         
         # Zona de éxito
         self.target_x = screen_width // 2
-        self.target_width = 100
-        self.perfect_width = 30  # Zona perfecta dentro del target
+        self.target_width = target_width
+        self.perfect_width = perfect_width  # Zona perfecta dentro del target
         
         # Estado
         self.active = True
@@ -146,11 +148,14 @@ class TimingMinigame(BaseMinigame):
     Debe lograr 3 aciertos consecutivos para tener éxito
     """
     
-    def __init__(self, screen_width: int = 1280, screen_height: int = 720):
-        super().__init__(screen_width, screen_height)
+    TUNING_KEY = 'timing'
+    
+    def __init__(self, screen_width: int = 1280, screen_height: int = 720,
+                 headless: bool = False, tuning: Optional[Dict[str, Any]] = None):
+        super().__init__(screen_width, screen_height, headless, tuning)
         
-        # Configuración del minijuego
-        self.time_remaining = 30.0
+        # Configuración del minijuego (desde el motor de dificultad)
+        self.time_remaining = self.tuning['time_limit']
         self.hits_needed = 3
         self.hits_done = 0
         self.perfect_hits = 0
@@ -161,8 +166,11 @@ class TimingMinigame(BaseMinigame):
         self.current_bar_index = 0
         
         # Dificultad (DEBE estar antes de create_bars)
-        self.base_speed = 200
-        self.speed_increase = 50  # Aumenta con cada acierto
+        self.base_speed = self.tuning['base_speed']
+        self.speed_increase = self.tuning['speed_increase']  # Aumenta con cada acierto
+        self.max_speed = self.tuning['max_speed']
+        self.target_width = self.tuning['target_width']
+        self.perfect_width = self.tuning['perfect_width']
         
         # Crear las barras (después de inicializar base_speed)
         self.create_bars()
@@ -178,6 +186,9 @@ class TimingMinigame(BaseMinigame):
     
     def load_assets(self):
         """Carga los assets del minijuego"""
+        if self.headless:
+            return
+        
         try:
             # Cargar fondo
             bg_path = os.path.join('data', 'assets', 'minigame_timing_bg.png')
@@ -200,7 +211,8 @@ class TimingMinigame(BaseMinigame):
         
         for i, y_pos in enumerate(y_positions):
             speed = self.base_speed + (i * self.speed_increase)
-            bar = TimingBar(y_pos, self.screen_width, speed)
+            bar = TimingBar(y_pos, self.screen_width, speed,
+                            self.target_width, self.perfect_width)
             # Solo la primera barra está activa inicialmente
             bar.active = (i == 0)
             self.bars.append(bar)
@@ -218,6 +230,35 @@ class TimingMinigame(BaseMinigame):
             if event.button == 1:  # Click izquierdo como alternativa
                 self.attempt_hit()
     
+    def apply_action(self, action: Dict[str, Any]):
+        """Aplica una acción programática (ver BaseMinigame.step)"""
+        if action.get('type') in ('press', 'click'):
+            self.attempt_hit()
+        else:
+            super().apply_action(action)
+    
+    def get_observation(self) -> Dict[str, Any]:
+        """Observación con la barra activa y el progreso"""
+        observation = super().get_observation()
+        current_bar = None
+        if self.current_bar_index < len(self.bars):
+            bar = self.bars[self.current_bar_index]
+            current_bar = {
+                'indicator_x': bar.indicator_x,
+                'direction': bar.direction,
+                'speed': bar.speed,
+                'target_x': bar.target_x,
+                'target_width': bar.target_width,
+                'perfect_width': bar.perfect_width
+            }
+        observation.update({
+            'hits_done': self.hits_done,
+            'hits_needed': self.hits_needed,
+            'misses': self.misses,
+            'current_bar': current_bar
+        })
+        return observation
+    
     def attempt_hit(self):
         """Intenta hacer un hit en la barra actual"""
         if self.current_bar_index >= len(self.bars):
@@ -271,7 +312,7 @@ class TimingMinigame(BaseMinigame):
         self.hits_done = 0
         
         # Recrear las barras con mayor dificultad
-        self.base_speed = min(400, self.base_speed + 20)
+        self.base_speed = min(self.max_speed, self.base_speed + 20)
         self.bars.clear()
         self.create_bars()
     
@@ -350,11 +391,9 @@ class TimingMinigame(BaseMinigame):
         if self.background:
             screen.blit(self.background, (0, 0))
         else:
-            # Fondo degradado
-            for i in range(self.screen_height):
-                color_value = int(20 + (i / self.screen_height) * 30)
-                color = (color_value, color_value, color_value + 20)
-                pygame.draw.line(screen, color, (0, i), (self.screen_width, i))
+            # Fondo degradado (generado una vez y cacheado)
+            screen.blit(get_gradient_background((self.screen_width, self.screen_height),
+                                                (20, 20, 40), (50, 50, 70)), (0, 0))
         
         # Flash de fallo
         if self.fail_flash > 0:
@@ -4,10 +4,10 @@ Wiring Puzzle - Minijuego de conexión de cables para reparación
 
 import pygame
 import random
-import math
 import os
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Any
 from .base import BaseMinigame
+from engine.backgrounds import get_grid_background
 import logging
 
 logger = logging.getLogger(__name__)
@@ -19,6 +19,8 @@ class Wire:
     def __init__(self, color: Tuple[int, int, int], start_pos: Tuple[int, int], 
                  end_pos: Tuple[int, int], wire_id: int):
         self.color = color
+        # Color del brillo central, calculado una sola vez por cable
+        self.lighter_color = tuple(min(255, c + 50) for c in color)
         self.wire_id = wire_id
         self.start_pos = start_pos  # Posición del conector izquierdo
         self.end_pos = end_pos  # Posición del conector derecho correcto
@@ -30,9 +32,19 @@ class Wire:
         
         # Puntos de control para curva de Bezier
         self.control_points = []
+        self.control_points_dirty = False
         
-        # Radio del conector
+        # Radio del conector (y radios de interacción al cuadrado)
         self.connector_radius = 15
+        self.grab_radius_sq = (self.connector_radius * 1.5) ** 2
+        self.snap_radius_sq = (self.connector_radius * 2) ** 2
+    
+    @staticmethod
+    def _distance_sq(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+        """Distancia al cuadrado entre dos puntos (evita math.sqrt)"""
+        dx = a[0] - b[0]
+        dy = a[1] - b[1]
+        return dx * dx + dy * dy
     
     def start_drag(self, mouse_pos: Tuple[int, int]) -> bool:
         """
@@ -42,20 +54,16 @@ class Wire:
             True si se inició el arrastre
         """
         # Verificar si el mouse está sobre el conector de inicio
-        distance = math.sqrt((mouse_pos[0] - self.start_pos[0])**2 + 
-                           (mouse_pos[1] - self.start_pos[1])**2)
-        
-        if distance <= self.connector_radius * 1.5:
+        if self._distance_sq(mouse_pos, self.start_pos) <= self.grab_radius_sq:
             self.is_being_dragged = True
             self.current_end_pos = mouse_pos
+            self.control_points_dirty = True
             self.is_connected = False
             return True
         
         # Si ya está conectado, verificar si se quiere desconectar
         if self.is_connected and self.current_end_pos:
-            distance = math.sqrt((mouse_pos[0] - self.current_end_pos[0])**2 + 
-                               (mouse_pos[1] - self.current_end_pos[1])**2)
-            if distance <= self.connector_radius * 1.5:
+            if self._distance_sq(mouse_pos, self.current_end_pos) <= self.grab_radius_sq:
                 self.is_being_dragged = True
                 self.is_connected = False
                 return True
@@ -63,17 +71,23 @@ class Wire:
         return False
     
     def update_drag(self, mouse_pos: Tuple[int, int]):
-        """Actualiza la posición durante el arrastre"""
+        """
+        Actualiza la posición durante el arrastre
+        
+        Los puntos de control se recalculan en el siguiente draw, no en cada
+        evento MOUSEMOTION.
+        """
         if self.is_being_dragged:
             self.current_end_pos = mouse_pos
-            self.update_control_points()
+            self.control_points_dirty = True
     
-    def end_drag(self, connectors: List[Tuple[int, int]]) -> bool:
+    def end_drag(self, connector_pos: Optional[Tuple[int, int]]) -> bool:
         """
         Termina el arrastre y verifica conexión
         
         Args:
-            connectors: Lista de posiciones de conectores derechos
+            connector_pos: Conector derecho bajo el extremo del cable (o None),
+                ya resuelto por el índice de conectores del minijuego
             
         Returns:
             True si se conectó correctamente
@@ -83,24 +97,17 @@ class Wire:
         
         self.is_being_dragged = False
         
-        # Verificar si se conectó a algún conector
-        for connector_pos in connectors:
-            distance = math.sqrt((self.current_end_pos[0] - connector_pos[0])**2 + 
-                               (self.current_end_pos[1] - connector_pos[1])**2)
+        if connector_pos is not None:
+            # Snap al conector
+            self.current_end_pos = connector_pos
+            self.update_control_points()
             
-            if distance <= self.connector_radius * 2:
-                # Snap al conector
-                self.current_end_pos = connector_pos
-                
-                # Verificar si es la conexión correcta
-                if connector_pos == self.end_pos:
-                    self.is_connected = True
-                    self.update_control_points()
-                    return True
-                else:
-                    # Conexión incorrecta - mantener conectado pero no es correcto
-                    self.update_control_points()
-                    return False
+            # Verificar si es la conexión correcta; si no lo es, el cable
+            # queda enchufado pero sin contar como conectado
+            if connector_pos == self.end_pos:
+                self.is_connected = True
+                return True
+            return False
         
         # No se conectó a ningún conector - resetear
         self.current_end_pos = None
@@ -108,6 +115,7 @@ class Wire:
     
     def update_control_points(self):
         """Actualiza los puntos de control para la curva del cable"""
+        self.control_points_dirty = False
         if not self.current_end_pos:
             return
         
@@ -131,20 +139,16 @@ class Wire:
         
         # Dibujar el cable si tiene una posición final
         if self.current_end_pos:
+            if self.control_points_dirty:
+                self.update_control_points()
+            
             # Dibujar cable con múltiples segmentos para simular curva
             if len(self.control_points) >= 2:
                 # Cable más grueso
-                for i in range(len(self.control_points) - 1):
-                    pygame.draw.line(screen, self.color, 
-                                   self.control_points[i], 
-                                   self.control_points[i + 1], 8)
+                pygame.draw.lines(screen, self.color, False, self.control_points, 8)
                 
                 # Línea central más delgada para efecto
-                for i in range(len(self.control_points) - 1):
-                    lighter_color = tuple(min(255, c + 50) for c in self.color)
-                    pygame.draw.line(screen, lighter_color, 
-                                   self.control_points[i], 
-                                   self.control_points[i + 1], 4)
+                pygame.draw.lines(screen, self.lighter_color, False, self.control_points, 4)
             
             # Dibujar extremo del cable
             end_color = self.color if not self.is_being_dragged else (255, 255, 255)
@@ -159,12 +163,15 @@ class WiringMinigame(BaseMinigame):
     Inspirado en el minijuego de Among Us
     """
     
-    def __init__(self, screen_width: int = 1280, screen_height: int = 720):
-        super().__init__(screen_width, screen_height)
+    TUNING_KEY = 'wiring'
+    
+    def __init__(self, screen_width: int = 1280, screen_height: int = 720,
+                 headless: bool = False, tuning: Optional[Dict[str, Any]] = None):
+        super().__init__(screen_width, screen_height, headless, tuning)
         
-        # Configuración del minijuego
-        self.time_remaining = 45.0
-        self.num_wires = 4
+        # Configuración del minijuego (desde el motor de dificultad)
+        self.time_remaining = self.tuning['time_limit']
+        self.num_wires = self.tuning['num_wires']
         
         # Colores disponibles para los cables
         self.wire_colors = [
@@ -181,9 +188,19 @@ class WiringMinigame(BaseMinigame):
         self.left_connectors: List[Tuple[int, int]] = []
         self.right_connectors: List[Tuple[int, int]] = []
         
+        # Índice de conectores: posición derecha -> cable que debe llegar ahí
+        self.target_wires: Dict[Tuple[int, int], Wire] = {}
+        self.connector_origin_y = 0.0
+        self.connector_spacing = 1.0
+        
         # Cable siendo arrastrado
         self.dragging_wire: Optional[Wire] = None
         
+        # Capa cacheada con paneles, conectores y cables asentados.
+        # Solo se redibuja cuando cambia alguna conexión.
+        self.wires_layer: Optional[pygame.Surface] = None
+        self.wires_layer_dirty = True
+        
         # Paneles
         self.left_panel_x = screen_width // 4
         self.right_panel_x = 3 * screen_width // 4
@@ -205,6 +222,9 @@ class WiringMinigame(BaseMinigame):
     
     def load_assets(self):
         """Carga los assets del minijuego"""
+        if self.headless:
+            return
+        
         try:
             # Cargar fondo
             bg_path = os.path.join('data', 'assets', 'minigame_wiring_bg.png')
@@ -222,12 +242,15 @@ class WiringMinigame(BaseMinigame):
         self.wires.clear()
         self.left_connectors.clear()
         self.right_connectors.clear()
+        self.target_wires.clear()
         
         # Seleccionar colores aleatorios para este puzzle
         selected_colors = random.sample(self.wire_colors, self.num_wires)
         
         # Crear posiciones de conectores
         spacing = self.panel_height / (self.num_wires + 1)
+        self.connector_origin_y = self.panel_y - self.panel_height // 2 + spacing
+        self.connector_spacing = spacing
         
         for i in range(self.num_wires):
             y_pos = self.panel_y - self.panel_height // 2 + spacing * (i + 1)
@@ -247,6 +270,35 @@ class WiringMinigame(BaseMinigame):
                 wire_id=i
             )
             self.wires.append(wire)
+            self.target_wires[wire.end_pos] = wire
+        
+        self.wires_layer_dirty = True
+    
+    def find_right_connector(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        Busca el conector derecho bajo una posición
+        
+        Los conectores están alineados en una columna con separación fija,
+        así que la fila candidata se obtiene directamente de la coordenada Y
+        y solo se comprueba ese conector con distancia al cuadrado.
+        
+        Returns:
+            Posición del conector o None si no hay ninguno en rango
+        """
+        if not self.right_connectors or pos is None:
+            return None
+        
+        row = int(round((pos[1] - self.connector_origin_y) / self.connector_spacing))
+        if row < 0 or row >= len(self.right_connectors):
+            return None
+        
+        connector_pos = self.right_connectors[row]
+        dx = pos[0] - connector_pos[0]
+        dy = pos[1] - connector_pos[1]
+        # Todos los cables comparten el mismo radio de snap
+        if self.wires and dx * dx + dy * dy <= self.wires[0].snap_radius_sq:
+            return connector_pos
+        return None
     
     def handle_input(self, event: pygame.event.Event):
         """Maneja la entrada del usuario"""
@@ -258,6 +310,7 @@ class WiringMinigame(BaseMinigame):
                 for wire in self.wires:
                     if wire.start_drag(mouse_pos):
                         self.dragging_wire = wire
+                        self.wires_layer_dirty = True
                         break
         
         elif event.type == pygame.MOUSEMOTION:
@@ -268,7 +321,9 @@ class WiringMinigame(BaseMinigame):
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1 and self.dragging_wire:
                 # Terminar arrastre
-                connected = self.dragging_wire.end_drag(self.right_connectors)
+                connector_pos = self.find_right_connector(self.dragging_wire.current_end_pos)
+                connected = self.dragging_wire.end_drag(connector_pos)
+                self.wires_layer_dirty = True
                 
                 if connected:
                     self.create_spark_effect(self.dragging_wire.current_end_pos)
@@ -284,12 +339,77 @@ class WiringMinigame(BaseMinigame):
                 # Resetear puzzle
                 self.reset_puzzle()
     
+    def drag_wire(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int]) -> bool:
+        """
+        Arrastra un cable de una posición a otra en una sola operación
+        
+        Equivale a MOUSEBUTTONDOWN en start_pos, MOUSEMOTION y MOUSEBUTTONUP
+        en end_pos.
+        
+        Returns:
+            True si el cable quedó conectado correctamente
+        """
+        for wire in self.wires:
+            if wire.start_drag(start_pos):
+                self.dragging_wire = wire
+                break
+        else:
+            return False
+        
+        wire.update_drag(end_pos)
+        connected = wire.end_drag(self.find_right_connector(end_pos))
+        self.dragging_wire = None
+        self.wires_layer_dirty = True
+        
+        if connected:
+            self.create_spark_effect(wire.current_end_pos)
+            self.check_completion()
+        return connected
+    
+    def apply_action(self, action: Dict[str, Any]):
+        """
+        Aplica una acción programática (ver BaseMinigame.step)
+        
+        Acciones propias:
+        - {'type': 'drag', 'from': (x, y), 'to': (x, y)}: arrastrar un cable
+        - {'type': 'reset'}: reiniciar el puzzle
+        """
+        action_type = action.get('type')
+        if action_type == 'drag':
+            self.drag_wire(action['from'], action['to'])
+        elif action_type == 'reset':
+            self.reset_puzzle()
+        else:
+            super().apply_action(action)
+    
+    def get_observation(self) -> Dict[str, Any]:
+        """Observación con cada cable, su conector correcto y su estado"""
+        observation = super().get_observation()
+        observation.update({
+            'connected': sum(1 for wire in self.wires if wire.is_connected),
+            'num_wires': self.num_wires,
+            'wires': [
+                {
+                    'id': wire.wire_id,
+                    'color': wire.color,
+                    'start': wire.start_pos,
+                    'target': wire.end_pos,
+                    'end': wire.current_end_pos,
+                    'connected': wire.is_connected
+                }
+                for wire in self.wires
+            ]
+        })
+        return observation
+    
     def reset_puzzle(self):
         """Resetea todos los cables"""
         for wire in self.wires:
             wire.is_connected = False
             wire.current_end_pos = None
             wire.is_being_dragged = False
+        self.dragging_wire = None
+        self.wires_layer_dirty = True
     
     def check_completion(self):
         """Verifica si el puzzle está completo"""
@@ -301,7 +421,8 @@ class WiringMinigame(BaseMinigame):
             self.calculate_rewards(True)
             
             # Retrasar un poco la finalización para mostrar el efecto
-            pygame.time.wait(500)
+            if not self.headless:
+                pygame.time.wait(500)
             self.complete_minigame(True)
     
     def create_spark_effect(self, pos: Tuple[int, int]):
@@ -362,14 +483,9 @@ class WiringMinigame(BaseMinigame):
         if self.background:
             screen.blit(self.background, (0, 0))
         else:
-            screen.fill((20, 20, 40))
-            
-            # Dibujar patrón de circuitos de fondo
-            grid_color = (30, 30, 60)
-            for x in range(0, self.screen_width, 50):
-                pygame.draw.line(screen, grid_color, (x, 0), (x, self.screen_height), 1)
-            for y in range(0, self.screen_height, 50):
-                pygame.draw.line(screen, grid_color, (0, y), (self.screen_width, y), 1)
+            # Patrón de circuitos de fondo (generado una vez y cacheado)
+            screen.blit(get_grid_background((self.screen_width, self.screen_height),
+                                            (20, 20, 40), (30, 30, 60), 50), (0, 0))
         
         # Flash de completado
         if self.completion_flash > 0:
@@ -378,30 +494,14 @@ class WiringMinigame(BaseMinigame):
             flash_surface.set_alpha(int(self.completion_flash * 100))
             screen.blit(flash_surface, (0, 0))
         
-        # Renderizar paneles
-        self.render_panels(screen)
-        
-        # Renderizar conectores del lado derecho primero (destinos)
-        for i, pos in enumerate(self.right_connectors):
-            # Encontrar el cable que debe conectarse aquí
-            target_wire = None
-            for wire in self.wires:
-                if wire.end_pos == pos:
-                    target_wire = wire
-                    break
-            
-            if target_wire:
-                # Dibujar conector con el color del cable objetivo
-                pygame.draw.circle(screen, target_wire.color, pos, 15)
-                pygame.draw.circle(screen, (255, 255, 255), pos, 15, 2)
-                
-                # Indicador si está correctamente conectado
-                if target_wire.is_connected:
-                    pygame.draw.circle(screen, (0, 255, 0), pos, 20, 3)
+        # Paneles, conectores y cables asentados (capa cacheada)
+        if self.wires_layer_dirty or self.wires_layer is None:
+            self.rebuild_wires_layer()
+        screen.blit(self.wires_layer, (0, 0))
         
-        # Renderizar cables
-        for wire in self.wires:
-            wire.draw(screen)
+        # Solo el cable arrastrado se dibuja en vivo
+        if self.dragging_wire:
+            self.dragging_wire.draw(screen)
         
         # Renderizar chispas
         for spark in self.spark_effects:
@@ -414,6 +514,36 @@ class WiringMinigame(BaseMinigame):
         # Renderizar UI
         self.render_ui(screen)
     
+    def rebuild_wires_layer(self):
+        """Redibuja la capa de paneles, conectores y cables que no se están arrastrando"""
+        if self.wires_layer is None:
+            self.wires_layer = pygame.Surface((self.screen_width, self.screen_height),
+                                              pygame.SRCALPHA)
+        self.wires_layer.fill((0, 0, 0, 0))
+        
+        # Renderizar paneles
+        self.render_panels(self.wires_layer)
+        
+        # Renderizar conectores del lado derecho primero (destinos)
+        for pos in self.right_connectors:
+            target_wire = self.target_wires.get(pos)
+            
+            if target_wire:
+                # Dibujar conector con el color del cable objetivo
+                pygame.draw.circle(self.wires_layer, target_wire.color, pos, 15)
+                pygame.draw.circle(self.wires_layer, (255, 255, 255), pos, 15, 2)
+                
+                # Indicador si está correctamente conectado
+                if target_wire.is_connected:
+                    pygame.draw.circle(self.wires_layer, (0, 255, 0), pos, 20, 3)
+        
+        # Renderizar cables asentados
+        for wire in self.wires:
+            if wire is not self.dragging_wire:
+                wire.draw(self.wires_layer)
+        
+        self.wires_layer_dirty = False
+    
     def render_panels(self, screen: pygame.Surface):
         """Renderiza los paneles de conexión"""
         # Panel izquierdo
@@ -1,14 +1,160 @@
 """
 Repair - Sistema de Reparación de la Nave
 Simplificado para MVP: Un solo progreso de reparación general
+
+Además, RepairSystem modela los componentes de 'ship_components' de
+config.json: cada uno tiene su progreso, sus recursos necesarios y los
+componentes de los que depende ('depends_on'). Al arrancar se compila un
+grafo de dependencias (orden topológico y dependientes de cada componente) y
+un índice recurso -> componentes, de modo que cuando cambia el inventario
+solo se reevalúan los componentes que usan los recursos modificados.
 """
 
-from typing import Dict, Optional, Any
+from enum import Enum
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Any
 import logging
 
+from .resources import ResourceType
+
 logger = logging.getLogger(__name__)
 
 
+class ComponentStatus(Enum):
+    """Estado de un componente según su progreso de reparación"""
+    DESTROYED = "destroyed"
+    CRITICAL = "critical"
+    DAMAGED = "damaged"
+    FUNCTIONAL = "functional"
+
+
+# Progreso inicial de cada estado (y umbral mínimo para alcanzarlo)
+STATUS_PROGRESS: Dict[ComponentStatus, float] = {
+    ComponentStatus.DESTROYED: 0.0,
+    ComponentStatus.CRITICAL: 25.0,
+    ComponentStatus.DAMAGED: 50.0,
+    ComponentStatus.FUNCTIONAL: 100.0,
+}
+
+# Componentes por defecto (equivalentes a la sección 'ship_components' de config.json)
+DEFAULT_SHIP_COMPONENTS: List[Dict[str, Any]] = [
+    {'name': 'Motor Principal', 'status': 'damaged', 'is_critical': True, 'repair_difficulty': 3,
+     'required_resources': {'metal': 30, 'circuits': 15, 'fuel': 20},
+     'depends_on': ['Soporte Vital']},
+    {'name': 'Sistema de Navegación', 'status': 'critical', 'is_critical': True, 'repair_difficulty': 2,
+     'required_resources': {'circuits': 25, 'rare_minerals': 5},
+     'depends_on': ['Motor Principal']},
+    {'name': 'Soporte Vital', 'status': 'functional', 'is_critical': True, 'repair_difficulty': 2,
+     'required_resources': {'metal': 15, 'circuits': 10},
+     'depends_on': []},
+    {'name': 'Escudo Deflector', 'status': 'destroyed', 'is_critical': False, 'repair_difficulty': 4,
+     'required_resources': {'metal': 40, 'circuits': 20, 'rare_minerals': 10},
+     'depends_on': ['Motor Principal']},
+    {'name': 'Sistema de Comunicaciones', 'status': 'damaged', 'is_critical': False, 'repair_difficulty': 1,
+     'required_resources': {'circuits': 15, 'metal': 10},
+     'depends_on': ['Sistema de Navegación']},
+]
+
+
+class ShipComponent:
+    """
+    Componente de la nave con su progreso de reparación
+    
+    Atributos:
+        name: Nombre (identificador) del componente
+        is_critical: Si es necesario para despegar
+        repair_difficulty: Pasos de reparación necesarios desde 0%
+        required_resources: Recursos que consume iniciar la reparación
+        depends_on: Componentes que deben estar reparados antes
+        repair_progress: Progreso actual (0-100)
+        in_repair: Si ya se pagaron los recursos y faltan pasos
+    """
+    
+    def __init__(self, name: str, required_resources: Optional[Mapping[ResourceType, int]] = None,
+                 is_critical: bool = False, repair_difficulty: int = 1,
+                 status: ComponentStatus = ComponentStatus.DAMAGED,
+                 depends_on: Iterable[str] = ()):
+        """
+        Args:
+            name: Nombre del componente
+            required_resources: {ResourceType: cantidad} para iniciar la reparación
+            is_critical: Si es necesario para despegar
+            repair_difficulty: Pasos necesarios (cada paso suma 100 / dificultad)
+            status: Estado inicial
+            depends_on: Nombres de los componentes de los que depende
+        """
+        self.name = name
+        self.required_resources: Dict[ResourceType, int] = dict(required_resources or {})
+        self.is_critical = is_critical
+        self.repair_difficulty = max(1, int(repair_difficulty))
+        self.depends_on = tuple(depends_on)
+        self.repair_progress = STATUS_PROGRESS[status]
+        self.initial_progress = self.repair_progress
+        self.in_repair = False
+    
+    @classmethod
+    def from_config(cls, entry: Dict[str, Any]) -> 'ShipComponent':
+        """Crea un componente desde una entrada de 'ship_components'"""
+        return cls(
+            name=entry['name'],
+            required_resources={ResourceType(key): amount
+                                for key, amount in entry.get('required_resources', {}).items()},
+            is_critical=entry.get('is_critical', False),
+            repair_difficulty=entry.get('repair_difficulty', 1),
+            status=ComponentStatus(entry.get('status', 'damaged')),
+            depends_on=entry.get('depends_on', ())
+        )
+    
+    @property
+    def status(self) -> ComponentStatus:
+        """Estado derivado del progreso"""
+        current = ComponentStatus.DESTROYED
+        for status, threshold in STATUS_PROGRESS.items():
+            if self.repair_progress >= threshold:
+                current = status
+        return current
+    
+    @property
+    def step_progress(self) -> float:
+        """Progreso que suma cada paso de reparación exitoso"""
+        return 100.0 / self.repair_difficulty
+    
+    def add_repair_progress(self, amount: float) -> float:
+        """
+        Añade progreso de reparación (limitado a 0-100)
+        
+        Returns:
+            Nuevo progreso
+        """
+        self.repair_progress = max(0.0, min(100.0, self.repair_progress + amount))
+        if self.is_repaired():
+            self.in_repair = False
+        return self.repair_progress
+    
+    def is_repaired(self) -> bool:
+        """True si el componente está completamente reparado"""
+        return self.repair_progress >= 100.0
+    
+    def can_start_repair(self, available: Mapping[ResourceType, int]) -> bool:
+        """
+        Verifica si los recursos disponibles cubren la reparación
+        
+        Args:
+            available: {ResourceType: cantidad disponible}
+        """
+        if self.is_repaired():
+            return False
+        return all(available.get(resource_type, 0) >= amount
+                   for resource_type, amount in self.required_resources.items())
+    
+    def reset(self) -> None:
+        """Vuelve al estado inicial"""
+        self.repair_progress = self.initial_progress
+        self.in_repair = False
+    
+    def __repr__(self) -> str:
+        return f"ShipComponent({self.name!r}, {self.repair_progress:.0f}%, {self.status.value})"
+
+
 class RepairSystem:
     """
     Sistema simplificado de reparación de la nave
@@ -29,13 +175,28 @@ class RepairSystem:
         - engine.state.GameState: Para actualizar progreso total
     """
     
-    def __init__(self):
-        """Inicializa el sistema de reparación"""
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa el sistema de reparación
+        
+        Args:
+            config: Configuración del juego (sección 'ship_components'; None = valores por defecto)
+        """
         # Referencias a otros componentes
         self.resource_manager = None
         self.event_manager = None
         self.game_state = None
         
+        # Componentes de la nave y sus índices precalculados
+        entries = (config or {}).get('ship_components', DEFAULT_SHIP_COMPONENTS)
+        self.components: Dict[str, ShipComponent] = {}
+        for entry in entries:
+            component = ShipComponent.from_config(entry)
+            if component.name in self.components:
+                raise ValueError(f"Componente duplicado en ship_components: {component.name}")
+            self.components[component.name] = component
+        self._build_indexes()
+        
         # Configuración de reparación
         self.materials_cost_min = 5
         self.materials_cost_max = 10
@@ -188,4 +349,239 @@ class RepairSystem:
             'estimated_materials': estimated_materials,
             'estimated_oxygen': attempts_needed * self.oxygen_cost
         }
-
+    
+    # ===== Componentes de la nave =====
+    
+    def _build_indexes(self) -> None:
+        """Compila el grafo de dependencias y el índice recurso -> componentes"""
+        self._dependents: Dict[str, List[str]] = {name: [] for name in self.components}
+        self._resource_index: Dict[ResourceType, List[str]] = {resource_type: [] for resource_type in ResourceType}
+        for component in self.components.values():
+            for dependency in component.depends_on:
+                if dependency not in self.components:
+                    raise ValueError(f"{component.name} depende de un componente desconocido: {dependency}")
+                self._dependents[dependency].append(component.name)
+            for resource_type in component.required_resources:
+                self._resource_index[resource_type].append(component.name)
+        
+        # Orden topológico (Kahn); si no cubre todos los componentes hay un ciclo
+        indegree = {name: len(component.depends_on) for name, component in self.components.items()}
+        queue = [name for name, degree in indegree.items() if degree == 0]
+        order = []
+        while queue:
+            name = queue.pop(0)
+            order.append(name)
+            for dependent in self._dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    queue.append(dependent)
+        if len(order) != len(self.components):
+            cycle = sorted(name for name, degree in indegree.items() if degree > 0)
+            raise ValueError(f"Dependencias circulares entre componentes: {cycle}")
+        self.repair_order = tuple(order)
+        
+        self._reset_tracking()
+    
+    def _reset_tracking(self) -> None:
+        """Recalcula dependencias pendientes; los recursos se sincronizan con el inventario"""
+        self._pending_dependencies: Dict[str, int] = {
+            name: sum(not self.components[dependency].is_repaired() for dependency in component.depends_on)
+            for name, component in self.components.items()
+        }
+        self._missing: Dict[str, Set[ResourceType]] = {
+            name: set(component.required_resources) for name, component in self.components.items()
+        }
+        self._affordable: Set[str] = set()
+        self._synced_inventory = None
+    
+    def _available(self, resource_type: ResourceType) -> int:
+        """Cantidad disponible de un recurso en el inventario tipado"""
+        return self.resource_manager.inventory.get_amount(resource_type)
+    
+    def _update_affordable(self, name: str) -> None:
+        """Actualiza la pertenencia de un componente al conjunto de reparaciones asequibles"""
+        component = self.components[name]
+        if (not self._missing[name] and self._pending_dependencies[name] == 0
+                and not component.is_repaired() and not component.in_repair):
+            self._affordable.add(name)
+        else:
+            self._affordable.discard(name)
+    
+    def _ensure_synced(self) -> None:
+        """Sincroniza todos los componentes si el inventario conectado cambió"""
+        inventory = self.resource_manager.inventory if self.resource_manager else None
+        if inventory is not self._synced_inventory:
+            self._synced_inventory = inventory
+            if inventory is not None:
+                self.refresh_resources()
+    
+    def refresh_resources(self, resource_types: Optional[Iterable[ResourceType]] = None) -> None:
+        """
+        Reevalúa los componentes que usan los recursos indicados
+        
+        Args:
+            resource_types: Recursos cuyo inventario cambió (None = todos)
+        """
+        if not self.resource_manager:
+            return
+        resource_types = list(ResourceType) if resource_types is None else resource_types
+        
+        touched = set()
+        for resource_type in resource_types:
+            available = self._available(resource_type)
+            for name in self._resource_index[resource_type]:
+                if available >= self.components[name].required_resources[resource_type]:
+                    self._missing[name].discard(resource_type)
+                else:
+                    self._missing[name].add(resource_type)
+                touched.add(name)
+        for name in touched:
+            self._update_affordable(name)
+    
+    def on_resources_changed(self, event) -> None:
+        """Handler de RESOURCES_GAINED / RESOURCES_CONSUMED"""
+        self._ensure_synced()
+        resources = (event.data or {}).get('resources', {})
+        self.refresh_resources(ResourceType(key) for key in resources)
+    
+    def _mark_repaired(self, name: str) -> List[str]:
+        """
+        Propaga la reparación de un componente a sus dependientes
+        
+        Returns:
+            Componentes desbloqueados por esta reparación
+        """
+        unlocked = []
+        for dependent in self._dependents[name]:
+            self._pending_dependencies[dependent] -= 1
+            if self._pending_dependencies[dependent] == 0:
+                unlocked.append(dependent)
+            self._update_affordable(dependent)
+        self._update_affordable(name)
+        return unlocked
+    
+    def get_component(self, name: str) -> Optional[ShipComponent]:
+        """Componente por nombre (None si no existe)"""
+        return self.components.get(name)
+    
+    def is_unlocked(self, name: str) -> bool:
+        """True si todas las dependencias del componente están reparadas"""
+        return self._pending_dependencies[name] == 0
+    
+    def start_repair(self, name: str) -> Dict[str, Any]:
+        """
+        Inicia la reparación de un componente consumiendo sus recursos
+        
+        Args:
+            name: Nombre del componente
+            
+        Returns:
+            Diccionario con 'success' y 'message'
+        """
+        component = self.components.get(name)
+        if component is None:
+            return {'success': False, 'message': f'Componente desconocido: {name}'}
+        if component.is_repaired():
+            return {'success': False, 'message': f'{name} ya está reparado'}
+        if component.in_repair:
+            return {'success': True, 'message': f'{name} ya está en reparación'}
+        if not self.is_unlocked(name):
+            return {'success': False, 'message': f'{name} requiere reparar antes: {", ".join(self.get_blockers(name))}'}
+        if not self.resource_manager:
+            return {'success': False, 'message': 'Sistema no inicializado'}
+        
+        self._ensure_synced()
+        if not self.resource_manager.consume_resources(component.required_resources, "repair"):
+            missing = ", ".join(resource_type.value for resource_type in sorted(
+                self._missing[name], key=lambda resource_type: resource_type.value))
+            return {'success': False, 'message': f'Recursos insuficientes para {name}: {missing}'}
+        
+        component.in_repair = True
+        self.refresh_resources(component.required_resources)
+        self._update_affordable(name)
+        logger.info(f"Reparación de {name} iniciada")
+        return {'success': True, 'message': f'Reparación de {name} iniciada'}
+    
+    def complete_repair_step(self, name: str, success: bool = True) -> Dict[str, Any]:
+        """
+        Completa un paso de reparación de un componente en reparación
+        
+        Args:
+            name: Nombre del componente
+            success: Si el minijuego fue exitoso (un fallo no suma progreso)
+            
+        Returns:
+            Diccionario con 'success', 'progress', 'is_repaired' y 'unlocked'
+        """
+        component = self.components.get(name)
+        if component is None or not component.in_repair:
+            return {'success': False, 'progress': component.repair_progress if component else 0.0,
+                    'is_repaired': bool(component and component.is_repaired()), 'unlocked': []}
+        
+        old_progress = component.repair_progress
+        if success:
+            component.add_repair_progress(component.step_progress)
+        
+        unlocked = self._mark_repaired(name) if component.is_repaired() else []
+        if self.event_manager and component.repair_progress != old_progress:
+            from engine.events import EventType
+            self.event_manager.emit_quick(
+                EventType.REPAIR_PROGRESS_CHANGED,
+                {
+                    'component': name,
+                    'old_progress': old_progress,
+                    'new_progress': component.repair_progress,
+                    'increment': component.repair_progress - old_progress,
+                    'unlocked': unlocked
+                }
+            )
+        
+        if unlocked:
+            logger.info(f"{name} reparado; desbloquea: {', '.join(unlocked)}")
+        return {
+            'success': success,
+            'progress': component.repair_progress,
+            'is_repaired': component.is_repaired(),
+            'unlocked': unlocked
+        }
+    
+    def get_total_progress(self) -> float:
+        """Progreso medio de todos los componentes (0-100)"""
+        if not self.components:
+            return 100.0
+        return sum(component.repair_progress for component in self.components.values()) / len(self.components)
+    
+    def get_repairable_components(self) -> List[ShipComponent]:
+        """Componentes sin reparar cuyas dependencias ya están reparadas (orden topológico)"""
+        return [self.components[name] for name in self.repair_order
+                if not self.components[name].is_repaired() and self.is_unlocked(name)]
+    
+    def get_affordable_repairs(self) -> List[str]:
+        """Componentes cuya reparación se puede iniciar ahora (orden topológico)"""
+        self._ensure_synced()
+        return [name for name in self.repair_order if name in self._affordable]
+    
+    def get_blockers(self, name: str) -> List[str]:
+        """Dependencias sin reparar de un componente"""
+        return [dependency for dependency in self.components[name].depends_on
+                if not self.components[dependency].is_repaired()]
+    
+    def get_next_unlocks(self, name: str) -> List[str]:
+        """Componentes que quedarían desbloqueados al reparar `name`"""
+        if self.components[name].is_repaired():
+            return []
+        return [dependent for dependent in self._dependents[name] if self._pending_dependencies[dependent] == 1]
+    
+    def get_critical_components(self) -> List[ShipComponent]:
+        """Componentes necesarios para despegar"""
+        return [component for component in self.components.values() if component.is_critical]
+    
+    def can_launch_ship(self) -> bool:
+        """True si todos los componentes críticos están reparados"""
+        return all(component.is_repaired() for component in self.get_critical_components())
+    
+    def reset(self) -> None:
+        """Vuelve los componentes a su estado inicial (nueva partida)"""
+        for component in self.components.values():
+            component.reset()
+        self._reset_tracking()
@@ -2,14 +2,216 @@
 Resources - Sistema de Recolección de Recursos
 Simplificado para MVP: Un solo tipo de material genérico
 Materiales = Trabajo (concepto educativo)
+
+Además de los materiales genéricos (GameState.materials), ResourceManager
+mantiene un inventario tipado con los recursos de la sección 'resources' de
+config.json. Las cantidades, capacidades y valores se guardan en arrays de
+NumPy con un índice fijo por ResourceType, de modo que añadir o consumir un
+lote es una sola operación vectorizada y emite un único evento.
 """
 
-from typing import Dict, Optional, Any
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Mapping, Optional, Union, Any
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
+class ResourceType(Enum):
+    """Tipos de recurso (el orden define el índice en el inventario)"""
+    METAL = "metal"
+    CIRCUITS = "circuits"
+    FUEL = "fuel"
+    RARE_MINERALS = "rare_minerals"
+    OXYGEN_CANISTER = "oxygen_canister"
+    SCRAP = "scrap"
+
+
+# Índice fijo de cada recurso en los arrays del inventario
+RESOURCE_INDEX: Dict[ResourceType, int] = {resource_type: index for index, resource_type in enumerate(ResourceType)}
+
+# Valores por defecto (equivalentes a la sección 'resources' de config.json)
+DEFAULT_RESOURCES: Dict[str, Dict[str, Any]] = {
+    'metal': {'max_storage': 100, 'value': 1.0, 'initial_amount': 10},
+    'circuits': {'max_storage': 50, 'value': 2.0, 'initial_amount': 5},
+    'fuel': {'max_storage': 75, 'value': 1.5, 'initial_amount': 0},
+    'rare_minerals': {'max_storage': 30, 'value': 5.0, 'initial_amount': 0},
+    'oxygen_canister': {'max_storage': 20, 'value': 3.0, 'initial_amount': 2},
+    'scrap': {'max_storage': 150, 'value': 0.5, 'initial_amount': 15},
+}
+
+# Valor de un material genérico (conversión de recursos a materiales)
+MATERIAL_VALUE = 1.0
+
+ResourceBatch = Union[Mapping[ResourceType, int], np.ndarray]
+
+
+@dataclass
+class Resource:
+    """
+    Cantidad de un tipo de recurso con su límite de almacenamiento
+    
+    Atributos:
+        resource_type: Tipo de recurso
+        amount: Cantidad actual
+        max_storage: Capacidad máxima
+        value: Valor unitario (en materiales genéricos)
+    """
+    resource_type: ResourceType
+    amount: int = 0
+    max_storage: int = 100
+    value: float = 1.0
+    
+    def add(self, amount: int) -> int:
+        """
+        Añade recursos hasta el límite de almacenamiento
+        
+        Returns:
+            Cantidad realmente añadida
+        """
+        added = max(0, min(amount, self.max_storage - self.amount))
+        self.amount += added
+        return added
+    
+    def consume(self, amount: int) -> bool:
+        """
+        Consume recursos si hay suficientes
+        
+        Returns:
+            True si se pudieron consumir
+        """
+        if amount < 0 or amount > self.amount:
+            return False
+        self.amount -= amount
+        return True
+
+
+class ResourceInventory:
+    """
+    Inventario tipado respaldado por arrays de índice fijo
+    
+    Atributos:
+        amounts: Cantidad de cada recurso (int64, índice RESOURCE_INDEX)
+        capacities: Capacidad máxima de cada recurso
+        values: Valor unitario de cada recurso (solo lectura)
+        material_weights: Materiales genéricos por unidad (values / MATERIAL_VALUE)
+    """
+    
+    def __init__(self, section: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Args:
+            section: Sección 'resources' de config.json (None = valores por defecto)
+        """
+        section = section or {}
+        entries = [{**DEFAULT_RESOURCES[resource_type.value], **section.get(resource_type.value, {})}
+                   for resource_type in ResourceType]
+        
+        self.initial_amounts = np.array([entry['initial_amount'] for entry in entries], dtype=np.int64)
+        self.initial_capacities = np.array([entry['max_storage'] for entry in entries], dtype=np.int64)
+        self.initial_amounts = np.minimum(self.initial_amounts, self.initial_capacities)
+        self.initial_amounts.flags.writeable = False
+        self.initial_capacities.flags.writeable = False
+        
+        # Pesos precalculados para intercambio y conversión a materiales
+        self.values = np.array([entry['value'] for entry in entries], dtype=np.float64)
+        self.material_weights = self.values / MATERIAL_VALUE
+        self.values.flags.writeable = False
+        self.material_weights.flags.writeable = False
+        
+        self.amounts = self.initial_amounts.copy()
+        self.capacities = self.initial_capacities.copy()
+    
+    def reset(self) -> None:
+        """Vuelve a las cantidades y capacidades iniciales"""
+        self.amounts[:] = self.initial_amounts
+        self.capacities[:] = self.initial_capacities
+    
+    @staticmethod
+    def to_vector(resources: ResourceBatch) -> np.ndarray:
+        """Convierte un lote {ResourceType: cantidad} a un vector (negativos = 0)"""
+        if isinstance(resources, np.ndarray):
+            return np.maximum(resources.astype(np.int64, copy=False), 0)
+        vector = np.zeros(len(RESOURCE_INDEX), dtype=np.int64)
+        for resource_type, amount in resources.items():
+            vector[RESOURCE_INDEX[resource_type]] += amount
+        return np.maximum(vector, 0)
+    
+    @staticmethod
+    def to_dict(vector: np.ndarray) -> Dict[ResourceType, int]:
+        """Convierte un vector a {ResourceType: cantidad} (solo cantidades no nulas)"""
+        return {resource_type: int(vector[index])
+                for resource_type, index in RESOURCE_INDEX.items() if vector[index]}
+    
+    def get_amount(self, resource_type: ResourceType) -> int:
+        """Cantidad de un recurso"""
+        return int(self.amounts[RESOURCE_INDEX[resource_type]])
+    
+    def get_resource(self, resource_type: ResourceType) -> Resource:
+        """Copia de un recurso como Resource"""
+        index = RESOURCE_INDEX[resource_type]
+        return Resource(resource_type, int(self.amounts[index]),
+                        int(self.capacities[index]), float(self.values[index]))
+    
+    def add_batch(self, resources: ResourceBatch) -> np.ndarray:
+        """
+        Añade un lote de recursos recortando cada uno a su capacidad
+        
+        Returns:
+            Vector con lo realmente añadido
+        """
+        target = np.minimum(self.amounts + self.to_vector(resources), self.capacities)
+        added = np.maximum(target - self.amounts, 0)
+        self.amounts += added
+        return added
+    
+    def has_batch(self, resources: ResourceBatch) -> bool:
+        """True si hay suficiente de todos los recursos del lote"""
+        return bool(np.all(self.amounts >= self.to_vector(resources)))
+    
+    def consume_batch(self, resources: ResourceBatch) -> bool:
+        """
+        Consume un lote completo o nada
+        
+        Returns:
+            True si había suficiente de todos los recursos
+        """
+        vector = self.to_vector(resources)
+        if np.any(self.amounts < vector):
+            return False
+        self.amounts -= vector
+        return True
+    
+    def upgrade_storage(self, resource_type: ResourceType, extra_storage: int) -> int:
+        """
+        Aumenta la capacidad de un recurso
+        
+        Returns:
+            Nueva capacidad
+        """
+        index = RESOURCE_INDEX[resource_type]
+        self.capacities[index] += max(0, extra_storage)
+        return int(self.capacities[index])
+    
+    def get_value(self, resources: Optional[ResourceBatch] = None) -> float:
+        """Valor total de un lote (None = todo el inventario)"""
+        vector = self.amounts if resources is None else self.to_vector(resources)
+        return float(vector @ self.values)
+    
+    def get_material_equivalent(self, resources: Optional[ResourceBatch] = None) -> int:
+        """Materiales genéricos equivalentes a un lote (None = todo el inventario)"""
+        vector = self.amounts if resources is None else self.to_vector(resources)
+        return int(vector @ self.material_weights)
+    
+    def as_dict(self) -> Dict[str, Dict[str, int]]:
+        """Resumen {recurso: {'amount', 'max_storage'}}"""
+        return {resource_type.value: {'amount': int(self.amounts[index]),
+                                      'max_storage': int(self.capacities[index])}
+                for resource_type, index in RESOURCE_INDEX.items()}
+
+
 class ResourceManager:
     """
     Gestor simplificado de recursos del juego
@@ -29,8 +231,13 @@ class ResourceManager:
         - engine.state.GameState: Para actualizar el estado del juego
     """
     
-    def __init__(self):
-        """Inicializa el gestor de recursos"""
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        """
+        Inicializa el gestor de recursos
+        
+        Args:
+            config: Configuración del juego (sección 'resources'; None = valores por defecto)
+        """
         # Referencias a otros componentes
         self.event_manager = None
         self.game_state = None
@@ -39,6 +246,9 @@ class ResourceManager:
         self.mining_reward_success = 10  # Materiales por minería exitosa
         self.mining_reward_fail = 2      # Materiales por minería fallida
         
+        # Inventario tipado (independiente de los materiales genéricos)
+        self.inventory = ResourceInventory((config or {}).get('resources'))
+        
         logger.info("ResourceManager inicializado (sistema simplificado)")
 
 
@@ -162,12 +372,152 @@ class ResourceManager:
             Diccionario con información de recursos
         """
         if not self.game_state:
-            return {"materials": 0, "max_materials": 999}
+            return {"materials": 0, "max_materials": 999, "resources": self.inventory.as_dict()}
         
         return {
             "materials": self.game_state.materials,
             "max_materials": self.game_state.max_materials,
             "is_low": self.game_state.materials < 5,
-            "is_critical": self.game_state.materials == 0
+            "is_critical": self.game_state.materials == 0,
+            "resources": self.inventory.as_dict()
         }
+    
+    # ===== Inventario tipado =====
+    
+    def collect_resources(self, resources: ResourceBatch, source: str = "mining") -> Dict[ResourceType, int]:
+        """
+        Recolecta un lote de recursos tipados (un solo evento por lote)
+        
+        Args:
+            resources: {ResourceType: cantidad} o vector de índice fijo
+            source: Origen de los recursos
+            
+        Returns:
+            Cantidad realmente añadida de cada recurso
+        """
+        added = self.inventory.add_batch(resources)
+        gained = ResourceInventory.to_dict(added)
+        
+        if gained and self.event_manager:
+            from engine.events import EventType
+            self.event_manager.emit_quick(
+                EventType.RESOURCES_GAINED,
+                {"resources": {resource_type.value: amount for resource_type, amount in gained.items()},
+                 "source": source}
+            )
+        
+        return gained
+    
+    def collect_resource(self, resource_type: ResourceType, amount: int, source: str = "mining") -> int:
+        """Recolecta un solo tipo de recurso; devuelve lo realmente añadido"""
+        return self.collect_resources({resource_type: amount}, source).get(resource_type, 0)
+    
+    def consume_resources(self, resources: ResourceBatch, purpose: str = "repair") -> bool:
+        """
+        Consume un lote de recursos tipados: todo o nada (un solo evento por lote)
+        
+        Args:
+            resources: {ResourceType: cantidad} o vector de índice fijo
+            purpose: Propósito del consumo
+            
+        Returns:
+            True si había suficiente de todos los recursos
+        """
+        vector = ResourceInventory.to_vector(resources)
+        if not self.inventory.consume_batch(vector):
+            return False
+        
+        if vector.any() and self.event_manager:
+            from engine.events import EventType
+            self.event_manager.emit_quick(
+                EventType.RESOURCES_CONSUMED,
+                {"resources": {resource_type.value: amount
+                               for resource_type, amount in ResourceInventory.to_dict(vector).items()},
+                 "purpose": purpose}
+            )
+        
+        return True
+    
+    def consume_resource(self, resource_type: ResourceType, amount: int, purpose: str = "repair") -> bool:
+        """Consume un solo tipo de recurso"""
+        return self.consume_resources({resource_type: amount}, purpose)
+    
+    def has_resources(self, resources: ResourceBatch) -> bool:
+        """True si hay suficiente de todos los recursos del lote"""
+        return self.inventory.has_batch(resources)
+    
+    def get_resource(self, resource_type: ResourceType) -> Resource:
+        """Estado actual de un recurso"""
+        return self.inventory.get_resource(resource_type)
+    
+    def get_resource_amount(self, resource_type: ResourceType) -> int:
+        """Cantidad actual de un recurso"""
+        return self.inventory.get_amount(resource_type)
+    
+    def upgrade_storage(self, resource_type: ResourceType, extra_storage: int) -> int:
+        """
+        Aumenta la capacidad de almacenamiento de un recurso
+        
+        Returns:
+            Nueva capacidad
+        """
+        capacity = self.inventory.upgrade_storage(resource_type, extra_storage)
+        logger.info(f"Almacenamiento de {resource_type.value} ampliado a {capacity}")
+        return capacity
+    
+    def trade_resources(self, give: ResourceBatch, receive_type: ResourceType) -> int:
+        """
+        Intercambia un lote de recursos por otro tipo según su valor
+        
+        Solo se consume lo necesario para la cantidad recibida cuando esta se
+        recorta por capacidad: si no cabe nada, no se intercambia.
+        
+        Args:
+            give: Recursos entregados
+            receive_type: Recurso que se recibe
+            
+        Returns:
+            Cantidad recibida (0 si no se pudo intercambiar)
+        """
+        vector = ResourceInventory.to_vector(give)
+        index = RESOURCE_INDEX[receive_type]
+        if not self.inventory.has_batch(vector):
+            return 0
+        
+        free = int(self.inventory.capacities[index] - self.inventory.amounts[index])
+        received = min(int(self.inventory.get_value(vector) // self.inventory.values[index]), free)
+        if received <= 0:
+            return 0
+        
+        self.consume_resources(vector, "trade")
+        self.collect_resources({receive_type: received}, "trade")
+        logger.info(f"Intercambio de recursos: +{received} {receive_type.value}")
+        return received
+    
+    def convert_to_materials(self, resources: ResourceBatch, purpose: str = "exchange") -> int:
+        """
+        Convierte recursos tipados en materiales genéricos (p.ej. para pagar deudas)
+        
+        Args:
+            resources: Recursos a convertir
+            purpose: Propósito de la conversión
+            
+        Returns:
+            Materiales añadidos a GameState (0 si no hay recursos suficientes)
+        """
+        if not self.game_state:
+            logger.error("GameState no conectado a ResourceManager")
+            return 0
+        
+        vector = ResourceInventory.to_vector(resources)
+        materials = self.inventory.get_material_equivalent(vector)
+        free = self.game_state.max_materials - self.game_state.materials
+        if materials <= 0 or materials > free or not self.consume_resources(vector, purpose):
+            return 0
+        
+        return self.collect_materials(materials, purpose)
+    
+    def reset(self) -> None:
+        """Reinicia el inventario tipado (nueva partida)"""
+        self.inventory.reset()
 
@@ -12,16 +12,23 @@ import sys
 import json
 import logging
 import os
+import time
 from engine.state import GameState
 from engine.loop import GameLoop
-from engine.events import EventManager
+from engine.events import EventManager, EventType
+from engine.timers import TimerScheduler
+from engine import trace
 from ui.renderer import Renderer
 from ui.hud import HUD
 from ui.narrator import Narrator
 from ui.audio import AudioManager
+from ui.assets import AssetLoader, AssetSpec
 from finance.loan_manager import LoanManager
 from gameplay.resources import ResourceManager
 from gameplay.repair import RepairSystem
+from gameplay.difficulty import DifficultyEngine
+from simulation.forecaster import RiskForecaster
+from simulation.advisor import StrategyAdvisor
 
 # Configurar logging
 logging.basicConfig(
@@ -64,10 +71,14 @@ def main():
     Inicializa Pygame, crea las instancias necesarias y ejecuta el bucle principal
     """
     logger.info("Iniciando AstroDebt...")
+    launch_time = time.perf_counter()
     
     # Cargar configuración
     config = load_config()
     
+    # Traza binaria de eventos (sección 'trace'; desactivada por defecto)
+    trace.start_from_config(config)
+    
     # Inicializar Pygame
     pygame.init()
     pygame.mixer.init()
@@ -78,28 +89,30 @@ def main():
     screen = pygame.display.set_mode((screen_width, screen_height))
     pygame.display.set_caption(config['game']['title'])
     
-    # Crear icono de ventana (si existe)
-    try:
-        icon_path = os.path.join('data', 'assets', 'blue_spaceship.png')
-        if os.path.exists(icon_path):
-            icon = pygame.image.load(icon_path)
-            pygame.display.set_icon(icon)
-    except Exception as e:
-        logger.warning(f"No se pudo cargar el icono: {e}")
-    
     # Crear instancias principales
     event_manager = EventManager()
+    
+    # Cargador de recursos en segundo plano: la intro se muestra desde el primer
+    # frame con marcadores de posición y los sprites aparecen al estar listos
+    asset_loader = AssetLoader()
+    asset_loader.event_manager = event_manager
+    
+    # Icono de ventana (si existe)
+    asset_loader.add_images([AssetSpec('icon', 'blue_spaceship.png', (64, 64), alpha=False)],
+                            lambda key, icon: pygame.display.set_icon(icon))
     game_state = GameState(config)
     
     # Crear sistemas del juego
-    resource_manager = ResourceManager()
-    loan_manager = LoanManager()
-    repair_system = RepairSystem()
+    resource_manager = ResourceManager(config)
+    loan_manager = LoanManager(config)
+    repair_system = RepairSystem(config)
     
     # Crear componentes de UI
-    renderer = Renderer(screen_width, screen_height)
-    hud = HUD(screen)
-    narrator = Narrator(screen)
+    # Temporizadores compartidos por la UI (los avanza el game loop)
+    timers = TimerScheduler()
+    renderer = Renderer(screen_width, screen_height, timers)
+    hud = HUD(screen, timers)
+    narrator = Narrator(screen, timers)
     audio_manager = AudioManager()
     
     # Conectar referencias cruzadas
@@ -116,6 +129,8 @@ def main():
     repair_system.resource_manager = resource_manager
     repair_system.event_manager = event_manager
     repair_system.game_state = game_state
+    event_manager.subscribe(EventType.RESOURCES_GAINED, repair_system.on_resources_changed)
+    event_manager.subscribe(EventType.RESOURCES_CONSUMED, repair_system.on_resources_changed)
     
     hud.game_state = game_state
     hud.loan_manager = loan_manager
@@ -123,23 +138,51 @@ def main():
     
     narrator.event_manager = event_manager
     
-    # Inicializar componentes
-    renderer.initialize(screen)
-    hud.initialize()
-    narrator.initialize()
+    # Pronóstico de riesgo en segundo plano (indicador del HUD)
+    risk_forecaster = RiskForecaster()
+    risk_forecaster.game_state = game_state
+    risk_forecaster.loan_manager = loan_manager
+    risk_forecaster.event_manager = event_manager
+    event_manager.subscribe(EventType.RISK_FORECAST_UPDATED, hud.on_risk_forecast)
+    
+    # Consejero de estrategia en segundo plano (consejo del HUD)
+    strategy_advisor = StrategyAdvisor()
+    strategy_advisor.game_state = game_state
+    strategy_advisor.loan_manager = loan_manager
+    strategy_advisor.event_manager = event_manager
+    event_manager.subscribe(EventType.ADVICE_UPDATED, hud.on_advice)
+    
+    # Inicializar componentes (sus imágenes se registran en el cargador)
+    renderer.initialize(screen, asset_loader)
+    hud.initialize(asset_loader)
+    narrator.initialize(asset_loader)
+    
+    # Cargar y reproducir música de fondo cuando el cargador la haya leído
+    music_file = '399325__komitwav__chiptune-loop-100-bpm.wav'
+    
+    def start_music(data) -> None:
+        if audio_manager.load_music(music_file, data):
+            audio_manager.play_music(loops=-1, fade_ms=1000)  # Loop infinito con fade in de 1 segundo
+            logger.info("Música de fondo iniciada")
     
-    # Cargar y reproducir música de fondo
-    if audio_manager.load_music('399325__komitwav__chiptune-loop-100-bpm.wav'):
-        audio_manager.play_music(loops=-1, fade_ms=1000)  # Loop infinito con fade in de 1 segundo
-        logger.info("Música de fondo iniciada")
+    asset_loader.add_file(os.path.join('data', 'music', music_file), start_music)
+    asset_loader.start()
     
     # Crear y configurar el game loop
-    game_loop = GameLoop(game_state, event_manager)
+    game_loop = GameLoop(game_state, event_manager, timers)
     game_loop.renderer = renderer
     game_loop.hud = hud
     game_loop.narrator = narrator
     game_loop.audio_manager = audio_manager
     game_loop.config = config
+    game_loop.launch_time = launch_time
+    game_loop.fps = config['game'].get('fps', 60)
+    game_loop.idle_fps = config['game'].get('idle_fps', 10)
+    game_loop.difficulty_engine = DifficultyEngine(config)
+    game_loop.risk_forecaster = risk_forecaster
+    risk_forecaster.start()
+    game_loop.strategy_advisor = strategy_advisor
+    strategy_advisor.start()
     
     # Asignar game_state al renderer para que esté disponible desde el inicio
     renderer.game_state = game_state
@@ -158,6 +201,7 @@ def main():
         game_state.materials = 50
         game_state.oxygen = 75.0
         game_state.turn_number = 15
+        game_state.mark_changed()
     
     # 👥 MODO TESTING DE PRESTAMISTAS
     # Cambiar a True para mostrar las 3 imágenes de prestamistas en el fondo:
@@ -182,6 +226,9 @@ def main():
     finally:
         # Cleanup
         logger.info("Cerrando el juego...")
+        asset_loader.stop()
+        loan_manager.ledger.close()
+        trace.stop_tracing()
         pygame.quit()
         sys.exit()
 
@@ -0,0 +1,31 @@
+"""
+Simulation Module
+Herramientas de simulación sin ventana: bots para los minijuegos, ejecución
+masiva de episodios para balancear recompensas y dificultad, pronóstico
+Monte Carlo del riesgo de la partida en curso y consejero de estrategia (MCTS)
+"""
+
+from .bots import (
+    BotPolicy, NearestMineralBot, LowestAsteroidBot, TimingBot, GreedyWiringBot, BOT_POLICIES
+)
+from .harness import run_simulation, build_tasks, summarize
+from .forecaster import RiskForecaster, forecast_risk, snapshot_state
+from .advisor import StrategyAdvisor, StrategySearch, recommend
+
+__all__ = [
+    'BotPolicy',
+    'NearestMineralBot',
+    'LowestAsteroidBot',
+    'TimingBot',
+    'GreedyWiringBot',
+    'BOT_POLICIES',
+    'run_simulation',
+    'build_tasks',
+    'summarize',
+    'RiskForecaster',
+    'forecast_risk',
+    'snapshot_state',
+    'StrategyAdvisor',
+    'StrategySearch',
+    'recommend'
+]
@@ -0,0 +1,459 @@
+"""
+Advisor - Consejero de estrategia con búsqueda Monte Carlo en árbol
+Recomienda la siguiente acción (minar, reparar, cambiar materiales por
+oxígeno, pagar, aceptar o rechazar un préstamo) buscando con MCTS (UCT) sobre
+las reglas puras de engine.rules. Las estadísticas de cada estado se guardan
+en una tabla de transposición indexada por una clave compacta del estado (la
+tupla de sus campos relevantes), así que los estados que se alcanzan por
+caminos distintos (o en búsquedas consecutivas) comparten su evaluación.
+
+StrategyAdvisor busca en un hilo de fondo con un presupuesto de tiempo fijo
+y encola un evento ADVICE_UPDATED con cada recomendación parcial, para
+que el HUD la muestre sin afectar a los FPS. Vuelve a pedir consejo cuando
+cambia cualquier parte del estado que usan las reglas, y guarda la
+recomendación final de cada estado para repetirla sin buscar.
+"""
+
+import math
+import random
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple, Any
+import logging
+
+from engine import rules
+from finance.compact import CREDITOR_STRATEGIES
+from engine.rules import Action, RulesState
+
+logger = logging.getLogger(__name__)
+
+# Presupuesto de búsqueda por defecto
+DEFAULT_TIME_BUDGET = 0.5  # Segundos por recomendación
+DEFAULT_UPDATE_INTERVAL = 0.1  # Segundos entre recomendaciones parciales
+DEFAULT_MAX_DEPTH = 6  # Acciones simuladas por iteración
+DEFAULT_EXPLORATION = 1.4  # Constante de exploración de UCB1
+DEFAULT_MAX_ENTRIES = 200000  # Estados en la tabla de transposición
+DEFAULT_MAX_RESULTS = 1024  # Recomendaciones finales guardadas por estado
+
+# Grupos de GameState que piden una búsqueda nueva (ver GameState.changed_since)
+ADVISOR_GROUPS = ('oxygen', 'materials', 'repair', 'turn', 'status', 'loans')
+
+# Evaluación de un estado no terminal: progreso de reparación y si los
+# recursos (oxígeno + materiales - deuda, en oxígeno equivalente) alcanzan
+# para las reparaciones que faltan
+VALUE_WEIGHTS = {
+    'repair': 0.7,
+    'budget': 0.3,
+}
+REPAIR_GAIN = sum(rules.REPAIR_REWARD) / 2  # Progreso medio por reparación
+REPAIR_OXYGEN_EQUIVALENT = (sum(rules.ACTION_OXYGEN_COST) / 2 +
+                            rules.EXCHANGE_OXYGEN_PER_MATERIAL * sum(rules.REPAIR_MATERIAL_COST) / 2)
+
+# Política de simulación: acción al azar con esta probabilidad, si no la heurística
+ROLLOUT_EPSILON = 0.25
+LOW_OXYGEN = 30  # Por debajo se venden materiales o se acepta un préstamo
+
+# Texto de cada acción para el HUD
+ACTION_LABELS = {
+    rules.MINE: "Minar asteroides",
+    rules.REPAIR: "Reparar la nave",
+    rules.EXCHANGE: "Cambiar materiales por oxígeno",
+    rules.ACCEPT: "Aceptar el préstamo",
+    rules.REJECT: "Rechazar el préstamo",
+    rules.PAY: "Pagar {amount} materiales a {creditor}",
+    rules.END_TURN: "Esperar",
+}
+
+
+# Clave de un estado en la tabla de transposición (ver state_key)
+StateKey = Tuple[Any, ...]
+
+
+def state_key(state: RulesState) -> StateKey:
+    """
+    Clave compacta de un estado (tabla de transposición y caché de resultados)
+    
+    Es la propia tupla, no su hash, así que dos estados distintos nunca
+    comparten entrada. El oxígeno y la reparación se redondean a enteros y
+    el número de turno no cuenta: las reglas no dependen de él.
+    """
+    return (int(state.oxygen), int(state.max_oxygen), state.materials,
+            int(state.repair_progress),
+            tuple((loan.creditor, loan.materials_owed, loan.turns_until_due, loan.is_defaulted)
+                  for loan in state.loans),
+            state.pending_offer and (state.pending_offer.creditor, int(state.pending_offer.amount)))
+
+
+def evaluate(state: RulesState) -> float:
+    """
+    Valor de un estado entre 0 (game over) y 1 (victoria)
+    
+    Los estados no terminales se puntúan con VALUE_WEIGHTS.
+    """
+    if state.victory:
+        return 1.0
+    if state.game_over:
+        return 0.0
+    progress = state.repair_progress / rules.VICTORY_REPAIR_PROGRESS
+    remaining = math.ceil((rules.VICTORY_REPAIR_PROGRESS - state.repair_progress) / REPAIR_GAIN)
+    budget = state.oxygen + rules.EXCHANGE_OXYGEN_PER_MATERIAL * (state.materials - rules.total_debt(state))
+    feasibility = max(0.0, min(1.0, budget / max(1.0, remaining * REPAIR_OXYGEN_EQUIVALENT)))
+    return VALUE_WEIGHTS['repair'] * progress + VALUE_WEIGHTS['budget'] * feasibility
+
+
+def rollout_action(state: RulesState, rng) -> Action:
+    """
+    Acción de la fase de simulación
+    
+    Con probabilidad ROLLOUT_EPSILON una acción legal al azar; si no, la de un
+    jugador sensato: vender materiales o aceptar préstamos con poco oxígeno,
+    reparar si se puede y minar si no.
+    """
+    if rng.random() < ROLLOUT_EPSILON:
+        return rng.choice(rules.legal_actions(state))
+    if state.pending_offer is not None:
+        return Action(rules.ACCEPT if state.oxygen < LOW_OXYGEN else rules.REJECT)
+    if state.oxygen < LOW_OXYGEN and state.materials > 0:
+        return Action(rules.EXCHANGE, state.materials)
+    if rules.can_repair(state):
+        return Action(rules.REPAIR)
+    if rules.can_mine(state):
+        return Action(rules.MINE)
+    return Action(rules.END_TURN)
+
+
+def describe_action(action: Action, state: RulesState) -> str:
+    """Texto de una acción para el jugador"""
+    label = ACTION_LABELS[action.kind]
+    if action.kind == rules.PAY:
+        creditor = CREDITOR_STRATEGIES[state.loans[action.index].creditor].name
+        label = label.format(amount=int(action.amount), creditor=creditor)
+    return label
+
+
+class _Node:
+    """Estadísticas de un estado: visitas y valor acumulado de cada acción"""
+    
+    __slots__ = ('actions', 'visits', 'counts', 'totals')
+    
+    def __init__(self, actions):
+        self.actions = actions
+        self.visits = 0
+        self.counts = [0] * len(actions)
+        self.totals = [0.0] * len(actions)
+    
+    def select(self, exploration: float) -> int:
+        """Acción a explorar (primero las no probadas, después UCB1)"""
+        counts = self.counts
+        for index, count in enumerate(counts):
+            if count == 0:
+                return index
+        log_visits = math.log(self.visits)
+        totals = self.totals
+        return max(range(len(counts)),
+                   key=lambda i: totals[i] / counts[i] + exploration * math.sqrt(log_visits / counts[i]))
+    
+    def update(self, index: int, value: float) -> None:
+        self.visits += 1
+        self.counts[index] += 1
+        self.totals[index] += value
+
+
+class StrategySearch:
+    """
+    Búsqueda MCTS con tabla de transposición
+    
+    La tabla se conserva entre búsquedas (hasta max_entries estados), de modo
+    que una búsqueda sobre un estado ya explorado continúa donde se quedó.
+    
+    Atributos:
+        table: Estadísticas por state_key
+        iterations: Iteraciones totales realizadas
+    """
+    
+    def __init__(self, exploration: float = DEFAULT_EXPLORATION, max_depth: int = DEFAULT_MAX_DEPTH,
+                 max_entries: int = DEFAULT_MAX_ENTRIES, seed: Optional[int] = None):
+        """
+        Args:
+            exploration: Constante de exploración de UCB1
+            max_depth: Acciones simuladas por iteración (árbol + simulación)
+            max_entries: Tamaño máximo de la tabla (se vacía al superarlo)
+            seed: Semilla (None = aleatoria)
+        """
+        self.exploration = exploration
+        self.max_depth = max_depth
+        self.max_entries = max_entries
+        self.rng = random.Random(seed)
+        self.table: Dict[StateKey, _Node] = {}
+        self.iterations = 0
+    
+    def _node(self, state: RulesState) -> _Node:
+        """Nodo de un estado (lo crea si no está en la tabla)"""
+        key = state_key(state)
+        node = self.table.get(key)
+        if node is None:
+            if len(self.table) >= self.max_entries:
+                self.table.clear()
+            node = self.table[key] = _Node(rules.legal_actions(state))
+        return node
+    
+    def iterate(self, root: RulesState) -> None:
+        """Una iteración: selección, expansión, simulación y retropropagación"""
+        rng = self.rng
+        transition = rules.transition
+        state = root
+        path = []
+        depth = 0
+        
+        # Selección/expansión: se baja por la tabla hasta añadir un estado nuevo
+        while depth < self.max_depth and not rules.is_terminal(state):
+            key = state_key(state)
+            node = self.table.get(key)
+            expanded = node is None
+            if expanded:
+                node = self._node(state)
+            index = node.select(self.exploration)
+            path.append((node, index))
+            state = transition(state, node.actions[index], rng)
+            depth += 1
+            if expanded:
+                break
+        
+        # Simulación con rollout_action hasta agotar la profundidad
+        while depth < self.max_depth and not rules.is_terminal(state):
+            state = transition(state, rollout_action(state, rng), rng)
+            depth += 1
+        
+        value = evaluate(state)
+        for node, index in path:
+            node.update(index, value)
+        self.iterations += 1
+    
+    def recommendation(self, root: RulesState) -> Optional[Dict[str, Any]]:
+        """
+        Mejor acción según la búsqueda hasta ahora (la más visitada)
+        
+        Returns:
+            Diccionario con action, label, value, visits y options (todas las
+            acciones de la raíz ordenadas por visitas); None si no hay acciones
+        """
+        node = self.table.get(state_key(root))
+        if node is None or not node.actions:
+            return None
+        options = []
+        for action, count, total in zip(node.actions, node.counts, node.totals):
+            options.append({
+                'action': action,
+                'label': describe_action(action, root),
+                'visits': count,
+                'value': total / count if count else 0.0
+            })
+        options.sort(key=lambda option: (option['visits'], option['value']), reverse=True)
+        best = options[0]
+        return {
+            'action': best['action'],
+            'label': best['label'],
+            'value': best['value'],
+            'visits': node.visits,
+            'options': options
+        }
+    
+    def run(self, root: RulesState, time_budget: float = DEFAULT_TIME_BUDGET,
+            update_interval: float = DEFAULT_UPDATE_INTERVAL,
+            on_update: Optional[Callable[[Dict[str, Any]], None]] = None,
+            should_stop: Optional[Callable[[], bool]] = None,
+            max_iterations: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Busca durante `time_budget` segundos
+        
+        Args:
+            root: Estado actual
+            time_budget: Segundos de búsqueda
+            update_interval: Segundos entre llamadas a on_update
+            on_update: Recibe una recomendación parcial cada update_interval
+                segundos y la final (con 'final' = True)
+            should_stop: Se consulta entre iteraciones para abandonar la búsqueda
+            max_iterations: Límite de iteraciones (None = solo tiempo)
+        
+        Returns:
+            Recomendación final (ver recommendation) con 'iterations',
+            'elapsed' y 'final'; None si no hay acciones posibles
+        """
+        if rules.is_terminal(root):
+            return None
+        self._node(root)
+        start = time.perf_counter()
+        deadline = start + time_budget
+        next_update = start + update_interval
+        iterations = 0
+        
+        while max_iterations is None or iterations < max_iterations:
+            now = time.perf_counter()
+            if now >= deadline or (should_stop and should_stop()):
+                break
+            self.iterate(root)
+            iterations += 1
+            
+            if on_update and now >= next_update:
+                next_update = now + update_interval
+                result = self.recommendation(root)
+                if result:
+                    on_update(dict(result, iterations=iterations, elapsed=now - start, final=False))
+        
+        result = self.recommendation(root)
+        if result is None:
+            return None
+        result.update(iterations=iterations, elapsed=time.perf_counter() - start, final=True)
+        if on_update:
+            on_update(result)
+        return result
+
+
+def recommend(state: RulesState, time_budget: float = DEFAULT_TIME_BUDGET,
+              seed: Optional[int] = None, max_iterations: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """
+    Recomienda una acción con una búsqueda nueva
+    
+    Args:
+        state: Estado actual (engine.rules.from_game_state)
+        time_budget: Segundos de búsqueda
+        seed: Semilla (None = aleatoria)
+        max_iterations: Límite de iteraciones (para resultados reproducibles)
+    
+    Returns:
+        Recomendación (ver StrategySearch.run)
+    """
+    return StrategySearch(seed=seed).run(state, time_budget, max_iterations=max_iterations)
+
+
+class StrategyAdvisor:
+    """
+    Consejero de estrategia en segundo plano
+    
+    El hilo principal solo copia el estado (engine.rules.from_game_state)
+    cuando cambian los recursos, los préstamos, el turno o la fase
+    (ADVISOR_GROUPS); el hilo de fondo busca durante time_budget segundos y
+    encola en el EventManager las recomendaciones parciales y la final. Si
+    llega una petición nueva se abandona la búsqueda en curso (la tabla de
+    transposición se conserva). Las recomendaciones finales se guardan por
+    state_key: pedir consejo para un estado ya resuelto no vuelve a buscar.
+    
+    Dependencias (se asignan después):
+        - engine.state.GameState
+        - finance.loan_manager.LoanManager
+        - engine.events.EventManager
+    """
+    
+    def __init__(self, time_budget: float = DEFAULT_TIME_BUDGET,
+                 update_interval: float = DEFAULT_UPDATE_INTERVAL, seed: Optional[int] = None,
+                 max_results: int = DEFAULT_MAX_RESULTS):
+        """
+        Args:
+            time_budget: Segundos de búsqueda por recomendación
+            update_interval: Segundos entre recomendaciones parciales
+            seed: Semilla (None = aleatoria)
+            max_results: Recomendaciones finales guardadas (se vacían al superarlo)
+        """
+        self.time_budget = time_budget
+        self.update_interval = update_interval
+        self.search = StrategySearch(seed=seed)
+        self.max_results = max_results
+        
+        # Recomendación final por state_key (solo la usa el hilo de fondo)
+        self.results: Dict[StateKey, Dict[str, Any]] = {}
+        
+        # Referencias a otros componentes (se asignan después)
+        self.game_state = None
+        self.loan_manager = None
+        self.event_manager = None
+        
+        # Última recomendación (parcial o final)
+        self.latest: Optional[Dict[str, Any]] = None
+        
+        self._pending: Optional[RulesState] = None
+        self._last_state: Optional[Any] = None
+        self._last_version = -1
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Arranca el hilo de fondo"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="StrategyAdvisor", daemon=True)
+        self._thread.start()
+        logger.info(f"Consejero de estrategia iniciado ({self.time_budget:.2f}s por consejo)")
+    
+    def stop(self) -> None:
+        """Detiene el hilo de fondo"""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+    
+    def request_advice(self) -> None:
+        """Pide una recomendación para el estado actual (reemplaza la pendiente)"""
+        if not self.game_state:
+            return
+        state = rules.from_game_state(self.game_state, self.loan_manager)
+        with self._lock:
+            self._pending = state
+        self._wake.set()
+    
+    def request_if_changed(self) -> None:
+        """
+        Pide una recomendación solo si el estado cambió desde la última petición
+        
+        Pensado para llamarse cada frame: solo compara la versión de GameState.
+        """
+        if not self.game_state:
+            return
+        if (self.game_state is self._last_state and
+                not self.game_state.changed_since(self._last_version, *ADVISOR_GROUPS)):
+            return
+        self._last_state = self.game_state
+        self._last_version = self.game_state.version
+        self.request_advice()
+    
+    def _publish(self, result: Dict[str, Any]) -> None:
+        """Guarda y encola una recomendación"""
+        self.latest = result
+        if self.event_manager:
+            from engine.events import Event, EventType
+            # queue_event solo añade a una lista: seguro desde otro hilo
+            self.event_manager.queue_event(
+                Event(EventType.ADVICE_UPDATED, result, source="StrategyAdvisor"))
+    
+    def _run(self) -> None:
+        """Bucle del hilo de fondo"""
+        while not self._stopping.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                state, self._pending = self._pending, None
+            if state is None or self._stopping.is_set():
+                continue
+            
+            key = state_key(state)
+            cached = self.results.get(key)
+            if cached is not None:
+                self._publish(cached)
+                continue
+            
+            try:
+                # Una petición nueva (wake) interrumpe la búsqueda en curso
+                result = self.search.run(state, self.time_budget, self.update_interval,
+                                         on_update=self._publish,
+                                         should_stop=lambda: self._wake.is_set() or self._stopping.is_set())
+                
+                # Solo se guardan las búsquedas que agotaron su presupuesto
+                if result is not None and not (self._wake.is_set() or self._stopping.is_set()):
+                    if len(self.results) >= self.max_results:
+                        self.results.clear()
+                    self.results[key] = result
+            except Exception as e:
+                logger.error(f"Error en el consejero de estrategia: {e}", exc_info=True)
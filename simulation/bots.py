@@ -0,0 +1,190 @@
+"""
+Bots - Políticas scriptadas para jugar los minijuegos sin jugador humano
+Cada bot recibe la observación de BaseMinigame.step() y devuelve la lista de
+acciones del siguiente paso. Se usan para medir tasas de éxito y recompensas.
+"""
+
+import math
+import random
+from abc import ABC, abstractmethod
+from typing import Dict, List, Any, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class BotPolicy(ABC):
+    """
+    Política base abstracta de un bot
+    
+    El tiempo de reacción limita cuántas acciones por segundo puede hacer el bot,
+    para que sus resultados se parezcan a los de un jugador y no a los de una máquina.
+    """
+    
+    def __init__(self, reaction_time: float = 0.0, rng: Optional[random.Random] = None):
+        """
+        Args:
+            reaction_time: Segundos mínimos entre dos acciones
+            rng: Generador aleatorio propio (por defecto el módulo random)
+        """
+        self.reaction_time = reaction_time
+        self.rng = rng or random
+        self.cooldown = 0.0
+    
+    def act(self, observation: Dict[str, Any], delta_time: float) -> List[Dict[str, Any]]:
+        """
+        Decide las acciones del siguiente paso
+        
+        Args:
+            observation: Observación devuelta por step()
+            delta_time: Duración del paso
+        
+        Returns:
+            Lista de acciones (vacía si el bot aún está reaccionando)
+        """
+        self.cooldown -= delta_time
+        if self.cooldown > 0:
+            return []
+        
+        actions = self.decide(observation, delta_time)
+        if actions:
+            self.cooldown = self.reaction_time
+        return actions
+    
+    @abstractmethod
+    def decide(self, observation: Dict[str, Any], delta_time: float) -> List[Dict[str, Any]]:
+        """Lógica específica del bot (implementada por cada subclase)"""
+        pass
+
+
+class NearestMineralBot(BotPolicy):
+    """Mineral Rush: hace clic en el mineral clicable más cercano al cursor"""
+    
+    def __init__(self, reaction_time: float = 0.25, rng: Optional[random.Random] = None):
+        super().__init__(reaction_time, rng)
+        self.cursor: Tuple[float, float] = (640, 360)
+    
+    def decide(self, observation, delta_time):
+        candidates = [mineral for mineral in observation['minerals'] if mineral['clickable']]
+        if not candidates:
+            return []
+        
+        cursor_x, cursor_y = self.cursor
+        target = min(candidates, key=lambda mineral: (mineral['pos'][0] - cursor_x) ** 2 +
+                                                     (mineral['pos'][1] - cursor_y) ** 2)
+        self.cursor = target['pos']
+        return [{'type': 'click', 'pos': target['pos']}]
+
+
+class LowestAsteroidBot(BotPolicy):
+    """Asteroid Shooter: dispara al asteroide más bajo (el más cercano a escapar)"""
+    
+    PROJECTILE_SPEED = 800
+    
+    def __init__(self, reaction_time: float = 0.2, lead_target: bool = True,
+                 rng: Optional[random.Random] = None):
+        """
+        Args:
+            lead_target: Si es True apunta a la posición futura del asteroide
+        """
+        super().__init__(reaction_time, rng)
+        self.lead_target = lead_target
+    
+    def decide(self, observation, delta_time):
+        if not observation['can_shoot']:
+            return []
+        
+        # Solo asteroides ya visibles en pantalla
+        visible = [asteroid for asteroid in observation['asteroids'] if asteroid['pos'][1] > 0]
+        if not visible:
+            return []
+        
+        target = max(visible, key=lambda asteroid: asteroid['pos'][1])
+        target_x, target_y = target['pos']
+        if self.lead_target:
+            cannon_x, cannon_y = observation['cannon']
+            distance = math.hypot(target_x - cannon_x, target_y - cannon_y)
+            target_y += target['speed'] * distance / self.PROJECTILE_SPEED
+        
+        return [{'type': 'click', 'pos': (target_x, target_y)}]
+
+
+class TimingBot(BotPolicy):
+    """
+    Timing Precision: pulsa cuando el indicador pasa por el objetivo
+    
+    Con jitter=0 el bot es perfecto; con jitter>0 apunta a un punto desplazado
+    según una normal de desviación `jitter` píxeles, re-muestreada tras cada intento.
+    """
+    
+    def __init__(self, jitter: float = 0.0, reaction_time: float = 0.0,
+                 rng: Optional[random.Random] = None):
+        super().__init__(reaction_time, rng)
+        self.jitter = jitter
+        self.offset = self._sample_offset()
+    
+    def _sample_offset(self) -> float:
+        """Error de este intento respecto al centro del objetivo"""
+        return self.rng.gauss(0.0, self.jitter) if self.jitter > 0 else 0.0
+    
+    def decide(self, observation, delta_time):
+        bar = observation['current_bar']
+        if bar is None:
+            return []
+        
+        aim_x = bar['target_x'] + self.offset
+        # El indicador avanza speed*dt por paso: pulsar en el paso más cercano al punto
+        if abs(bar['indicator_x'] - aim_x) <= bar['speed'] * delta_time / 2:
+            self.offset = self._sample_offset()
+            return [{'type': 'press'}]
+        return []
+
+
+class GreedyWiringBot(BotPolicy):
+    """
+    Wiring Puzzle: emparejamiento voraz de cables
+    
+    Toma el primer cable sin conectar y lo arrastra al conector de su color;
+    con error_rate>0 a veces lo suelta en el conector de otro cable pendiente.
+    """
+    
+    def __init__(self, reaction_time: float = 1.2, error_rate: float = 0.0,
+                 rng: Optional[random.Random] = None):
+        """
+        Args:
+            error_rate: Probabilidad de soltar el cable en un conector equivocado
+        """
+        super().__init__(reaction_time, rng)
+        self.error_rate = error_rate
+    
+    def decide(self, observation, delta_time):
+        pending = [wire for wire in observation['wires'] if not wire['connected']]
+        if not pending:
+            return []
+        
+        wire = pending[0]
+        target = wire['target']
+        if self.error_rate > 0 and len(pending) > 1 and self.rng.random() < self.error_rate:
+            target = self.rng.choice([other['target'] for other in pending[1:]])
+        
+        return [{'type': 'drag', 'from': wire['start'], 'to': target}]
+
+
+# Políticas disponibles por minijuego: nombre -> fábrica del bot
+BOT_POLICIES = {
+    'mining': {
+        'nearest': lambda rng: NearestMineralBot(rng=rng),
+    },
+    'asteroid_shooter': {
+        'lowest': lambda rng: LowestAsteroidBot(rng=rng),
+        'lowest_no_lead': lambda rng: LowestAsteroidBot(lead_target=False, rng=rng),
+    },
+    'timing': {
+        'perfect': lambda rng: TimingBot(jitter=0.0, rng=rng),
+        'jitter': lambda rng: TimingBot(jitter=25.0, rng=rng),
+    },
+    'wiring': {
+        'greedy': lambda rng: GreedyWiringBot(rng=rng),
+        'greedy_sloppy': lambda rng: GreedyWiringBot(error_rate=0.3, rng=rng),
+    },
+}
@@ -0,0 +1,102 @@
+"""
+Debt Benchmark - Memoria y velocidad de construcción de préstamos
+Compara las clases de finance.debt con finance.compact.CompactDebt (uno a
+uno y con bulk_create): bytes por préstamo y préstamos creados por segundo.
+
+Uso:
+    python -m simulation.debt_benchmark --loans 200000
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Any
+import logging
+
+from finance.compact import CompactDebt
+from finance.portfolio import CREDITOR_TABLE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOANS = 100000
+
+
+def make_inputs(count: int, seed: int = 0) -> Dict[str, List[Any]]:
+    """Acreedores, principales y plazos aleatorios (los mismos para todos los casos)"""
+    rng = random.Random(seed)
+    keys = [key for key, _, _, _ in CREDITOR_TABLE]
+    return {
+        'creditors': [rng.choice(keys) for _ in range(count)],
+        'principals': [float(rng.randint(10, 60)) for _ in range(count)],
+        'turns': [rng.randint(1, 20) for _ in range(count)]
+    }
+
+
+def build_cases(inputs: Dict[str, List[Any]]) -> Dict[str, Callable[[], list]]:
+    """Funciones que construyen todos los préstamos de cada representación"""
+    classes = {key: debt_class for key, debt_class, _, _ in CREDITOR_TABLE}
+    creditors, principals, turns = inputs['creditors'], inputs['principals'], inputs['turns']
+    return {
+        'Debt (subclases)': lambda: [classes[c](p, t) for c, p, t in zip(creditors, principals, turns)],
+        'CompactDebt': lambda: [CompactDebt(c, p, t) for c, p, t in zip(creditors, principals, turns)],
+        'CompactDebt.bulk_create': lambda: CompactDebt.bulk_create(creditors, principals, turns)
+    }
+
+
+def measure(build: Callable[[], list], count: int) -> Dict[str, float]:
+    """
+    Mide una representación
+    
+    Returns:
+        {'loans_per_second', 'bytes_per_loan'}
+    """
+    gc.collect()
+    start = time.perf_counter()
+    loans = build()
+    elapsed = time.perf_counter() - start
+    del loans
+    
+    # La memoria se mide aparte: tracemalloc ralentiza la construcción
+    gc.collect()
+    tracemalloc.start()
+    loans = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del loans
+    
+    return {
+        'loans_per_second': count / max(elapsed, 1e-9),
+        'bytes_per_loan': current / count
+    }
+
+
+def run_benchmark(count: int = DEFAULT_LOANS, seed: int = 0) -> Dict[str, Dict[str, float]]:
+    """Mide todas las representaciones con los mismos préstamos"""
+    inputs = make_inputs(count, seed)
+    return {name: measure(build, count) for name, build in build_cases(inputs).items()}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Benchmark de representaciones de préstamos")
+    parser.add_argument('--loans', type=int, default=DEFAULT_LOANS, help="Préstamos por caso")
+    parser.add_argument('--seed', type=int, default=0, help="Semilla")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.WARNING)
+    
+    results = run_benchmark(args.loans, args.seed)
+    baseline = results['Debt (subclases)']
+    for name, row in results.items():
+        print(f"{name:<24} {row['bytes_per_loan']:7.0f} bytes/préstamo "
+              f"({row['bytes_per_loan'] / baseline['bytes_per_loan']:4.0%})  "
+              f"{row['loans_per_second']:10.0f} préstamos/s "
+              f"(x{row['loans_per_second'] / baseline['loans_per_second']:.1f})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
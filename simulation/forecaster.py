@@ -0,0 +1,403 @@
+"""
+Forecaster - Pronóstico Monte Carlo del riesgo de game over
+Simula en paralelo (NumPy) miles de futuros posibles de la partida actual:
+consumo de oxígeno por turno, coste aleatorio de los minijuegos y
+penalizaciones de los préstamos. Devuelve la probabilidad de terminar por
+'oxygen_depleted' o 'debt_overwhelming' en los próximos turnos.
+
+El cálculo corre en un hilo de fondo y el resultado vuelve al juego como un
+evento RISK_FORECAST_UPDATED encolado en el EventManager, para que el HUD
+muestre el indicador de riesgo sin afectar a los FPS.
+"""
+
+import threading
+from typing import Dict, List, Optional, Any, Tuple
+import logging
+
+import numpy as np
+
+from finance.interest import DEFAULT_TURN_RATES
+from finance.portfolio import LoanPortfolio, CREDITOR_CODES
+from engine import rules
+
+logger = logging.getLogger(__name__)
+
+# Tamaño del pronóstico por defecto
+DEFAULT_NUM_FUTURES = 2000
+DEFAULT_HORIZON = 10
+DEFAULT_WHAT_IF_FUTURES = 500
+
+# Grupos de GameState que afectan al pronóstico (ver GameState.changed_since)
+FORECAST_GROUPS = ('oxygen', 'materials', 'repair', 'turn', 'loans')
+
+# Reglas del juego que se simulan (engine.rules)
+MINIGAME_OXYGEN_COST = rules.ACTION_OXYGEN_COST
+REPAIR_MATERIAL_COST = rules.REPAIR_MATERIAL_COST
+MIN_MATERIALS_FOR_REPAIR = rules.MIN_MATERIALS_FOR_REPAIR
+REPAIR_REWARD = rules.REPAIR_REWARD
+VICTORY_REPAIR_PROGRESS = rules.VICTORY_REPAIR_PROGRESS
+MINING_REWARD = rules.MINING_REWARD
+MINING_PROBABILITY = 0.5  # Probabilidad de elegir minería cuando se puede reparar
+EXCHANGE_OXYGEN_PER_MATERIAL = rules.EXCHANGE_OXYGEN_PER_MATERIAL
+EXCHANGE_OXYGEN_CAP = rules.EXCHANGE_OXYGEN_CAP
+EXCHANGE_THRESHOLD = 30  # Oxígeno por debajo del cual el jugador vende materiales
+DEBT_OXYGEN_THRESHOLD = rules.DEBT_OXYGEN_THRESHOLD
+DEBT_MATERIALS_MARGIN = rules.DEBT_MATERIALS_MARGIN
+
+
+def snapshot_state(game_state, loan_manager=None) -> Dict[str, Any]:
+    """
+    Copia el estado relevante de la partida (se llama en el hilo principal)
+    
+    Args:
+        game_state: Estado del juego
+        loan_manager: Gestor de préstamos (opcional)
+    
+    Returns:
+        Datos independientes de los objetos del juego, listos para el hilo de fondo
+    """
+    loans = list(loan_manager.active_loans) if loan_manager else []
+    return {
+        'oxygen': game_state.oxygen,
+        'max_oxygen': game_state.max_oxygen,
+        'materials': game_state.materials,
+        'repair_progress': game_state.repair_progress,
+        'oxygen_cost_per_turn': game_state.oxygen_cost_per_turn,
+        'turn': game_state.turn_number,
+        'portfolio': LoanPortfolio.from_debts([loans])
+    }
+
+
+def simulate_futures(oxygen: np.ndarray, max_oxygen: np.ndarray, materials: np.ndarray,
+                     repair_progress: np.ndarray, portfolio: LoanPortfolio,
+                     oxygen_cost_per_turn: float, horizon: int,
+                     rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """
+    Simula `horizon` turnos de muchos futuros a la vez (modifica los arrays)
+    
+    Cada turno simulado: el jugador juega un minijuego (minería si no le
+    llegan los materiales para reparar; si no, minería o reparación al azar),
+    paga los mínimos de sus préstamos si puede, vende materiales por oxígeno
+    si le queda poco, consume el oxígeno del turno y recibe las
+    penalizaciones de los préstamos en default.
+    
+    Args:
+        oxygen, max_oxygen, materials, repair_progress: Estado de cada futuro
+        portfolio: Préstamos (el jugador i de la cartera es el futuro i)
+        oxygen_cost_per_turn: Oxígeno consumido al cerrar cada turno
+        horizon: Turnos simulados
+        rng: Generador aleatorio
+    
+    Returns:
+        Arrays por futuro: depleted_turn, overwhelmed_turn, victory_turn,
+        default_turn (turno 1..horizon en que ocurre; 0 = nunca) y oxygen,
+        materials y repair_progress al terminar (o al final del horizonte)
+    """
+    n = len(oxygen)
+    loan_player = portfolio.player[:portfolio.size]
+    
+    # Turno (1..horizon) en el que termina cada futuro; 0 = sigue vivo
+    depleted_turn = np.zeros(n, dtype=np.int64)
+    overwhelmed_turn = np.zeros(n, dtype=np.int64)
+    victory_turn = np.zeros(n, dtype=np.int64)
+    default_turn = np.zeros(n, dtype=np.int64)
+    final = {'oxygen': oxygen.copy(), 'materials': materials.copy(),
+             'repair_progress': repair_progress.copy()}
+    
+    for turn in range(1, horizon + 1):
+        # Minijuego del turno
+        mining = (rng.random(n) < MINING_PROBABILITY) | (materials < MIN_MATERIALS_FOR_REPAIR)
+        oxygen -= rng.integers(MINIGAME_OXYGEN_COST[0], MINIGAME_OXYGEN_COST[1] + 1, n)
+        reward = rng.integers(MINING_REWARD[0], MINING_REWARD[1] + 1, n)
+        cost = rng.integers(REPAIR_MATERIAL_COST[0], REPAIR_MATERIAL_COST[1] + 1, n)
+        repair = rng.integers(REPAIR_REWARD[0], REPAIR_REWARD[1] + 1, n)
+        # consume_materials no hace nada si no alcanzan los materiales
+        repairing = ~mining & (materials >= cost)
+        materials += np.where(mining, reward, np.where(repairing, -cost, 0))
+        repair_progress += np.where(repairing, repair, 0)
+        
+        # Pagar los mínimos si alcanzan los materiales
+        if portfolio.size:
+            due = portfolio.get_minimum_payment_due()
+            payers = (due > 0) & (materials >= due)
+            rows = np.flatnonzero(payers[loan_player] & portfolio.active[:portfolio.size])
+            portfolio.make_payments(rows, portfolio.get_minimum_payments()[rows])
+            materials -= np.where(payers, due, 0)
+        
+        # Vender materiales por oxígeno si queda poco (sin pasar del máximo)
+        needed = (np.ceil(EXCHANGE_OXYGEN_CAP - oxygen).astype(np.int64) +
+                  EXCHANGE_OXYGEN_PER_MATERIAL - 1) // EXCHANGE_OXYGEN_PER_MATERIAL
+        sold = np.where(oxygen < EXCHANGE_THRESHOLD, np.minimum(materials, np.maximum(needed, 0)), 0)
+        materials -= sold
+        oxygen[:] = np.minimum(oxygen + sold * EXCHANGE_OXYGEN_PER_MATERIAL,
+                               np.maximum(oxygen, EXCHANGE_OXYGEN_CAP))
+        
+        # Fin de turno (GameState.advance_turn)
+        oxygen -= oxygen_cost_per_turn
+        alive = (depleted_turn == 0) & (overwhelmed_turn == 0) & (victory_turn == 0)
+        if portfolio.size:
+            penalties = portfolio.advance_turn()
+            portfolio.apply_penalties(penalties, materials, max_oxygen, oxygen, repair_progress)
+            in_default = np.zeros(n, dtype=bool)
+            in_default[loan_player[penalties['defaulted']]] = True
+            default_turn[alive & in_default & (default_turn == 0)] = turn
+        
+        # GameState.check_game_over_conditions: oxígeno, deudas y victoria, en ese orden
+        depleted = alive & (oxygen <= 0)
+        total_debt = portfolio.get_total_debt() if portfolio.size else np.zeros(n, dtype=np.int64)
+        overwhelmed = (alive & ~depleted & (oxygen < DEBT_OXYGEN_THRESHOLD) &
+                       (total_debt > materials + DEBT_MATERIALS_MARGIN))
+        won = alive & ~depleted & ~overwhelmed & (repair_progress >= VICTORY_REPAIR_PROGRESS)
+        depleted_turn[depleted] = turn
+        overwhelmed_turn[overwhelmed] = turn
+        victory_turn[won] = turn
+        
+        # El estado final de cada futuro es el del turno en que termina
+        final['oxygen'][alive] = oxygen[alive]
+        final['materials'][alive] = materials[alive]
+        final['repair_progress'][alive] = repair_progress[alive]
+        if not (alive & ~depleted & ~overwhelmed & ~won).any():
+            break
+    
+    return dict(final, depleted_turn=depleted_turn, overwhelmed_turn=overwhelmed_turn,
+                victory_turn=victory_turn, default_turn=default_turn)
+
+
+def forecast_risk(snapshot: Dict[str, Any], num_futures: int = DEFAULT_NUM_FUTURES,
+                  horizon: int = DEFAULT_HORIZON, seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Simula `num_futures` futuros de `horizon` turnos a partir de un snapshot
+    
+    Args:
+        snapshot: Resultado de snapshot_state
+        num_futures: Número de futuros simulados
+        horizon: Turnos simulados por futuro
+        seed: Semilla (None = aleatoria)
+    
+    Returns:
+        Diccionario con la probabilidad de cada tipo de game over dentro del
+        horizonte, el riesgo acumulado por turno y el turno esperado de game over
+    """
+    rng = np.random.default_rng(seed)
+    n = num_futures
+    
+    futures = simulate_futures(
+        np.full(n, float(snapshot['oxygen'])),
+        np.full(n, float(snapshot['max_oxygen'])),
+        np.full(n, int(snapshot['materials']), dtype=np.int64),
+        np.full(n, float(snapshot['repair_progress'])),
+        snapshot['portfolio'].replicate(n),
+        snapshot['oxygen_cost_per_turn'], horizon, rng)
+    depleted_turn = futures['depleted_turn']
+    overwhelmed_turn = futures['overwhelmed_turn']
+    
+    end_turn = np.maximum(depleted_turn, overwhelmed_turn)
+    game_over = end_turn > 0
+    cumulative = [float(np.mean(game_over & (end_turn <= turn))) for turn in range(1, horizon + 1)]
+    
+    return {
+        'turn': snapshot['turn'],
+        'futures': n,
+        'horizon': horizon,
+        'oxygen_depleted': float(np.mean(depleted_turn > 0)),
+        'debt_overwhelming': float(np.mean(overwhelmed_turn > 0)),
+        'game_over': float(np.mean(game_over)),
+        'cumulative_risk': cumulative,
+        'expected_turns_to_game_over': float(end_turn[game_over].mean()) if game_over.any() else None
+    }
+
+
+def evaluate_what_if(snapshot: Dict[str, Any], candidates: List[Dict[str, Any]],
+                     num_futures: int = DEFAULT_WHAT_IF_FUTURES, horizon: int = DEFAULT_HORIZON,
+                     seed: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Evalúa varias acciones hipotéticas sobre el mismo snapshot en una sola simulación
+    
+    Cada candidato solo describe su diferencia con el snapshot compartido; los
+    futuros de todos los candidatos se simulan juntos en los mismos arrays.
+    
+    Args:
+        snapshot: Resultado de snapshot_state (no se modifica)
+        candidates: Acciones, cada una con:
+            action: 'accept', 'reject' o 'pay'
+            offer: Oferta a aceptar (formato de LoanManager.pending_offer), para 'accept'
+            turn_rate: Interés por turno del préstamo aceptado (opcional)
+            row: Índice del préstamo en snapshot['portfolio'], para 'pay'
+            materials: Materiales a pagar, para 'pay'
+        num_futures: Futuros simulados por candidato
+        horizon: Turnos simulados
+        seed: Semilla (None = aleatoria)
+    
+    Returns:
+        Por candidato: oxygen/materials inmediatos, projected_oxygen,
+        projected_materials, projected_repair, default_risk, game_over_risk,
+        victory_chance y expected_turns_to_victory
+    """
+    count = len(candidates)
+    if count == 0:
+        return []
+    
+    base = snapshot['portfolio']
+    oxygen = np.full(count, float(snapshot['oxygen']))
+    materials = np.full(count, int(snapshot['materials']), dtype=np.int64)
+    portfolio = base.replicate(count)
+    
+    for index, candidate in enumerate(candidates):
+        action = candidate.get('action')
+        if action == 'accept':
+            offer = candidate['offer']
+            code = CREDITOR_CODES[offer['creditor_type']]
+            portfolio.add_loans([index], [code], [offer['amount']], [offer['turns_to_pay']],
+                                [candidate.get('turn_rate', DEFAULT_TURN_RATES[offer['creditor_type']])])
+            oxygen[index] += offer['amount']
+        elif action == 'pay':
+            paid = min(int(candidate['materials']), int(materials[index]))
+            if paid > 0:
+                portfolio.make_payments([index * base.size + candidate['row']], [paid])
+                materials[index] -= paid
+        elif action != 'reject':
+            raise ValueError(f"Acción desconocida: {action}")
+    
+    rng = np.random.default_rng(seed)
+    futures = simulate_futures(
+        np.tile(oxygen, num_futures),
+        np.full(count * num_futures, float(snapshot['max_oxygen'])),
+        np.tile(materials, num_futures),
+        np.full(count * num_futures, float(snapshot['repair_progress'])),
+        portfolio.replicate(num_futures),
+        snapshot['oxygen_cost_per_turn'], horizon, rng)
+    
+    # Futuro f del candidato c = posición f * count + c -> matriz (futuros, candidatos)
+    def by_candidate(name):
+        return futures[name].reshape(num_futures, count)
+    
+    game_over = (by_candidate('depleted_turn') > 0) | (by_candidate('overwhelmed_turn') > 0)
+    victory_turn = by_candidate('victory_turn')
+    results = []
+    for index, candidate in enumerate(candidates):
+        won = victory_turn[:, index] > 0
+        results.append({
+            'action': candidate.get('action'),
+            'oxygen': float(oxygen[index]),
+            'materials': int(materials[index]),
+            'projected_oxygen': float(by_candidate('oxygen')[:, index].mean()),
+            'projected_materials': float(by_candidate('materials')[:, index].mean()),
+            'projected_repair': float(by_candidate('repair_progress')[:, index].mean()),
+            'default_risk': float(np.mean(by_candidate('default_turn')[:, index] > 0)),
+            'game_over_risk': float(np.mean(game_over[:, index])),
+            'victory_chance': float(np.mean(won)),
+            'expected_turns_to_victory': float(victory_turn[won, index].mean()) if won.any() else None
+        })
+    return results
+
+
+class RiskForecaster:
+    """
+    Servicio de pronóstico de riesgo en segundo plano
+    
+    El hilo principal solo copia el estado (snapshot_state) cuando cambia;
+    el hilo de fondo simula y encola el resultado en el EventManager, que lo
+    entrega en el siguiente process_queue() del bucle principal. Si llegan
+    varias peticiones mientras se calcula, solo se atiende la más reciente.
+    
+    Dependencias (se asignan después):
+        - engine.state.GameState
+        - finance.loan_manager.LoanManager
+        - engine.events.EventManager
+    """
+    
+    def __init__(self, num_futures: int = DEFAULT_NUM_FUTURES, horizon: int = DEFAULT_HORIZON,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            num_futures: Futuros simulados por pronóstico
+            horizon: Turnos simulados por futuro
+            seed: Semilla base (None = aleatoria)
+        """
+        self.num_futures = num_futures
+        self.horizon = horizon
+        self.seed = seed
+        
+        # Referencias a otros componentes (se asignan después)
+        self.game_state = None
+        self.loan_manager = None
+        self.event_manager = None
+        
+        # Último resultado calculado
+        self.latest: Optional[Dict[str, Any]] = None
+        
+        self._pending: Optional[Dict[str, Any]] = None
+        self._last_state: Optional[Any] = None
+        self._last_version = -1
+        self._forecasts_run = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Arranca el hilo de fondo"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="RiskForecaster", daemon=True)
+        self._thread.start()
+        logger.info(f"Pronóstico de riesgo iniciado ({self.num_futures} futuros, "
+                    f"{self.horizon} turnos)")
+    
+    def stop(self) -> None:
+        """Detiene el hilo de fondo"""
+        self._stopping.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+    
+    def request_forecast(self) -> None:
+        """Pide un pronóstico del estado actual (reemplaza la petición pendiente)"""
+        if not self.game_state:
+            return
+        snapshot = snapshot_state(self.game_state, self.loan_manager)
+        with self._lock:
+            self._pending = snapshot
+        self._wake.set()
+    
+    def request_if_changed(self) -> None:
+        """
+        Pide un pronóstico solo si el estado cambió desde la última petición
+        
+        Pensado para llamarse cada frame: solo compara la versión de GameState.
+        """
+        if not self.game_state:
+            return
+        if (self.game_state is self._last_state and
+                not self.game_state.changed_since(self._last_version, *FORECAST_GROUPS)):
+            return
+        self._last_state = self.game_state
+        self._last_version = self.game_state.version
+        self.request_forecast()
+    
+    def _run(self) -> None:
+        """Bucle del hilo de fondo"""
+        while not self._stopping.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                snapshot, self._pending = self._pending, None
+            if snapshot is None or self._stopping.is_set():
+                continue
+            
+            try:
+                seed = None if self.seed is None else self.seed + self._forecasts_run
+                result = forecast_risk(snapshot, self.num_futures, self.horizon, seed)
+            except Exception as e:
+                logger.error(f"Error en el pronóstico de riesgo: {e}", exc_info=True)
+                continue
+            self._forecasts_run += 1
+            self.latest = result
+            
+            if self.event_manager:
+                from engine.events import Event, EventType
+                # queue_event solo añade a una lista: seguro desde otro hilo
+                self.event_manager.queue_event(
+                    Event(EventType.RISK_FORECAST_UPDATED, result, source="RiskForecaster"))
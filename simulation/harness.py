@@ -0,0 +1,251 @@
+"""
+Harness - Ejecuta miles de partidas de minijuegos con bots en paralelo
+Reparte los episodios entre todos los núcleos con multiprocessing y escribe
+la tasa de éxito y la distribución de recompensas por minijuego, política y
+nivel de dificultad.
+
+Uso:
+    python -m simulation.harness --episodes 2000 --difficulties 0 1 2 --output sim_results
+"""
+
+import argparse
+import csv
+import json
+import math
+import multiprocessing
+import os
+import random
+import sys
+import time
+import zlib
+from collections import Counter, defaultdict
+from typing import Dict, List, Any, Optional, Tuple
+import logging
+
+from gameplay.difficulty import DifficultyEngine
+
+logger = logging.getLogger(__name__)
+
+# Paso de simulación (equivalente a 60 FPS)
+DEFAULT_DELTA_TIME = 1 / 60
+
+# Límite de tiempo simulado por episodio (los minijuegos sin reloj no terminan solos)
+MAX_EPISODE_TIME = 120.0
+
+# Clave en config.json -> (clase del minijuego, recompensa que se mide)
+MINIGAMES = {
+    'mining': ('MiningMinigame', 'reward_materials'),
+    'asteroid_shooter': ('AsteroidShooterMinigame', 'reward_materials'),
+    'timing': ('TimingMinigame', 'reward_repair'),
+    'wiring': ('WiringMinigame', 'reward_repair'),
+}
+
+
+def load_config(config_path: str) -> Dict[str, Any]:
+    """
+    Lee config.json (las tablas de dificultad se compilan a partir de él)
+    
+    Returns:
+        Configuración del juego (vacía si no se puede leer)
+    """
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"No se pudo leer {config_path}: {e}")
+        return {}
+
+
+def run_episode(task: Tuple[str, str, int, Dict[str, Any], int, float]) -> Dict[str, Any]:
+    """
+    Ejecuta un episodio completo (se llama dentro de los procesos del pool)
+    
+    Args:
+        task: (minijuego, política, nivel, parámetros, semilla, delta_time)
+    
+    Returns:
+        Resultado del episodio
+    """
+    from gameplay import minigames
+    from simulation.bots import BOT_POLICIES
+    
+    minigame_name, policy_name, level, tuning, seed, delta_time = task
+    class_name, reward_key = MINIGAMES[minigame_name]
+    
+    # Los minijuegos usan el módulo random; el bot tiene su propio generador
+    random.seed(seed)
+    bot = BOT_POLICIES[minigame_name][policy_name](random.Random(seed ^ 0x5EED))
+    
+    minigame = getattr(minigames, class_name)(headless=True, tuning=tuning)
+    
+    observation = minigame.get_observation()
+    elapsed = 0.0
+    while not observation['is_complete'] and elapsed < MAX_EPISODE_TIME:
+        observation = minigame.step(delta_time, bot.act(observation, delta_time))
+        elapsed += delta_time
+    
+    return {
+        'minigame': minigame_name,
+        'policy': policy_name,
+        'difficulty': level,
+        'seed': seed,
+        'success': observation['success'],
+        'reward': observation[reward_key],
+        'score': observation['score'],
+        'duration': round(elapsed, 3)
+    }
+
+
+def build_tasks(episodes: int, difficulties: List[int],
+                engine: Optional[DifficultyEngine] = None,
+                minigame_names: Optional[List[str]] = None,
+                base_seed: int = 0,
+                delta_time: float = DEFAULT_DELTA_TIME,
+                turn: int = 0) -> List[Tuple]:
+    """
+    Genera la lista de episodios a ejecutar
+    
+    Cada combinación (minijuego, política, dificultad) recibe `episodes`
+    episodios con semillas deterministas. Los parámetros de cada nivel se
+    toman de las tablas del motor de dificultad (el mismo que usa el juego).
+    
+    Args:
+        engine: Motor de dificultad (None = valores por defecto)
+        turn: Turno de la partida que se simula (rampa de dificultad)
+    """
+    from simulation.bots import BOT_POLICIES
+    
+    engine = engine or DifficultyEngine()
+    tasks = []
+    for minigame_name in minigame_names or MINIGAMES:
+        for policy_name in BOT_POLICIES[minigame_name]:
+            for level in difficulties:
+                # dict: los MappingProxyType no se pueden enviar a otro proceso
+                tuning = dict(engine.get_tuning(minigame_name, level, turn))
+                for episode in range(episodes):
+                    seed = zlib.crc32(
+                        f"{base_seed}:{minigame_name}:{policy_name}:{level}:{episode}".encode())
+                    tasks.append((minigame_name, policy_name, level, tuning, seed, delta_time))
+    return tasks
+
+
+def summarize(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Agrupa resultados por (minijuego, política, dificultad)
+    
+    Returns:
+        Lista de resúmenes con tasa de éxito y distribución de recompensas
+    """
+    groups = defaultdict(list)
+    for result in results:
+        groups[(result['minigame'], result['policy'], result['difficulty'])].append(result)
+    
+    summary = []
+    for (minigame_name, policy_name, level), group in sorted(groups.items()):
+        rewards = sorted(result['reward'] for result in group)
+        count = len(rewards)
+        mean = sum(rewards) / count
+        variance = sum((reward - mean) ** 2 for reward in rewards) / count
+        
+        summary.append({
+            'minigame': minigame_name,
+            'policy': policy_name,
+            'difficulty': level,
+            'episodes': count,
+            'success_rate': sum(1 for result in group if result['success']) / count,
+            'reward_mean': mean,
+            'reward_std': math.sqrt(variance),
+            'reward_min': rewards[0],
+            'reward_p50': rewards[count // 2],
+            'reward_p90': rewards[min(count - 1, int(count * 0.9))],
+            'reward_max': rewards[-1],
+            'reward_histogram': {str(reward): n for reward, n in sorted(Counter(rewards).items())},
+            'mean_duration': sum(result['duration'] for result in group) / count
+        })
+    return summary
+
+
+def run_simulation(tasks: List[Tuple], processes: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Ejecuta los episodios en un pool de procesos (uno por núcleo por defecto)
+    
+    Args:
+        tasks: Episodios generados por build_tasks
+        processes: Número de procesos (None = todos los núcleos)
+    
+    Returns:
+        Resultados de todos los episodios
+    """
+    processes = processes or os.cpu_count() or 1
+    if processes == 1:
+        return [run_episode(task) for task in tasks]
+    
+    # Lotes grandes para que el coste de IPC no domine episodios tan cortos
+    chunksize = max(1, len(tasks) // (processes * 8))
+    with multiprocessing.Pool(processes=processes) as pool:
+        return list(pool.imap_unordered(run_episode, tasks, chunksize=chunksize))
+
+
+def write_results(output_dir: str, results: List[Dict[str, Any]],
+                  summary: List[Dict[str, Any]]) -> None:
+    """Escribe episodes.csv y summary.json en output_dir"""
+    os.makedirs(output_dir, exist_ok=True)
+    
+    episodes_path = os.path.join(output_dir, 'episodes.csv')
+    with open(episodes_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0].keys()))
+        writer.writeheader()
+        writer.writerows(results)
+    
+    summary_path = os.path.join(output_dir, 'summary.json')
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    
+    logger.info(f"Resultados escritos en {episodes_path} y {summary_path}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Simulación de minijuegos con bots")
+    parser.add_argument('--episodes', type=int, default=1000,
+                        help="Episodios por minijuego, política y dificultad")
+    parser.add_argument('--difficulties', type=int, nargs='+', default=[0],
+                        help="Niveles de dificultad (índices de difficulty_multipliers)")
+    parser.add_argument('--minigames', nargs='+', choices=list(MINIGAMES),
+                        help="Minijuegos a simular (por defecto todos)")
+    parser.add_argument('--processes', type=int, default=None,
+                        help="Procesos del pool (por defecto todos los núcleos)")
+    parser.add_argument('--turn', type=int, default=0,
+                        help="Turno de la partida (aplica la rampa de dificultad por turno)")
+    parser.add_argument('--seed', type=int, default=0, help="Semilla base")
+    parser.add_argument('--config', default=os.path.join('data', 'config.json'))
+    parser.add_argument('--output', default='sim_results', help="Directorio de salida")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # Los minijuegos registran cada golpe en INFO: en miles de episodios es ruido
+    logging.getLogger('gameplay').setLevel(logging.WARNING)
+    
+    engine = DifficultyEngine(load_config(args.config))
+    tasks = build_tasks(args.episodes, args.difficulties, engine,
+                        args.minigames, args.seed, turn=args.turn)
+    
+    start = time.perf_counter()
+    results = run_simulation(tasks, args.processes)
+    elapsed = time.perf_counter() - start
+    logger.info(f"{len(results)} episodios en {elapsed:.1f}s "
+                f"({len(results) / max(elapsed, 1e-9):.0f} episodios/s)")
+    
+    summary = summarize(results)
+    write_results(args.output, results, summary)
+    
+    for row in summary:
+        print(f"{row['minigame']:<18} {row['policy']:<16} nivel {row['difficulty']}: "
+              f"éxito {row['success_rate']:6.1%}  recompensa {row['reward_mean']:5.2f} "
+              f"± {row['reward_std']:4.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
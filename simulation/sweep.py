@@ -0,0 +1,470 @@
+"""
+Sweep - Barrido de parámetros de balance en paralelo
+Simula N partidas completas por cada punto de una rejilla de parámetros
+(valores de config.json y constantes de GameState, ResourceManager y
+RepairSystem) con jugadores programados, sobre las reglas puras de
+engine.rules. Las partidas se reparten en lotes entre todos los núcleos; cada
+lote terminado se añade como una fila a chunks.csv, así que un barrido
+interrumpido se reanuda saltándose los lotes ya escritos.
+
+Uso:
+    python -m simulation.sweep --param gameplay.initial_oxygen=80,100,120 \\
+        --param ResourceManager.mining_reward_success=6,10 --games 500 --output sweep_results
+"""
+
+import argparse
+import copy
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Any, Optional, Tuple
+import logging
+
+from engine import rules
+from engine.rules import Action, OfferState, RulesState, transition
+from simulation.harness import load_config
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GAMES = 200
+DEFAULT_CHUNK_SIZE = 50
+DEFAULT_MAX_TURNS = 60
+DEFAULT_SKILL = 0.6  # Probabilidad de ganar cada minijuego
+
+# Objetos cuyas constantes se pueden barrer como "Clase.atributo"
+OBJECT_PARAMETERS = ('GameState', 'ResourceManager', 'RepairSystem')
+
+# Columnas fijas de chunks.csv (después van los parámetros de la rejilla)
+CHUNK_FIELDS = ['point', 'policy', 'chunk', 'games', 'wins', 'turns', 'win_turns', 'defaults',
+                'oxygen_depleted', 'debt_overwhelming', 'timeouts', 'loans']
+
+
+@dataclass(frozen=True)
+class ScriptedPolicy:
+    """
+    Jugador programado para el barrido
+    
+    Atributos:
+        accept_below: Acepta préstamos con menos oxígeno que esto
+        exchange_below: Vende materiales con menos oxígeno que esto
+        pay_within: Paga el mínimo de los préstamos que vencen en estos turnos
+        repair_materials: Materiales mínimos para preferir reparar a minar
+    """
+    accept_below: float
+    exchange_below: float
+    pay_within: int
+    repair_materials: int
+    
+    def accept_offer(self, state: RulesState) -> bool:
+        """Decide si acepta la oferta pendiente"""
+        return state.oxygen < self.accept_below
+    
+    def plan_turn(self, state: RulesState) -> List[Action]:
+        """Pagos e intercambio antes del minijuego del turno"""
+        actions = []
+        materials = state.materials
+        for index, loan in enumerate(state.loans):
+            if loan.is_defaulted or loan.turns_until_due <= self.pay_within:
+                amount = min(rules.minimum_payment(loan), materials)
+                if amount > 0:
+                    actions.append(Action(rules.PAY, amount, index))
+                    materials -= amount
+        if state.oxygen < self.exchange_below and materials > 0:
+            actions.append(Action(rules.EXCHANGE, materials))
+        return actions
+    
+    def choose_minigame(self, state: RulesState) -> Optional[str]:
+        """Minijuego del turno (None = ninguno)"""
+        if rules.can_repair(state) and state.materials >= self.repair_materials:
+            return rules.REPAIR
+        if rules.can_mine(state):
+            return rules.MINE
+        return None
+
+
+POLICIES: Dict[str, ScriptedPolicy] = {
+    'cautious': ScriptedPolicy(accept_below=20, exchange_below=40, pay_within=3, repair_materials=10),
+    'balanced': ScriptedPolicy(accept_below=30, exchange_below=30, pay_within=1, repair_materials=5),
+    'greedy': ScriptedPolicy(accept_below=101, exchange_below=20, pay_within=0, repair_materials=5),
+}
+
+
+def parse_param(text: str) -> Tuple[str, List[Any]]:
+    """
+    Lee un parámetro de la rejilla: "nombre=v1,v2,..." (valores JSON o texto)
+    
+    Nombres válidos:
+        - Ruta en config.json: "gameplay.initial_oxygen", "creditors.ktar.base_interest_rate"
+        - Constante de un objeto: "ResourceManager.mining_reward_success"
+        - "skill": probabilidad de ganar cada minijuego
+    """
+    name, sep, values = text.partition('=')
+    if not sep or not name or not values:
+        raise ValueError(f"Parámetro inválido (se espera nombre=v1,v2): {text}")
+    parsed = []
+    for value in values.split(','):
+        try:
+            parsed.append(json.loads(value))
+        except json.JSONDecodeError:
+            parsed.append(value)
+    return name.strip(), parsed
+
+
+def build_grid(params: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """Producto cartesiano de los valores de cada parámetro"""
+    names = list(params)
+    return [dict(zip(names, values)) for values in itertools.product(*(params[name] for name in names))]
+
+
+def point_id(point: Dict[str, Any]) -> str:
+    """Identificador estable de un punto de la rejilla"""
+    return f"{zlib.crc32(json.dumps(point, sort_keys=True).encode()):08x}"
+
+
+def build_parameters(config: Dict[str, Any], point: Dict[str, Any]) -> Tuple[Dict[str, Any], Any]:
+    """
+    Aplica un punto de la rejilla y lee los valores que usa la partida
+    
+    Construye GameState, ResourceManager, RepairSystem y LenderOfferEngine con
+    la configuración modificada (así se respetan sus valores por defecto) y
+    después asigna las constantes "Clase.atributo".
+    
+    Returns:
+        (parámetros de la partida, LenderOfferEngine)
+    """
+    from engine.state import GameState
+    from finance.offers import LenderOfferEngine
+    from gameplay.repair import RepairSystem
+    from gameplay.resources import ResourceManager
+    
+    config = copy.deepcopy(config)
+    for name, value in point.items():
+        section, _, _ = name.partition('.')
+        if name == 'skill' or section in OBJECT_PARAMETERS:
+            continue
+        target = config
+        *path, key = name.split('.')
+        for part in path:
+            target = target.setdefault(part, {})
+        target[key] = value
+    
+    objects = {
+        'GameState': GameState(config=config),
+        'ResourceManager': ResourceManager(config),
+        'RepairSystem': RepairSystem(config),
+    }
+    for name, value in point.items():
+        section, _, attribute = name.partition('.')
+        if section in OBJECT_PARAMETERS:
+            if not hasattr(objects[section], attribute):
+                raise ValueError(f"{section} no tiene el atributo {attribute}")
+            setattr(objects[section], attribute, value)
+    
+    game_state = objects['GameState']
+    resource_manager = objects['ResourceManager']
+    repair_system = objects['RepairSystem']
+    parameters = {
+        'oxygen': game_state.oxygen,
+        'max_oxygen': game_state.max_oxygen,
+        'materials': game_state.materials,
+        'max_materials': game_state.max_materials,
+        'oxygen_cost_per_turn': game_state.oxygen_cost_per_turn,
+        'oxygen_cost_mining': game_state.oxygen_cost_mining,
+        'oxygen_cost_repair': game_state.oxygen_cost_repair,
+        'max_loans': config.get('gameplay', {}).get('max_active_loans', rules.MAX_ACTIVE_LOANS),
+        'mining_reward_success': resource_manager.mining_reward_success,
+        'mining_reward_fail': resource_manager.mining_reward_fail,
+        'repair_increment_success': repair_system.repair_increment_success,
+        'repair_increment_fail': repair_system.repair_increment_fail,
+        'skill': point.get('skill', DEFAULT_SKILL),
+    }
+    return parameters, LenderOfferEngine(config)
+
+
+def play_game(parameters: Dict[str, Any], offer_engine, policy: ScriptedPolicy,
+              rng: random.Random, max_turns: int = DEFAULT_MAX_TURNS) -> Dict[str, Any]:
+    """
+    Juega una partida completa
+    
+    Cada turno: puede aparecer un prestamista (LenderOfferEngine.sample_offer),
+    el jugador paga e intercambia según su política, juega un minijuego (gana
+    con probabilidad 'skill') y termina el turno.
+    
+    Returns:
+        won, turns, defaulted, reason ('victory', 'oxygen_depleted',
+        'debt_overwhelming' o 'timeout') y loans (préstamos aceptados)
+    """
+    state = RulesState(
+        oxygen=parameters['oxygen'],
+        max_oxygen=parameters['max_oxygen'],
+        materials=parameters['materials'],
+        max_materials=parameters['max_materials'],
+        oxygen_cost_per_turn=parameters['oxygen_cost_per_turn'],
+        oxygen_cost_mining=parameters['oxygen_cost_mining'],
+        oxygen_cost_repair=parameters['oxygen_cost_repair'],
+        max_loans=parameters['max_loans']
+    )
+    loans = 0
+    defaulted = False
+    
+    while not rules.is_terminal(state) and state.turn < max_turns:
+        if len(state.loans) < state.max_loans:
+            offer = offer_engine.sample_offer(state.oxygen, rng)
+            if offer:
+                terms = offer_engine.get_creditor(offer['creditor_type'])
+                state = state._replace(pending_offer=OfferState(
+                    offer['creditor_type'], offer['amount'], offer['turns_to_pay'], terms.turn_rate))
+                accepted = policy.accept_offer(state)
+                state = transition(state, Action(rules.ACCEPT if accepted else rules.REJECT), rng)
+                loans += accepted
+        
+        for action in policy.plan_turn(state):
+            state = transition(state, action, rng)
+        
+        minigame = policy.choose_minigame(state)
+        if minigame:
+            success = rng.random() < parameters['skill']
+            if minigame == rules.MINE:
+                reward = parameters['mining_reward_success' if success else 'mining_reward_fail']
+            else:
+                reward = parameters['repair_increment_success' if success else 'repair_increment_fail']
+            state = transition(state, Action(minigame, outcome=reward), rng)
+        
+        state = transition(state, Action(rules.END_TURN), rng)
+        defaulted = defaulted or any(loan.is_defaulted for loan in state.loans)
+    
+    if state.victory:
+        reason = 'victory'
+    else:
+        reason = state.reason or 'timeout'
+    return {'won': state.victory, 'turns': state.turn, 'defaulted': defaulted,
+            'reason': reason, 'loans': loans}
+
+
+def run_chunk(task: Tuple[str, Dict[str, Any], str, int, int, int, int, Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Juega un lote de partidas de un punto y una política (se llama en el pool)
+    
+    Args:
+        task: (punto, valores del punto, política, lote, partidas, semilla,
+            turnos máximos, configuración)
+    
+    Returns:
+        Fila de chunks.csv con los totales del lote
+    """
+    point, values, policy_name, chunk, games, seed, max_turns, config = task
+    parameters, offer_engine = build_parameters(config, values)
+    policy = POLICIES[policy_name]
+    rng = random.Random(seed)
+    
+    row = dict.fromkeys(CHUNK_FIELDS, 0)
+    row.update(point=point, policy=policy_name, chunk=chunk, games=games)
+    for _ in range(games):
+        result = play_game(parameters, offer_engine, policy, rng, max_turns)
+        row['wins'] += result['won']
+        row['turns'] += result['turns']
+        row['win_turns'] += result['turns'] if result['won'] else 0
+        row['defaults'] += result['defaulted']
+        row['loans'] += result['loans']
+        if result['reason'] == 'timeout':
+            row['timeouts'] += 1
+        elif result['reason'] != 'victory':
+            row[result['reason']] += 1
+    row.update(values)
+    return row
+
+
+def build_tasks(grid: List[Dict[str, Any]], policies: List[str], games: int, config: Dict[str, Any],
+                chunk_size: int = DEFAULT_CHUNK_SIZE, base_seed: int = 0,
+                max_turns: int = DEFAULT_MAX_TURNS) -> List[Tuple]:
+    """Lotes de partidas de cada punto y política, con semillas deterministas"""
+    tasks = []
+    for values in grid:
+        point = point_id(values)
+        for policy_name in policies:
+            for chunk, start in enumerate(range(0, games, chunk_size)):
+                seed = zlib.crc32(f"{base_seed}:{point}:{policy_name}:{chunk}".encode())
+                tasks.append((point, values, policy_name, chunk, min(chunk_size, games - start),
+                              seed, max_turns, config))
+    return tasks
+
+
+def load_chunks(path: str, fieldnames: List[str]) -> List[Dict[str, Any]]:
+    """
+    Lee los lotes ya escritos (para reanudar)
+    
+    Descarta la última línea si quedó a medias (barrido interrumpido a mitad
+    de escritura: no termina en salto de línea) y reescribe el fichero sin ella.
+    
+    Raises:
+        ValueError: Si las columnas no coinciden con la rejilla actual
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r', newline='', encoding='utf-8') as f:
+        text = f.read()
+    if not text.endswith('\n'):
+        text = text[:text.rfind('\n') + 1]
+    reader = csv.DictReader(text.splitlines())
+    if reader.fieldnames != fieldnames:
+        raise ValueError(f"{path} es de otra rejilla (columnas {reader.fieldnames})")
+    rows = list(reader)
+    
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
+
+
+def run_sweep(tasks: List[Tuple], path: str, fieldnames: List[str],
+              processes: Optional[int] = None, resume: bool = True) -> List[Dict[str, Any]]:
+    """
+    Ejecuta los lotes pendientes y añade cada resultado a chunks.csv al terminar
+    
+    Args:
+        tasks: Lotes generados por build_tasks
+        path: Ruta de chunks.csv
+        fieldnames: Columnas (CHUNK_FIELDS + parámetros)
+        processes: Número de procesos (None = todos los núcleos)
+        resume: Conservar los lotes ya escritos (False = empezar de cero)
+    
+    Returns:
+        Todas las filas (las anteriores y las nuevas)
+    """
+    rows = load_chunks(path, fieldnames) if resume else []
+    done = {(row['point'], row['policy'], int(row['chunk'])) for row in rows}
+    pending = [task for task in tasks if (task[0], task[2], task[3]) not in done]
+    logger.info(f"{len(pending)} lotes pendientes ({len(tasks) - len(pending)} ya calculados)")
+    
+    if not resume or not os.path.exists(path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            csv.DictWriter(f, fieldnames=fieldnames).writeheader()
+    
+    processes = processes or os.cpu_count() or 1
+    with open(path, 'a', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        if processes == 1:
+            results: Iterable[Dict[str, Any]] = map(run_chunk, pending)
+            pool = None
+        else:
+            pool = multiprocessing.Pool(processes=processes)
+            results = pool.imap_unordered(run_chunk, pending)
+        try:
+            for row in results:
+                writer.writerow(row)
+                f.flush()
+                rows.append(row)
+        finally:
+            if pool:
+                pool.terminate()
+                pool.join()
+    return rows
+
+
+def summarize(rows: List[Dict[str, Any]], params: List[str]) -> List[Dict[str, Any]]:
+    """
+    Agrupa los lotes por (punto, política)
+    
+    Returns:
+        Lista con win_rate, avg_turns, avg_win_turns, default_rate y tasas de
+        cada final por punto de la rejilla y política
+    """
+    groups: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    for row in rows:
+        key = (row['point'], row['policy'])
+        group = groups.setdefault(key, dict({name: row[name] for name in params},
+                                            point=row['point'], policy=row['policy'],
+                                            **dict.fromkeys(CHUNK_FIELDS[3:], 0)))
+        for field in CHUNK_FIELDS[3:]:
+            group[field] += int(row[field])
+    
+    summary = []
+    for (_, policy_name), group in sorted(groups.items()):
+        games = group['games']
+        summary.append({
+            **{name: group[name] for name in params},
+            'point': group['point'],
+            'policy': policy_name,
+            'games': games,
+            'win_rate': group['wins'] / games,
+            'avg_turns': group['turns'] / games,
+            'avg_win_turns': group['win_turns'] / group['wins'] if group['wins'] else None,
+            'default_rate': group['defaults'] / games,
+            'oxygen_depleted_rate': group['oxygen_depleted'] / games,
+            'debt_overwhelming_rate': group['debt_overwhelming'] / games,
+            'timeout_rate': group['timeouts'] / games,
+            'avg_loans': group['loans'] / games
+        })
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Barrido de parámetros de balance")
+    parser.add_argument('--param', action='append', default=[], metavar='NOMBRE=V1,V2',
+                        help="Parámetro de la rejilla (repetible)")
+    parser.add_argument('--games', type=int, default=DEFAULT_GAMES,
+                        help="Partidas por punto de la rejilla y política")
+    parser.add_argument('--policies', nargs='+', choices=list(POLICIES), default=list(POLICIES))
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Partidas por lote (unidad de reparto y de reanudación)")
+    parser.add_argument('--max-turns', type=int, default=DEFAULT_MAX_TURNS)
+    parser.add_argument('--processes', type=int, default=None,
+                        help="Procesos del pool (por defecto todos los núcleos)")
+    parser.add_argument('--seed', type=int, default=0, help="Semilla base")
+    parser.add_argument('--config', default=os.path.join('data', 'config.json'))
+    parser.add_argument('--output', default='sweep_results', help="Directorio de salida")
+    parser.add_argument('--restart', action='store_true',
+                        help="Descarta los lotes ya escritos en lugar de reanudar")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # Cada punto construye GameState, ResourceManager... que registran en INFO
+    for name in ('engine', 'finance', 'gameplay'):
+        logging.getLogger(name).setLevel(logging.WARNING)
+    
+    try:
+        params = dict(parse_param(text) for text in args.param)
+    except ValueError as e:
+        parser.error(str(e))
+    grid = build_grid(params)
+    config = load_config(args.config)
+    # Comprobar los nombres antes de repartir el trabajo
+    for values in grid[:1]:
+        build_parameters(config, values)
+    
+    tasks = build_tasks(grid, args.policies, args.games, config, args.chunk_size,
+                        args.seed, args.max_turns)
+    fieldnames = CHUNK_FIELDS + list(params)
+    chunks_path = os.path.join(args.output, 'chunks.csv')
+    
+    start = time.perf_counter()
+    rows = run_sweep(tasks, chunks_path, fieldnames, args.processes, resume=not args.restart)
+    elapsed = time.perf_counter() - start
+    logger.info(f"{len(grid)} puntos x {len(args.policies)} políticas en {elapsed:.1f}s")
+    
+    summary = summarize(rows, list(params))
+    summary_path = os.path.join(args.output, 'summary.json')
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    logger.info(f"Resultados escritos en {chunks_path} y {summary_path}")
+    
+    for row in summary:
+        values = ' '.join(f"{name}={row[name]}" for name in params)
+        print(f"{values} {row['policy']:<9}: victorias {row['win_rate']:6.1%}  "
+              f"turnos {row['avg_turns']:5.1f}  impagos {row['default_rate']:6.1%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Test Suite for Strategy Advisor
+Pruebas del consejero de estrategia (MCTS con tabla de transposición)
+"""
+
+import unittest
+import logging
+import time
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from engine import rules
+from engine.rules import RulesState, OfferState
+from engine.state import GameState
+from engine.events import EventManager, EventType
+from simulation.advisor import StrategyAdvisor, StrategySearch, evaluate, state_key
+
+
+class TestStrategySearch(unittest.TestCase):
+    """Pruebas de la búsqueda"""
+    
+    def test_state_key_ignores_turn_and_fractions(self):
+        """Estados equivalentes comparten entrada en la tabla"""
+        state = RulesState(oxygen=50.2, materials=10, turn=3)
+        self.assertEqual(state_key(state), state_key(state._replace(oxygen=50.7, turn=9)))
+        self.assertNotEqual(state_key(state), state_key(state._replace(materials=11)))
+    
+    def test_evaluate_bounds(self):
+        """Victoria vale 1, game over 0 y el resto queda entre ambos"""
+        self.assertEqual(evaluate(RulesState(victory=True)), 1.0)
+        self.assertEqual(evaluate(RulesState(game_over=True)), 0.0)
+        value = evaluate(RulesState(oxygen=60, materials=20, repair_progress=40))
+        self.assertTrue(0.0 < value < 1.0)
+    
+    def test_recommends_exchange_with_low_oxygen(self):
+        """Con poco oxígeno y muchos materiales conviene cambiarlos"""
+        state = RulesState(oxygen=15, materials=30, repair_progress=30)
+        result = StrategySearch(seed=0).run(state, time_budget=5.0, max_iterations=2000)
+        self.assertEqual(result['action'].kind, rules.EXCHANGE)
+        self.assertTrue(result['final'])
+        self.assertEqual(result['iterations'], 2000)
+    
+    def test_recommends_repair_near_victory(self):
+        """A punto de terminar la nave conviene reparar"""
+        state = RulesState(oxygen=80, materials=30, repair_progress=90)
+        result = StrategySearch(seed=0).run(state, time_budget=5.0, max_iterations=2000)
+        self.assertEqual(result['action'].kind, rules.REPAIR)
+    
+    def test_offer_options_only(self):
+        """Con una oferta pendiente solo se decide aceptar o rechazar"""
+        state = RulesState(oxygen=90, materials=10, pending_offer=OfferState('zorvax', 30, 5, 0.05))
+        result = StrategySearch(seed=0).run(state, time_budget=5.0, max_iterations=500)
+        self.assertEqual({option['action'].kind for option in result['options']},
+                         {rules.ACCEPT, rules.REJECT})
+    
+    def test_table_is_reused_and_bounded(self):
+        """La tabla se conserva entre búsquedas y no supera max_entries"""
+        search = StrategySearch(max_entries=300, seed=0)
+        state = RulesState(oxygen=70, materials=20, repair_progress=20)
+        search.run(state, time_budget=5.0, max_iterations=400)
+        first = search.recommendation(state)['visits']
+        search.run(state, time_budget=5.0, max_iterations=400)
+        self.assertGreater(search.recommendation(state)['visits'], first)
+        self.assertLessEqual(len(search.table), 300)
+    
+    def test_progressive_updates(self):
+        """Las recomendaciones parciales llegan antes que la final"""
+        updates = []
+        StrategySearch(seed=0).run(RulesState(oxygen=60, materials=20), time_budget=0.3,
+                                   update_interval=0.05, on_update=updates.append)
+        self.assertGreater(len(updates), 1)
+        self.assertTrue(updates[-1]['final'])
+        self.assertFalse(any(update['final'] for update in updates[:-1]))
+    
+    def test_terminal_state_has_no_advice(self):
+        """Una partida terminada no tiene recomendación"""
+        self.assertIsNone(StrategySearch(seed=0).run(RulesState(game_over=True), time_budget=0.1))
+
+
+class TestStrategyAdvisor(unittest.TestCase):
+    """Pruebas del servicio en segundo plano"""
+    
+    def setUp(self):
+        logging.disable(logging.INFO)
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+    
+    def test_advice_arrives_through_event_queue(self):
+        """La recomendación final llega como evento al procesar la cola"""
+        event_manager = EventManager()
+        received = []
+        event_manager.subscribe(EventType.ADVICE_UPDATED, received.append)
+        
+        advisor = StrategyAdvisor(time_budget=0.2, update_interval=0.05, seed=0)
+        advisor.game_state = GameState()
+        advisor.event_manager = event_manager
+        advisor.start()
+        try:
+            advisor.request_if_changed()
+            deadline = time.time() + 5.0
+            while not (advisor.latest and advisor.latest['final']) and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            advisor.stop()
+        
+        # Nada se entrega hasta que el hilo principal procesa la cola
+        self.assertEqual(received, [])
+        event_manager.process_queue()
+        self.assertTrue(received)
+        self.assertTrue(received[-1].data['final'])
+        self.assertIs(advisor.latest, received[-1].data)
+    
+    def test_request_if_changed_uses_state_version(self):
+        """Sin cambios en GameState no se pide una nueva recomendación"""
+        advisor = StrategyAdvisor()
+        advisor.game_state = GameState()
+        
+        advisor.request_if_changed()
+        self.assertIsNotNone(advisor._pending)
+        advisor._pending = None
+        
+        advisor.request_if_changed()
+        self.assertIsNone(advisor._pending)
+        
+        advisor.game_state.add_materials(5)
+        advisor.request_if_changed()
+        self.assertEqual(advisor._pending.materials, advisor.game_state.materials)
+    
+    def test_exchange_requests_new_advice(self):
+        """El intercambio del HUD (solo oxígeno y materiales) pide consejo nuevo"""
+        advisor = StrategyAdvisor()
+        advisor.game_state = GameState()
+        advisor.game_state.oxygen = 40.0
+        advisor.game_state.materials = 20
+        advisor.request_if_changed()
+        advisor._pending = None
+        
+        # Mismo camino que HUD.confirm_exchange
+        before = rules.from_game_state(advisor.game_state)
+        after = rules.transition(before, rules.Action(rules.EXCHANGE, 12))
+        rules.apply_to_game(advisor.game_state, before, after)
+        self.assertEqual(advisor.game_state.oxygen, 100.0)
+        self.assertEqual(advisor.game_state.materials, 8)
+        
+        advisor.request_if_changed()
+        self.assertIsNotNone(advisor._pending)
+        self.assertEqual((advisor._pending.oxygen, advisor._pending.materials), (100.0, 8))
+    
+    def test_final_advice_is_cached_per_state(self):
+        """Un estado ya resuelto repite su recomendación sin buscar"""
+        advisor = StrategyAdvisor(time_budget=0.1, update_interval=0.05, seed=0)
+        advisor.game_state = GameState()
+        key = state_key(rules.from_game_state(advisor.game_state))
+        advisor.start()
+        try:
+            advisor.request_advice()
+            deadline = time.time() + 5.0
+            while key not in advisor.results and time.time() < deadline:
+                time.sleep(0.01)
+            first = advisor.results[key]
+            iterations = advisor.search.iterations
+            
+            advisor.latest = None
+            advisor.request_advice()
+            while advisor.latest is None and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            advisor.stop()
+        
+        self.assertTrue(first['final'])
+        self.assertIs(advisor.latest, first)
+        self.assertEqual(advisor.search.iterations, iterations)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Test Suite for Payment Allocator
+Pruebas del reparto óptimo de materiales entre préstamos
+"""
+
+import unittest
+import itertools
+import random
+import logging
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from finance.debt import ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt
+from finance.allocator import PaymentAllocator, PENALTY_COSTS, loan_state, _loan_cost, _solve
+from finance.loan_manager import LoanManager
+
+COSTS = tuple(sorted(PENALTY_COSTS.items()))
+
+
+def _penalty_cost(penalty):
+    """Coste de una penalización de Debt.apply_penalty"""
+    units = (penalty.get('materials_lost', 0) + penalty.get('oxygen_lost', 0) +
+             penalty.get('repair_lost', 0))
+    return PENALTY_COSTS.get(penalty.get('type'), 0.0) * units
+
+
+class _State:
+    """Estado mínimo del jugador para LoanManager"""
+    
+    def __init__(self, materials):
+        self.materials = materials
+        self.turn_number = 1
+    
+    def consume_materials(self, amount):
+        self.materials -= amount
+    
+    def mark_changed(self, *groups):
+        pass
+
+
+class TestPaymentAllocator(unittest.TestCase):
+    """Pruebas de PaymentAllocator"""
+    
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.allocator = PaymentAllocator()
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+    
+    def test_loan_cost_matches_debt(self):
+        """El coste simulado coincide con avanzar un Debt real y penalizarlo"""
+        rng = random.Random(11)
+        classes = [ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt]
+        for _ in range(40):
+            debt = rng.choice(classes)(rng.randint(10, 60), rng.randint(1, 6))
+            paid = rng.randint(0, debt.materials_owed)
+            expected_cost, _ = _loan_cost(loan_state(debt), paid, 8, COSTS)
+            
+            if debt.make_payment(paid):
+                self.assertEqual(expected_cost, 0.0)
+                continue
+            cost = 0.0
+            for _ in range(8):
+                debt.advance_turn()
+                if debt.is_defaulted:
+                    cost += _penalty_cost(debt.apply_penalty())
+            self.assertAlmostEqual(expected_cost, cost)
+    
+    def test_matches_brute_force(self):
+        """El reparto es óptimo frente a la búsqueda exhaustiva"""
+        rng = random.Random(4)
+        classes = [ZorvaxDebt, KtarDebt, NebulaConsortiumDebt]
+        for _ in range(15):
+            loans = [rng.choice(classes)(rng.randint(5, 20), rng.randint(1, 4)) for _ in range(2)]
+            materials = rng.randint(0, 40)
+            plan = self.allocator.allocate(loans, materials)
+            
+            states = [loan_state(loan) for loan in loans]
+            best = min(
+                sum(_loan_cost(state, paid, plan['horizon'], COSTS)[0]
+                    for state, paid in zip(states, payments))
+                for payments in itertools.product(*[range(state.materials_owed + 1) for state in states])
+                if sum(payments) <= materials)
+            self.assertAlmostEqual(plan['expected_penalty'], best)
+            self.assertLessEqual(plan['materials_used'], materials)
+            self.assertLessEqual(plan['expected_penalty'], plan['baseline_penalty'])
+    
+    def test_pays_off_loan_with_worst_penalty(self):
+        """Con materiales limitados, salda el préstamo cuya penalización cuesta más"""
+        ktar = KtarDebt(50, 1)  # 60 materiales, 10 de oxígeno máximo por turno en default
+        zorvax = ZorvaxDebt(10, 1)  # 15 materiales, 3 por turno en default
+        plan = self.allocator.allocate([zorvax, ktar], 60)
+        self.assertEqual(plan['payments'], [0, 60])
+    
+    def test_repeated_queries_are_cached(self):
+        """Abrir el panel otra vez con el mismo estado reutiliza la caché"""
+        loans = [ZorvaxDebt(30, 3), KtarDebt(25, 2)]
+        self.allocator.allocate(loans, 50)
+        hits = _solve.cache_info().hits
+        self.allocator.allocate(loans, 50)
+        self.assertEqual(_solve.cache_info().hits, hits + 1)
+    
+    def test_loan_manager_auto_pay(self):
+        """LoanManager.auto_pay aplica el reparto y descuenta los materiales"""
+        manager = LoanManager()
+        manager.game_state = _State(80)
+        manager.active_loans = [ZorvaxDebt(10, 1), KtarDebt(50, 1)]
+        paid = manager.auto_pay()
+        self.assertEqual(paid, 75)
+        self.assertEqual(manager.game_state.materials, 5)
+        self.assertEqual(len(manager.active_loans), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Test Suite for Asset Loader
+Pruebas de la carga de recursos en segundo plano
+"""
+
+import unittest
+import logging
+import time
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, ROOT)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from engine.events import EventManager
+from ui.assets import AssetLoader, AssetSpec
+from ui.renderer import Renderer
+
+ASSETS = os.path.join(ROOT, 'data', 'assets')
+
+
+class TestAssetLoader(unittest.TestCase):
+    """Pruebas del hilo de carga y la entrega por la cola de eventos"""
+    
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        pygame.init()
+        self.screen = pygame.display.set_mode((320, 240))
+        self.event_manager = EventManager()
+        self.loader = AssetLoader()
+        self.loader.event_manager = self.event_manager
+        self.loader.directory = ASSETS
+    
+    def tearDown(self):
+        self.loader.stop()
+        pygame.quit()
+        logging.disable(logging.NOTSET)
+    
+    def _wait_until_done(self):
+        deadline = time.time() + 10.0
+        while not self.loader.is_done and time.time() < deadline:
+            self.event_manager.process_queue()
+            time.sleep(0.01)
+    
+    def test_images_arrive_on_main_thread(self):
+        """Las imágenes llegan escaladas al procesar la cola y los fallos cuentan en el progreso"""
+        received = {}
+        self.loader.add_images([AssetSpec('ship', 'blue_spaceship.png', (150, 100)),
+                                AssetSpec('missing', 'no_existe.png')], received.__setitem__)
+        self.loader.add_file(os.path.join(ASSETS, 'repair_bar.png'),
+                             lambda data: received.__setitem__('file', data))
+        self.assertEqual(self.loader.progress, 0.0)
+        
+        self.loader.start()
+        time.sleep(0.2)
+        # Nada se entrega fuera de process_queue
+        self.assertEqual(received, {})
+        
+        self._wait_until_done()
+        self.assertTrue(self.loader.is_done)
+        self.assertEqual(self.loader.progress, 1.0)
+        self.assertEqual((self.loader.loaded, self.loader.failed), (2, 1))
+        self.assertEqual(received['ship'].get_size(), (150, 100))
+        self.assertTrue(received['file'].read(4).startswith(b'\x89PNG'))
+    
+    def test_renderer_placeholders_swap_to_sprites(self):
+        """El renderer dibuja marcadores desde el inicio y los sustituye por los sprites"""
+        renderer = Renderer(320, 240)
+        renderer.initialize(self.screen, self.loader)
+        placeholder = renderer.assets['blue_spaceship']
+        self.assertIn('landing_moon', renderer.assets)
+        renderer.render_intro()
+        
+        self.loader.start()
+        self._wait_until_done()
+        self.assertIsNot(renderer.assets['blue_spaceship'], placeholder)
+        self.assertEqual(renderer.assets['blue_spaceship'].get_size(), (150, 100))
+        self.assertIn('space_background', renderer.assets)
+
+
+if __name__ == '__main__':
+    unittest.main()
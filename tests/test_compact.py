@@ -0,0 +1,89 @@
+"""
+Test Suite for Compact Debt
+Pruebas de CompactDebt frente a las clases Debt
+"""
+
+import unittest
+import random
+import logging
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from finance.debt import ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt
+from finance.compact import CompactDebt, CREDITOR_STRATEGIES
+from simulation.debt_benchmark import run_benchmark
+
+STATE = ('principal', 'interest_rate', 'current_balance', 'materials_owed', 'turns_until_due',
+         'is_defaulted', 'turn_rate', 'accrued_interest', 'base_materials', 'creditor_name')
+
+
+def _state(loan):
+    return tuple(getattr(loan, name) for name in STATE)
+
+
+class TestCompactDebt(unittest.TestCase):
+    """Pruebas de equivalencia con finance.debt"""
+    
+    def setUp(self):
+        logging.disable(logging.WARNING)
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+    
+    def test_no_instance_dict(self):
+        """Los préstamos compactos no tienen __dict__"""
+        loan = CompactDebt('zorvax', 40)
+        self.assertFalse(hasattr(loan, '__dict__'))
+        with self.assertRaises(AttributeError):
+            loan.extra = 1
+    
+    def test_random_turns_match_debt(self):
+        """Pagos, intereses, defaults y penalizaciones idénticos a Debt"""
+        rng = random.Random(9)
+        classes = [ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt]
+        for _ in range(60):
+            debt_class = rng.choice(classes)
+            principal, turns = rng.randint(10, 60), rng.randint(1, 8)
+            debt = debt_class(principal, turns)
+            compact = CompactDebt(debt.CREDITOR_TYPE, principal, turns)
+            self.assertEqual(_state(compact), _state(debt))
+            
+            for _ in range(10):
+                amount = rng.randint(0, 20) if rng.random() < 0.4 else 0
+                self.assertEqual(compact.make_payment(amount), debt.make_payment(amount))
+                self.assertEqual(compact.calculate_interest(), debt.calculate_interest())
+                self.assertEqual(compact.project_balance(5), debt.project_balance(5))
+                compact.advance_turn()
+                debt.advance_turn()
+                self.assertEqual(compact.apply_penalty(), debt.apply_penalty())
+                self.assertEqual(compact.get_minimum_payment(), debt.get_minimum_payment())
+                self.assertEqual(_state(compact), _state(debt))
+    
+    def test_bulk_create_and_conversion(self):
+        """bulk_create equivale a construir uno a uno; from_debt/to_debt conservan el estado"""
+        creditors = list(CREDITOR_STRATEGIES) * 3
+        principals = [45.0] * len(creditors)
+        bulk = CompactDebt.bulk_create(creditors, principals, turn_rates=[0.07] * len(creditors))
+        single = [CompactDebt(c, p, turn_rate=0.07) for c, p in zip(creditors, principals)]
+        self.assertEqual([_state(loan) for loan in bulk], [_state(loan) for loan in single])
+        self.assertEqual(bulk[3].principal, 30)  # Límite del aliado
+        
+        debt = KtarDebt(50, 4)
+        debt.make_payment(7)
+        debt.advance_turn()
+        compact = CompactDebt.from_debt(debt)
+        self.assertEqual(_state(compact), _state(debt))
+        self.assertEqual(_state(compact.to_debt()), _state(debt))
+    
+    def test_benchmark_reports_smaller_loans(self):
+        """El benchmark mide menos memoria por préstamo que las subclases"""
+        results = run_benchmark(2000)
+        self.assertLess(results['CompactDebt.bulk_create']['bytes_per_loan'],
+                        results['Debt (subclases)']['bytes_per_loan'])
+
+
+if __name__ == '__main__':
+    unittest.main()
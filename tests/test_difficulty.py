@@ -0,0 +1,107 @@
+"""
+Test Suite for Difficulty Engine
+Pruebas de las tablas de ajuste de minijuegos por nivel y turno
+"""
+
+import unittest
+import json
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gameplay.difficulty import DifficultyEngine, MINIGAME_PARAMETERS, default_tuning
+from gameplay.minigames import TimingMinigame, WiringMinigame
+
+
+CONFIG = {
+    'minigames': {
+        'timing': {
+            'duration': 20.0,
+            'difficulty_multipliers': [1.0, 2.0],
+            'turn_ramp': 0.1,
+            'max_ramp_turns': 5
+        },
+        'wiring': {
+            'difficulty_multipliers': [1.0, 10.0],
+            'turn_ramp': 0.0
+        }
+    }
+}
+
+
+class TestDifficultyEngine(unittest.TestCase):
+    """Pruebas del motor de dificultad"""
+    
+    def setUp(self):
+        """Motor compilado con una configuración de prueba"""
+        self.engine = DifficultyEngine(CONFIG)
+    
+    def test_defaults_without_config(self):
+        """Sin configuración, nivel 0 y turno 0 devuelven los valores base"""
+        engine = DifficultyEngine()
+        for name, parameters in MINIGAME_PARAMETERS.items():
+            tuning = engine.get_tuning(name)
+            for param, spec in parameters.items():
+                self.assertEqual(tuning[param], spec.resolve(spec.base, 1.0))
+    
+    def test_shipped_config_has_no_turn_ramp(self):
+        """Con config.json, el nivel 0 no cambia con los turnos"""
+        with open(os.path.join(os.path.dirname(__file__), '..', 'data', 'config.json'), encoding='utf-8') as f:
+            engine = DifficultyEngine(json.load(f))
+        for name in MINIGAME_PARAMETERS:
+            self.assertEqual(engine.get_tuning(name, 0, 20), engine.get_tuning(name, 0, 0))
+        
+        engine = DifficultyEngine()
+        for name in MINIGAME_PARAMETERS:
+            self.assertEqual(engine.get_tuning(name, 0, 20), engine.get_tuning(name))
+    
+    def test_config_overrides_and_aliases(self):
+        """Los valores base de config.json (incluido 'duration') se aplican"""
+        self.assertEqual(self.engine.get_tuning('timing')['time_limit'], 20.0)
+        self.assertEqual(self.engine.get_level_count('timing'), 2)
+    
+    def test_level_and_turn_scaling(self):
+        """El multiplicador combina nivel y rampa por turno"""
+        self.assertAlmostEqual(self.engine.get_tuning('timing', 1)['base_speed'], 400.0)
+        # nivel 1 (x2) en turno 3 (x1.3)
+        self.assertAlmostEqual(self.engine.get_tuning('timing', 1, 3)['base_speed'], 520.0)
+    
+    def test_out_of_range_is_clamped(self):
+        """Niveles y turnos fuera de rango usan el extremo más cercano"""
+        self.assertEqual(self.engine.get_tuning('timing', 9, 100),
+                         self.engine.get_tuning('timing', 1, 5))
+        self.assertEqual(self.engine.get_tuning('timing', -1, -1),
+                         self.engine.get_tuning('timing'))
+    
+    def test_parameter_limits(self):
+        """Los límites mínimo y máximo se respetan al escalar"""
+        tuning = self.engine.get_tuning('wiring', 1)
+        self.assertEqual(tuning['num_wires'], 6)
+        self.assertEqual(tuning['time_limit'], 15.0)
+    
+    def test_tables_are_read_only(self):
+        """Las tablas compartidas no se pueden modificar"""
+        with self.assertRaises(TypeError):
+            self.engine.get_tuning('timing')['base_speed'] = 1.0
+
+
+class TestMinigameTuning(unittest.TestCase):
+    """Pruebas de los minijuegos con parámetros de dificultad"""
+    
+    def test_minigame_uses_tuning(self):
+        """El minijuego lee sus parámetros del ajuste recibido"""
+        engine = DifficultyEngine(CONFIG)
+        minigame = WiringMinigame(headless=True, tuning=engine.get_tuning('wiring', 1))
+        self.assertEqual(minigame.num_wires, 6)
+        self.assertEqual(len(minigame.get_observation()['wires']), 6)
+    
+    def test_minigame_defaults(self):
+        """Sin tuning, el minijuego usa los valores por defecto"""
+        minigame = TimingMinigame(headless=True)
+        self.assertEqual(minigame.time_remaining, default_tuning('timing')['time_limit'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,8 @@ Pruebas unitarias para el sistema financiero
 """
 
 import unittest
+import random
+import logging
 import sys
 import os
 
@@ -119,6 +121,128 @@ class TestLoanManager(unittest.TestCase):
         pass
 
 
+class TestDebtSchedule(unittest.TestCase):
+    """Pruebas del calendario de pagos cacheado"""
+    
+    def test_schedule_matches_minimum_payments(self):
+        """Cada fila coincide con get_minimum_payment tras pagar el mínimo"""
+        debt = ZorvaxDebt(50)
+        for row in debt.get_schedule()['payments']:
+            self.assertEqual(debt.turns_until_due, row['turns_until_due'])
+            self.assertEqual(debt.get_minimum_payment(), row['minimum_payment'])
+            debt.make_payment(row['minimum_payment'])
+            self.assertEqual(debt.materials_owed, row['remaining'])
+            debt.advance_turn()
+    
+    def test_schedule_is_cached_until_payment(self):
+        """El calendario se reutiliza hasta un pago o un cambio de turno"""
+        debt = KtarDebt(40)
+        schedule = debt.get_schedule()
+        self.assertIs(debt.get_schedule(), schedule)
+        
+        debt.make_payment(10)
+        after_payment = debt.get_schedule()
+        self.assertIsNot(after_payment, schedule)
+        self.assertEqual(after_payment['payments'][0]['remaining'] + after_payment['payments'][0]['minimum_payment'],
+                         debt.materials_owed)
+        
+        debt.advance_turn()
+        self.assertIsNot(debt.get_schedule(), after_payment)
+    
+    def test_penalty_turn(self):
+        """La penalización salta al vencer con materiales pendientes"""
+        debt = KtarDebt(40, turns=3)
+        self.assertEqual(debt.get_penalty_turn(), 3)
+        
+        debt.make_payment(debt.materials_owed - 1)
+        self.assertIsNone(debt.get_penalty_turn())
+        
+        overdue = ZorvaxDebt(30, turns=1)
+        overdue.advance_turn()
+        self.assertTrue(overdue.is_defaulted)
+        self.assertEqual(overdue.get_penalty_turn(), 0)
+        self.assertEqual(overdue.get_minimum_payment(), overdue.materials_owed)
+
+
+
+class _PlayerState:
+    """Estado mínimo del jugador para LoanManager"""
+    
+    def __init__(self):
+        self.oxygen = 30.0
+        self.max_oxygen = 100.0
+        self.materials = 500
+        self.repair_progress = 50.0
+        self.turn_number = 1
+    
+    def update_oxygen(self, amount):
+        self.oxygen += amount
+    
+    def consume_materials(self, amount):
+        self.materials -= amount
+    
+    def mark_changed(self, *groups):
+        pass
+    
+    def update_repair_progress(self, amount):
+        self.repair_progress += amount
+
+
+class TestLoanAggregates(unittest.TestCase):
+    """Pruebas de los agregados incrementales de LoanManager"""
+    
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.manager = LoanManager({'gameplay': {'debug_loan_aggregates': True}})
+        self.manager.game_state = _PlayerState()
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+    
+    def _expected(self):
+        loans = self.manager.active_loans
+        due = [loan.turns_until_due for loan in loans if loan.materials_owed > 0]
+        return (sum(loan.materials_owed for loan in loans),
+                sum(loan.get_minimum_payment() for loan in loans),
+                sum(1 for loan in loans if loan.is_defaulted),
+                self.manager.game_state.turn_number + min(due) if due else None)
+    
+    def test_aggregates_follow_random_game(self):
+        """Aceptar, pagar, penalizar y avanzar turnos mantiene los agregados exactos"""
+        rng = random.Random(2)
+        for _ in range(60):
+            action = rng.random()
+            if action < 0.3 and len(self.manager.active_loans) < self.manager.max_loans:
+                self.manager.pending_offer = self.manager.offer_engine.build_offer(
+                    rng.choice(['zorvax', 'ktar', 'nebula', 'friendly']), rng.randint(10, 50))
+                self.manager.accept_pending_offer()
+            elif action < 0.6 and self.manager.active_loans:
+                loan = rng.choice(self.manager.active_loans)
+                self.manager.make_payment(loan, rng.randint(1, loan.materials_owed))
+            else:
+                self.manager.game_state.turn_number += 1
+                self.manager.process_turn()
+            
+            actual = (self.manager.get_total_debt_in_materials(), self.manager.get_minimum_payment_due(),
+                      self.manager.get_defaulted_count(), self.manager.get_next_due_turn())
+            self.assertEqual(actual, self._expected())
+        self.assertEqual(self.manager.aggregate_mismatches, 0)
+    
+    def test_external_changes_and_reset(self):
+        """Sustituir active_loans desde fuera reconstruye los agregados; reset los vacía"""
+        self.manager.active_loans = [ZorvaxDebt(20, 4), KtarDebt(30, 2)]
+        self.assertEqual(self.manager.get_total_debt_in_materials(), 30 + 36)
+        self.assertEqual(self.manager.get_next_due_turn(), 3)
+        
+        self.manager.active_loans.append(FriendlyDebt(10, 1))
+        self.assertEqual(self.manager.get_total_debt_in_materials(), 30 + 36 + 10)
+        
+        self.manager.reset()
+        self.assertEqual(self.manager.get_total_debt_in_materials(), 0)
+        self.assertIsNone(self.manager.get_next_due_turn())
+        self.assertEqual(self.manager.aggregate_mismatches, 0)
+
+
 if __name__ == '__main__':
     unittest.main()
 
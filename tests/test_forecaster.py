@@ -0,0 +1,169 @@
+"""
+Test Suite for Risk Forecaster
+Pruebas del pronóstico Monte Carlo de riesgo de game over
+"""
+
+import unittest
+import logging
+import time
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from engine.state import GameState
+from engine.events import EventManager, EventType
+from finance.debt import ZorvaxDebt, KtarDebt
+from finance.loan_manager import LoanManager
+from simulation.forecaster import RiskForecaster, forecast_risk, snapshot_state
+
+
+class TestForecastRisk(unittest.TestCase):
+    """Pruebas de la simulación vectorizada"""
+    
+    def setUp(self):
+        """Partida nueva sin préstamos"""
+        logging.disable(logging.INFO)
+        self.game_state = GameState()
+        self.loan_manager = LoanManager()
+        self.loan_manager.game_state = self.game_state
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+    
+    def test_seed_is_reproducible(self):
+        """Misma semilla, mismo pronóstico"""
+        snapshot = snapshot_state(self.game_state, self.loan_manager)
+        self.assertEqual(forecast_risk(snapshot, 500, seed=3), forecast_risk(snapshot, 500, seed=3))
+    
+    def test_probabilities_are_consistent(self):
+        """Las probabilidades están en [0, 1] y el riesgo acumulado no decrece"""
+        self.game_state.oxygen = 30
+        result = forecast_risk(snapshot_state(self.game_state, self.loan_manager), 500, seed=1)
+        for key in ('oxygen_depleted', 'debt_overwhelming', 'game_over'):
+            self.assertGreaterEqual(result[key], 0.0)
+            self.assertLessEqual(result[key], 1.0)
+        self.assertEqual(result['cumulative_risk'], sorted(result['cumulative_risk']))
+        self.assertAlmostEqual(result['cumulative_risk'][-1], result['game_over'])
+    
+    def test_heavy_debt_raises_risk(self):
+        """Con deudas impagables el riesgo de 'debt_overwhelming' sube"""
+        snapshot = snapshot_state(self.game_state, self.loan_manager)
+        safe = forecast_risk(snapshot, 1000, horizon=5, seed=1)
+        self.assertEqual(safe['debt_overwhelming'], 0.0)
+        
+        self.game_state.oxygen = 25
+        self.game_state.materials = 0
+        self.loan_manager.active_loans = [ZorvaxDebt(90, 2), KtarDebt(60, 1)]
+        risky = forecast_risk(snapshot_state(self.game_state, self.loan_manager), 1000,
+                              horizon=5, seed=1)
+        self.assertGreater(risky['debt_overwhelming'], 0.5)
+    
+    def test_snapshot_is_independent(self):
+        """Pagar después del snapshot no cambia los datos copiados"""
+        loan = ZorvaxDebt(50)
+        self.loan_manager.active_loans = [loan]
+        snapshot = snapshot_state(self.game_state, self.loan_manager)
+        loan.make_payment(20)
+        self.assertEqual(snapshot['portfolio'].materials_owed[0], 75)
+
+
+
+class TestWhatIf(unittest.TestCase):
+    """Pruebas de LoanManager.evaluate_what_if"""
+    
+    def setUp(self):
+        logging.disable(logging.INFO)
+        self.game_state = GameState()
+        self.game_state.oxygen = 40
+        self.game_state.materials = 40
+        self.loan_manager = LoanManager()
+        self.loan_manager.game_state = self.game_state
+        self.loan_manager.active_loans = [KtarDebt(30, 3)]
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+    
+    def test_candidates_evaluated_in_one_call(self):
+        """Aceptar, rechazar y pagar se evalúan juntos sin tocar el estado real"""
+        offer = self.loan_manager.offer_engine.build_offer('zorvax', 40)
+        loan = self.loan_manager.active_loans[0]
+        results = self.loan_manager.evaluate_what_if([
+            {'action': 'accept', 'offer': offer},
+            {'action': 'reject'},
+            {'action': 'pay', 'loan': loan, 'materials': loan.materials_owed}
+        ], num_futures=400, seed=2)
+        
+        accept, reject, pay = results
+        self.assertEqual((accept['oxygen'], accept['materials']), (80.0, 40))
+        self.assertEqual((reject['oxygen'], reject['materials']), (40.0, 40))
+        self.assertEqual(pay['materials'], 4)
+        self.assertEqual(pay['default_risk'], 0.0)
+        self.assertGreater(reject['default_risk'], 0.0)
+        for result in results:
+            self.assertTrue(0.0 <= result['game_over_risk'] <= 1.0)
+            self.assertTrue(0.0 <= result['victory_chance'] <= 1.0)
+        
+        # El estado real no cambia
+        self.assertEqual(self.game_state.oxygen, 40)
+        self.assertEqual(self.game_state.materials, 40)
+        self.assertEqual(loan.materials_owed, 36)
+        self.assertEqual(len(self.loan_manager.active_loans), 1)
+    
+    def test_defaults_to_pending_offer(self):
+        """Sin candidatos compara aceptar y rechazar la oferta pendiente"""
+        self.assertEqual(self.loan_manager.evaluate_what_if(), [])
+        self.loan_manager.pending_offer = self.loan_manager.offer_engine.build_offer('ktar', 25)
+        results = self.loan_manager.evaluate_what_if(num_futures=100, seed=0)
+        self.assertEqual([r['action'] for r in results], ['accept', 'reject'])
+        self.assertEqual(results, self.loan_manager.evaluate_what_if(num_futures=100, seed=0))
+
+
+class TestRiskForecaster(unittest.TestCase):
+    """Pruebas del servicio en segundo plano"""
+    
+    def test_result_arrives_through_event_queue(self):
+        """El resultado llega como evento al procesar la cola del EventManager"""
+        event_manager = EventManager()
+        received = []
+        event_manager.subscribe(EventType.RISK_FORECAST_UPDATED, received.append)
+        
+        forecaster = RiskForecaster(num_futures=200, horizon=5, seed=0)
+        forecaster.game_state = GameState()
+        forecaster.event_manager = event_manager
+        forecaster.start()
+        try:
+            forecaster.request_if_changed()
+            deadline = time.time() + 5.0
+            while not event_manager.event_queue and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            forecaster.stop()
+        
+        # Nada se entrega hasta que el hilo principal procesa la cola
+        self.assertEqual(received, [])
+        event_manager.process_queue()
+        self.assertEqual(len(received), 1)
+        self.assertEqual(received[0].data['horizon'], 5)
+        self.assertIs(forecaster.latest, received[0].data)
+    
+    def test_request_if_changed_uses_state_version(self):
+        """Sin cambios en GameState no se pide un nuevo pronóstico"""
+        forecaster = RiskForecaster(num_futures=200, horizon=5, seed=0)
+        forecaster.game_state = GameState()
+        
+        forecaster.request_if_changed()
+        self.assertIsNotNone(forecaster._pending)
+        forecaster._pending = None
+        
+        forecaster.request_if_changed()
+        self.assertIsNone(forecaster._pending)
+        
+        forecaster.game_state.update_oxygen(-5)
+        forecaster.request_if_changed()
+        self.assertIsNotNone(forecaster._pending)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Test Suite for Idle Frame Pacing
+Pruebas del reposo del bucle cuando nada se anima
+"""
+
+import unittest
+import logging
+import threading
+import time
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from engine.state import GameState
+from engine.events import EventManager, EventType, Event
+from engine.loop import GameLoop
+from ui.renderer import Renderer
+from ui.hud import HUD
+from ui.narrator import Narrator
+
+
+class TestIdlePacing(unittest.TestCase):
+    """Pruebas de detección de reposo y del despertar del bucle"""
+    
+    def setUp(self):
+        logging.disable(logging.INFO)
+        pygame.init()
+        screen = pygame.display.set_mode((320, 240))
+        
+        self.game_state = GameState()
+        self.game_state.current_phase = "main_game"
+        self.loop = GameLoop(self.game_state, EventManager())
+        self.loop.renderer = Renderer(320, 240)
+        self.loop.renderer.game_state = self.game_state
+        self.loop.hud = HUD(screen)
+        self.loop.narrator = Narrator(screen)
+    
+    def tearDown(self):
+        pygame.quit()
+        logging.disable(logging.NOTSET)
+    
+    def test_idle_only_when_nothing_animates(self):
+        """Notificaciones, texto escribiéndose o un prestamista entrando impiden el reposo"""
+        self.assertTrue(self.loop.is_idle())
+        
+        self.loop.hud.add_notification("Hola", duration=0.5)
+        self.assertFalse(self.loop.is_idle())
+        self.loop.update(1.0)
+        self.assertTrue(self.loop.is_idle())
+        
+        self.loop.narrator.show_narrative("Texto corto")
+        self.assertFalse(self.loop.is_idle())
+        self.loop.update(1.0)
+        self.assertTrue(self.loop.narrator.is_active)
+        self.assertTrue(self.loop.is_idle())
+        
+        self.loop.renderer.show_lender('zorvax')
+        self.assertFalse(self.loop.is_idle())
+        self.loop.update(0.6)
+        self.assertTrue(self.loop.is_idle())
+        
+        self.game_state.current_phase = "intro"
+        self.assertFalse(self.loop.is_idle())
+    
+    def test_idle_on_end_screen_after_victory(self):
+        """El despegue de victoria usa la tasa completa; la pantalla final reposa"""
+        self.game_state.current_phase = "end"
+        self.game_state.victory = True
+        self.assertTrue(self.loop.is_idle())
+        
+        renderer = self.loop.renderer
+        renderer.screen = pygame.display.get_surface()
+        renderer.start_victory_animation()
+        self.assertFalse(self.loop.is_idle())
+        
+        for _ in range(1000):
+            if renderer.victory_animation_complete:
+                break
+            renderer.render_victory_sequence()
+        self.assertTrue(renderer.victory_animation_complete)
+        renderer.render_victory_sequence()
+        self.assertTrue(self.loop.is_idle())
+    
+    def test_wait_is_bounded_by_idle_fps(self):
+        """Sin eventos la espera dura aproximadamente un frame de reposo"""
+        self.loop.idle_fps = 20
+        pygame.event.clear()
+        start = time.perf_counter()
+        self.loop._wait_for_activity()
+        elapsed = time.perf_counter() - start
+        self.assertTrue(0.03 <= elapsed < 0.5, elapsed)
+    
+    def test_input_wakes_and_is_not_lost(self):
+        """Una tecla despierta al bucle y llega a handle_events"""
+        self.loop.idle_fps = 1
+        pygame.event.clear()
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_ESCAPE))
+        start = time.perf_counter()
+        self.loop._wait_for_activity()
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertEqual(self.loop._woken_event.type, pygame.KEYDOWN)
+        self.loop.handle_events()
+        self.assertIsNone(self.loop._woken_event)
+    
+    def test_queued_event_from_thread_wakes(self):
+        """Un evento encolado desde otro hilo (p. ej. el consejero) corta la espera"""
+        self.loop.idle_fps = 1
+        pygame.event.clear()
+        timer = threading.Timer(0.1, self.loop.event_manager.queue_event,
+                                (Event(EventType.ADVICE_UPDATED, {}),))
+        start = time.perf_counter()
+        timer.start()
+        self.loop._wait_for_activity()
+        timer.join()
+        self.assertLess(time.perf_counter() - start, 0.8)
+        self.assertFalse(self.loop.is_idle())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Test Suite for Interest Models
+Pruebas de los modelos de interés en forma cerrada
+"""
+
+import unittest
+import logging
+import sys
+import os
+
+import numpy as np
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from finance.interest import (
+    SimpleInterest, CompoundInterest, LateExponentialInterest, NoInterest, create_interest_model
+)
+from finance.debt import ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt
+
+
+class TestClosedForms(unittest.TestCase):
+    """La forma cerrada coincide con aplicar el modelo turno a turno"""
+    
+    def _iterate(self, model, balance, base, turns, turns_until_due):
+        """Proyección turno a turno (referencia)"""
+        for _ in range(turns):
+            balance = model.balance_at(balance, base, 1, turns_until_due)
+            turns_until_due -= 1
+        return balance
+    
+    def test_closed_form_matches_iteration(self):
+        """Proyección a 1000 turnos igual que 1000 pasos de un turno"""
+        for model in (SimpleInterest(0.1), CompoundInterest(0.01), NoInterest()):
+            self.assertAlmostEqual(model.balance_at(80.0, 75, 1000, 10),
+                                   self._iterate(model, 80.0, 75, 1000, 10), delta=1e-6 * 80.0 * 1e5)
+        late = LateExponentialInterest(0.02)
+        expected = self._iterate(late, 55.0, 55, 30, 5)
+        self.assertAlmostEqual(late.balance_at(55.0, 55, 30, 5) / expected, 1.0, places=9)
+        
+        # Tras alcanzar el tipo máximo el crecimiento es compuesto y finito
+        self.assertLess(late.balance_at(55.0, 55, 1000, 5), float('inf'))
+    
+    def test_late_interest_only_after_due(self):
+        """El Consorcio no cobra interés mientras el préstamo está en plazo"""
+        late = LateExponentialInterest(0.02)
+        self.assertEqual(late.balance_at(55.0, 55, 4, 5), 55.0)
+        self.assertGreater(late.balance_at(55.0, 55, 5, 5), 55.0)
+        
+        # El tipo crece con cada turno de retraso
+        first = late.balance_at(100.0, 100, 1, 0) - 100.0
+        later = late.balance_at(100.0, 100, 1, -5) - 100.0
+        self.assertGreater(later, first)
+    
+    def test_zero_rate_late_interest_stays_flat(self):
+        """Un préstamo del Consorcio sin interés no crece aunque lleve mucho retraso"""
+        late = LateExponentialInterest(0.0)
+        for turns in (1, 10, 100, 1000):
+            self.assertEqual(late.balance_at(55.0, 55, turns, 5), 55.0)
+        self.assertEqual(late.balance_at(55.0, 55, 1, -500), 55.0)
+        
+        # En un array, los préstamos sin interés no afectan a los demás
+        balances = LateExponentialInterest.closed_form(
+            np.array([55.0, 55.0]), 55, 200, 5, np.array([0.0, 0.02]))
+        self.assertEqual(balances[0], 55.0)
+        self.assertGreater(balances[1], 55.0)
+        
+        loan = NebulaConsortiumDebt(50, turn_rate=0.0)
+        owed = loan.materials_owed
+        for _ in range(150):
+            loan.advance_turn()
+        self.assertEqual(loan.materials_owed, owed)
+    
+    def test_simple_interest_on_original_debt(self):
+        """El interés simple no depende del saldo actual"""
+        model = SimpleInterest(0.1)
+        self.assertAlmostEqual(model.balance_at(10.0, 60, 3, 5), 28.0)
+    
+    def test_creditor_models(self):
+        """Cada acreedor usa su modelo y su tipo por defecto"""
+        self.assertIsInstance(create_interest_model('zorvax'), CompoundInterest)
+        self.assertEqual(create_interest_model('zorvax', 0.07).rate, 0.07)
+        self.assertIsInstance(create_interest_model('desconocido'), NoInterest)
+
+
+class TestDebtInterest(unittest.TestCase):
+    """Pruebas del interés aplicado a las deudas"""
+    
+    def setUp(self):
+        logging.disable(logging.WARNING)
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+    
+    def test_projection_matches_turns(self):
+        """project_balance(n) predice los materiales tras n turnos sin pagos"""
+        for debt_class in (ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt):
+            debt = debt_class(40, turns=4)
+            projected = debt.project_balance(12)
+            for _ in range(12):
+                debt.advance_turn()
+            self.assertAlmostEqual(debt.materials_owed + debt.accrued_interest, projected, places=6)
+    
+    def test_compound_growth(self):
+        """Zorvax compone el 5% por turno sobre el saldo"""
+        debt = ZorvaxDebt(50)
+        self.assertAlmostEqual(debt.calculate_interest(), 75 * 0.05)
+        debt.advance_turn()
+        self.assertEqual(debt.materials_owed, 78)
+        self.assertAlmostEqual(debt.accrued_interest, 0.75)
+    
+    def test_custom_turn_rate(self):
+        """El tipo por turno se puede fijar al crear el préstamo"""
+        debt = KtarDebt(50, turn_rate=0.0)
+        debt.advance_turn()
+        self.assertEqual(debt.materials_owed, 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
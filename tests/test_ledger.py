@@ -0,0 +1,117 @@
+"""
+Test Suite for Loan Ledger
+Pruebas del libro mayor de préstamos y su exportación a SQLite
+"""
+
+import unittest
+import tempfile
+import logging
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from finance.ledger import (LoanLedger, query_database, summarize_database,
+                            OFFER, ACCEPTANCE, PAYMENT, PENALTY, DEFAULT)
+from finance.loan_manager import LoanManager
+
+
+class _State:
+    """Estado mínimo del jugador para LoanManager"""
+    
+    def __init__(self):
+        self.oxygen = 10.0
+        self.max_oxygen = 100.0
+        self.materials = 200
+        self.repair_progress = 50.0
+        self.turn_number = 1
+    
+    def update_oxygen(self, amount):
+        self.oxygen += amount
+    
+    def consume_materials(self, amount):
+        self.materials -= amount
+    
+    def mark_changed(self, *groups):
+        pass
+    
+    def update_repair_progress(self, amount):
+        self.repair_progress += amount
+
+
+class TestLoanLedger(unittest.TestCase):
+    """Pruebas de LoanLedger"""
+    
+    def setUp(self):
+        logging.disable(logging.WARNING)
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'ledger.db')
+    
+    def tearDown(self):
+        self.tmpdir.cleanup()
+        logging.disable(logging.NOTSET)
+    
+    def test_indexed_queries(self):
+        """Los índices por acreedor, tipo y turno combinan filtros"""
+        ledger = LoanLedger()
+        ledger.record(OFFER, 1, 'zorvax', oxygen=40)
+        ledger.record(ACCEPTANCE, 1, 'zorvax', loan_id=1, oxygen=40, materials=60)
+        ledger.record(PAYMENT, 2, 'zorvax', loan_id=1, materials=10)
+        ledger.record(PAYMENT, 2, 'ktar', loan_id=2, materials=5)
+        
+        self.assertEqual([e.kind for e in ledger.query(creditor='zorvax')],
+                         [OFFER, ACCEPTANCE, PAYMENT])
+        self.assertEqual([e.creditor for e in ledger.query(kind=PAYMENT, turn=2)], ['zorvax', 'ktar'])
+        self.assertEqual(ledger.query(creditor='ktar', turn=1), [])
+        self.assertEqual(len(ledger.query(loan_id=1)), 2)
+        self.assertEqual(ledger.get_totals_by_creditor()['zorvax'],
+                         {'borrowed': 40.0, 'paid': 10, 'penalties': 0, 'defaults': 0})
+        with self.assertRaises(ValueError):
+            ledger.record('bogus', 1)
+    
+    def test_batched_sqlite_writes(self):
+        """Solo se escribe en SQLite al llenarse el lote o al cerrar"""
+        ledger = LoanLedger(self.db_path, player='ana', batch_size=3)
+        ledger.record(OFFER, 1, 'ktar', oxygen=25)
+        ledger.record(ACCEPTANCE, 1, 'ktar', loan_id=1, oxygen=25, materials=30, turns=5)
+        self.assertFalse(os.path.exists(self.db_path))
+        ledger.record(PAYMENT, 2, 'ktar', loan_id=1, materials=30, paid_off=True)
+        self.assertEqual(len(query_database(self.db_path)), 3)
+        ledger.record(OFFER, 3, 'zorvax', oxygen=30)
+        ledger.close()
+        
+        rows = query_database(self.db_path, creditor='ktar', kind=ACCEPTANCE)
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['player'], 'ana')
+        self.assertEqual(rows[0]['data'], {'turns': 5})
+        self.assertEqual(len(query_database(self.db_path, player='ana')), 4)
+    
+    def test_loan_manager_records_history(self):
+        """LoanManager registra oferta, aceptación, pago, default y penalización"""
+        manager = LoanManager({'ledger': {'db_path': self.db_path, 'player': 'luis'}})
+        manager.game_state = _State()
+        manager.check_loan_appearance()
+        manager.accept_pending_offer()
+        loan = manager.active_loans[0]
+        manager.make_payment(loan, 5)
+        loan.turns_until_due = 1
+        manager.game_state.turn_number = 2
+        manager.process_turn()
+        manager.process_turn()
+        manager.ledger.close()
+        
+        kinds = [entry.kind for entry in manager.ledger.entries]
+        self.assertEqual(kinds, [OFFER, ACCEPTANCE, PAYMENT, DEFAULT, PENALTY, PENALTY])
+        self.assertTrue(all(e.loan_id == 1 for e in manager.ledger.entries[1:]))
+        
+        summary = summarize_database(self.db_path)
+        self.assertEqual(len(summary), 1)
+        self.assertEqual(summary[0]['player'], 'luis')
+        self.assertEqual(summary[0]['creditor'], 'zorvax')
+        self.assertEqual((summary[0]['loans'], summary[0]['paid'], summary[0]['penalties'],
+                          summary[0]['defaults']), (1, 5, 2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
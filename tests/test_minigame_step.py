@@ -0,0 +1,132 @@
+"""
+Test Suite for Minigame Stepping
+Pruebas de la interfaz step() de los minijuegos en modo headless (sin ventana)
+"""
+
+import unittest
+import random
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gameplay.minigames import (
+    MiningMinigame, AsteroidShooterMinigame, TimingMinigame,
+    WiringMinigame, OxygenRescueMinigame
+)
+
+
+DT = 1 / 60
+
+
+class TestHeadlessConstruction(unittest.TestCase):
+    """Pruebas de creación sin ventana"""
+
+    def test_all_minigames_build_headless(self):
+        """Los cinco minijuegos se crean sin fuentes ni superficie"""
+        for minigame_class in (MiningMinigame, AsteroidShooterMinigame, TimingMinigame,
+                               WiringMinigame, OxygenRescueMinigame):
+            minigame = minigame_class(headless=True)
+            self.assertIsNone(minigame.surface)
+            self.assertIsNone(minigame.font_normal)
+            observation = minigame.step(DT)
+            self.assertFalse(observation['is_complete'])
+
+    def test_quit_action_fails_minigame(self):
+        """La acción 'quit' termina el minijuego como fallo"""
+        minigame = TimingMinigame(headless=True)
+        observation = minigame.step(DT, [{'type': 'quit'}])
+        self.assertTrue(observation['is_complete'])
+        self.assertFalse(observation['success'])
+
+
+class TestMinigameStep(unittest.TestCase):
+    """Pruebas de simulación paso a paso"""
+
+    def setUp(self):
+        """Semilla fija para resultados reproducibles"""
+        random.seed(1234)
+
+    def test_timer_runs_out(self):
+        """Sin acciones, el tiempo se agota y el minijuego falla"""
+        minigame = AsteroidShooterMinigame(headless=True)
+        observation = minigame.get_observation()
+        steps = 0
+        while not observation['is_complete']:
+            observation = minigame.step(DT)
+            steps += 1
+        self.assertFalse(observation['success'])
+        self.assertAlmostEqual(steps * DT, 30.0, delta=DT * 2)
+
+    def test_timing_perfect_hits(self):
+        """Pulsar cuando el indicador está en el centro completa las 3 barras"""
+        minigame = TimingMinigame(headless=True)
+        observation = minigame.get_observation()
+        for _ in range(10000):
+            if observation['is_complete']:
+                break
+            bar = observation['current_bar']
+            actions = []
+            if abs(bar['indicator_x'] - bar['target_x']) <= bar['perfect_width'] / 4:
+                actions.append({'type': 'press'})
+            observation = minigame.step(DT, actions)
+        self.assertTrue(observation['success'])
+        self.assertEqual(minigame.perfect_hits, 3)
+        self.assertGreater(observation['reward_repair'], 0)
+
+    def test_wiring_drag_to_targets(self):
+        """Arrastrar cada cable a su conector resuelve el puzzle"""
+        minigame = WiringMinigame(headless=True)
+        observation = minigame.get_observation()
+        actions = [{'type': 'drag', 'from': wire['start'], 'to': wire['target']}
+                   for wire in observation['wires']]
+        observation = minigame.step(DT, actions)
+        self.assertTrue(observation['is_complete'])
+        self.assertTrue(observation['success'])
+        self.assertEqual(observation['connected'], observation['num_wires'])
+
+    def test_wiring_wrong_connector(self):
+        """Soltar un cable en otro conector no cuenta como conectado"""
+        minigame = WiringMinigame(headless=True)
+        wires = minigame.get_observation()['wires']
+        wrong_target = next(wire['target'] for wire in wires[1:]
+                            if wire['target'] != wires[0]['target'])
+        observation = minigame.step(DT, [{'type': 'drag', 'from': wires[0]['start'],
+                                          'to': wrong_target}])
+        self.assertEqual(observation['connected'], 0)
+        self.assertEqual(observation['wires'][0]['end'], wrong_target)
+
+    def test_mining_clicks_collect(self):
+        """Hacer clic en minerales visibles suma materiales"""
+        minigame = MiningMinigame(headless=True)
+        observation = minigame.get_observation()
+        while not observation['is_complete']:
+            actions = [{'type': 'click', 'pos': mineral['pos']}
+                       for mineral in observation['minerals'] if mineral['clickable']]
+            observation = minigame.step(DT, actions)
+        self.assertGreater(observation['materials_collected'], 0)
+        self.assertEqual(observation['reward_materials'], observation['materials_collected'])
+
+    def test_oxygen_rescue_move_and_shoot(self):
+        """El jugador se mueve con 'move' y derrota enemigos disparando"""
+        minigame = OxygenRescueMinigame(headless=True)
+        start_x = minigame.player.x
+        minigame.step(0.5, [{'type': 'move', 'direction': (-1, 0)}])
+        self.assertLess(minigame.player.x, start_x)
+
+        observation = minigame.step(DT, [{'type': 'move', 'direction': (0, 0)}])
+        for _ in range(60 * 120):
+            if observation['is_complete']:
+                break
+            actions = []
+            ready = [enemy for enemy in observation['enemies'] if not enemy['entering']]
+            if ready:
+                actions.append({'type': 'click', 'pos': ready[0]['pos']})
+            observation = minigame.step(DT, actions)
+        self.assertTrue(observation['is_complete'])
+        self.assertGreater(observation['score'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+Test Suite for Lender Offers
+Pruebas del motor de ofertas compilado desde config.json
+"""
+
+import unittest
+import random
+import logging
+import json
+import sys
+import os
+
+import numpy as np
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from finance.offers import LenderOfferEngine
+from finance.loan_manager import LoanManager
+from finance.portfolio import CREDITOR_CODES
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'config.json')
+
+
+class _State:
+    """Estado mínimo del jugador para LoanManager"""
+    
+    def __init__(self, oxygen):
+        self.oxygen = oxygen
+        self.turn_number = 1
+    
+    def update_oxygen(self, amount):
+        self.oxygen += amount
+    
+    def mark_changed(self, *groups):
+        pass
+
+
+class TestLenderOfferEngine(unittest.TestCase):
+    """Pruebas de LenderOfferEngine"""
+    
+    def setUp(self):
+        logging.disable(logging.INFO)
+        with open(CONFIG_PATH, 'r', encoding='utf-8') as f:
+            self.config = json.load(f)
+        self.engine = LenderOfferEngine(self.config)
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+    
+    def test_config_compiled_into_tables(self):
+        """Nombres, plazos y tipos por turno vienen de config.creditors"""
+        for key, section in self.config['creditors'].items():
+            terms = self.engine.get_creditor(key)
+            self.assertEqual(terms.name, section['name'])
+            self.assertEqual(terms.terms, section['default_terms'])
+            self.assertEqual(terms.turn_rate, section['base_interest_rate'])
+            self.assertEqual(terms.interest_rate, terms.debt_class(20).interest_rate)
+        with self.assertRaises(TypeError):
+            self.engine.creditors['zorvax'] = None
+    
+    def test_oxygen_bands(self):
+        """Los tramos reproducen las reglas originales de aparición"""
+        rng = random.Random(3)
+        for _ in range(200):
+            offer = self.engine.sample_offer(19.9, rng)
+            self.assertEqual(offer['creditor_type'], 'zorvax')
+            self.assertTrue(30 <= offer['amount'] <= 50)
+            self.assertEqual(offer['materials_to_pay'], int(offer['amount'] * 1.5))
+        self.assertEqual(self.engine.get_band(20).appearance_chance, 0.5)
+        self.assertEqual(self.engine.get_band(50).appearance_chance, 0.2)
+        offers = [self.engine.sample_offer(80, rng) for _ in range(2000)]
+        appeared = [offer for offer in offers if offer]
+        self.assertAlmostEqual(len(appeared) / len(offers), 0.2, delta=0.04)
+        self.assertEqual({offer['creditor_type'] for offer in appeared}, {'zorvax', 'ktar'})
+    
+    def test_custom_weights(self):
+        """Los pesos de la configuración determinan el acreedor"""
+        config = {'loan_offers': {'bands': [
+            {'max_oxygen': None, 'appearance_chance': 1.0,
+             'creditors': {'nebula': 3, 'ktar': 1}, 'amount': [10, 10]}]}}
+        engine = LenderOfferEngine(config)
+        rng = random.Random(5)
+        offers = [engine.sample_offer(60, rng)['creditor_type'] for _ in range(4000)]
+        self.assertAlmostEqual(offers.count('nebula') / len(offers), 0.75, delta=0.03)
+        with self.assertRaises(ValueError):
+            LenderOfferEngine({'loan_offers': {'bands': [
+                {'appearance_chance': 1.0, 'creditors': {'bogus': 1}, 'amount': [1, 2]}]}})
+    
+    def test_batch_offers(self):
+        """Los lotes usan las mismas tablas que sample_offer"""
+        oxygen = np.array([5.0, 30.0, 90.0] * 1000)
+        batch = self.engine.sample_offers_batch(oxygen, np.random.default_rng(1))
+        critical = oxygen < 20
+        self.assertTrue(batch['appeared'][critical].all())
+        self.assertTrue((batch['creditor'][critical] == CREDITOR_CODES['zorvax']).all())
+        self.assertTrue(((batch['amount'] >= 20) & (batch['amount'] <= 50)).all())
+        self.assertAlmostEqual(batch['appeared'][oxygen > 50].mean(), 0.2, delta=0.05)
+        zorvax = batch['creditor'] == CREDITOR_CODES['zorvax']
+        self.assertTrue((batch['materials_to_pay'][zorvax] ==
+                         (batch['amount'][zorvax] * 1.5).astype(int)).all())
+        self.assertTrue((batch['turns'][zorvax] == 10).all())
+    
+    def test_loan_manager_uses_config(self):
+        """LoanManager crea préstamos con el tipo por turno de la configuración"""
+        config = dict(self.config, creditors={'zorvax': {'base_interest_rate': 0.08}})
+        manager = LoanManager(config)
+        manager.game_state = _State(10)
+        offer = manager.check_loan_appearance()
+        self.assertEqual(offer['creditor_type'], 'zorvax')
+        self.assertTrue(manager.accept_pending_offer())
+        self.assertEqual(manager.active_loans[0].turn_rate, 0.08)
+        self.assertEqual(manager.max_loans, self.config['gameplay']['max_active_loans'])
+
+
+if __name__ == '__main__':
+    unittest.main()
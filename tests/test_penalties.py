@@ -0,0 +1,54 @@
+"""
+Test Suite for Creditor Penalties
+Pruebas de la tabla de penalizaciones compartida por los backends de finance
+"""
+
+import unittest
+import sys
+import os
+
+import numpy as np
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from finance.debt import ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt
+from finance.penalties import CREDITOR_PENALTIES
+
+
+class TestCreditorPenalties(unittest.TestCase):
+    """Pruebas de finance.penalties"""
+    
+    def test_debt_uses_table(self):
+        """Debt.apply_penalty devuelve la penalización de la tabla"""
+        for cls in (ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt):
+            loan = cls(40)
+            self.assertEqual(loan.apply_penalty(), {})
+            loan.is_defaulted = True
+            expected = CREDITOR_PENALTIES[cls.CREDITOR_TYPE].describe(loan.materials_owed, loan.principal)
+            self.assertEqual(loan.apply_penalty(), expected)
+    
+    def test_known_values(self):
+        """Cantidades y mensajes de cada acreedor"""
+        zorvax = CREDITOR_PENALTIES['zorvax'].describe(25, 20)
+        self.assertEqual(zorvax['materials_lost'], 3)
+        self.assertEqual(zorvax['message'], "Zorvax se lleva 3 materiales como penalización")
+        self.assertEqual(CREDITOR_PENALTIES['zorvax'].describe(75, 50)['materials_lost'], 7)
+        self.assertAlmostEqual(CREDITOR_PENALTIES['ktar'].describe(60, 30)['oxygen_lost'], 6.0)
+        self.assertEqual(CREDITOR_PENALTIES['ktar'].describe(120, 100)['oxygen_lost'], 10)
+        self.assertAlmostEqual(CREDITOR_PENALTIES['nebula'].describe(55, 50)['repair_lost'], 5.0)
+        self.assertNotIn('repair_lost', CREDITOR_PENALTIES['friendly'].describe(21, 20))
+    
+    def test_scalar_matches_array(self):
+        """La misma fórmula da lo mismo con escalares y con arrays"""
+        owed = np.array([0, 9, 30, 31, 250])
+        principal = np.array([5.0, 20.0, 49.0, 50.0, 200.0])
+        for key, penalty in CREDITOR_PENALTIES.items():
+            vector = penalty.amount(owed, principal, np.maximum, np.minimum)
+            for i in range(len(owed)):
+                scalar = penalty.amount(int(owed[i]), float(principal[i]))
+                self.assertAlmostEqual(float(np.broadcast_to(vector, owed.shape)[i]), scalar, msg=key)
+
+
+if __name__ == '__main__':
+    unittest.main()
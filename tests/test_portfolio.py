@@ -0,0 +1,131 @@
+"""
+Test Suite for Loan Portfolio
+Pruebas de la cartera vectorizada frente a las clases Debt
+"""
+
+import unittest
+import random
+import logging
+import sys
+import os
+
+import numpy as np
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from finance.debt import ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt
+from finance.portfolio import LoanPortfolio, CREDITOR_TABLE, ZORVAX, KTAR, NEBULA, FRIENDLY
+
+
+def _loan_state(debt):
+    """Estado de un Debt con las mismas claves que get_loan_state"""
+    return {
+        'principal': debt.principal,
+        'interest_rate': debt.interest_rate,
+        'current_balance': debt.current_balance,
+        'materials_owed': debt.materials_owed,
+        'turns_until_due': debt.turns_until_due,
+        'is_defaulted': debt.is_defaulted,
+        'turn_rate': debt.turn_rate,
+        'accrued_interest': debt.accrued_interest,
+        'base_materials': debt.base_materials
+    }
+
+
+class TestLoanPortfolio(unittest.TestCase):
+    """Pruebas de equivalencia con finance.debt"""
+    
+    def setUp(self):
+        """Silenciar los logs de cada préstamo creado"""
+        logging.disable(logging.INFO)
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+    
+    def test_creditor_table_matches_classes(self):
+        """Intereses y plazos coinciden con los constructores de Debt"""
+        for _, debt_class, rate, turns in CREDITOR_TABLE:
+            debt = debt_class(20)
+            self.assertEqual(debt.interest_rate, rate)
+            self.assertEqual(debt.turns_until_due, turns)
+    
+    def test_new_loans_match_debt(self):
+        """Materiales adeudados y límite del aliado idénticos a Debt"""
+        portfolio = LoanPortfolio(1)
+        principals = [37, 50, 41, 45]
+        rows = portfolio.add_loans([0] * 4, [ZORVAX, KTAR, NEBULA, FRIENDLY], principals)
+        debts = [ZorvaxDebt(37), KtarDebt(50), NebulaConsortiumDebt(41), FriendlyDebt(45)]
+        for row, debt in zip(rows, debts):
+            state = portfolio.get_loan_state(row)
+            del state['creditor']
+            self.assertEqual(state, _loan_state(debt))
+    
+    def test_random_turns_match_debt(self):
+        """Pagos, turnos, defaults y penalizaciones idénticos en partidas aleatorias"""
+        rng = random.Random(7)
+        classes = [ZorvaxDebt, KtarDebt, NebulaConsortiumDebt, FriendlyDebt]
+        debts_by_player = [[rng.choice(classes)(rng.randint(10, 60), rng.randint(1, 8))
+                            for _ in range(rng.randint(0, 3))]
+                           for _ in range(50)]
+        portfolio = LoanPortfolio.from_debts(debts_by_player)
+        debts = [debt for loans in debts_by_player for debt in loans]
+        active = [True] * len(debts)
+        
+        for _ in range(12):
+            # Pagos aleatorios
+            rows, amounts = [], []
+            for row, debt in enumerate(debts):
+                if active[row] and rng.random() < 0.3:
+                    rows.append(row)
+                    amounts.append(rng.randint(0, 25))
+            paid_off = portfolio.make_payments(rows, amounts)
+            for row, amount, done in zip(rows, amounts, paid_off):
+                self.assertEqual(debts[row].make_payment(amount), done)
+                if done:
+                    active[row] = False
+            
+            # Avance de turno como en LoanManager.process_turn
+            penalties = portfolio.advance_turn()
+            expected_defaulted = []
+            for row, debt in enumerate(debts):
+                if not active[row]:
+                    continue
+                debt.advance_turn()
+                penalty = debt.apply_penalty()
+                if debt.is_defaulted:
+                    expected_defaulted.append(row)
+                self.assertEqual(penalties['materials_lost'][row], penalty.get('materials_lost', 0))
+                self.assertEqual(penalties['oxygen_lost'][row], penalty.get('oxygen_lost', 0))
+                self.assertEqual(penalties['repair_lost'][row], penalty.get('repair_lost', 0))
+            self.assertEqual(list(penalties['defaulted']), expected_defaulted)
+            
+            for row, debt in enumerate(debts):
+                state = portfolio.get_loan_state(row)
+                del state['creditor']
+                self.assertEqual(state, _loan_state(debt))
+                if active[row]:
+                    self.assertEqual(portfolio.get_minimum_payments()[row], debt.get_minimum_payment())
+        
+        expected_totals = [sum(debt.materials_owed for debt in loans if debt.materials_owed > 0)
+                           for loans in debts_by_player]
+        self.assertEqual(list(portfolio.get_total_debt()), expected_totals)
+    
+    def test_apply_penalties_clamps_player_state(self):
+        """Las penalizaciones no dejan materiales ni reparación en negativo"""
+        portfolio = LoanPortfolio(2)
+        portfolio.add_loans([0, 0, 1], [ZORVAX, ZORVAX, NEBULA], [50, 50, 50], [1, 1, 1])
+        penalties = portfolio.advance_turn()
+        
+        materials = np.array([5, 5])
+        max_oxygen = np.array([100.0, 100.0])
+        oxygen = np.array([80.0, 80.0])
+        repair = np.array([20.0, 3.0])
+        portfolio.apply_penalties(penalties, materials, max_oxygen, oxygen, repair)
+        
+        self.assertEqual(list(materials), [0, 5])
+        self.assertEqual(list(repair), [20.0, 0.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,9 +7,23 @@ import unittest
 import sys
 import os
 
+import numpy as np
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from gameplay.resources import ResourceManager, ResourceType, Resource
+from gameplay.resources import ResourceInventory, RESOURCE_INDEX
+from engine.state import GameState
+
+
+class RecordingEvents:
+    """EventManager mínimo que registra las emisiones"""
+    
+    def __init__(self):
+        self.emitted = []
+    
+    def emit_quick(self, event_type, data=None, source=None):
+        self.emitted.append((event_type, data))
 
 
 class TestResource(unittest.TestCase):
@@ -17,39 +31,34 @@ class TestResource(unittest.TestCase):
     
     def setUp(self):
         """Configuración antes de cada prueba"""
-        # TODO: Crear recursos de prueba
-        pass
+        self.resource = Resource(ResourceType.METAL, amount=10, max_storage=50, value=1.0)
     
     def test_resource_creation(self):
         """Prueba creación de recurso"""
-        # TODO: Crear Resource
-        # TODO: Verificar atributos iniciales
-        pass
+        self.assertEqual(self.resource.resource_type, ResourceType.METAL)
+        self.assertEqual(self.resource.amount, 10)
+        self.assertEqual(self.resource.max_storage, 50)
     
     def test_add_resource_within_limit(self):
         """Prueba añadir recursos dentro del límite"""
-        # TODO: Añadir recursos
-        # TODO: Verificar cantidad actualizada
-        pass
+        self.assertEqual(self.resource.add(15), 15)
+        self.assertEqual(self.resource.amount, 25)
     
     def test_add_resource_exceeds_limit(self):
         """Prueba añadir recursos que exceden el límite"""
-        # TODO: Intentar añadir más del max_storage
-        # TODO: Verificar que se limita correctamente
-        pass
+        self.assertEqual(self.resource.add(100), 40)
+        self.assertEqual(self.resource.amount, 50)
     
     def test_consume_resource_sufficient(self):
         """Prueba consumir recursos cuando hay suficientes"""
-        # TODO: Añadir recursos
-        # TODO: Consumir recursos
-        # TODO: Verificar éxito y cantidad actualizada
-        pass
+        self.resource.add(5)
+        self.assertTrue(self.resource.consume(12))
+        self.assertEqual(self.resource.amount, 3)
     
     def test_consume_resource_insufficient(self):
         """Prueba consumir recursos cuando no hay suficientes"""
-        # TODO: Intentar consumir más de lo disponible
-        # TODO: Verificar que falla
-        pass
+        self.assertFalse(self.resource.consume(11))
+        self.assertEqual(self.resource.amount, 10)
 
 
 class TestResourceManager(unittest.TestCase):
@@ -57,57 +66,117 @@ class TestResourceManager(unittest.TestCase):
     
     def setUp(self):
         """Configuración antes de cada prueba"""
-        # TODO: Crear instancia de ResourceManager
-        pass
+        self.events = RecordingEvents()
+        self.manager = ResourceManager()
+        self.manager.event_manager = self.events
+        self.manager.game_state = GameState()
     
     def test_resource_manager_initialization(self):
         """Prueba inicialización del gestor"""
-        # TODO: Verificar que todos los recursos están inicializados
-        pass
+        summary = self.manager.get_summary()['resources']
+        self.assertEqual(set(summary), {resource_type.value for resource_type in ResourceType})
+        self.assertEqual(self.manager.get_resource_amount(ResourceType.METAL), 10)
+        self.assertEqual(self.manager.get_resource(ResourceType.SCRAP).max_storage, 150)
     
     def test_collect_resource(self):
         """Prueba recolección de recursos"""
-        # TODO: Recolectar recurso
-        # TODO: Verificar cantidad actualizada
-        pass
+        self.assertEqual(self.manager.collect_resource(ResourceType.FUEL, 30), 30)
+        self.assertEqual(self.manager.get_resource_amount(ResourceType.FUEL), 30)
+        self.assertEqual(self.manager.collect_resource(ResourceType.FUEL, 100), 45)
     
     def test_consume_resource(self):
         """Prueba consumo de recursos"""
-        # TODO: Añadir recursos
-        # TODO: Consumir recursos
-        # TODO: Verificar cantidad actualizada
-        pass
+        self.manager.collect_resource(ResourceType.CIRCUITS, 10)
+        self.assertTrue(self.manager.consume_resource(ResourceType.CIRCUITS, 12))
+        self.assertEqual(self.manager.get_resource_amount(ResourceType.CIRCUITS), 3)
     
     def test_has_resources_true(self):
         """Prueba verificación de recursos suficientes"""
-        # TODO: Añadir recursos
-        # TODO: Verificar has_resources devuelve True
-        pass
+        self.manager.collect_resource(ResourceType.FUEL, 5)
+        self.assertTrue(self.manager.has_resources({ResourceType.METAL: 10, ResourceType.FUEL: 5}))
     
     def test_has_resources_false(self):
         """Prueba verificación de recursos insuficientes"""
-        # TODO: Verificar has_resources devuelve False cuando no hay suficientes
-        pass
+        self.assertFalse(self.manager.has_resources({ResourceType.METAL: 5, ResourceType.RARE_MINERALS: 1}))
     
     def test_consume_multiple_resources(self):
         """Prueba consumo de múltiples tipos de recursos"""
-        # TODO: Añadir varios tipos de recursos
-        # TODO: Consumir varios tipos
-        # TODO: Verificar éxito y cantidades actualizadas
-        pass
+        self.manager.collect_resources({ResourceType.FUEL: 20, ResourceType.RARE_MINERALS: 4})
+        self.events.emitted.clear()
+        
+        self.assertTrue(self.manager.consume_resources(
+            {ResourceType.FUEL: 15, ResourceType.RARE_MINERALS: 4, ResourceType.SCRAP: 5}))
+        self.assertEqual(self.manager.get_resource_amount(ResourceType.FUEL), 5)
+        self.assertEqual(self.manager.get_resource_amount(ResourceType.RARE_MINERALS), 0)
+        self.assertEqual(self.manager.get_resource_amount(ResourceType.SCRAP), 10)
+        self.assertEqual(len(self.events.emitted), 1)
+        
+        # Todo o nada: si falta uno, no se consume ninguno
+        self.assertFalse(self.manager.consume_resources({ResourceType.FUEL: 1, ResourceType.CIRCUITS: 99}))
+        self.assertEqual(self.manager.get_resource_amount(ResourceType.FUEL), 5)
+        self.assertEqual(len(self.events.emitted), 1)
     
     def test_upgrade_storage(self):
         """Prueba mejora de capacidad de almacenamiento"""
-        # TODO: Mejorar storage de un recurso
-        # TODO: Verificar max_storage actualizado
-        pass
+        self.assertEqual(self.manager.upgrade_storage(ResourceType.RARE_MINERALS, 20), 50)
+        self.assertEqual(self.manager.collect_resource(ResourceType.RARE_MINERALS, 60), 50)
     
     def test_trade_resources(self):
         """Prueba intercambio de recursos"""
-        # TODO: Añadir recursos a dar
-        # TODO: Ejecutar trade
-        # TODO: Verificar recursos dados y recibidos
-        pass
+        # 10 metal (10.0) + 4 chatarra (2.0) = 12.0 -> 4 bombonas de oxígeno (3.0)
+        received = self.manager.trade_resources({ResourceType.METAL: 10, ResourceType.SCRAP: 4},
+                                                ResourceType.OXYGEN_CANISTER)
+        self.assertEqual(received, 4)
+        self.assertEqual(self.manager.get_resource_amount(ResourceType.METAL), 0)
+        self.assertEqual(self.manager.get_resource_amount(ResourceType.OXYGEN_CANISTER), 6)
+        
+        # Sin recursos suficientes no se intercambia nada
+        self.assertEqual(self.manager.trade_resources({ResourceType.METAL: 1}, ResourceType.FUEL), 0)
+
+
+class TestResourceBatches(unittest.TestCase):
+    """Pruebas de lotes vectorizados y conversión a materiales"""
+    
+    def setUp(self):
+        """Configuración antes de cada prueba"""
+        self.events = RecordingEvents()
+        self.game_state = GameState()
+        self.manager = ResourceManager({'resources': {'scrap': {'max_storage': 20, 'initial_amount': 0}}})
+        self.manager.event_manager = self.events
+        self.manager.game_state = self.game_state
+    
+    def test_batch_clamps_each_resource_with_single_event(self):
+        """Un lote se recorta por capacidad de cada recurso y emite un solo evento"""
+        gained = self.manager.collect_resources({ResourceType.METAL: 200, ResourceType.SCRAP: 25,
+                                                 ResourceType.FUEL: 3})
+        self.assertEqual(gained, {ResourceType.METAL: 90, ResourceType.FUEL: 3, ResourceType.SCRAP: 20})
+        self.assertEqual(len(self.events.emitted), 1)
+        self.assertEqual(self.events.emitted[0][1]['resources']['scrap'], 20)
+    
+    def test_vector_batch_matches_mapping(self):
+        """Un vector de índice fijo equivale al diccionario"""
+        vector = np.zeros(len(RESOURCE_INDEX), dtype=np.int64)
+        vector[RESOURCE_INDEX[ResourceType.CIRCUITS]] = 7
+        self.assertEqual(ResourceInventory.to_dict(ResourceInventory.to_vector(vector)),
+                         {ResourceType.CIRCUITS: 7})
+    
+    def test_convert_to_materials_uses_value_weights(self):
+        """La conversión a materiales genéricos usa los valores de config"""
+        self.manager.collect_resource(ResourceType.RARE_MINERALS, 3)
+        before = self.game_state.materials
+        materials = self.manager.convert_to_materials({ResourceType.RARE_MINERALS: 3, ResourceType.CIRCUITS: 5},
+                                                      "loan_payment")
+        self.assertEqual(materials, 25)
+        self.assertEqual(self.game_state.materials, before + 25)
+        self.assertEqual(self.manager.get_resource_amount(ResourceType.CIRCUITS), 0)
+    
+    def test_reset_restores_initial_inventory(self):
+        """reset vuelve a las cantidades y capacidades iniciales"""
+        self.manager.upgrade_storage(ResourceType.METAL, 50)
+        self.manager.collect_resource(ResourceType.METAL, 120)
+        self.manager.reset()
+        self.assertEqual(self.manager.get_resource(ResourceType.METAL),
+                         Resource(ResourceType.METAL, 10, 100, 1.0))
 
 
 if __name__ == '__main__':
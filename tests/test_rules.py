@@ -0,0 +1,197 @@
+"""
+Test Suite for Rules Module
+Pruebas del núcleo puro de reglas y su equivalencia con GameState/LoanManager
+"""
+
+import unittest
+import random
+import sys
+import os
+import time
+import subprocess
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from engine import rules
+from engine.rules import Action, RulesState, transition
+from engine.state import GameState
+from finance.loan_manager import LoanManager
+from finance.loan_step import LoanState
+
+
+class TestTransitions(unittest.TestCase):
+    """Pruebas de cada acción"""
+    
+    def setUp(self):
+        """Configuración antes de cada prueba"""
+        self.state = RulesState(oxygen=50.0, materials=20)
+        self.rng = random.Random(0)
+    
+    def test_transition_does_not_modify_state(self):
+        """El estado original no cambia"""
+        new_state = transition(self.state, Action(rules.MINE, outcome=4), self.rng)
+        self.assertEqual(self.state.oxygen, 50.0)
+        self.assertEqual(new_state.materials, 24)
+        self.assertTrue(35 <= new_state.oxygen <= 38)
+    
+    def test_mine_requires_oxygen(self):
+        """Sin oxígeno suficiente la acción no hace nada"""
+        state = self.state._replace(oxygen=11.0)
+        self.assertIs(transition(state, Action(rules.MINE), self.rng), state)
+    
+    def test_action_costs_come_from_state(self):
+        """El coste mínimo de oxígeno de cada minijuego es el del estado"""
+        state = self.state._replace(oxygen=18.0, oxygen_cost_mining=20.0)
+        self.assertFalse(rules.can_mine(state))
+        self.assertTrue(rules.can_repair(state))
+        self.assertIs(transition(state, Action(rules.MINE), self.rng), state)
+        
+        state = self.state._replace(oxygen_cost_repair=20.0)
+        new_state = transition(state, Action(rules.REPAIR, outcome=5), self.rng)
+        self.assertTrue(27 <= new_state.oxygen <= 30)
+        
+        game_state = GameState()
+        game_state.oxygen_cost_mining = 30.0
+        self.assertEqual(rules.from_game_state(game_state).oxygen_cost_mining, 30.0)
+    
+    def test_repair_costs_and_victory(self):
+        """Reparar consume oxígeno y materiales y puede dar la victoria"""
+        state = self.state._replace(repair_progress=95.0)
+        new_state = transition(state, Action(rules.REPAIR, outcome=10), self.rng)
+        self.assertTrue(10 <= new_state.materials <= 15)
+        self.assertEqual(new_state.repair_progress, 100)
+        self.assertTrue(new_state.victory)
+        self.assertIs(transition(new_state, Action(rules.END_TURN), self.rng), new_state)
+    
+    def test_exchange_matches_hud(self):
+        """El intercambio vende solo lo necesario para llegar a 100"""
+        self.assertEqual(rules.exchange_quote(50.0, 20, 4), (4, 20))
+        self.assertEqual(rules.exchange_quote(88.0, 20, 10), (3, 12))
+        self.assertEqual(rules.exchange_quote(100.0, 20, 10), (0, 0))
+        new_state = transition(self.state, Action(rules.EXCHANGE, 20), self.rng)
+        self.assertEqual((new_state.oxygen, new_state.materials), (100.0, 10))
+    
+    def test_offer_accept_pay(self):
+        """Aceptar crea el préstamo y pagarlo entero lo elimina"""
+        state = transition(self.state, Action(rules.OFFER, 30, creditor='zorvax'), self.rng)
+        state = transition(state, Action(rules.ACCEPT), self.rng)
+        self.assertIsNone(state.pending_offer)
+        self.assertEqual(state.oxygen, 80.0)
+        self.assertEqual(state.loans[0].materials_owed, 45)
+        
+        state = state._replace(materials=50)
+        state = transition(state, Action(rules.PAY, 45, 0), self.rng)
+        self.assertEqual(state.loans, ())
+        self.assertEqual(state.materials, 5)
+    
+    def test_unknown_action(self):
+        """Una acción desconocida es un error"""
+        with self.assertRaises(ValueError):
+            transition(self.state, Action('fly'), self.rng)
+    
+    def test_legal_actions_change_state(self):
+        """Todas las acciones legales son aplicables"""
+        state = transition(self.state, Action(rules.OFFER, 20, creditor='ktar'), self.rng)
+        self.assertEqual({a.kind for a in rules.legal_actions(state)}, {rules.ACCEPT, rules.REJECT})
+        state = transition(state, Action(rules.ACCEPT), self.rng)
+        for action in rules.legal_actions(state):
+            self.assertIsNot(transition(state, action, random.Random(1)), state, action)
+
+
+class TestParityWithGame(unittest.TestCase):
+    """El núcleo reproduce GameState.advance_turn y LoanManager"""
+    
+    def _compare(self, game_state, loan_manager, state):
+        self.assertAlmostEqual(state.oxygen, game_state.oxygen)
+        self.assertAlmostEqual(state.max_oxygen, game_state.max_oxygen)
+        self.assertEqual(state.materials, game_state.materials)
+        self.assertAlmostEqual(state.repair_progress, game_state.repair_progress)
+        self.assertEqual(state.game_over, game_state.game_over)
+        self.assertEqual([(loan.materials_owed, loan.turns_until_due, loan.is_defaulted)
+                          for loan in state.loans],
+                         [(loan.materials_owed, loan.turns_until_due, loan.is_defaulted)
+                          for loan in loan_manager.active_loans])
+    
+    def test_random_games_match(self):
+        """Partidas aleatorias de préstamos, pagos y turnos dan el mismo estado"""
+        for seed in range(20):
+            rng = random.Random(seed)
+            game_state = GameState()
+            game_state.oxygen = 60.0
+            game_state.materials = 30
+            game_state.repair_progress = 40.0
+            loan_manager = LoanManager()
+            loan_manager.game_state = game_state
+            game_state.loan_manager = loan_manager
+            state = rules.from_game_state(game_state)
+            
+            for _ in range(25):
+                if game_state.game_over:
+                    break
+                roll = rng.random()
+                if roll < 0.3 and loan_manager.check_loan_appearance():
+                    loan_manager.accept_pending_offer()
+                    offer = rules.from_game_state(game_state).loans[-1]
+                    state = transition(state, Action(rules.OFFER, offer.principal,
+                                                     offer.turns_until_due, offer.creditor))
+                    state = transition(state, Action(rules.ACCEPT))
+                elif roll < 0.5 and loan_manager.active_loans:
+                    index = rng.randrange(len(loan_manager.active_loans))
+                    amount = rng.randint(1, 15)
+                    loan_manager.make_payment(loan_manager.active_loans[index], amount)
+                    state = transition(state, Action(rules.PAY, amount, index))
+                else:
+                    game_state.advance_turn()
+                    state = transition(state, Action(rules.END_TURN))
+                self._compare(game_state, loan_manager, state)
+
+
+    def test_game_turn_applies_transition(self):
+        """GameState.advance_turn copia el resultado de transition(END_TURN)"""
+        game_state = GameState()
+        game_state.oxygen = 50.0
+        game_state.materials = 40
+        loan_manager = LoanManager()
+        loan_manager.game_state = game_state
+        game_state.loan_manager = loan_manager
+        for creditor in ('ktar', 'zorvax'):
+            loan_manager.pending_offer = loan_manager.offer_engine.build_offer(creditor, 30)
+            loan_manager.accept_pending_offer()
+        loan_manager.active_loans[0].turns_until_due = 1
+        
+        expected = transition(rules.from_game_state(game_state), Action(rules.END_TURN))
+        game_state.advance_turn()
+        self.assertEqual(game_state.turn_number, expected.turn)
+        self._compare(game_state, loan_manager, expected)
+        self.assertLess(game_state.max_oxygen, 100.0)
+        self.assertEqual(loan_manager.ledger.entries[-1].kind, 'penalty')
+    
+    def test_finance_does_not_import_rules(self):
+        """finance no depende de engine.rules (solo engine.rules importa finance)"""
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+        code = ("import sys, finance, finance.loan_manager; "
+                "sys.exit('engine.rules' in sys.modules)")
+        self.assertEqual(subprocess.run([sys.executable, '-c', code], cwd=root).returncode, 0)
+        self.assertIs(rules.LoanState, LoanState)
+
+
+class TestThroughput(unittest.TestCase):
+    """El núcleo es lo bastante rápido para búsquedas"""
+    
+    def test_many_transitions(self):
+        """Miles de transiciones en una fracción de segundo"""
+        rng = random.Random(0)
+        state = RulesState(oxygen=80.0, materials=30,
+                           loans=(rules.new_loan('zorvax', 30), rules.new_loan('ktar', 20)))
+        start = time.perf_counter()
+        count = 0
+        while count < 20000:
+            current = state
+            while not rules.is_terminal(current) and count < 20000:
+                current = transition(current, rng.choice(rules.legal_actions(current)), rng)
+                count += 1
+        self.assertLess(time.perf_counter() - start, 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
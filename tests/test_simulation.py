@@ -0,0 +1,49 @@
+"""
+Test Suite for Simulation Module
+Pruebas de los bots y del harness de simulación de minijuegos
+"""
+
+import unittest
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from gameplay.difficulty import DifficultyEngine
+from simulation.harness import build_tasks, run_simulation, summarize
+
+
+class TestBotHarness(unittest.TestCase):
+    """Pruebas del harness de bots"""
+    
+    def test_build_tasks_is_deterministic(self):
+        """Las semillas no dependen del proceso ni del orden de ejecución"""
+        engine = DifficultyEngine({'minigames': {'timing': {'difficulty_multipliers': [1.0, 2.0]}}})
+        tasks = build_tasks(3, [0, 1], engine, ['timing'])
+        self.assertEqual(tasks, build_tasks(3, [0, 1], engine, ['timing']))
+        # 2 políticas x 2 niveles x 3 episodios
+        self.assertEqual(len(tasks), 12)
+        self.assertEqual({task[3]['base_speed'] for task in tasks if task[2] == 1}, {400.0})
+    
+    def test_perfect_timing_bot_always_succeeds(self):
+        """El bot de timing perfecto completa todas las partidas"""
+        tasks = [task for task in build_tasks(5, [0], None, ['timing']) if task[1] == 'perfect']
+        results = run_simulation(tasks, processes=1)
+        self.assertTrue(all(result['success'] for result in results))
+    
+    def test_summary_per_difficulty(self):
+        """El resumen agrupa por minijuego, política y dificultad"""
+        engine = DifficultyEngine({'minigames': {'wiring': {'difficulty_multipliers': [1.0, 1.3, 1.6, 2.0, 2.5]}}})
+        tasks = build_tasks(4, [0, 4], engine, ['wiring'])
+        summary = summarize(run_simulation(tasks, processes=1))
+        self.assertEqual(len(summary), 4)
+        for row in summary:
+            self.assertEqual(row['episodes'], 4)
+            self.assertEqual(sum(row['reward_histogram'].values()), 4)
+            self.assertLessEqual(row['reward_min'], row['reward_mean'])
+            self.assertLessEqual(row['reward_mean'], row['reward_max'])
+
+
+if __name__ == '__main__':
+    unittest.main()
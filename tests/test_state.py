@@ -0,0 +1,87 @@
+"""
+Test Suite for GameState Module
+Pruebas de los contadores de versión del estado del juego
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from engine.state import GameState, STATE_GROUPS
+from finance.loan_manager import LoanManager
+from finance.debt import KtarDebt
+
+
+class TestStateVersions(unittest.TestCase):
+    """Pruebas de version, mark_changed y changed_since"""
+    
+    def setUp(self):
+        """Configuración antes de cada prueba"""
+        self.game_state = GameState()
+        self.game_state.oxygen = 50.0
+    
+    def test_methods_bump_their_group(self):
+        """Cada método incrementa la versión de su grupo"""
+        cases = [
+            ('oxygen', lambda: self.game_state.update_oxygen(-5)),
+            ('materials', lambda: self.game_state.add_materials(3)),
+            ('materials', lambda: self.game_state.consume_materials(2)),
+            ('repair', lambda: self.game_state.update_repair_progress(10)),
+            ('turn', lambda: self.game_state.advance_turn()),
+        ]
+        for group, action in cases:
+            version = self.game_state.version
+            action()
+            self.assertTrue(self.game_state.changed_since(version, group), group)
+            self.assertGreater(self.game_state.get_version(group), version)
+    
+    def test_no_change_keeps_version(self):
+        """Operaciones sin efecto no cambian la versión"""
+        self.game_state.oxygen = self.game_state.max_oxygen
+        version = self.game_state.version
+        self.game_state.update_oxygen(10)
+        self.game_state.add_materials(0)
+        self.game_state.consume_materials(10 ** 6)
+        self.game_state.update_repair_progress(0)
+        self.assertFalse(self.game_state.changed_since(version))
+    
+    def test_changed_since_filters_groups(self):
+        """changed_since con grupos ignora cambios en otros grupos"""
+        version = self.game_state.version
+        self.game_state.add_materials(5)
+        self.assertTrue(self.game_state.changed_since(version))
+        self.assertFalse(self.game_state.changed_since(version, 'oxygen', 'repair'))
+        
+        version = self.game_state.version
+        self.game_state.mark_changed()
+        self.assertTrue(all(self.game_state.changed_since(version, group) for group in STATE_GROUPS))
+    
+    def test_loan_changes_bump_loans_group(self):
+        """LoanManager marca el grupo 'loans' al cambiar los préstamos"""
+        loan_manager = LoanManager()
+        loan_manager.game_state = self.game_state
+        self.game_state.loan_manager = loan_manager
+        self.game_state.materials = 100
+        
+        version = self.game_state.version
+        loan = KtarDebt(20, 5)
+        loan_manager.active_loans.append(loan)
+        loan_manager._add_loan_aggregate(loan)
+        self.assertTrue(self.game_state.changed_since(version, 'loans'))
+        
+        version = self.game_state.version
+        loan_manager.make_payment(loan, 5)
+        self.assertTrue(self.game_state.changed_since(version, 'loans'))
+    
+    def test_versions_not_part_of_equality(self):
+        """Las versiones no afectan a la comparación ni al constructor"""
+        other = GameState()
+        other.oxygen = 50.0
+        other.mark_changed()
+        self.assertEqual(self.game_state, other)
+
+
+if __name__ == '__main__':
+    unittest.main()
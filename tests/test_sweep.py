@@ -0,0 +1,134 @@
+"""
+Test Suite for Balance Sweep
+Pruebas del barrido de parámetros de balance
+"""
+
+import unittest
+import logging
+import random
+import shutil
+import sys
+import os
+import tempfile
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulation.sweep import (
+    CHUNK_FIELDS, POLICIES, build_grid, build_parameters, build_tasks, parse_param,
+    play_game, point_id, run_sweep, summarize
+)
+
+CONFIG = {'gameplay': {'initial_oxygen': 100.0, 'oxygen_consumption_per_turn': 2.0}}
+
+
+class TestSweepGrid(unittest.TestCase):
+    """Pruebas de la rejilla y de los parámetros"""
+    
+    def setUp(self):
+        logging.disable(logging.INFO)
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+    
+    def test_parse_and_grid(self):
+        """Los valores se leen como JSON y la rejilla es el producto cartesiano"""
+        name, values = parse_param('gameplay.initial_oxygen=80,100.5')
+        self.assertEqual((name, values), ('gameplay.initial_oxygen', [80, 100.5]))
+        with self.assertRaises(ValueError):
+            parse_param('gameplay.initial_oxygen')
+        
+        grid = build_grid({'a': [1, 2], 'b': ['x', 'y', 'z']})
+        self.assertEqual(len(grid), 6)
+        self.assertEqual(point_id({'a': 1, 'b': 'x'}), point_id({'b': 'x', 'a': 1}))
+    
+    def test_parameters_from_config_and_objects(self):
+        """Las rutas de config.json y las constantes de los objetos llegan a la partida"""
+        parameters, _ = build_parameters(CONFIG, {
+            'gameplay.initial_oxygen': 70.0,
+            'ResourceManager.mining_reward_success': 4,
+            'RepairSystem.repair_increment_success': 30.0,
+        })
+        self.assertEqual(parameters['oxygen'], 70.0)
+        self.assertEqual(parameters['mining_reward_success'], 4)
+        self.assertEqual(parameters['repair_increment_success'], 30.0)
+        
+        # Los costes de las acciones de GameState llegan al núcleo de reglas
+        parameters, offer_engine = build_parameters(CONFIG, {'GameState.oxygen_cost_mining': 200.0,
+                                                             'GameState.oxygen_cost_repair': 200.0})
+        self.assertEqual(parameters['oxygen_cost_mining'], 200.0)
+        result = play_game(parameters, offer_engine, POLICIES['balanced'], random.Random(0))
+        self.assertFalse(result['won'])
+        with self.assertRaises(ValueError):
+            build_parameters(CONFIG, {'GameState.unknown': 1})
+    
+    def test_play_game_is_reproducible(self):
+        """La misma semilla da la misma partida"""
+        parameters, offer_engine = build_parameters(CONFIG, {})
+        results = [play_game(parameters, offer_engine, POLICIES['balanced'], random.Random(3))
+                   for _ in range(2)]
+        self.assertEqual(results[0], results[1])
+        self.assertIn(results[0]['reason'],
+                      ('victory', 'oxygen_depleted', 'debt_overwhelming', 'timeout'))
+    
+    def test_generous_repairs_win_more(self):
+        """Reparaciones más grandes suben la tasa de victorias"""
+        rates = []
+        for increment in (5.0, 40.0):
+            parameters, offer_engine = build_parameters(
+                CONFIG, {'RepairSystem.repair_increment_success': increment})
+            rng = random.Random(0)
+            wins = sum(play_game(parameters, offer_engine, POLICIES['cautious'], rng)['won']
+                       for _ in range(100))
+            rates.append(wins)
+        self.assertLess(rates[0], rates[1])
+
+
+class TestSweepRunner(unittest.TestCase):
+    """Pruebas de la ejecución por lotes y la reanudación"""
+    
+    def setUp(self):
+        logging.disable(logging.INFO)
+        self.output = tempfile.mkdtemp()
+        self.path = os.path.join(self.output, 'chunks.csv')
+        self.params = ['gameplay.initial_oxygen']
+        self.fieldnames = CHUNK_FIELDS + self.params
+        grid = build_grid({'gameplay.initial_oxygen': [80.0, 120.0]})
+        self.tasks = build_tasks(grid, ['balanced'], 30, CONFIG, chunk_size=10)
+    
+    def tearDown(self):
+        logging.disable(logging.NOTSET)
+        shutil.rmtree(self.output)
+    
+    def test_resume_skips_written_chunks(self):
+        """Al reanudar solo se calculan los lotes que faltan (y se descarta una línea a medias)"""
+        rows = run_sweep(self.tasks[:4], self.path, self.fieldnames, processes=1)
+        self.assertEqual(len(rows), 4)
+        
+        # Simular una interrupción a mitad de escribir la última fila
+        with open(self.path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(text[:-5])
+        
+        rows = run_sweep(self.tasks, self.path, self.fieldnames, processes=1)
+        self.assertEqual(len(rows), len(self.tasks))
+        self.assertEqual(len({(row['point'], row['chunk']) for row in rows}), len(self.tasks))
+        
+        summary = summarize(rows, self.params)
+        self.assertEqual(len(summary), 2)
+        for row in summary:
+            self.assertEqual(row['games'], 30)
+            self.assertTrue(0.0 <= row['win_rate'] <= 1.0)
+            self.assertTrue(0.0 <= row['default_rate'] <= 1.0)
+            self.assertGreater(row['avg_turns'], 0)
+    
+    def test_other_grid_is_rejected(self):
+        """No se reanuda sobre un fichero de otra rejilla"""
+        run_sweep(self.tasks[:1], self.path, self.fieldnames, processes=1)
+        with self.assertRaises(ValueError):
+            run_sweep(self.tasks, self.path, CHUNK_FIELDS + ['skill'], processes=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,168 @@
+"""
+Test Suite for Timer Scheduler
+Pruebas del planificador de temporizadores y de los componentes que lo usan
+"""
+
+import unittest
+import logging
+import sys
+import os
+
+# Añadir el directorio padre al path para importar módulos
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import pygame
+
+from engine.timers import TimerScheduler
+from ui.renderer import Renderer
+from ui.hud import HUD
+from ui.narrator import Narrator
+
+
+class TestTimerScheduler(unittest.TestCase):
+    """Pruebas del montículo de plazos"""
+    
+    def setUp(self):
+        self.timers = TimerScheduler()
+        self.fired = []
+    
+    def test_fires_in_deadline_order(self):
+        """Los plazos vencidos se ejecutan en orden y los iguales en orden de registro"""
+        self.timers.schedule(0.3, self.fired.append, 'c')
+        self.timers.schedule(0.1, self.fired.append, 'a')
+        self.timers.schedule(0.1, self.fired.append, 'b')
+        self.timers.schedule(1.0, self.fired.append, 'd')
+        
+        self.assertEqual(self.timers.advance(0.05), 0)
+        self.assertEqual(self.timers.advance(0.5), 3)
+        self.assertEqual(self.fired, ['a', 'b', 'c'])
+        self.assertAlmostEqual(self.timers.time_until_next(), 0.45)
+        self.assertEqual(len(self.timers), 1)
+    
+    def test_cancel(self):
+        """Un temporizador cancelado no se ejecuta y deja de contar"""
+        timer = self.timers.schedule(0.1, self.fired.append, 'x')
+        timer.cancel()
+        timer.cancel()
+        self.assertEqual(len(self.timers), 0)
+        self.assertIsNone(self.timers.time_until_next())
+        self.timers.advance(1.0)
+        self.assertEqual(self.fired, [])
+    
+    def test_many_cancellations_compact_heap(self):
+        """Muchas cancelaciones no dejan crecer el montículo"""
+        timers = [self.timers.schedule(i, self.fired.append, i) for i in range(200)]
+        for timer in timers[:150]:
+            timer.cancel()
+        self.assertEqual(len(self.timers), 50)
+        self.assertLess(len(self.timers._heap), 200)
+        self.timers.advance(500)
+        self.assertEqual(self.fired, list(range(150, 200)))
+    
+    def test_rescheduling_callback_runs_next_advance(self):
+        """Un callback que se reprograma con plazo 0 no bloquea el avance"""
+        def tick():
+            self.fired.append(self.timers.now)
+            self.timers.schedule(0, tick)
+        
+        self.timers.schedule(0, tick)
+        self.timers.advance(0.1)
+        self.timers.advance(0.1)
+        self.assertEqual(len(self.fired), 2)
+    
+    def test_failing_callback_does_not_stop_others(self):
+        """Un error en un callback se registra y el resto sigue"""
+        logging.disable(logging.ERROR)
+        try:
+            self.timers.schedule(0.1, lambda: 1 / 0)
+            self.timers.schedule(0.1, self.fired.append, 'ok')
+            self.assertEqual(self.timers.advance(0.2), 2)
+        finally:
+            logging.disable(logging.NOTSET)
+        self.assertEqual(self.fired, ['ok'])
+
+
+class TestComponentTimers(unittest.TestCase):
+    """Los componentes de UI usan el planificador en vez de contadores por frame"""
+    
+    def setUp(self):
+        logging.disable(logging.INFO)
+        pygame.init()
+        screen = pygame.display.set_mode((320, 240))
+        self.timers = TimerScheduler()
+        self.renderer = Renderer(320, 240, self.timers)
+        self.hud = HUD(screen, self.timers)
+        self.narrator = Narrator(screen, self.timers)
+    
+    def tearDown(self):
+        pygame.quit()
+        logging.disable(logging.NOTSET)
+    
+    def test_notifications_expire(self):
+        """Las notificaciones desaparecen al vencer y las descartadas se cancelan"""
+        self.hud.add_notification("corta", duration=1.0)
+        self.hud.add_notification("larga", duration=3.0)
+        self.timers.advance(1.5)
+        self.assertEqual([n['message'] for n in self.hud.notifications], ['larga'])
+        
+        for i in range(12):
+            self.hud.add_notification(f"n{i}")
+        self.assertEqual(len(self.hud.notifications), 10)
+        self.assertEqual(len(self.timers), 10)
+        self.timers.advance(5.0)
+        self.assertEqual(self.hud.notifications, [])
+    
+    def test_shake_and_lender(self):
+        """El shake termina y el prestamista espera input tras su entrada"""
+        self.renderer.apply_screen_shake(0.8, 0.4)
+        self.renderer.show_lender('zorvax')
+        self.timers.advance(0.45)
+        self.assertEqual(self.renderer.shake_intensity, 0.0)
+        self.assertFalse(self.renderer.lender_waiting_for_input)
+        self.timers.advance(0.1)
+        self.assertTrue(self.renderer.lender_waiting_for_input)
+        
+        self.renderer.show_lender('ktarr')
+        self.renderer.dismiss_lender()
+        self.assertEqual(len(self.timers), 0)
+    
+    def test_narrator_typing(self):
+        """El texto se revela con el tiempo y el temporizador lo completa"""
+        self.narrator.show_narrative("x" * 30)
+        self.timers.advance(0.5)
+        self.narrator.update(0.5)
+        self.assertEqual(self.narrator.current_dialogue.current_char, 15)
+        self.assertFalse(self.narrator.current_dialogue.is_complete)
+        self.timers.advance(0.5)
+        self.assertTrue(self.narrator.current_dialogue.is_complete)
+        
+        self.narrator.show_narrative("y" * 30)
+        self.narrator.reveal_all()
+        self.assertEqual(len(self.timers), 0)
+    
+    def test_components_work_without_shared_timers(self):
+        """Sin planificador compartido cada componente avanza el suyo en update"""
+        screen = pygame.display.get_surface()
+        hud = HUD(screen)
+        hud.add_notification("sola", duration=1.0)
+        hud.update(1.5)
+        self.assertEqual(hud.notifications, [])
+        
+        renderer = Renderer(320, 240)
+        renderer.show_lender('zorvax')
+        renderer.update(0.6)
+        self.assertTrue(renderer.lender_waiting_for_input)
+        
+        narrator = Narrator(screen)
+        narrator.show_narrative("z" * 30)
+        narrator.update(0.5)
+        self.assertEqual(narrator.current_dialogue.current_char, 15)
+        narrator.update(0.5)
+        self.assertTrue(narrator.current_dialogue.is_complete)
+        self.assertEqual(len(self.timers), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Test Suite for Trace Module
+Pruebas del registro binario de eventos
+"""
+
+import unittest
+import sys
+import os
+import io
+import csv
+import tempfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from engine import trace
+from engine.trace import TraceBuffer, TraceKind, RECORD, read_trace, write_csv, write_text
+from engine.state import GameState
+from finance.debt import KtarDebt
+
+
+class TestTraceBuffer(unittest.TestCase):
+    """Pruebas del buffer circular"""
+    
+    def test_drain_returns_records_in_order(self):
+        """Los registros salen en el orden en que entraron"""
+        buffer = TraceBuffer(capacity=4)
+        for value in range(3):
+            buffer.append(TraceKind.MATERIALS_ADDED, 0, value, 0.0, 0.0)
+        data, count = buffer.drain()
+        self.assertEqual(count, 3)
+        self.assertEqual([row[3] for row in RECORD.iter_unpack(data)], [0, 1, 2])
+        self.assertEqual(buffer.drain(), (b'', 0))
+    
+    def test_wraparound_drops_oldest(self):
+        """Al dar la vuelta se descartan los registros más antiguos"""
+        buffer = TraceBuffer(capacity=4)
+        for value in range(3):
+            buffer.append(TraceKind.MATERIALS_ADDED, 0, value, 0.0, 0.0)
+        buffer.drain()
+        for value in range(3, 9):
+            buffer.append(TraceKind.MATERIALS_ADDED, 0, value, 0.0, 0.0)
+        data, count = buffer.drain()
+        self.assertEqual([row[3] for row in RECORD.iter_unpack(data)], [5, 6, 7, 8])
+        self.assertEqual(buffer.dropped, 2)
+
+
+class TestTraceFile(unittest.TestCase):
+    """Pruebas de escritura, lectura y decodificación"""
+    
+    def setUp(self):
+        """Archivo temporal para la traza"""
+        handle, self.path = tempfile.mkstemp(suffix='.bin')
+        os.close(handle)
+    
+    def tearDown(self):
+        """Desactiva la traza y borra el archivo"""
+        trace.stop_tracing()
+        os.remove(self.path)
+    
+    def test_game_mutations_roundtrip(self):
+        """Las mutaciones del juego se leen del archivo comprimido"""
+        trace.start_tracing(self.path, capacity=16, flush_interval=60)
+        game_state = GameState()
+        game_state.update_oxygen(-10)
+        game_state.add_materials(7)
+        game_state.consume_materials(100)
+        loan = KtarDebt(20, 5)
+        loan.make_payment(24)
+        trace.stop_tracing()
+        
+        rows = list(read_trace(self.path))
+        kinds = [TraceKind(row[1]) for row in rows]
+        self.assertEqual(kinds, [TraceKind.OXYGEN_UPDATED, TraceKind.MATERIALS_ADDED,
+                                 TraceKind.MATERIALS_INSUFFICIENT, TraceKind.DEBT_CREATED,
+                                 TraceKind.DEBT_PAYMENT, TraceKind.DEBT_PAID_OFF])
+        self.assertEqual(rows[0][4:], (100.0, 90.0))
+        self.assertEqual(rows[3][2:4], (KtarDebt.CREDITOR_CODE, 24))
+        
+        text = io.StringIO()
+        self.assertEqual(write_text(read_trace(self.path), text), 6)
+        self.assertIn("DEBT_CREATED", text.getvalue())
+        self.assertIn("creditor=ktar", text.getvalue())
+        
+        output = io.StringIO()
+        write_csv(read_trace(self.path), output)
+        table = list(csv.reader(io.StringIO(output.getvalue())))
+        self.assertEqual(table[0], list(trace.RECORD_FIELDS))
+        self.assertEqual(table[2][1:4], ['MATERIALS_ADDED', '0', '7'])
+    
+    def test_disabled_trace_records_nothing(self):
+        """Sin traza activa, record no hace nada"""
+        self.assertFalse(trace.is_enabled())
+        GameState().update_oxygen(-5)
+        trace.start_tracing(self.path, capacity=16, flush_interval=60)
+        trace.stop_tracing()
+        self.assertEqual(list(read_trace(self.path)), [])
+    
+    def test_creditor_codes_match_portfolio(self):
+        """Los códigos de la traza coinciden con los de LoanPortfolio"""
+        from finance.portfolio import CREDITOR_TABLE, CREDITOR_CODES
+        for key, debt_class, _, _ in CREDITOR_TABLE:
+            self.assertEqual(debt_class.CREDITOR_CODE, CREDITOR_CODES[key])
+    
+    def test_rejects_foreign_files(self):
+        """Un archivo que no es una traza se rechaza"""
+        with open(self.path, 'wb') as handle:
+            handle.write(b'not a trace file')
+        with self.assertRaises(ValueError):
+            list(read_trace(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,7 @@ from .renderer import Renderer
 from .hud import HUD
 from .narrator import Narrator
 from .audio import AudioManager
+from .assets import AssetLoader, AssetSpec
 
-__all__ = ['Renderer', 'HUD', 'Narrator', 'AudioManager']
+__all__ = ['Renderer', 'HUD', 'Narrator', 'AudioManager', 'AssetLoader', 'AssetSpec']
 
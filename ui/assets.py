@@ -0,0 +1,223 @@
+"""
+AssetLoader - Carga de recursos en segundo plano
+Decodifica imágenes (y lee la música) en un hilo para que la ventana muestre
+la intro desde el primer frame. Cada recurso terminado viaja como evento
+ASSET_LOADED por la cola del EventManager; al procesarla, el hilo principal
+convierte la superficie al formato de la pantalla y se la entrega a su
+componente, que sustituye el marcador de posición por el sprite real.
+"""
+
+import io
+import os
+import threading
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+import logging
+
+import pygame
+
+from engine.events import Event, EventType
+
+logger = logging.getLogger(__name__)
+
+ASSET_DIR = os.path.join('data', 'assets')
+
+
+class AssetSpec(NamedTuple):
+    """
+    Imagen a cargar
+    
+    Attributes:
+        key: Nombre del asset en el componente
+        filename: Archivo dentro de data/assets
+        size: Tamaño final (None = tamaño original)
+        alpha: True para convert_alpha, False para dejar la superficie tal cual
+    """
+    key: str
+    filename: str
+    size: Optional[Tuple[int, int]] = None
+    alpha: bool = True
+
+
+def decode_image(spec: AssetSpec, directory: str = ASSET_DIR) -> Optional[pygame.Surface]:
+    """
+    Carga y escala una imagen (seguro fuera del hilo principal)
+    
+    Args:
+        spec: Imagen a cargar
+        directory: Carpeta de assets
+    
+    Returns:
+        Superficie sin convertir, o None si el archivo no existe
+    """
+    path = os.path.join(directory, spec.filename)
+    if not os.path.exists(path):
+        return None
+    image = pygame.image.load(path)
+    if spec.size:
+        image = pygame.transform.scale(image, spec.size)
+    return image
+
+
+def finish_image(image: pygame.Surface, spec: AssetSpec) -> pygame.Surface:
+    """
+    Convierte la imagen al formato de la pantalla (solo en el hilo principal)
+    
+    Args:
+        image: Superficie devuelta por decode_image
+        spec: Imagen cargada
+    
+    Returns:
+        Superficie lista para dibujar
+    """
+    if spec.alpha and pygame.display.get_surface() is not None:
+        return image.convert_alpha()
+    return image
+
+
+def load_images(specs: List[AssetSpec], on_ready: Callable[[str, pygame.Surface], None]) -> None:
+    """
+    Carga imágenes de forma síncrona (sin AssetLoader)
+    
+    Args:
+        specs: Imágenes a cargar
+        on_ready: Callback (key, superficie) por cada imagen cargada
+    """
+    for spec in specs:
+        try:
+            image = decode_image(spec)
+            if image is not None:
+                on_ready(spec.key, finish_image(image, spec))
+                logger.debug(f"Asset cargado: {spec.filename}")
+        except Exception as e:
+            logger.warning(f"No se pudo cargar asset {spec.filename}: {e}")
+
+
+class AssetLoader:
+    """
+    Cargador de recursos en un hilo de fondo
+    
+    Responsabilidades:
+        - Decodificar y escalar imágenes fuera del hilo principal
+        - Leer archivos completos (música) a memoria
+        - Entregar cada recurso por la cola de eventos e informar del progreso
+    
+    Uso:
+        loader.add_images(Renderer.ASSET_SPECS, renderer.on_asset_ready)
+        loader.start()
+        # ... el bucle procesa la cola y los sprites aparecen al estar listos
+    
+    Dependencias:
+        - engine.events.EventManager: Cola de eventos (se asigna después)
+    """
+    
+    def __init__(self):
+        """Inicializa el cargador sin trabajos"""
+        self.event_manager = None
+        self.directory = ASSET_DIR
+        
+        # Trabajos: (tipo, spec o ruta, callback)
+        self._jobs: List[Tuple[str, Any, Callable]] = []
+        self.loaded = 0
+        self.failed = 0
+        self.started_at: Optional[float] = None
+        self.elapsed: Optional[float] = None  # Duración total de la carga
+        
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def add_images(self, specs: List[AssetSpec], on_ready: Callable[[str, pygame.Surface], None]) -> None:
+        """
+        Añade imágenes a la carga
+        
+        Args:
+            specs: Imágenes a cargar
+            on_ready: Callback (key, superficie) llamado en el hilo principal
+        """
+        for spec in specs:
+            self._jobs.append(('image', spec, on_ready))
+    
+    def add_file(self, path: str, on_ready: Callable[[io.BytesIO], None]) -> None:
+        """
+        Añade un archivo que se lee entero a memoria (p. ej. la música)
+        
+        Args:
+            path: Ruta del archivo
+            on_ready: Callback con el contenido como BytesIO (hilo principal)
+        """
+        self._jobs.append(('file', path, on_ready))
+    
+    @property
+    def total(self) -> int:
+        """Número de recursos registrados"""
+        return len(self._jobs)
+    
+    @property
+    def progress(self) -> float:
+        """Fracción de recursos entregados (0.0 - 1.0)"""
+        if not self._jobs:
+            return 1.0
+        return (self.loaded + self.failed) / len(self._jobs)
+    
+    @property
+    def is_done(self) -> bool:
+        """True cuando todos los recursos se han entregado"""
+        return self.elapsed is not None
+    
+    def start(self) -> None:
+        """Arranca el hilo de carga"""
+        if self._thread and self._thread.is_alive():
+            return
+        self.event_manager.subscribe(EventType.ASSET_LOADED, self._on_asset_loaded)
+        self.started_at = time.perf_counter()
+        if not self._jobs:
+            self.elapsed = 0.0
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="AssetLoader", daemon=True)
+        self._thread.start()
+        logger.info(f"Carga de recursos iniciada ({self.total} archivos)")
+    
+    def stop(self) -> None:
+        """Detiene el hilo de carga (los recursos pendientes no se cargan)"""
+        self._stopping.set()
+        if self._thread:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+    
+    def _run(self) -> None:
+        """Bucle del hilo: carga cada trabajo y lo encola como evento"""
+        for index, (kind, item, _) in enumerate(self._jobs):
+            if self._stopping.is_set():
+                return
+            try:
+                if kind == 'image':
+                    result = decode_image(item, self.directory)
+                else:
+                    with open(item, 'rb') as f:
+                        result = io.BytesIO(f.read())
+            except Exception as e:
+                logger.warning(f"No se pudo cargar {item}: {e}")
+                result = None
+            self.event_manager.queue_event(Event(EventType.ASSET_LOADED,
+                                                 {'index': index, 'result': result},
+                                                 source="AssetLoader"))
+    
+    def _on_asset_loaded(self, event: Event) -> None:
+        """Entrega un recurso a su componente (hilo principal, al procesar la cola)"""
+        kind, item, on_ready = self._jobs[event.data['index']]
+        result = event.data['result']
+        
+        if result is None:
+            self.failed += 1
+        else:
+            self.loaded += 1
+            if kind == 'image':
+                on_ready(item.key, finish_image(result, item))
+            else:
+                on_ready(result)
+        
+        if self.loaded + self.failed == self.total:
+            self.elapsed = time.perf_counter() - self.started_at
+            logger.info(f"Recursos cargados: {self.loaded}/{self.total} en "
+                        f"{self.elapsed * 1000:.0f} ms ({self.failed} sin cargar)")
@@ -6,7 +6,7 @@ Maneja música de fondo y efectos de sonido del juego
 import pygame
 import os
 import logging
-from typing import Dict, Optional
+from typing import BinaryIO, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -80,23 +80,28 @@ class AudioManager:
         if name in self.sounds:
             self.sounds[name].stop()
     
-    def load_music(self, filename: str) -> bool:
+    def load_music(self, filename: str, data: Optional[BinaryIO] = None) -> bool:
         """
         Carga música de fondo
         
         Args:
             filename: Nombre del archivo en data/music/
+            data: Contenido ya leído (p. ej. por ui.assets.AssetLoader); si se
+                omite, se lee el archivo
             
         Returns:
             True si se cargó correctamente, False en caso contrario
         """
         try:
-            path = os.path.join('data', 'music', filename)
-            if not os.path.exists(path):
-                logger.warning(f"Archivo de música no encontrado: {path}")
-                return False
+            if data is not None:
+                pygame.mixer.music.load(data, os.path.splitext(filename)[1].lstrip('.'))
+            else:
+                path = os.path.join('data', 'music', filename)
+                if not os.path.exists(path):
+                    logger.warning(f"Archivo de música no encontrado: {path}")
+                    return False
+                pygame.mixer.music.load(path)
             
-            pygame.mixer.music.load(path)
             pygame.mixer.music.set_volume(self.music_volume)
             self.current_music = filename
             logger.info(f"Música cargada: {filename}")
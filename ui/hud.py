@@ -4,10 +4,13 @@ Interfaz de usuario que muestra información del juego
 """
 
 import pygame
-import os
-from typing import Optional, Dict, List, Tuple
+from typing import Callable, Optional, Dict, List, Tuple, Any
 import logging
 
+from engine import rules
+from engine.timers import TimerScheduler
+from .assets import AssetSpec, load_images
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,12 +33,23 @@ class HUD:
         - gameplay.resources.ResourceManager: Para mostrar inventario
     """
     
-    def __init__(self, screen: pygame.Surface):
+    # Iconos del HUD (sin convert_alpha, como siempre se han cargado)
+    ASSET_SPECS = [
+        AssetSpec('oxygen_bar', 'oxygen_bar.png', (32, 32), alpha=False),
+        AssetSpec('materials_bar', 'materials_bar.png', (32, 32), alpha=False),
+        AssetSpec('repair_bar', 'repair_bar.png', (32, 32), alpha=False),
+        AssetSpec('alert_oxygen', 'alert_oxygen.png', (32, 32), alpha=False),
+        AssetSpec('alert_materials', 'alert_materials.png', (32, 32), alpha=False),
+        AssetSpec('repair_msg', 'repair_msg.png', (300, 100), alpha=False),
+    ]
+    
+    def __init__(self, screen: pygame.Surface, timers: Optional[TimerScheduler] = None):
         """
         Inicializa el HUD
         
         Args:
             screen: Superficie de Pygame donde renderizar
+            timers: Temporizadores compartidos con el bucle (None = propios, los avanza update)
         """
         self.screen = screen
         self.screen_width = screen.get_width()
@@ -50,6 +64,8 @@ class HUD:
         self.game_state = None
         self.loan_manager = None
         self.resource_manager = None
+        self._owns_timers = timers is None
+        self.timers = TimerScheduler() if timers is None else timers
         
         # Estado del HUD
         self.notifications: List[Dict] = []
@@ -58,6 +74,18 @@ class HUD:
         self.show_repair_panel = False
         self.show_action_menu = True
         
+        # Textos de estado cacheados: clave -> (game_state, versión, superficie)
+        self._state_text_cache: Dict[str, Tuple[Any, int, pygame.Surface]] = {}
+        
+        # Reparto óptimo de pagos (se recalcula al abrir el panel de deudas)
+        self.payment_plan: Optional[Dict[str, Any]] = None
+        
+        # Último pronóstico de riesgo (simulation.forecaster)
+        self.risk_forecast: Optional[Dict[str, Any]] = None
+        
+        # Última recomendación del consejero (simulation.advisor)
+        self.advice: Optional[Dict[str, Any]] = None
+        
         # Modal de intercambio de materiales por oxígeno
         self.show_exchange_modal = False
         self.exchange_amount = 0
@@ -73,8 +101,13 @@ class HUD:
         self.turn_info_pos = (self.screen_width - 200, 20)
         self.action_menu_pos = (self.screen_width // 2 - 175, self.screen_height - 140)
     
-    def initialize(self) -> None:
-        """Inicializa fuentes y recursos del HUD"""
+    def initialize(self, asset_loader=None) -> None:
+        """
+        Inicializa fuentes y recursos del HUD
+        
+        Args:
+            asset_loader: Si se indica, los iconos se cargan en segundo plano
+        """
         # Cargar fuentes
         try:
             self.large_font = pygame.font.Font(None, 36)
@@ -87,8 +120,11 @@ class HUD:
             self.font = pygame.font.SysFont('Arial', 24)
             self.small_font = pygame.font.SysFont('Arial', 18)
         
-        # Cargar assets del HUD
-        self._load_assets()
+        # Cargar assets del HUD (los iconos que faltan simplemente no se dibujan)
+        if asset_loader:
+            asset_loader.add_images(self.ASSET_SPECS, self.assets.__setitem__)
+        else:
+            self._load_assets()
         logger.info("HUD inicializado")
     
     def render(self) -> None:
@@ -166,8 +202,8 @@ class HUD:
             self.screen.blit(icon, icon_rect)
         
         # Dibujar texto
-        text = f"Oxígeno: {self.game_state.oxygen:.0f}/{self.game_state.max_oxygen:.0f}"
-        text_surface = self.font.render(text, True, (255, 255, 255))
+        text_surface = self._state_text('oxygen', 'oxygen', lambda: self.font.render(
+            f"Oxígeno: {self.game_state.oxygen:.0f}/{self.game_state.max_oxygen:.0f}", True, (255, 255, 255)))
         text_rect = text_surface.get_rect()
         text_rect.midleft = (x + bar_width + 10, y + bar_height // 2)
         self.screen.blit(text_surface, text_rect)
@@ -179,6 +215,23 @@ class HUD:
             alert_rect.midleft = (x + bar_width + 150, y + bar_height // 2)
             self.screen.blit(alert, alert_rect)
     
+    def _state_text(self, key: str, group: str, render: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """
+        Superficie de texto que solo se vuelve a renderizar cuando cambia su grupo de GameState
+        
+        Args:
+            key: Identificador del texto
+            group: Grupo de GameState del que depende (ver GameState.changed_since)
+            render: Función que renderiza la superficie
+        """
+        version = self.game_state.get_version(group)
+        cached = self._state_text_cache.get(key)
+        if cached and cached[0] is self.game_state and cached[1] == version:
+            return cached[2]
+        surface = render()
+        self._state_text_cache[key] = (self.game_state, version, surface)
+        return surface
+    
     def render_resource_summary(self) -> None:
         """Renderiza resumen de materiales (simplificado)"""
         if not self.game_state:
@@ -209,7 +262,8 @@ class HUD:
                 alert_rect.midleft = (x + 150, y + 15)
                 self.screen.blit(alert, alert_rect)
         
-        text_surface = self.font.render(materials_text, True, color)
+        text_surface = self._state_text('materials', 'materials',
+                                        lambda: self.font.render(materials_text, True, color))
         self.screen.blit(text_surface, (x, y))
     
     def render_repair_progress(self) -> None:
@@ -244,8 +298,8 @@ class HUD:
             self.screen.blit(icon, icon_rect)
         
         # Dibujar texto con porcentaje
-        text = f"Reparación: {self.game_state.repair_progress:.0f}%"
-        text_surface = self.font.render(text, True, (255, 255, 255))
+        text_surface = self._state_text('repair', 'repair', lambda: self.font.render(
+            f"Reparación: {self.game_state.repair_progress:.0f}%", True, (255, 255, 255)))
         text_rect = text_surface.get_rect()
         text_rect.midleft = (x + bar_width + 10, y + bar_height // 2)
         self.screen.blit(text_surface, text_rect)
@@ -331,12 +385,10 @@ class HUD:
         y += 30
         
         # Listar préstamos activos (simplificado)
-        total_debt = 0
         for i, loan in enumerate(self.loan_manager.active_loans[:3]):  # Máximo 3 visibles
             # Obtener información del préstamo
             creditor = loan.creditor_name
-            debt_materials = int(loan.current_balance * 1.5)  # Conversión simplificada
-            total_debt += debt_materials
+            debt_materials = loan.materials_owed
             
             # Color según urgencia
             if loan.turns_until_due <= 2:
@@ -352,7 +404,8 @@ class HUD:
             self.screen.blit(text_surface, (x, y))
             y += 20
         
-        # Mostrar deuda total
+        # Mostrar deuda total (agregado mantenido por LoanManager)
+        total_debt = self.loan_manager.get_total_debt_in_materials()
         if total_debt > 0:
             y += 10
             total_text = f"Total a pagar: {total_debt} materiales"
@@ -380,6 +433,80 @@ class HUD:
         phase_rect = phase_surface.get_rect()
         phase_rect.topright = (x + 180, y + 25)
         self.screen.blit(phase_surface, phase_rect)
+        
+        self.render_risk_gauge(x, y + 50)
+        self.render_advice(x, y + 80)
+    
+    def render_risk_gauge(self, x: int, y: int) -> None:
+        """
+        Renderiza el indicador de riesgo de game over del último pronóstico
+        
+        Args:
+            x: Posición x (esquina izquierda de la zona de información del turno)
+            y: Posición y superior
+        """
+        if not self.risk_forecast:
+            return
+        
+        risk = self.risk_forecast['game_over']
+        if risk < 0.2:
+            color = (0, 200, 0)  # Verde
+        elif risk < 0.5:
+            color = (255, 255, 0)  # Amarillo
+        else:
+            color = (255, 0, 0)  # Rojo
+        
+        risk_text = f"Riesgo ({self.risk_forecast['horizon']} turnos): {risk:.0%}"
+        text_surface = self.small_font.render(risk_text, True, color)
+        text_rect = text_surface.get_rect()
+        text_rect.topright = (x + 180, y)
+        self.screen.blit(text_surface, text_rect)
+        
+        # Barra del indicador
+        bar_width = 120
+        bar_rect = pygame.Rect(x + 180 - bar_width, y + 18, bar_width, 8)
+        pygame.draw.rect(self.screen, (50, 50, 50), bar_rect)
+        fill_width = int(bar_width * risk)
+        if fill_width > 0:
+            pygame.draw.rect(self.screen, color, (bar_rect.x, bar_rect.y, fill_width, bar_rect.height))
+        pygame.draw.rect(self.screen, (255, 255, 255), bar_rect, 1)
+    
+    def on_risk_forecast(self, event) -> None:
+        """
+        Recibe un pronóstico de riesgo (evento RISK_FORECAST_UPDATED)
+        
+        Args:
+            event: Evento con el resultado de simulation.forecaster.forecast_risk
+        """
+        self.risk_forecast = event.data
+    
+    def render_advice(self, x: int, y: int) -> None:
+        """
+        Renderiza la acción recomendada por el consejero de estrategia
+        
+        Args:
+            x: Posición x (esquina izquierda de la zona de información del turno)
+            y: Posición y superior
+        """
+        if not self.advice:
+            return
+        
+        # Los puntos suspensivos indican que la búsqueda sigue mejorando el consejo
+        suffix = "" if self.advice.get('final') else "..."
+        advice_text = f"Consejo: {self.advice['label']}{suffix}"
+        text_surface = self.small_font.render(advice_text, True, (150, 220, 255))
+        text_rect = text_surface.get_rect()
+        text_rect.topright = (x + 180, y)
+        self.screen.blit(text_surface, text_rect)
+    
+    def on_advice(self, event) -> None:
+        """
+        Recibe una recomendación de estrategia (evento ADVICE_UPDATED)
+        
+        Args:
+            event: Evento con el resultado de simulation.advisor.StrategySearch.run
+        """
+        self.advice = event.data
     
     def render_notifications(self) -> None:
         """Renderiza notificaciones flotantes"""
@@ -388,7 +515,7 @@ class HUD:
         # Renderizar notificaciones activas
         for i, notification in enumerate(self.notifications[:5]):  # Máximo 5 notificaciones
             # Calcular opacidad basada en tiempo restante
-            alpha = min(255, notification['time_remaining'] * 255 / notification['duration'])
+            alpha = min(255, notification['timer'].remaining * 255 / notification['duration'])
             
             # Color según tipo
             colors = {
@@ -426,16 +553,22 @@ class HUD:
         notification = {
             'message': message,
             'type': notification_type,
-            'duration': duration,
-            'time_remaining': duration
+            'duration': duration
         }
+        notification['timer'] = self.timers.schedule(duration, self._expire_notification, notification)
         self.notifications.insert(0, notification)
         logger.info(f"Notificación: {message}")
         
         # Limitar número de notificaciones
         if len(self.notifications) > 10:
+            for dropped in self.notifications[10:]:
+                dropped['timer'].cancel()
             self.notifications = self.notifications[:10]
     
+    def _expire_notification(self, notification: Dict) -> None:
+        """Temporizador: retira una notificación cuando vence su duración"""
+        self.notifications = [n for n in self.notifications if n is not notification]
+    
     def render_inventory_panel(self) -> None:
         """Renderiza el panel detallado de inventario (simplificado)"""
         # Panel de fondo
@@ -520,14 +653,16 @@ class HUD:
             text_rect.top = y
             self.screen.blit(text_surface, text_rect)
         else:
+            plan = self.payment_plan or {}
+            optimal = dict(zip(map(id, plan.get('loans', [])), plan.get('payments', [])))
             for loan in self.loan_manager.active_loans:
                 # Información del préstamo
                 loan_info = [
                     f"Acreedor: {loan.creditor_name}",
                     f"Oxígeno prestado: {loan.principal:.0f}",
                     f"Materiales a pagar: {int(loan.current_balance * 1.5)}",
-                    f"Turnos restantes: {loan.turns_until_due}",
-                    f"Interés: {loan.interest_rate * 100:.0f}%"
+                    f"Turnos restantes: {loan.turns_until_due} | Pago mínimo: {loan.get_minimum_payment()} mat.",
+                    f"Interés: {loan.interest_rate * 100:.0f}% | Pago óptimo: {optimal.get(id(loan), 0)} mat."
                 ]
                 
                 for info in loan_info:
@@ -541,7 +676,7 @@ class HUD:
                 y += 20  # Espacio entre préstamos
         
         # Botón de cerrar
-        close_text = "[ESC] Cerrar"
+        close_text = "[A] Pago automático | [ESC] Cerrar" if self.loan_manager.active_loans else "[ESC] Cerrar"
         close_surface = self.small_font.render(close_text, True, (255, 255, 100))
         close_rect = close_surface.get_rect()
         close_rect.centerx = panel_rect.centerx
@@ -645,6 +780,27 @@ class HUD:
         self.show_debt_panel = not self.show_debt_panel
         self.show_inventory = False
         self.show_repair_panel = False
+        if self.show_debt_panel:
+            self.refresh_payment_plan()
+    
+    def refresh_payment_plan(self) -> None:
+        """Recalcula el reparto óptimo de materiales entre los préstamos"""
+        if self.loan_manager and self.loan_manager.active_loans:
+            self.payment_plan = self.loan_manager.get_payment_plan()
+        else:
+            self.payment_plan = None
+    
+    def auto_pay_loans(self) -> None:
+        """Paga los préstamos con el reparto óptimo de los materiales disponibles"""
+        if not self.loan_manager or not self.loan_manager.active_loans:
+            return
+        
+        paid = self.loan_manager.auto_pay()
+        if paid > 0:
+            self.add_notification(f"Pago automático: {paid} materiales", "success")
+        else:
+            self.add_notification("Ningún pago reduce tus penalizaciones", "info")
+        self.refresh_payment_plan()
     
     def toggle_repair_panel(self) -> None:
         """Alterna la visibilidad del panel de reparación"""
@@ -693,7 +849,7 @@ class HUD:
             return
         
         # Verificar si el oxígeno ya está al máximo
-        if self.game_state.oxygen >= 100:
+        if self.game_state.oxygen >= rules.EXCHANGE_OXYGEN_CAP:
             self.add_notification("Tu oxígeno ya está al 100% ✅", "info")
             self.close_exchange_modal()
             return
@@ -702,27 +858,18 @@ class HUD:
             self.add_notification("Cantidad no válida ❌", "error")
             return
         
-        # Realizar el intercambio: 1 material = 5 oxígeno
-        materials_to_sell = self.exchange_amount
+        # 1 material = 5 oxígeno, sin pasar de 100 (engine.rules.transition)
+        before = rules.from_game_state(self.game_state)
+        after = rules.transition(before, rules.Action(rules.EXCHANGE, self.exchange_amount))
+        materials_to_sell = before.materials - after.materials
+        oxygen_gained = after.oxygen - before.oxygen
         
-        # Calcular oxígeno que se ganaría (1 material = 5 oxígeno)
-        oxygen_gained = materials_to_sell * 5
-        
-        # Verificar que no se exceda el máximo de oxígeno
-        oxygen_available = 100 - self.game_state.oxygen
-        if oxygen_gained > oxygen_available:
-            # Ajustar la cantidad para no exceder 100
-            oxygen_gained = int(oxygen_available)
-            # Calcular cuántos materiales se necesitan realmente
-            materials_to_sell = (oxygen_gained + 4) // 5  # Redondear hacia arriba
-            
-            if materials_to_sell <= 0:
-                self.add_notification("Tu oxígeno ya está al 100% ✅", "info")
-                self.close_exchange_modal()
-                return
+        if materials_to_sell <= 0:
+            self.add_notification("Tu oxígeno ya está al 100% ✅", "info")
+            self.close_exchange_modal()
+            return
         
-        self.game_state.consume_materials(materials_to_sell)
-        self.game_state.update_oxygen(float(oxygen_gained))
+        rules.apply_to_game(self.game_state, before, after)
         
         self.add_notification(f"+{oxygen_gained:.1f} oxígeno conseguido 🫧", "success")
         logger.info(f"Intercambio realizado: {materials_to_sell} materiales por {oxygen_gained:.1f} oxígeno")
@@ -731,16 +878,25 @@ class HUD:
     
     def update(self, delta_time: float) -> None:
         """
-        Actualiza animaciones y timers del HUD
+        Actualiza animaciones del HUD
+        
+        Las notificaciones caducan con temporizadores de engine.timers, así
+        que solo hay que avanzarlos cuando el HUD usa los suyos propios.
         
         Args:
             delta_time: Tiempo transcurrido
         """
-        # Actualizar timers de notificaciones
-        for notification in self.notifications[:]:
-            notification['time_remaining'] -= delta_time
-            if notification['time_remaining'] <= 0:
-                self.notifications.remove(notification)
+        if self._owns_timers:
+            self.timers.advance(delta_time)
+    
+    def is_animating(self) -> bool:
+        """
+        Indica si el HUD necesita la tasa de frames completa
+        
+        Returns:
+            True si hay notificaciones desvaneciéndose o se arrastra el slider
+        """
+        return bool(self.notifications) or self.exchange_slider_dragging
     
     def handle_input(self, event: pygame.event.Event) -> None:
         """
@@ -768,6 +924,9 @@ class HUD:
             elif event.key == pygame.K_o:
                 # Abrir modal de intercambio
                 self.open_exchange_modal()
+            elif event.key == pygame.K_a and self.show_debt_panel:
+                # Pago automático desde el panel de deudas
+                self.auto_pay_loans()
             elif event.key == pygame.K_ESCAPE:
                 # Cerrar todos los paneles
                 self.show_inventory = False
@@ -776,29 +935,7 @@ class HUD:
     
     def _load_assets(self) -> None:
         """Carga los assets del HUD"""
-        asset_files = {
-            'oxygen_bar': 'oxygen_bar.png',
-            'materials_bar': 'materials_bar.png',
-            'repair_bar': 'repair_bar.png',
-            'alert_oxygen': 'alert_oxygen.png',
-            'alert_materials': 'alert_materials.png',
-            'repair_msg': 'repair_msg.png'
-        }
-        
-        for key, filename in asset_files.items():
-            path = os.path.join('data', 'assets', filename)
-            try:
-                if os.path.exists(path):
-                    image = pygame.image.load(path)
-                    # Escalar iconos a tamaño apropiado
-                    if 'alert' in key or 'bar' in key:
-                        image = pygame.transform.scale(image, (32, 32))
-                    elif 'msg' in key:
-                        image = pygame.transform.scale(image, (300, 100))
-                    self.assets[key] = image
-                    logger.debug(f"Asset cargado: {filename}")
-            except Exception as e:
-                logger.warning(f"No se pudo cargar asset {filename}: {e}")
+        load_images(self.ASSET_SPECS, self.assets.__setitem__)
     
     def _calculate_max_materials_to_sell(self) -> int:
         """Calcula el máximo de materiales que se pueden vender sin exceder 100 de oxígeno"""
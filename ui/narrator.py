@@ -4,11 +4,13 @@ Simplificado para MVP: Mensajes educativos y guía del jugador
 """
 
 import pygame
-import os
 from typing import List, Dict, Optional, Callable, Any
 from enum import Enum, auto
 import logging
 
+from engine.timers import TimerScheduler
+from .assets import AssetSpec, load_images
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,12 +66,16 @@ class Narrator:
         - engine.events.EventManager: Para emitir eventos de diálogo
     """
     
-    def __init__(self, screen: pygame.Surface):
+    # Imagen del guía que acompaña a la narrativa
+    ASSET_SPECS = [AssetSpec('helper', 'npc_helper.png', (80, 100))]
+    
+    def __init__(self, screen: pygame.Surface, timers: Optional[TimerScheduler] = None):
         """
         Inicializa el narrador
         
         Args:
             screen: Superficie de Pygame donde renderizar
+            timers: Temporizadores compartidos con el bucle (None = propios, los avanza update)
         """
         self.screen = screen
         self.screen_width = screen.get_width()
@@ -84,8 +90,12 @@ class Narrator:
         self.current_dialogue: Optional[DialogueNode] = None
         self.dialogue_queue: List[DialogueNode] = []
         self.is_active = False
-        self.text_speed = 50  # Caracteres por segundo
-        self.time_since_last_char = 0.0
+        # Caracteres por segundo. El contador anterior truncaba el tiempo sobrante
+        # en cada frame y a 60 FPS revelaba ~30 c/s con text_speed=50: se fija el
+        # ritmo que el juego mostraba en realidad
+        self.text_speed = 30
+        self.typing_started = 0.0  # Instante (tiempo de juego) en que empezó el diálogo
+        self._typing_timer = None
         
         # UI del diálogo
         # Dejar espacio a la izquierda para el NPC helper (80px imagen + 20px margen = 100px extra)
@@ -98,6 +108,8 @@ class Narrator:
         
         # Referencias
         self.event_manager = None
+        self._owns_timers = timers is None
+        self.timers = TimerScheduler() if timers is None else timers
         
         # Mensajes contextuales para eventos
         self.contextual_messages = {
@@ -128,8 +140,13 @@ class Narrator:
             ]
         }
     
-    def initialize(self) -> None:
-        """Inicializa fuentes y recursos"""
+    def initialize(self, asset_loader=None) -> None:
+        """
+        Inicializa fuentes y recursos
+        
+        Args:
+            asset_loader: Si se indica, la imagen del guía se carga en segundo plano
+        """
         # Cargar fuentes
         try:
             self.speaker_font = pygame.font.Font(None, 28)
@@ -141,21 +158,27 @@ class Narrator:
             self.font = pygame.font.SysFont('Arial', 22)
             self.small_font = pygame.font.SysFont('Arial', 18)
         
-        # Cargar imagen del helper
-        helper_path = os.path.join('data', 'assets', 'npc_helper.png')
-        try:
-            if os.path.exists(helper_path):
-                self.helper_image = pygame.image.load(helper_path).convert_alpha()
-                self.helper_image = pygame.transform.scale(self.helper_image, (80, 100))
-                logger.debug("Helper image cargada")
-        except Exception as e:
-            logger.warning(f"No se pudo cargar helper image: {e}")
+        # Cargar imagen del helper (hasta que llegue, el diálogo se muestra sin ella)
+        if asset_loader:
+            asset_loader.add_images(self.ASSET_SPECS, self.on_asset_ready)
+        else:
+            load_images(self.ASSET_SPECS, self.on_asset_ready)
         
         # Configurar suscripciones a eventos
         self._setup_event_subscriptions()
         
         logger.info("Narrator inicializado")
     
+    def on_asset_ready(self, key: str, image: pygame.Surface) -> None:
+        """
+        Guarda la imagen del guía cuando termina de cargarse
+        
+        Args:
+            key: Nombre del asset ('helper')
+            image: Superficie ya convertida
+        """
+        self.helper_image = image
+    
     def show_dialogue(self, dialogue: DialogueNode) -> None:
         """
         Muestra un diálogo inmediatamente
@@ -166,7 +189,13 @@ class Narrator:
         self.current_dialogue = dialogue
         self.current_dialogue.current_char = 0
         self.is_active = True
-        self.time_since_last_char = 0.0
+        
+        # El fin de la escritura es un temporizador; update solo calcula cuánto se ve
+        self._cancel_typing_timer()
+        self.typing_started = self.timers.now
+        if not dialogue.is_complete:
+            self._typing_timer = self.timers.schedule(
+                len(dialogue.text) / self.text_speed, self.reveal_all)
         
         # Emitir evento
         if self.event_manager:
@@ -217,7 +246,8 @@ class Narrator:
         )
         self.show_dialogue(dialogue)
     
-    def show_loan_offer(self, creditor: str, amount: float, materials_to_pay: int) -> None:
+    def show_loan_offer(self, creditor: str, amount: float, materials_to_pay: int,
+                        comparison: Optional[List[Dict[str, Any]]] = None) -> None:
         """
         Muestra una oferta de préstamo educativa
         
@@ -225,14 +255,26 @@ class Narrator:
             creditor: Nombre del prestamista
             amount: Cantidad de oxígeno ofrecido
             materials_to_pay: Materiales a devolver
+            comparison: Resultado de LoanManager.evaluate_what_if() para
+                [aceptar, rechazar] (opcional)
         """
         text = (
             f"{creditor} te ofrece {amount:.0f} de oxígeno. "
             f"Deberás devolver {materials_to_pay} materiales. "
             f"Recuerda: El oxígeno es tu moneda, los materiales representan tu trabajo. "
-            f"[A] Aceptar  [R] Rechazar"
         )
         
+        if comparison:
+            labels = {'accept': "Si aceptas", 'reject': "Si rechazas"}
+            for result in comparison:
+                label = labels.get(result['action'], result['action'])
+                text += f"{label}: riesgo de game over {result['game_over_risk']:.0%}"
+                if result['expected_turns_to_victory'] is not None:
+                    text += f", victoria en ~{result['expected_turns_to_victory']:.0f} turnos"
+                text += ". "
+        
+        text += "[A] Aceptar  [R] Rechazar"
+        
         dialogue = DialogueNode(
             text=text,
             speaker=creditor,
@@ -248,25 +290,40 @@ class Narrator:
         Args:
             delta_time: Tiempo transcurrido
         """
+        if self._owns_timers:
+            self.timers.advance(delta_time)
+        
         if not self.is_active or not self.current_dialogue:
             return
         
-        # Actualizar efecto de escritura
+        # Actualizar efecto de escritura (reveal_all lo completa al vencer el temporizador)
         if not self.current_dialogue.is_complete:
-            self.time_since_last_char += delta_time
-            
-            # Calcular cuántos caracteres revelar
-            chars_to_reveal = int(self.time_since_last_char * self.text_speed)
-            if chars_to_reveal > 0:
-                self.current_dialogue.current_char = min(
-                    self.current_dialogue.current_char + chars_to_reveal,
-                    len(self.current_dialogue.text)
-                )
-                self.time_since_last_char = 0.0
-                
-                # Verificar si se completó el texto
-                if self.current_dialogue.current_char >= len(self.current_dialogue.text):
-                    self.current_dialogue.is_complete = True
+            elapsed = self.timers.now - self.typing_started
+            self.current_dialogue.current_char = min(int(elapsed * self.text_speed),
+                                                     len(self.current_dialogue.text))
+    
+    def reveal_all(self) -> None:
+        """Muestra el texto completo del diálogo actual"""
+        self._cancel_typing_timer()
+        if self.current_dialogue:
+            self.current_dialogue.current_char = len(self.current_dialogue.text)
+            self.current_dialogue.is_complete = True
+    
+    def _cancel_typing_timer(self) -> None:
+        """Cancela el fin de escritura pendiente"""
+        if self._typing_timer:
+            self._typing_timer.cancel()
+            self._typing_timer = None
+    
+    def is_animating(self) -> bool:
+        """
+        Indica si el texto del diálogo actual todavía se está escribiendo
+        
+        Returns:
+            True mientras el efecto de escritura no haya terminado
+        """
+        return bool(self.is_active and self.current_dialogue
+                    and not self.current_dialogue.is_complete)
     
     def render(self) -> None:
         """Renderiza el diálogo actual"""
@@ -367,8 +424,7 @@ class Narrator:
             # Saltar texto
             elif event.key == pygame.K_ESCAPE:
                 if not self.current_dialogue.is_complete:
-                    self.current_dialogue.current_char = len(self.current_dialogue.text)
-                    self.current_dialogue.is_complete = True
+                    self.reveal_all()
                 else:
                     self.skip_dialogue()
         
@@ -376,8 +432,7 @@ class Narrator:
             if event.button == 1:  # Click izquierdo
                 if not self.current_dialogue.is_complete:
                     # Completar texto instantáneamente
-                    self.current_dialogue.current_char = len(self.current_dialogue.text)
-                    self.current_dialogue.is_complete = True
+                    self.reveal_all()
                 else:
                     self.advance_dialogue()
     
@@ -388,8 +443,7 @@ class Narrator:
         
         if not self.current_dialogue.is_complete:
             # Revelar todo el texto
-            self.current_dialogue.current_char = len(self.current_dialogue.text)
-            self.current_dialogue.is_complete = True
+            self.reveal_all()
         else:
             # Llamar callback si existe
             if self.current_dialogue.on_complete:
@@ -410,6 +464,7 @@ class Narrator:
     
     def close_dialogue(self) -> None:
         """Cierra el diálogo actual"""
+        self._cancel_typing_timer()
         self.is_active = False
         self.current_dialogue = None
         
@@ -4,14 +4,19 @@ Gestiona el renderizado de todos los elementos visuales del juego
 """
 
 import pygame
-import os
 import math
 import random
 from typing import Optional, Dict, List, Tuple
 import logging
+from engine.backgrounds import get_gradient_background
+from engine.timers import TimerScheduler
+from .assets import AssetSpec, load_images
 
 logger = logging.getLogger(__name__)
 
+# Duración de la entrada deslizante del prestamista (segundos)
+LENDER_ENTRY_DURATION = 0.5
+
 
 class Renderer:
     """
@@ -28,13 +33,31 @@ class Renderer:
         - engine.state.GameState: Para obtener estado visual
     """
     
-    def __init__(self, screen_width: int = 1280, screen_height: int = 720):
+    # Imágenes del renderer y su tamaño en pantalla
+    ASSET_SPECS = [
+        AssetSpec('space_background', 'space_background.png'),
+        AssetSpec('blue_spaceship', 'blue_spaceship.png', (150, 100)),
+        AssetSpec('player', 'player.png', (50, 70)),
+        AssetSpec('landing_moon', 'landing_moon.png', (300, 150)),
+        AssetSpec('start_button', 'start_button.png', (200, 60)),
+        AssetSpec('copper_mineral', 'copper_mineral.png'),
+        AssetSpec('silver_mineral', 'silver_mineral.png'),
+        AssetSpec('gold_mineral', 'gold_mineral.png'),
+        AssetSpec('zorvax_alien', 'zorvax_alien.png', (100, 120)),
+        AssetSpec('ktarr_alien', 'ktarr_alien.png', (100, 120)),
+        AssetSpec('alien', 'alien.png', (100, 120)),
+        AssetSpec('npc_helper', 'npc_helper.png', (100, 120)),
+    ]
+    
+    def __init__(self, screen_width: int = 1280, screen_height: int = 720,
+                 timers: Optional[TimerScheduler] = None):
         """
         Inicializa el renderer
         
         Args:
             screen_width: Ancho de la pantalla
             screen_height: Alto de la pantalla
+            timers: Temporizadores compartidos con el bucle (None = propios, los avanza update)
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -50,10 +73,14 @@ class Renderer:
         self.camera_offset = [0, 0]
         self.shake_intensity = 0.0
         self.shake_duration = 0.0
+        self._shake_timer = None
         
         # Assets del juego
         self.assets: Dict[str, pygame.Surface] = {}
         
+        # Fondo escalado a pantalla (se escala una sola vez)
+        self.scaled_background: Optional[pygame.Surface] = None
+        
         # Estrellas de fondo
         self.stars: List[Tuple[int, int, int]] = []
         
@@ -74,18 +101,24 @@ class Renderer:
         self.lender_type = None  # 'zorvax', 'ktarr', 'consorcio'
         self.lender_animation_time = 0.0
         self.lender_waiting_for_input = False  # Esperando que jugador presione continuar
+        self._lender_timer = None
         
         # Modo testing: Mostrar todos los prestamistas
         self.show_all_lenders_testing = False
         
         # Referencias
         self.game_state = None
+        self._owns_timers = timers is None
+        self.timers = TimerScheduler() if timers is None else timers
+        self.asset_loader = None  # ui.assets.AssetLoader si la carga es en segundo plano
     
-    def initialize(self, screen: pygame.Surface) -> None:
+    def initialize(self, screen: pygame.Surface, asset_loader=None) -> None:
         """Inicializa el renderer con la pantalla
         
         Args:
             screen: Superficie de Pygame para renderizar
+            asset_loader: Si se indica, las imágenes se cargan en segundo plano y
+                mientras tanto se dibujan marcadores de posición
         """
         self.screen = screen
         
@@ -96,7 +129,12 @@ class Renderer:
         self.effect_layer = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
         
         # Cargar assets
-        self._load_assets()
+        if asset_loader:
+            self.asset_loader = asset_loader
+            self._create_placeholders()
+            asset_loader.add_images(self.ASSET_SPECS, self.on_asset_ready)
+        else:
+            self._load_assets()
         
         # Generar estrellas de fondo
         self._generate_stars()
@@ -146,16 +184,12 @@ class Renderer:
         """Renderiza el fondo espacial con estrellas"""
         # Usar asset de fondo si está disponible
         if 'space_background' in self.assets:
-            bg = self.assets['space_background']
-            # Escalar para cubrir toda la pantalla
-            bg_scaled = pygame.transform.scale(bg, (self.screen_width, self.screen_height))
-            self.background_layer.blit(bg_scaled, (0, 0))
+            self.background_layer.blit(self._get_scaled_background(), (0, 0))
         else:
-            # Fondo degradado de negro a azul oscuro
-            for y in range(self.screen_height):
-                color_value = int(20 * (1 - y / self.screen_height))
-                color = (0, 0, color_value)
-                pygame.draw.line(self.background_layer, color, (0, y), (self.screen_width, y))
+            # Fondo degradado de azul oscuro a negro (generado una vez y cacheado)
+            self.background_layer.blit(
+                get_gradient_background((self.screen_width, self.screen_height),
+                                        (0, 0, 20), (0, 0, 0)), (0, 0))
         
         # Dibujar estrellas
         for star in self.stars:
@@ -190,8 +224,7 @@ class Renderer:
                 ship_copy.blit(red_overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
                 ship = ship_copy
             
-            # Animación de flotación suave
-            self.ship_animation_time += 0.02
+            # Animación de flotación suave (avanza en update según el tiempo real)
             float_offset = math.sin(self.ship_animation_time) * 3
             ship_y += int(float_offset)
         
@@ -259,8 +292,7 @@ class Renderer:
         
         # Renderizar fondo en la superficie temporal
         if 'space_background' in self.assets:
-            bg = self.assets['space_background']
-            bg_scaled = pygame.transform.scale(bg, (self.screen_width, self.screen_height))
+            bg_scaled = self._get_scaled_background()
             intro_surface.blit(bg_scaled, (0, 0))
         else:
             intro_surface.fill((10, 10, 30))
@@ -448,6 +480,23 @@ class Renderer:
         
         # Dibujar la superficie temporal en la pantalla principal (SIN shake)
         self.screen.blit(intro_surface, (0, 0))
+        
+        # Progreso de la carga en segundo plano
+        if self.asset_loader and not self.asset_loader.is_done:
+            self.render_loading_bar(self.asset_loader.progress)
+    
+    def render_loading_bar(self, progress: float) -> None:
+        """
+        Dibuja una barra fina de carga en la parte inferior de la pantalla
+        
+        Args:
+            progress: Fracción cargada (0.0 - 1.0)
+        """
+        bar_rect = pygame.Rect(self.screen_width // 2 - 150, self.screen_height - 20, 300, 6)
+        pygame.draw.rect(self.screen, (60, 60, 80), bar_rect)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_rect.width * progress)
+        pygame.draw.rect(self.screen, (100, 200, 255), fill_rect)
     
     def render_end_screen(self) -> None:
         """Renderiza la pantalla final (victoria o derrota)"""
@@ -547,6 +596,11 @@ class Renderer:
         """
         self.shake_intensity = intensity
         self.shake_duration = duration
+        
+        # El fin del shake es un temporizador, no un contador por frame
+        if self._shake_timer:
+            self._shake_timer.cancel()
+        self._shake_timer = self.timers.schedule(duration, self.reset_shake)
     
     def update(self, delta_time: float) -> None:
         """
@@ -555,61 +609,80 @@ class Renderer:
         Args:
             delta_time: Tiempo transcurrido
         """
-        # Actualizar shake solo durante la intro
-        if self.shake_duration > 0:
-            self.shake_duration -= delta_time
-            # Reducir intensidad gradualmente
+        if self._owns_timers:
+            self.timers.advance(delta_time)
+        
+        # Flotación de la nave: 1.2 rad/s (antes 0.02 por frame a 60 FPS),
+        # así no se ralentiza cuando el bucle baja la tasa de frames en reposo
+        self.ship_animation_time += delta_time * 1.2
+        
+        # Reducir intensidad gradualmente (reset_shake lo termina al vencer su temporizador)
+        if self._shake_timer:
             self.shake_intensity *= 0.9
-            
-            if self.shake_duration <= 0:
-                self.shake_intensity = 0.0
-                self.shake_duration = 0.0
+    
+    def is_animating(self) -> bool:
+        """
+        Indica si hay una animación que necesita la tasa de frames completa
+        
+        La flotación de la nave, las estrellas y los parpadeos son ambientales
+        y se ven bien a la tasa reducida de reposo.
+        
+        Returns:
+            True si hay shake, un prestamista entrando o el despegue de victoria en curso
+        """
+        if self._shake_timer:
+            return True
+        if self.lender_visible and not self.lender_waiting_for_input:
+            return True
+        return self.victory_animation_active and not self.victory_animation_complete
     
     def reset_shake(self) -> None:
         """Resetea completamente el efecto de shake"""
+        if self._shake_timer:
+            self._shake_timer.cancel()
+            self._shake_timer = None
         self.shake_intensity = 0.0
         self.shake_duration = 0.0
         self.camera_offset = [0, 0]
     
     def _load_assets(self) -> None:
         """Carga todos los assets del juego"""
-        asset_files = {
-            'space_background': 'space_background.png',
-            'blue_spaceship': 'blue_spaceship.png',
-            'player': 'player.png',
-            'landing_moon': 'landing_moon.png',
-            'start_button': 'start_button.png',
-            'copper_mineral': 'copper_mineral.png',
-            'silver_mineral': 'silver_mineral.png',
-            'gold_mineral': 'gold_mineral.png',
-            'zorvax_alien': 'zorvax_alien.png',
-            'ktarr_alien': 'ktarr_alien.png',
-            'alien': 'alien.png',
-            'npc_helper': 'npc_helper.png'
-        }
+        load_images(self.ASSET_SPECS, self.on_asset_ready)
+    
+    def on_asset_ready(self, key: str, image: pygame.Surface) -> None:
+        """
+        Guarda un asset cargado (sustituye al marcador de posición si lo había)
         
-        for key, filename in asset_files.items():
-            path = os.path.join('data', 'assets', filename)
-            try:
-                if os.path.exists(path):
-                    image = pygame.image.load(path).convert_alpha()
-                    
-                    # Escalar assets según su tipo
-                    if key == 'blue_spaceship':
-                        image = pygame.transform.scale(image, (150, 100))
-                    elif key == 'player':
-                        image = pygame.transform.scale(image, (50, 70))
-                    elif key == 'landing_moon':
-                        image = pygame.transform.scale(image, (300, 150))
-                    elif 'alien' in key or key == 'npc_helper':
-                        image = pygame.transform.scale(image, (100, 120))
-                    elif 'button' in key:
-                        image = pygame.transform.scale(image, (200, 60))
-                    
-                    self.assets[key] = image
-                    logger.debug(f"Asset cargado: {filename}")
-            except Exception as e:
-                logger.warning(f"No se pudo cargar asset {filename}: {e}")
+        Args:
+            key: Nombre del asset
+            image: Superficie ya convertida
+        """
+        self.assets[key] = image
+        if key == 'space_background':
+            self.scaled_background = None
+    
+    def _create_placeholders(self) -> None:
+        """Crea formas simples para la nave, la luna y el jugador mientras cargan los sprites"""
+        ship = pygame.Surface((150, 100), pygame.SRCALPHA)
+        pygame.draw.polygon(ship, (140, 160, 200), [(10, 60), (60, 30), (140, 50), (60, 80)])
+        pygame.draw.circle(ship, (100, 200, 255), (70, 52), 10)
+        self.assets['blue_spaceship'] = ship
+        
+        moon = pygame.Surface((300, 150), pygame.SRCALPHA)
+        pygame.draw.ellipse(moon, (120, 120, 130), moon.get_rect())
+        self.assets['landing_moon'] = moon
+        
+        player = pygame.Surface((50, 70), pygame.SRCALPHA)
+        pygame.draw.rect(player, (230, 230, 230), (10, 15, 30, 50), border_radius=8)
+        pygame.draw.circle(player, (230, 230, 230), (25, 12), 10)
+        self.assets['player'] = player
+    
+    def _get_scaled_background(self) -> pygame.Surface:
+        """Obtiene el asset de fondo escalado a pantalla, escalándolo solo la primera vez"""
+        if self.scaled_background is None:
+            self.scaled_background = pygame.transform.scale(
+                self.assets['space_background'], (self.screen_width, self.screen_height))
+        return self.scaled_background
     
     def _generate_stars(self) -> None:
         """Genera estrellas aleatorias para el fondo"""
@@ -628,8 +701,7 @@ class Renderer:
         
         # Renderizar fondo con espacio
         if 'space_background' in self.assets:
-            bg = self.assets['space_background']
-            bg_scaled = pygame.transform.scale(bg, (self.screen_width, self.screen_height))
+            bg_scaled = self._get_scaled_background()
             self.screen.blit(bg_scaled, (0, 0))
         else:
             self.screen.fill((10, 10, 30))
@@ -791,8 +863,7 @@ class Renderer:
         if self.victory_animation_complete:
             # Fondo
             if 'space_background' in self.assets:
-                bg = self.assets['space_background']
-                bg_scaled = pygame.transform.scale(bg, (self.screen_width, self.screen_height))
+                bg_scaled = self._get_scaled_background()
                 self.screen.blit(bg_scaled, (0, 0))
             else:
                 self.screen.fill((10, 10, 30))
@@ -852,19 +923,31 @@ class Renderer:
         self.lender_type = lender_type
         self.lender_animation_time = 0.0
         self.lender_waiting_for_input = False
+        
+        # Después de la animación de entrada, esperar input del jugador
+        self._cancel_lender_timer()
+        self._lender_timer = self.timers.schedule(LENDER_ENTRY_DURATION, self._on_lender_entered)
         logger.info(f"Prestamista {lender_type} apareciendo en escena")
     
     def update_lender(self, delta_time: float) -> None:
         """Actualiza la animación del prestamista"""
         if self.lender_visible:
             self.lender_animation_time += delta_time
-            
-            # Después de la animación de entrada (0.5s), esperar input del jugador
-            if self.lender_animation_time >= 0.5:
-                self.lender_waiting_for_input = True
+    
+    def _on_lender_entered(self) -> None:
+        """Temporizador: terminó la entrada del prestamista"""
+        self._lender_timer = None
+        self.lender_waiting_for_input = True
+    
+    def _cancel_lender_timer(self) -> None:
+        """Cancela la espera de la entrada del prestamista si está pendiente"""
+        if self._lender_timer:
+            self._lender_timer.cancel()
+            self._lender_timer = None
     
     def dismiss_lender(self) -> None:
         """Oculta el prestamista cuando el jugador presiona continuar"""
+        self._cancel_lender_timer()
         self.lender_visible = False
         self.lender_type = None
         self.lender_animation_time = 0.0
@@ -893,7 +976,7 @@ class Renderer:
         lender_image = self.assets[asset_key]
         
         # Animación de entrada (deslizar desde la derecha solo los primeros 0.5s)
-        progress = min(1.0, self.lender_animation_time / 0.5)
+        progress = min(1.0, self.lender_animation_time / LENDER_ENTRY_DURATION)
         ease_progress = 1 - (1 - progress) ** 3  # Ease out
         
         # Posición: desde fuera de pantalla derecha hacia el centro-derecha
@@ -1032,6 +1115,7 @@ class Renderer:
         self.victory_animation_complete = False
         
         # Prestamista
+        self._cancel_lender_timer()
         self.lender_visible = False
         self.lender_type = None
         self.lender_animation_time = 0.0